@@ -0,0 +1,29 @@
+import Mathlib.Algebra.Algebra.Basic
+import Mathlib.Algebra.Field.Basic
+import Mathlib.Algebra.Group.Basic
+import Mathlib.Algebra.Group.Hom.Defs
+import Mathlib.Algebra.Group.Subgroup.Basic
+import Mathlib.Algebra.Module.LinearMap.Defs
+import Mathlib.Algebra.Module.Submodule.Basic
+import Mathlib.Algebra.Polynomial.Basic
+import Mathlib.Algebra.Ring.Basic
+import Mathlib.Algebra.Ring.Hom.Defs
+import Mathlib.Algebra.Ring.Subring.Basic
+import Mathlib.Data.Matrix.Basic
+import Mathlib.RingTheory.Ideal.Basic
+import Mathlib.Tactic.Common
+import Mathlib.Tactic.Linarith
+import Mathlib.Tactic.NormNum
+import Mathlib.Tactic.Ring
+
+/-!
+# Candidate prelude
+
+Import header for verifier candidate files. It pulls in only the Mathlib slices
+behind the algebra families in `ProjectConfig.algebra_name_prefixes` plus the
+tactics tried by the proof engines, so candidates can `import LeanExtract.Prelude`
+instead of all of `Mathlib`.
+
+Build once with `lake build LeanExtract.Prelude`; the Python verifier rebuilds it
+when `lean-toolchain`, `lake-manifest.json`, `lakefile.toml` or this file change.
+-/
@@ -0,0 +1,33 @@
+"""Reproducible benchmarks for the pipeline hot paths."""
+
+from autonomous_discovery.benchmarks.harness import Benchmark, BenchmarkResult, run_benchmark
+from autonomous_discovery.benchmarks.history import (
+    Comparison,
+    append_run,
+    compare_runs,
+    input_mismatches,
+    load_runs,
+    run_metadata,
+)
+from autonomous_discovery.benchmarks.suites import (
+    DumpInputs,
+    dump_benchmarks,
+    novelty_benchmarks,
+    verifier_benchmarks,
+)
+
+__all__ = [
+    "Benchmark",
+    "BenchmarkResult",
+    "Comparison",
+    "DumpInputs",
+    "append_run",
+    "compare_runs",
+    "dump_benchmarks",
+    "input_mismatches",
+    "load_runs",
+    "novelty_benchmarks",
+    "run_benchmark",
+    "run_metadata",
+    "verifier_benchmarks",
+]
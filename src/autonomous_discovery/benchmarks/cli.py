@@ -0,0 +1,266 @@
+"""CLI for running the benchmark suite and comparing recorded runs."""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from autonomous_discovery.benchmarks.harness import Benchmark, BenchmarkResult, run_benchmark
+from autonomous_discovery.benchmarks.history import (
+    append_run,
+    compare_runs,
+    input_mismatches,
+    load_runs,
+    run_metadata,
+)
+from autonomous_discovery.benchmarks.suites import (
+    DumpInputs,
+    dump_benchmarks,
+    novelty_benchmarks,
+    verifier_benchmarks,
+)
+from autonomous_discovery.config import ProjectConfig
+from autonomous_discovery.knowledge_base.synthetic import (
+    SyntheticDumpConfig,
+    write_synthetic_dump,
+)
+
+DEFAULT_FAMILY_COUNTS = (2, 4, 8, 16)
+
+
+def build_parser(config: ProjectConfig | None = None) -> argparse.ArgumentParser:
+    config = config or ProjectConfig()
+    parser = argparse.ArgumentParser(description="Benchmark the discovery pipeline hot paths.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    default_history = config.data_processed_dir / "benchmark_history.json"
+
+    run_parser = subparsers.add_parser("run", help="Run benchmarks and record them.")
+    run_parser.add_argument("--premises-path", type=Path, default=config.premises_path)
+    run_parser.add_argument("--decl-types-path", type=Path, default=config.decl_types_path)
+    run_parser.add_argument("--history", type=Path, default=default_history)
+    run_parser.add_argument(
+        "--synthetic-declarations",
+        type=int,
+        default=None,
+        help=(
+            "Benchmark a synthetic dump of this many declarations instead of the "
+            "--premises-path/--decl-types-path files (generated once, then reused)."
+        ),
+    )
+    run_parser.add_argument("--synthetic-seed", type=int, default=0)
+    run_parser.add_argument(
+        "--synthetic-dir",
+        type=Path,
+        default=config.data_processed_dir / "synthetic",
+        help="Where synthetic dumps are kept (default: data/processed/synthetic).",
+    )
+    run_parser.add_argument(
+        "--only",
+        action="append",
+        default=None,
+        help="Run benchmarks matching this glob (e.g. 'graph.*'); repeat for several.",
+    )
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument(
+        "--family-counts",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_FAMILY_COUNTS),
+        help="Family-prefix counts to benchmark gap detection at (default: 2 4 8 16).",
+    )
+    run_parser.add_argument(
+        "--novelty-history-sizes",
+        type=int,
+        nargs="+",
+        default=[100, 1_000, 10_000],
+        help="Known-statement counts to benchmark novelty checking at.",
+    )
+    run_parser.add_argument(
+        "--verifier-attempts",
+        type=int,
+        default=50,
+        help="Verification attempts per stub-Lean benchmark run.",
+    )
+    run_parser.add_argument("--list", action="store_true", help="List benchmarks and exit.")
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare two recorded runs and flag regressions."
+    )
+    compare_parser.add_argument("--history", type=Path, default=default_history)
+    compare_parser.add_argument(
+        "--baseline", type=int, default=-2, help="Run index of the baseline (default: -2)."
+    )
+    compare_parser.add_argument(
+        "--current", type=int, default=-1, help="Run index to compare (default: -1)."
+    )
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Flag benchmarks whose median slowed down by more than this fraction.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    config = ProjectConfig()
+    parser = build_parser(config)
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        return _run(args, config)
+    return _compare(args)
+
+
+def _run(args: argparse.Namespace, config: ProjectConfig) -> int:
+    if args.repeats <= 0:
+        print("--repeats must be a positive integer", file=sys.stderr)
+        return 1
+    if args.warmup < 0:
+        print("--warmup must be non-negative", file=sys.stderr)
+        return 1
+    if any(count <= 0 for count in args.family_counts):
+        print("--family-counts must be positive integers", file=sys.stderr)
+        return 1
+    if any(size <= 0 for size in args.novelty_history_sizes):
+        print("--novelty-history-sizes must be positive integers", file=sys.stderr)
+        return 1
+    if args.verifier_attempts <= 0:
+        print("--verifier-attempts must be a positive integer", file=sys.stderr)
+        return 1
+    if args.synthetic_declarations is not None and args.synthetic_declarations <= 0:
+        print("--synthetic-declarations must be a positive integer", file=sys.stderr)
+        return 1
+
+    premises_path, decl_types_path = args.premises_path, args.decl_types_path
+    if args.synthetic_declarations is not None:
+        dump_dir = args.synthetic_dir / f"{args.synthetic_declarations}-seed{args.synthetic_seed}"
+        premises_path = dump_dir / config.premises_file
+        decl_types_path = dump_dir / config.decl_types_file
+    inputs = DumpInputs(premises_path, decl_types_path)
+    benchmarks = [
+        *dump_benchmarks(
+            inputs,
+            family_prefixes=config.algebra_name_prefixes,
+            family_counts=sorted(set(args.family_counts)),
+        ),
+        *novelty_benchmarks(args.novelty_history_sizes),
+        *verifier_benchmarks(args.verifier_attempts),
+    ]
+    selected = _select(benchmarks, args.only)
+    if args.list:
+        for benchmark in selected:
+            print(benchmark.name)
+        return 0
+    if not selected:
+        print("No benchmarks match --only", file=sys.stderr)
+        return 1
+    needs_dump = any(benchmark.needs_dump for benchmark in selected)
+    if needs_dump and args.synthetic_declarations is not None:
+        if not premises_path.parent.exists():
+            # Generate next to the final directory and rename it into place so an
+            # interrupted run never leaves a truncated dump to be reused.
+            staging = premises_path.parent.with_name(f"{premises_path.parent.name}.tmp")
+            shutil.rmtree(staging, ignore_errors=True)
+            stats = write_synthetic_dump(
+                staging / premises_path.name,
+                staging / decl_types_path.name,
+                SyntheticDumpConfig(
+                    declarations=args.synthetic_declarations,
+                    seed=args.synthetic_seed,
+                    family_prefixes=config.algebra_name_prefixes,
+                ),
+            )
+            os.replace(staging, premises_path.parent)
+            print(f"Generated a synthetic dump of {stats.declarations} declarations")
+    elif needs_dump:
+        for path in (premises_path, decl_types_path):
+            if not path.exists():
+                print(f"Input file not found: {path}", file=sys.stderr)
+                return 1
+
+    results: list[BenchmarkResult] = []
+    for benchmark in selected:
+        result = run_benchmark(benchmark, repeats=args.repeats, warmup=args.warmup)
+        results.append(result)
+        memory = (
+            f"  peak {result.peak_alloc_mb:.1f} MB" if result.peak_alloc_mb is not None else ""
+        )
+        print(
+            f"{result.name:<45} {result.median_ms:>11.3f} ms  "
+            f"{result.items_per_s:>13.1f} items/s{memory}"
+        )
+    metadata = run_metadata()
+    if needs_dump:
+        metadata["inputs"] = {
+            "premises_path": str(premises_path),
+            "decl_types_path": str(decl_types_path),
+            "synthetic_declarations": args.synthetic_declarations,
+            "synthetic_seed": args.synthetic_seed if args.synthetic_declarations else None,
+        }
+        metadata["input_benchmarks"] = [
+            benchmark.name for benchmark in selected if benchmark.needs_dump
+        ]
+    append_run(args.history, results, metadata)
+    print(f"Recorded {len(results)} results in {args.history}")
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    if args.threshold < 0:
+        print("--threshold must be non-negative", file=sys.stderr)
+        return 1
+    try:
+        runs = load_runs(args.history)
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    try:
+        baseline, current = runs[args.baseline], runs[args.current]
+    except IndexError:
+        print(
+            f"{args.history} does not have runs {args.baseline} and {args.current}",
+            file=sys.stderr,
+        )
+        return 1
+
+    mismatched = input_mismatches(baseline, current)
+    if mismatched:
+        print(
+            f"Skipping {len(mismatched)} benchmark(s) timed on different inputs: "
+            f"{', '.join(mismatched)}",
+            file=sys.stderr,
+        )
+    comparisons = compare_runs(baseline, current, threshold=args.threshold)
+    for comparison in comparisons:
+        flag = "REGRESSION" if comparison.regressed else ""
+        print(
+            f"{comparison.name:<45} {comparison.baseline_ms:>11.3f} -> "
+            f"{comparison.current_ms:>11.3f} ms  x{comparison.ratio:<6.3f} {flag}".rstrip()
+        )
+    regressions = [comparison.name for comparison in comparisons if comparison.regressed]
+    if regressions:
+        print(
+            f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+def _select(benchmarks: list[Benchmark], patterns: list[str] | None) -> list[Benchmark]:
+    if not patterns:
+        return benchmarks
+    return [
+        benchmark
+        for benchmark in benchmarks
+        if any(fnmatch.fnmatchcase(benchmark.name, pattern) for pattern in patterns)
+    ]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
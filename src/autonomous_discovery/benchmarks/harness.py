@@ -0,0 +1,112 @@
+"""Timing harness: run a benchmark repeatedly and summarize its timings."""
+
+from __future__ import annotations
+
+import gc
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class Benchmark:
+    """A named workload.
+
+    ``prepare`` builds a fresh workload (untimed) and returns the callable to
+    time, which returns how many items it processed. ``needs_dump`` marks
+    workloads that read the premises/declaration dump; ``track_memory`` adds one
+    extra run under ``tracemalloc`` to record peak allocated memory.
+    """
+
+    name: str
+    prepare: Callable[[], Callable[[], int]]
+    needs_dump: bool = False
+    track_memory: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    name: str
+    items: int
+    wall_ms: tuple[float, ...]
+    peak_alloc_mb: float | None = None
+
+    @property
+    def median_ms(self) -> float:
+        return statistics.median(self.wall_ms)
+
+    @property
+    def min_ms(self) -> float:
+        return min(self.wall_ms)
+
+    @property
+    def items_per_s(self) -> float:
+        return self.items / (self.median_ms / 1000) if self.median_ms > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "items": self.items,
+            "wall_ms": list(self.wall_ms),
+            "median_ms": round(self.median_ms, 3),
+            "min_ms": round(self.min_ms, 3),
+            "items_per_s": round(self.items_per_s, 3),
+            "peak_alloc_mb": self.peak_alloc_mb,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> BenchmarkResult:
+        return cls(
+            name=payload["name"],
+            items=payload["items"],
+            wall_ms=tuple(payload["wall_ms"]),
+            peak_alloc_mb=payload.get("peak_alloc_mb"),
+        )
+
+
+def run_benchmark(benchmark: Benchmark, *, repeats: int = 5, warmup: int = 1) -> BenchmarkResult:
+    """Time ``repeats`` runs of ``benchmark`` after ``warmup`` untimed runs.
+
+    Each run gets a freshly prepared workload, and garbage collection is
+    disabled while it is timed so collector pauses do not land in one sample.
+    """
+    if repeats <= 0:
+        raise ValueError("repeats must be a positive integer")
+    if warmup < 0:
+        raise ValueError("warmup must be non-negative")
+    for _ in range(warmup):
+        benchmark.prepare()()
+
+    timings: list[float] = []
+    items = 0
+    for _ in range(repeats):
+        workload = benchmark.prepare()
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter_ns()
+            items = workload()
+            timings.append((time.perf_counter_ns() - started) / 1_000_000)
+        finally:
+            gc.enable()
+
+    peak_alloc_mb: float | None = None
+    if benchmark.track_memory:
+        workload = benchmark.prepare()
+        tracemalloc.start()
+        try:
+            workload()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peak_alloc_mb = round(peak / (1024 * 1024), 3)
+
+    return BenchmarkResult(
+        name=benchmark.name,
+        items=items,
+        wall_ms=tuple(round(timing, 3) for timing in timings),
+        peak_alloc_mb=peak_alloc_mb,
+    )
@@ -0,0 +1,133 @@
+"""JSON history of benchmark runs and regression comparison between two runs."""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import subprocess
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from autonomous_discovery.benchmarks.harness import BenchmarkResult
+
+HISTORY_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    """Median wall time of one benchmark in a baseline and a current run."""
+
+    name: str
+    baseline_ms: float
+    current_ms: float
+    ratio: float
+    regressed: bool
+
+
+def run_metadata() -> dict[str, Any]:
+    return {
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": f"{sys.platform}-{platform.machine()}",
+    }
+
+
+def load_runs(path: Path) -> list[dict[str, Any]]:
+    """The recorded runs, oldest first; an absent file has none."""
+    if not path.exists():
+        return []
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if payload.get("format_version") != HISTORY_FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark history format in {path}")
+    return list(payload["runs"])
+
+
+def append_run(
+    path: Path, results: Sequence[BenchmarkResult], metadata: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Append one run to the history file (rewritten atomically) and return it."""
+    run = {
+        **(metadata if metadata is not None else run_metadata()),
+        "results": [result.to_dict() for result in results],
+    }
+    runs = [*load_runs(path), run]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.name}.tmp")
+    temporary.write_text(
+        json.dumps({"format_version": HISTORY_FORMAT_VERSION, "runs": runs}, indent=2) + "\n",
+        encoding="utf-8",
+    )
+    os.replace(temporary, path)
+    return run
+
+
+def input_mismatches(baseline: dict[str, Any], current: dict[str, Any]) -> list[str]:
+    """Benchmarks in both runs that read a dump, when the runs read different dumps.
+
+    A run lists the benchmarks that read its ``inputs`` under ``input_benchmarks``.
+    """
+    if baseline.get("inputs") == current.get("inputs"):
+        return []
+    dependent = {*baseline.get("input_benchmarks", ()), *current.get("input_benchmarks", ())}
+    baseline_names = {item["name"] for item in baseline["results"]}
+    return [
+        item["name"]
+        for item in current["results"]
+        if item["name"] in dependent and item["name"] in baseline_names
+    ]
+
+
+def compare_runs(
+    baseline: dict[str, Any], current: dict[str, Any], *, threshold: float = 0.10
+) -> list[Comparison]:
+    """Compare the benchmarks present in both runs by median wall time.
+
+    A benchmark regressed when its current median exceeds the baseline's by
+    more than ``threshold`` (a fraction: 0.10 means 10% slower). Benchmarks
+    that timed different inputs (see :func:`input_mismatches`) are skipped.
+    """
+    if threshold < 0:
+        raise ValueError("threshold must be non-negative")
+    baseline_results = {
+        item["name"]: BenchmarkResult.from_dict(item) for item in baseline["results"]
+    }
+    skipped = set(input_mismatches(baseline, current))
+    comparisons: list[Comparison] = []
+    for item in current["results"]:
+        previous = baseline_results.get(item["name"])
+        if previous is None or item["name"] in skipped:
+            continue
+        result = BenchmarkResult.from_dict(item)
+        ratio = result.median_ms / previous.median_ms if previous.median_ms > 0 else 1.0
+        comparisons.append(
+            Comparison(
+                name=result.name,
+                baseline_ms=previous.median_ms,
+                current_ms=result.median_ms,
+                ratio=round(ratio, 3),
+                regressed=ratio > 1 + threshold,
+            )
+        )
+    return comparisons
+
+
+def _git_revision() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if completed.returncode != 0:
+        return None
+    return completed.stdout.strip() or None
@@ -0,0 +1,223 @@
+"""Benchmarks for the pipeline hot paths.
+
+Dump-based benchmarks (parsing, graph build, PageRank, descendant counts, gap
+detection) read the premises/declaration dump once through :class:`DumpInputs`
+and share the parsed data and graph. Novelty and verifier benchmarks generate
+their own deterministic workloads, so they run without a dump.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import shutil
+import stat
+import tempfile
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from autonomous_discovery.benchmarks.harness import Benchmark
+from autonomous_discovery.gap_detector.analogical import AnalogicalGapDetector, GapDetectorConfig
+from autonomous_discovery.knowledge_base.graph import MathlibGraph
+from autonomous_discovery.knowledge_base.parser import (
+    DeclarationEntry,
+    PremisesEntry,
+    parse_declaration_types,
+    parse_premises,
+)
+from autonomous_discovery.lean_bridge.runner import LeanResult, LeanRunner
+from autonomous_discovery.novelty_checker.basic import BasicNoveltyChecker
+from autonomous_discovery.novelty_checker.canonical import canonical_keys
+from autonomous_discovery.verifier.lean_verifier import LeanVerifier
+
+DESCENDANT_SAMPLE_SIZE = 1000
+NOVELTY_HISTORY_SIZES = (100, 1_000, 10_000)
+NOVELTY_QUERY_COUNT = 200
+VERIFIER_ATTEMPTS = 50
+
+
+class DumpInputs:
+    """Lazily loaded premises/declaration dump shared by the dump benchmarks."""
+
+    def __init__(self, premises_path: Path, decl_types_path: Path) -> None:
+        self.premises_path = premises_path
+        self.decl_types_path = decl_types_path
+
+    @functools.cached_property
+    def premises_text(self) -> str:
+        return self.premises_path.read_text(encoding="utf-8")
+
+    @functools.cached_property
+    def decl_types_text(self) -> str:
+        return self.decl_types_path.read_text(encoding="utf-8")
+
+    @functools.cached_property
+    def premises(self) -> list[PremisesEntry]:
+        return parse_premises(self.premises_text)
+
+    @functools.cached_property
+    def declarations(self) -> list[DeclarationEntry]:
+        return parse_declaration_types(self.decl_types_text)
+
+    @functools.cached_property
+    def graph(self) -> MathlibGraph:
+        return MathlibGraph.from_raw_data(self.premises, self.declarations)
+
+
+def dump_benchmarks(
+    inputs: DumpInputs, *, family_prefixes: Sequence[str], family_counts: Sequence[int]
+) -> list[Benchmark]:
+    def parse_premises_workload() -> Callable[[], int]:
+        text = inputs.premises_text
+        return lambda: len(parse_premises(text))
+
+    def parse_declarations_workload() -> Callable[[], int]:
+        text = inputs.decl_types_text
+        return lambda: len(parse_declaration_types(text))
+
+    def build_graph_workload() -> Callable[[], int]:
+        premises, declarations = inputs.premises, inputs.declarations
+        return lambda: MathlibGraph.from_raw_data(premises, declarations).node_count
+
+    def pagerank_workload() -> Callable[[], int]:
+        graph = inputs.graph
+        return lambda: len(graph.pagerank())
+
+    def descendants_workload() -> Callable[[], int]:
+        graph = inputs.graph
+        nodes = sorted(graph.nodes())
+        step = max(1, len(nodes) // DESCENDANT_SAMPLE_SIZE)
+        sample = nodes[::step][:DESCENDANT_SAMPLE_SIZE]
+
+        def run() -> int:
+            for node in sample:
+                graph.descendants_count(node)
+            return len(sample)
+
+        return run
+
+    def detect_workload(prefixes: tuple[str, ...]) -> Callable[[], Callable[[], int]]:
+        def prepare() -> Callable[[], int]:
+            graph = inputs.graph
+            detector = AnalogicalGapDetector(config=GapDetectorConfig(family_prefixes=prefixes))
+
+            def run() -> int:
+                detector.detect(graph)
+                return graph.node_count
+
+            return run
+
+        return prepare
+
+    benchmarks = [
+        Benchmark("parser.premises", parse_premises_workload, needs_dump=True),
+        Benchmark("parser.declaration_types", parse_declarations_workload, needs_dump=True),
+        Benchmark("graph.from_raw_data", build_graph_workload, needs_dump=True, track_memory=True),
+        Benchmark("graph.pagerank", pagerank_workload, needs_dump=True),
+        Benchmark("graph.descendants_batch", descendants_workload, needs_dump=True),
+    ]
+    for count in family_counts:
+        prefixes = tuple(family_prefixes[:count])
+        benchmarks.append(
+            Benchmark(
+                f"gap_detector.detect[families={len(prefixes)}]",
+                detect_workload(prefixes),
+                needs_dump=True,
+            )
+        )
+    return benchmarks
+
+
+def synthetic_statement(index: int, *, binder: str = "a") -> str:
+    """A distinct Lean-like statement; ``binder`` renames its bound variable."""
+    power = index % 7 + 1
+    return (
+        f"theorem bench_{index} (G : Type*) [Group G] ({binder} b : G) : "
+        f"{binder} * b ^ {power} * {binder} ^ {index} = b ^ {power} * {binder} ^ {index + 1}"
+    )
+
+
+def novelty_benchmarks(history_sizes: Sequence[int] = NOVELTY_HISTORY_SIZES) -> list[Benchmark]:
+    def novelty_workload(history_size: int) -> Callable[[], Callable[[], int]]:
+        def prepare() -> Callable[[], int]:
+            history = {synthetic_statement(index) for index in range(history_size)}
+            checker = BasicNoveltyChecker(existing_statements=history, batch_workers=1)
+            # Half alpha-renamed duplicates of the history, half unseen statements.
+            queries = [
+                synthetic_statement(index * history_size // NOVELTY_QUERY_COUNT, binder="x")
+                if index % 2 == 0
+                else synthetic_statement(history_size + index)
+                for index in range(NOVELTY_QUERY_COUNT)
+            ]
+            # Keys of the queries must be computed inside the timed run.
+            canonical_keys.cache_clear()
+            return lambda: len(checker.check_batch(queries))
+
+        return prepare
+
+    return [
+        Benchmark(f"novelty.check_batch[history={size}]", novelty_workload(size))
+        for size in history_sizes
+    ]
+
+
+class _StubLeanRunner(LeanRunner):
+    """Runs stand-in ``lean``/``lake`` executables that exit immediately."""
+
+    def __init__(self, bin_dir: Path) -> None:
+        super().__init__(project_dir=bin_dir)
+        self.bin_dir = bin_dir
+
+    def check_lean_available(self) -> bool:
+        return self.run_command([str(self.bin_dir / "lean"), "--version"]).success
+
+    def run_command(
+        self, cmd: list[str], *, timeout: int | None = None, cwd: str | None = None
+    ) -> LeanResult:
+        if cmd and cmd[0] == "lake":
+            cmd = [str(self.bin_dir / "lake"), *cmd[1:]]
+        return super().run_command(cmd, timeout=timeout, cwd=cwd)
+
+
+def _write_stub_executable(path: Path, script: str) -> None:
+    path.write_text(script, encoding="utf-8")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+
+@functools.cache
+def _stub_lean_bin_dir() -> Path:
+    bin_dir = Path(tempfile.mkdtemp(prefix="autonomous_discovery_stub_lean_"))
+    atexit.register(shutil.rmtree, bin_dir, ignore_errors=True)
+    _write_stub_executable(bin_dir / "lean", "#!/bin/sh\necho 'Lean (stub)'\n")
+    _write_stub_executable(bin_dir / "lake", "#!/bin/sh\nexit 0\n")
+    return bin_dir
+
+
+def verifier_benchmarks(attempts: int = VERIFIER_ATTEMPTS) -> list[Benchmark]:
+    """Verifier throughput with real subprocesses but a Lean that does no work.
+
+    This isolates the per-attempt overhead (availability probe, temp file,
+    process spawn) from Lean's own checking time.
+    """
+
+    def verifier_workload(probe_ttl_s: float) -> Callable[[], Callable[[], int]]:
+        def prepare() -> Callable[[], int]:
+            verifier = LeanVerifier(
+                runner=_StubLeanRunner(_stub_lean_bin_dir()),
+                require_sandbox=False,
+                availability_ttl_s=probe_ttl_s,
+            )
+
+            def run() -> int:
+                for index in range(attempts):
+                    verifier.verify(f"theorem bench_{index} : True", "by\n  trivial")
+                return attempts
+
+            return run
+
+        return prepare
+
+    return [
+        Benchmark(f"verifier.stub_lean[probe_ttl_s={ttl:g}]", verifier_workload(ttl))
+        for ttl in (0.0, 60.0)
+    ]
@@ -19,6 +19,13 @@ class LLMConfig:
     max_tokens: int = 2048
     parse_retries: int = 2
     timeout: float = 600.0
+    # >1 switches generation to concurrent requests over one keep-alive client.
+    max_concurrency: int = 1
+    # Stream chat responses and stop reading once a declaration has been emitted.
+    stream: bool = False
+    # >1 samples each gap with that many seeded requests (seeds seed, seed+1, ...).
+    samples_per_gap: int = 1
+    seed: int = 0
 
 
 @dataclass(frozen=True)
@@ -1,6 +1,12 @@
 """Conjecture generator implementations and interfaces."""
 
-from autonomous_discovery.conjecture_generator.io import read_conjectures, write_conjectures
+from autonomous_discovery.conjecture_generator.cache import ResponseCache, ResponseCacheMissError
+from autonomous_discovery.conjecture_generator.io import (
+    ConjectureWriter,
+    iter_conjectures,
+    read_conjectures,
+    write_conjectures,
+)
 from autonomous_discovery.conjecture_generator.llm_generator import OllamaConjectureGenerator
 from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
 from autonomous_discovery.conjecture_generator.protocol import ConjectureGenerator
@@ -9,8 +15,12 @@ from autonomous_discovery.conjecture_generator.template import TemplateConjectur
 __all__ = [
     "ConjectureCandidate",
     "ConjectureGenerator",
+    "ConjectureWriter",
     "OllamaConjectureGenerator",
+    "ResponseCache",
+    "ResponseCacheMissError",
     "TemplateConjectureGenerator",
+    "iter_conjectures",
     "read_conjectures",
     "write_conjectures",
 ]
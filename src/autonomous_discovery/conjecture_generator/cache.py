@@ -0,0 +1,150 @@
+"""Disk-backed prompt/response cache for LLM conjecture generation."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+CACHE_MODES: tuple[str, ...] = ("read_through", "record_only", "replay_only")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+"""
+
+
+class ResponseCacheMissError(LookupError):
+    """Raised in ``replay_only`` mode when a request has no recorded response."""
+
+
+class ResponseCache:
+    """SQLite cache of chat responses keyed on model, options and messages.
+
+    Modes:
+
+    - ``read_through``: serve hits, query the model on a miss and record the reply.
+    - ``record_only``: always query the model and record the reply (refresh).
+    - ``replay_only``: serve hits and never query the model; a miss raises
+      :class:`ResponseCacheMissError`, so offline reruns are deterministic.
+
+    Total stored content is kept under ``max_bytes`` by evicting the least
+    recently used entries.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        mode: str = "read_through",
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        if mode not in CACHE_MODES:
+            raise ValueError(f"mode must be one of {', '.join(CACHE_MODES)}")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer")
+        self.path = Path(path)
+        self.mode = mode
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._last_tick = 0
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> ResponseCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @staticmethod
+    def key_for(model: str, options: dict[str, Any], messages: list[dict[str, str]]) -> str:
+        """Stable hash of everything that determines the model's reply."""
+        material = json.dumps(
+            {"model": model, "options": options, "messages": messages},
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    @property
+    def reads(self) -> bool:
+        return self.mode != "record_only"
+
+    @property
+    def writes(self) -> bool:
+        return self.mode != "replay_only"
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE responses SET last_used = ? WHERE key = ?", (self._tick(), key)
+                )
+            return str(row[0])
+
+    def put(self, key: str, content: str) -> None:
+        size = len(content.encode("utf-8"))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, content, size, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, content, size, self._tick()),
+            )
+            self._evict()
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            (total,) = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return int(total)
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _tick(self) -> int:
+        # Strictly increasing so back-to-back uses keep their LRU order.
+        self._last_tick = max(time.time_ns(), self._last_tick + 1)
+        return self._last_tick
+
+    def _evict(self) -> None:
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+        evicted: list[tuple[str]] = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_used ASC, key ASC"
+        ):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
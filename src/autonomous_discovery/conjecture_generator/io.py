@@ -2,44 +2,72 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import Iterable, Iterator
 from dataclasses import asdict
 from pathlib import Path
 
 from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
+from autonomous_discovery.jsonl import DEFAULT_BATCH_SIZE, JsonlWriter, iter_jsonl
 
 
-def write_conjectures(conjectures: list[ConjectureCandidate], path: Path) -> None:
-    """Write conjecture candidates to JSONL."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
+class ConjectureWriter:
+    """Append conjecture candidates to JSONL (optionally ``.gz``/``.zst``) in batches."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        append: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        self._writer = JsonlWriter(path, append=append, batch_size=batch_size)
+
+    def __enter__(self) -> ConjectureWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def rows_written(self) -> int:
+        return self._writer.rows_written
+
+    def write(self, conjecture: ConjectureCandidate) -> None:
+        self._writer.write(asdict(conjecture))
+
+    def write_all(self, conjectures: Iterable[ConjectureCandidate]) -> None:
         for conjecture in conjectures:
-            row = asdict(conjecture)
-            f.write(json.dumps(row, sort_keys=True) + "\n")
+            self.write(conjecture)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def write_conjectures(conjectures: Iterable[ConjectureCandidate], path: Path) -> None:
+    """Write conjecture candidates to JSONL."""
+    with ConjectureWriter(path) as writer:
+        writer.write_all(conjectures)
+
+
+def iter_conjectures(path: Path) -> Iterator[ConjectureCandidate]:
+    """Yield conjecture candidates from JSONL one at a time."""
+    for row in iter_jsonl(path):
+        metadata_raw = row.get("metadata", {})
+        if not isinstance(metadata_raw, dict):
+            raise ValueError("metadata must be a JSON object")
+        try:
+            yield ConjectureCandidate(
+                gap_missing_decl=str(row["gap_missing_decl"]),
+                lean_statement=str(row["lean_statement"]),
+                rationale=str(row["rationale"]),
+                model_id=str(row["model_id"]),
+                temperature=float(row["temperature"]),
+                metadata={str(k): str(v) for k, v in metadata_raw.items()},
+            )
+        except KeyError as exc:
+            raise ValueError(f"Missing required field in JSONL line: {exc}") from exc
 
 
 def read_conjectures(path: Path) -> list[ConjectureCandidate]:
     """Read conjecture candidates from JSONL."""
-    items: list[ConjectureCandidate] = []
-    with path.open(encoding="utf-8") as f:
-        for line in f:
-            if not line.strip():
-                continue
-            row = json.loads(line)
-            metadata_raw = row.get("metadata", {})
-            if not isinstance(metadata_raw, dict):
-                raise ValueError("metadata must be a JSON object")
-            try:
-                items.append(
-                    ConjectureCandidate(
-                        gap_missing_decl=str(row["gap_missing_decl"]),
-                        lean_statement=str(row["lean_statement"]),
-                        rationale=str(row["rationale"]),
-                        model_id=str(row["model_id"]),
-                        temperature=float(row["temperature"]),
-                        metadata={str(k): str(v) for k, v in metadata_raw.items()},
-                    )
-                )
-            except KeyError as exc:
-                raise ValueError(f"Missing required field in JSONL line: {exc}") from exc
-    return items
+    return list(iter_conjectures(path))
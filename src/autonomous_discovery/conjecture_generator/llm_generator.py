@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import math
 import re
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass, field
+from typing import Any
 
 import httpx
 
 from autonomous_discovery.config import LLMConfig
+from autonomous_discovery.conjecture_generator.cache import ResponseCache, ResponseCacheMissError
 from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
 from autonomous_discovery.gap_detector.analogical import GapCandidate
+from autonomous_discovery.instrumentation import traced
+from autonomous_discovery.novelty_checker.canonical import canonical_keys
 
 logger = logging.getLogger(__name__)
 
@@ -31,13 +39,83 @@ _DECL_RE = re.compile(
     r"((?:theorem|lemma)\s+\S+.*?)(?:\s*:=|\s+where\b)",
     re.DOTALL,
 )
+_DECL_START_RE = re.compile(r"theorem|lemma")
+
+
+class _DeclScanner:
+    """Incremental ``_DECL_RE`` search over a growing streamed buffer.
+
+    ``feed`` returns True once the buffer holds a declaration whose first match
+    can no longer change as more text arrives. Scanning resumes at the earliest
+    keyword that could still start a match, so each chunk is not rescanned from
+    the beginning.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._pos = 0
+
+    @property
+    def text(self) -> str:
+        return self._buffer
+
+    def feed(self, chunk: str) -> bool:
+        self._buffer += chunk
+        match = _DECL_RE.search(self._buffer, self._pos)
+        if match is not None:
+            # `where\b` at the very end may still grow into e.g. `whereas`.
+            return not (match.end() == len(self._buffer) and self._buffer.endswith("where"))
+        start = _DECL_START_RE.search(self._buffer, self._pos)
+        # Keep a keyword-sized tail so a keyword split across chunks is still seen.
+        self._pos = start.start() if start else max(self._pos, len(self._buffer) - 6)
+        return False
+
+
+def rank_samples(statements: list[str]) -> list[tuple[str, int]]:
+    """Merge near-duplicate sampled statements and order them by agreement.
+
+    Duplicates are detected on the :func:`canonical_keys` layers the novelty
+    checker uses (normalized text, alpha-renamed binders, bi-implication); a
+    statement joins the earliest group it matches on any layer. Each group keeps
+    its first-seen statement; groups are sorted by vote count, then first
+    appearance.
+    """
+    representatives: list[str] = []
+    votes: list[int] = []
+    groups: dict[tuple[str, str | tuple[str, str]], int] = {}
+    for statement in statements:
+        keys = canonical_keys(statement)
+        layer_keys: list[tuple[str, str | tuple[str, str]]] = [
+            ("normalized", keys.normalized),
+            ("defeq", keys.defeq),
+        ]
+        if keys.bi_implication is not None:
+            layer_keys.append(("bi_implication", keys.bi_implication))
+        matches = [groups[key] for key in layer_keys if key in groups]
+        if matches:
+            votes[min(matches)] += 1
+            continue
+        for key in layer_keys:
+            groups[key] = len(representatives)
+        representatives.append(statement)
+        votes.append(1)
+    order = sorted(range(len(representatives)), key=lambda index: (-votes[index], index))
+    return [(representatives[index], votes[index]) for index in order]
 
 
 @dataclass(frozen=True, slots=True)
 class OllamaConjectureGenerator:
-    """Generate conjectures via Ollama LLM inference."""
+    """Generate conjectures via Ollama LLM inference.
+
+    With a ``cache``, chat responses are looked up and recorded per request
+    according to the cache mode; a replay-only miss counts as a failed request.
+    Sequential requests go through ``client`` when one is given, so a long-lived
+    caller keeps its connection to Ollama open across cycles.
+    """
 
     config: LLMConfig = field(default_factory=LLMConfig)
+    cache: ResponseCache | None = None
+    client: httpx.Client | None = None
 
     def generate(
         self,
@@ -47,21 +125,134 @@ class OllamaConjectureGenerator:
     ) -> list[ConjectureCandidate]:
         if max_candidates <= 0 or not gaps:
             return []
+        if self.config.max_concurrency > 1 or self.config.samples_per_gap > 1:
+            return asyncio.run(self.agenerate(gaps, max_candidates=max_candidates))
+        return list(self.iter_generate(gaps, max_candidates=max_candidates))
 
-        ranked = sorted(
-            gaps,
-            key=lambda g: (-g.score, g.missing_decl, g.source_decl, g.target_family),
-        )
+    def iter_generate(
+        self,
+        gaps: list[GapCandidate],
+        *,
+        max_candidates: int,
+    ) -> Iterator[ConjectureCandidate]:
+        """Yield :meth:`generate`'s candidates as soon as they are available.
 
-        candidates: list[ConjectureCandidate] = []
-        for gap in ranked:
-            if len(candidates) >= max_candidates:
+        Sequential mode yields after each gap; concurrent or sampled mode yields a
+        gap's candidates once it and every higher-ranked gap have completed.
+        """
+        if max_candidates <= 0 or not gaps:
+            return
+        if self.config.max_concurrency > 1 or self.config.samples_per_gap > 1:
+            loop = asyncio.new_event_loop()
+            batches = self.aiter_generate(gaps, max_candidates=max_candidates)
+            try:
+                while True:
+                    try:
+                        batch = loop.run_until_complete(anext(batches))
+                    except StopAsyncIteration:
+                        return
+                    yield from batch
+            finally:
+                loop.run_until_complete(batches.aclose())
+                loop.close()
+
+        produced = 0
+        for gap in self._rank(gaps):
+            if produced >= max_candidates:
                 break
             candidate = self._generate_for_gap(gap)
             if candidate is not None:
-                candidates.append(candidate)
+                produced += 1
+                yield candidate
+
+    async def agenerate(
+        self,
+        gaps: list[GapCandidate],
+        *,
+        max_candidates: int,
+    ) -> list[ConjectureCandidate]:
+        """Concurrent :meth:`generate` over one keep-alive ``httpx.AsyncClient``.
+
+        Gaps are processed in rank-order windows sized to the candidates still
+        needed, with at most ``config.max_concurrency`` requests in flight, so
+        the result and the set of gaps queried match the sequential mode.
+
+        With ``config.samples_per_gap = k > 1`` each gap is sampled by k seeded
+        requests in parallel (at least k in flight). Every parsed statement is
+        kept, near-duplicates are merged with the novelty checker's layers, and
+        a gap's candidates are ordered by how many samples agreed on them. The
+        repair loop only runs when no sample parses.
+        """
+        candidates: list[ConjectureCandidate] = []
+        async for batch in self.aiter_generate(gaps, max_candidates=max_candidates):
+            candidates.extend(batch)
         return candidates
 
+    async def aiter_generate(
+        self,
+        gaps: list[GapCandidate],
+        *,
+        max_candidates: int,
+    ) -> AsyncIterator[list[ConjectureCandidate]]:
+        """Yield :meth:`agenerate`'s candidates gap by gap, in rank order."""
+        if max_candidates <= 0 or not gaps:
+            return
+        if self.config.max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer")
+        if self.config.samples_per_gap <= 0:
+            raise ValueError("samples_per_gap must be a positive integer")
+
+        samples = self.config.samples_per_gap
+        concurrency = max(self.config.max_concurrency, samples)
+        ranked = self._rank(gaps)
+        semaphore = asyncio.Semaphore(concurrency)
+        limits = httpx.Limits(
+            max_connections=concurrency,
+            max_keepalive_connections=concurrency,
+        )
+        produced = 0
+        async with httpx.AsyncClient(
+            base_url=self.config.ollama_base_url,
+            timeout=self.config.timeout,
+            limits=limits,
+        ) as client:
+            position = 0
+            while produced < max_candidates and position < len(ranked):
+                # A sampled gap can yield up to `samples` candidates.
+                needed = max_candidates - produced
+                window = ranked[position : position + math.ceil(needed / samples)]
+                position += len(window)
+                if samples > 1:
+                    tasks = [
+                        asyncio.ensure_future(self._asample_gap(client, semaphore, gap))
+                        for gap in window
+                    ]
+                else:
+                    tasks = [
+                        asyncio.ensure_future(self._agenerate_for_gap(client, semaphore, gap))
+                        for gap in window
+                    ]
+                try:
+                    # Await in rank order so each gap's candidates stream out as soon as
+                    # every higher-ranked gap in the window is done.
+                    for task in tasks:
+                        result = await task
+                        batch = result if isinstance(result, list) else [result]
+                        batch = [c for c in batch if c is not None][: max_candidates - produced]
+                        produced += len(batch)
+                        if batch:
+                            yield batch
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _rank(self, gaps: list[GapCandidate]) -> list[GapCandidate]:
+        return sorted(
+            gaps,
+            key=lambda g: (-g.score, g.missing_decl, g.source_decl, g.target_family),
+        )
+
     def _generate_for_gap(self, gap: GapCandidate) -> ConjectureCandidate | None:
         messages = self._build_messages(gap)
         attempts = 1 + self.config.parse_retries
@@ -70,51 +261,46 @@ class OllamaConjectureGenerator:
             try:
                 content = self._call_ollama(messages)
             except Exception as exc:
-                logger.warning(
-                    "Ollama request failed for %s (attempt %d/%d): %s",
-                    gap.missing_decl,
-                    attempt_idx + 1,
-                    attempts,
-                    exc,
-                )
+                self._log_request_failure(gap, attempt_idx, attempts, exc)
                 continue
 
-            statements = self._parse_lean_statements(content)
-            if statements:
-                return ConjectureCandidate(
-                    gap_missing_decl=gap.missing_decl,
-                    lean_statement=statements[0],
-                    rationale=(
-                        f"LLM-generated conjecture for {gap.missing_decl} "
-                        f"via analogy from {gap.source_decl} to {gap.target_family}."
-                    ),
-                    model_id=self.config.model_name,
-                    temperature=self.config.temperature,
-                    metadata={
-                        "source_decl": gap.source_decl,
-                        "target_family": gap.target_family,
-                        "score": f"{gap.score:.6f}",
-                    },
-                )
+            candidate = self._candidate_from_response(gap, content)
+            if candidate is not None:
+                return candidate
+            self._append_repair_prompt(gap, messages, content, attempt_idx, attempts)
+
+        logger.warning(
+            "Failed to generate conjecture for %s after %d attempts",
+            gap.missing_decl,
+            attempts,
+        )
+        return None
 
-            # Append failed response and repair prompt for retry
-            logger.info(
-                "No parseable Lean statement for %s (attempt %d/%d), retrying",
-                gap.missing_decl,
-                attempt_idx + 1,
-                attempts,
-            )
-            messages.append({"role": "assistant", "content": content})
-            messages.append(
-                {
-                    "role": "user",
-                    "content": (
-                        "Your response did not contain a valid Lean 4 theorem or lemma "
-                        "declaration. Please output ONLY a single theorem/lemma "
-                        "statement with `:= by sorry` proof."
-                    ),
-                }
-            )
+    async def _agenerate_for_gap(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        gap: GapCandidate,
+        *,
+        messages: list[dict[str, str]] | None = None,
+        attempts: int | None = None,
+    ) -> ConjectureCandidate | None:
+        messages = messages if messages is not None else self._build_messages(gap)
+        attempts = attempts if attempts is not None else 1 + self.config.parse_retries
+
+        for attempt_idx in range(attempts):
+            try:
+                # Each retry queues again so one slow gap cannot hog a slot.
+                async with semaphore:
+                    content = await self._acall_ollama(client, messages)
+            except Exception as exc:
+                self._log_request_failure(gap, attempt_idx, attempts, exc)
+                continue
+
+            candidate = self._candidate_from_response(gap, content)
+            if candidate is not None:
+                return candidate
+            self._append_repair_prompt(gap, messages, content, attempt_idx, attempts)
 
         logger.warning(
             "Failed to generate conjecture for %s after %d attempts",
@@ -123,6 +309,120 @@ class OllamaConjectureGenerator:
         )
         return None
 
+    async def _asample_gap(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        gap: GapCandidate,
+    ) -> list[ConjectureCandidate]:
+        messages = self._build_messages(gap)
+        samples = self.config.samples_per_gap
+
+        async def sample(index: int) -> str | None:
+            try:
+                async with semaphore:
+                    return await self._acall_ollama(
+                        client, messages, seed=self.config.seed + index
+                    )
+            except Exception as exc:
+                self._log_request_failure(gap, index, samples, exc)
+                return None
+
+        replies = await asyncio.gather(*(sample(index) for index in range(samples)))
+        statements = [
+            statement
+            for reply in replies
+            if reply is not None
+            for statement in self._parse_lean_statements(reply)
+        ]
+        if statements:
+            return [
+                self._candidate(
+                    gap,
+                    statement,
+                    sample_votes=str(votes),
+                    samples_per_gap=str(samples),
+                )
+                for statement, votes in rank_samples(statements)
+            ]
+
+        failed = next((reply for reply in replies if reply is not None), None)
+        if failed is None or self.config.parse_retries <= 0:
+            logger.warning("No sample for %s produced a Lean statement", gap.missing_decl)
+            return []
+        # Repair from one unparseable sample instead of re-sending the original prompt.
+        self._append_repair_prompt(gap, messages, failed, 0, samples)
+        candidate = await self._agenerate_for_gap(
+            client, semaphore, gap, messages=messages, attempts=self.config.parse_retries
+        )
+        return [candidate] if candidate is not None else []
+
+    def _candidate_from_response(
+        self, gap: GapCandidate, content: str
+    ) -> ConjectureCandidate | None:
+        statements = self._parse_lean_statements(content)
+        if not statements:
+            return None
+        return self._candidate(gap, statements[0])
+
+    def _candidate(
+        self, gap: GapCandidate, statement: str, **extra_metadata: str
+    ) -> ConjectureCandidate:
+        return ConjectureCandidate(
+            gap_missing_decl=gap.missing_decl,
+            lean_statement=statement,
+            rationale=(
+                f"LLM-generated conjecture for {gap.missing_decl} "
+                f"via analogy from {gap.source_decl} to {gap.target_family}."
+            ),
+            model_id=self.config.model_name,
+            temperature=self.config.temperature,
+            metadata={
+                "source_decl": gap.source_decl,
+                "target_family": gap.target_family,
+                "score": f"{gap.score:.6f}",
+                **extra_metadata,
+            },
+        )
+
+    def _log_request_failure(
+        self, gap: GapCandidate, attempt_idx: int, attempts: int, exc: Exception
+    ) -> None:
+        logger.warning(
+            "Ollama request failed for %s (attempt %d/%d): %s",
+            gap.missing_decl,
+            attempt_idx + 1,
+            attempts,
+            exc,
+        )
+
+    def _append_repair_prompt(
+        self,
+        gap: GapCandidate,
+        messages: list[dict[str, str]],
+        content: str,
+        attempt_idx: int,
+        attempts: int,
+    ) -> None:
+        # Append failed response and repair prompt for retry
+        logger.info(
+            "No parseable Lean statement for %s (attempt %d/%d), retrying",
+            gap.missing_decl,
+            attempt_idx + 1,
+            attempts,
+        )
+        messages.append({"role": "assistant", "content": content})
+        messages.append(
+            {
+                "role": "user",
+                "content": (
+                    "Your response did not contain a valid Lean 4 theorem or lemma "
+                    "declaration. Please output ONLY a single theorem/lemma "
+                    "statement with `:= by sorry` proof."
+                ),
+            }
+        )
+
     def _build_messages(self, gap: GapCandidate) -> list[dict[str, str]]:
         user_content = (
             f"Generate a Lean 4 theorem statement for the missing declaration: "
@@ -143,23 +443,113 @@ class OllamaConjectureGenerator:
             {"role": "user", "content": user_content},
         ]
 
+    @traced("conjecture_generator.llm_request")
     def _call_ollama(self, messages: list[dict[str, str]]) -> str:
-        payload = {
-            "model": self.config.model_name,
-            "messages": messages,
-            "stream": False,
-            "options": {
-                "temperature": self.config.temperature,
-                "num_predict": self.config.max_tokens,
-            },
-        }
-        response = httpx.post(
+        key = self._cache_key(messages)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+        if self.config.stream:
+            return self._record_response(key, self._call_ollama_streaming(messages))
+        post = self.client.post if self.client is not None else httpx.post
+        response = post(
             f"{self.config.ollama_base_url}/api/chat",
-            json=payload,
+            json=self._chat_payload(messages),
             timeout=self.config.timeout,
         )
         response.raise_for_status()
-        data = response.json()
+        return self._record_response(key, self._response_content(response.json()))
+
+    def _call_ollama_streaming(self, messages: list[dict[str, str]]) -> str:
+        scanner = _DeclScanner()
+        stream = self.client.stream if self.client is not None else httpx.stream
+        with stream(
+            "POST",
+            f"{self.config.ollama_base_url}/api/chat",
+            json=self._chat_payload(messages),
+            timeout=self.config.timeout,
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                # Leaving the block closes the connection, which stops generation.
+                if self._feed_stream_line(scanner, line):
+                    break
+        return scanner.text
+
+    @traced("conjecture_generator.llm_request")
+    async def _acall_ollama(
+        self,
+        client: httpx.AsyncClient,
+        messages: list[dict[str, str]],
+        *,
+        seed: int | None = None,
+    ) -> str:
+        key = self._cache_key(messages, seed=seed)
+        payload = self._chat_payload(messages, seed=seed)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+        if self.config.stream:
+            scanner = _DeclScanner()
+            async with client.stream("POST", "/api/chat", json=payload) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if self._feed_stream_line(scanner, line):
+                        break
+            return self._record_response(key, scanner.text)
+        response = await client.post("/api/chat", json=payload)
+        response.raise_for_status()
+        return self._record_response(key, self._response_content(response.json()))
+
+    def _feed_stream_line(self, scanner: _DeclScanner, line: str) -> bool:
+        """Consume one NDJSON chunk; return True when reading can stop."""
+        if not line.strip():
+            return False
+        data = json.loads(line)
+        if isinstance(data, dict) and data.get("error"):
+            raise ValueError(f"Ollama stream error: {data['error']}")
+        done = bool(isinstance(data, dict) and data.get("done"))
+        content = "" if done and "message" not in data else self._response_content(data)
+        return scanner.feed(content) or done
+
+    def _cache_key(self, messages: list[dict[str, str]], *, seed: int | None = None) -> str | None:
+        if self.cache is None:
+            return None
+        return self.cache.key_for(self.config.model_name, self._chat_options(seed), messages)
+
+    def _cached_response(self, key: str | None) -> str | None:
+        if self.cache is None or key is None:
+            return None
+        cached = self.cache.get(key) if self.cache.reads else None
+        if cached is None and not self.cache.writes:
+            raise ResponseCacheMissError(f"No recorded Ollama response for request {key[:12]}")
+        return cached
+
+    def _record_response(self, key: str | None, content: str) -> str:
+        if self.cache is not None and key is not None and self.cache.writes:
+            self.cache.put(key, content)
+        return content
+
+    def _chat_options(self, seed: int | None = None) -> dict[str, Any]:
+        options: dict[str, Any] = {
+            "temperature": self.config.temperature,
+            "num_predict": self.config.max_tokens,
+        }
+        if seed is not None:
+            options["seed"] = seed
+        return options
+
+    def _chat_payload(
+        self, messages: list[dict[str, str]], *, seed: int | None = None
+    ) -> dict[str, Any]:
+        return {
+            "model": self.config.model_name,
+            "messages": messages,
+            "stream": self.config.stream,
+            "options": self._chat_options(seed),
+        }
+
+    def _response_content(self, data: Any) -> str:
         try:
             return data["message"]["content"]
         except (KeyError, TypeError) as exc:
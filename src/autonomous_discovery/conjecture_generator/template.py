@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 
 from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
@@ -22,15 +23,23 @@ class TemplateConjectureGenerator:
         *,
         max_candidates: int,
     ) -> list[ConjectureCandidate]:
+        return list(self.iter_generate(gaps, max_candidates=max_candidates))
+
+    def iter_generate(
+        self,
+        gaps: list[GapCandidate],
+        *,
+        max_candidates: int,
+    ) -> Iterator[ConjectureCandidate]:
+        """Yield :meth:`generate`'s candidates one at a time."""
         if max_candidates <= 0:
-            return []
+            return
 
         ranked = sorted(
             gaps,
             key=lambda gap: (-gap.score, gap.missing_decl, gap.source_decl, gap.target_family),
         )
 
-        candidates: list[ConjectureCandidate] = []
         for gap in ranked[:max_candidates]:
             theorem_name = self._safe_theorem_name(gap.missing_decl)
             rationale = (
@@ -45,19 +54,15 @@ class TemplateConjectureGenerator:
             for signal_name, signal_value in sorted(gap.signals.items()):
                 metadata[f"signal_{signal_name}"] = f"{signal_value:.6f}"
 
-            candidates.append(
-                ConjectureCandidate(
-                    gap_missing_decl=gap.missing_decl,
-                    lean_statement=f"theorem {theorem_name} : True",
-                    rationale=rationale,
-                    model_id=self.model_id,
-                    temperature=self.temperature,
-                    metadata=metadata,
-                )
+            yield ConjectureCandidate(
+                gap_missing_decl=gap.missing_decl,
+                lean_statement=f"theorem {theorem_name} : True",
+                rationale=rationale,
+                model_id=self.model_id,
+                temperature=self.temperature,
+                metadata=metadata,
             )
 
-        return candidates
-
     def _safe_theorem_name(self, missing_decl: str) -> str:
         if "\n" in missing_decl or "\r" in missing_decl:
             raise ValueError("missing_decl contains newline characters")
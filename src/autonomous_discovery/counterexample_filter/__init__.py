@@ -1,8 +1,27 @@
 """Counterexample filters for pruning likely-false conjectures."""
 
-from autonomous_discovery.counterexample_filter.basic import (
-    BasicCounterexampleFilter,
-    FilterDecision,
+from autonomous_discovery.counterexample_filter.basic import BasicCounterexampleFilter
+from autonomous_discovery.counterexample_filter.chain import ChainedCounterexampleFilter
+from autonomous_discovery.counterexample_filter.models import FilterDecision
+from autonomous_discovery.counterexample_filter.numeric import (
+    NumericCounterexampleFilter,
+    search_counterexample,
+)
+from autonomous_discovery.counterexample_filter.rules import (
+    DEFAULT_FILTER_RULES,
+    FilterRule,
+    RuleSetCounterexampleFilter,
+    load_filter_rules,
 )
 
-__all__ = ["BasicCounterexampleFilter", "FilterDecision"]
+__all__ = [
+    "DEFAULT_FILTER_RULES",
+    "BasicCounterexampleFilter",
+    "ChainedCounterexampleFilter",
+    "FilterDecision",
+    "FilterRule",
+    "NumericCounterexampleFilter",
+    "RuleSetCounterexampleFilter",
+    "load_filter_rules",
+    "search_counterexample",
+]
@@ -2,18 +2,14 @@
 
 from __future__ import annotations
 
-import re
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
+from autonomous_discovery.counterexample_filter.models import FilterDecision
+from autonomous_discovery.counterexample_filter.rules import RuleSetCounterexampleFilter
 
-
-@dataclass(frozen=True, slots=True)
-class FilterDecision:
-    """Result of filtering a conjecture before proof attempts."""
-
-    accepted: bool
-    reason: str
+_DEFAULT_RULE_SET = RuleSetCounterexampleFilter()
 
 
 @dataclass(frozen=True, slots=True)
@@ -21,9 +17,7 @@ class BasicCounterexampleFilter:
     """Cheap string-based guardrails before expensive verification."""
 
     def evaluate(self, conjecture: ConjectureCandidate) -> FilterDecision:
-        statement = conjecture.lean_statement.lower()
-        if re.search(r":\s*false\b", statement):
-            return FilterDecision(accepted=False, reason="contains_false_literal")
-        if re.search(r"\b1\s*=\s*0\b|\b0\s*=\s*1\b", statement):
-            return FilterDecision(accepted=False, reason="contains_obvious_contradiction")
-        return FilterDecision(accepted=True, reason="passed_basic_checks")
+        return _DEFAULT_RULE_SET.evaluate(conjecture)
+
+    def evaluate_batch(self, conjectures: Iterable[ConjectureCandidate]) -> list[FilterDecision]:
+        return _DEFAULT_RULE_SET.evaluate_batch(conjectures)
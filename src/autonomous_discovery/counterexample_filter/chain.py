@@ -0,0 +1,59 @@
+"""Compose counterexample filters into one staged filter."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
+from autonomous_discovery.counterexample_filter.models import FilterDecision
+
+
+@dataclass(frozen=True, slots=True)
+class ChainedCounterexampleFilter:
+    """Run filters in order; the first rejection wins.
+
+    Cheap filters should come first: in ``evaluate_batch`` each stage only sees
+    the conjectures every earlier stage accepted, using the stage's own
+    ``evaluate_batch`` when it has one. Accepted conjectures carry the last
+    stage's decision.
+    """
+
+    filters: Sequence[Any]
+
+    def __post_init__(self) -> None:
+        if not self.filters:
+            raise ValueError("filters must not be empty")
+
+    def close(self) -> None:
+        """Release the resources (e.g. worker processes) held by stages that have any."""
+        for stage in self.filters:
+            if hasattr(stage, "close"):
+                stage.close()
+
+    def evaluate(self, conjecture: ConjectureCandidate) -> FilterDecision:
+        decision = FilterDecision(accepted=True, reason="")
+        for stage in self.filters:
+            decision = stage.evaluate(conjecture)
+            if not decision.accepted:
+                break
+        return decision
+
+    def evaluate_batch(self, conjectures: Iterable[ConjectureCandidate]) -> list[FilterDecision]:
+        """Decisions for ``conjectures``, in input order."""
+        items = list(conjectures)
+        decisions = [FilterDecision(accepted=True, reason="")] * len(items)
+        pending = list(range(len(items)))
+        for stage in self.filters:
+            if not pending:
+                break
+            batch = [items[index] for index in pending]
+            if hasattr(stage, "evaluate_batch"):
+                stage_decisions = list(stage.evaluate_batch(batch))
+            else:
+                stage_decisions = [stage.evaluate(conjecture) for conjecture in batch]
+            for index, decision in zip(pending, stage_decisions, strict=True):
+                decisions[index] = decision
+            pending = [index for index in pending if decisions[index].accepted]
+        return decisions
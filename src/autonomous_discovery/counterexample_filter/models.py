@@ -0,0 +1,13 @@
+"""Data models for counterexample filtering."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class FilterDecision:
+    """Result of filtering a conjecture before proof attempts."""
+
+    accepted: bool
+    reason: str
@@ -0,0 +1,618 @@
+"""Numeric counterexample search for equational conjectures over small finite models.
+
+A statement such as ``theorem T (R : Type*) [Ring R] (a b : R) : a * b = b * a``
+is parsed into an expression tree and evaluated on every (or a sampled set of)
+variable assignments in a few small structures that satisfy the binder's class:
+ℤ/nℤ, 2x2 matrices over ℤ/nℤ and the symmetric group S3. Elements are table
+indices, so each operation is one NumPy gather over all assignments at once.
+
+Only single equations between terms built from variables, numerals, ``+``,
+``-``, ``*``, ``/``, ``⁻¹`` and ``^`` with a numeral exponent are checked;
+anything else (hypotheses, function symbols, unknown classes) is left to Lean.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import multiprocessing
+import re
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache, partial
+
+import numpy as np
+import numpy.typing as npt
+
+from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
+from autonomous_discovery.counterexample_filter.models import FilterDecision
+
+logger = logging.getLogger(__name__)
+
+Elements = npt.NDArray[np.int64]
+
+NUMERIC_REJECT_REASON = "numeric_counterexample"
+NUMERIC_PASS_REASON = "passed_numeric_checks"
+NUMERIC_UNCHECKED_REASON = "numeric_unchecked"
+# Smaller batches finish sooner in-process than after a round trip to the workers.
+PARALLEL_MIN_BATCH = 4
+
+
+# --- Finite structures -------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class FiniteStructure:
+    """Operation tables over elements ``0 .. size - 1``; ``None`` marks a missing op."""
+
+    name: str
+    labels: tuple[str, ...]
+    add: Elements | None = None
+    mul: Elements | None = None
+    neg: Elements | None = None
+    inv: Elements | None = None
+    zero: int | None = None
+    one: int | None = None
+
+    @property
+    def size(self) -> int:
+        return len(self.labels)
+
+
+def _zmod(n: int, *, field: bool = False) -> FiniteStructure:
+    elements = np.arange(n, dtype=np.int64)
+    inv = None
+    if field:
+        # Lean's convention for fields: 0⁻¹ = 0.
+        inv = np.array([pow(int(a), n - 2, n) if a else 0 for a in elements], dtype=np.int64)
+    return FiniteStructure(
+        name=f"ZMod {n}",
+        labels=tuple(str(a) for a in range(n)),
+        add=(elements[:, None] + elements[None, :]) % n,
+        mul=(elements[:, None] * elements[None, :]) % n,
+        neg=(-elements) % n,
+        inv=inv,
+        zero=0,
+        one=1 % n,
+    )
+
+
+def _matrix2(n: int) -> FiniteStructure:
+    entries = np.array(list(itertools.product(range(n), repeat=4)), dtype=np.int64)
+    index = {tuple(int(x) for x in row): i for i, row in enumerate(entries)}
+
+    def encode(rows: npt.NDArray[np.int64]) -> Elements:
+        weights = n ** np.arange(3, -1, -1, dtype=np.int64)
+        return ((rows % n) * weights).sum(axis=-1)
+
+    a, b, c, d = (entries[:, k] for k in range(4))
+    product = np.stack(
+        [
+            a[:, None] * a[None, :] + b[:, None] * c[None, :],
+            a[:, None] * b[None, :] + b[:, None] * d[None, :],
+            c[:, None] * a[None, :] + d[:, None] * c[None, :],
+            c[:, None] * b[None, :] + d[:, None] * d[None, :],
+        ],
+        axis=-1,
+    )
+    return FiniteStructure(
+        name=f"Matrix (Fin 2) (Fin 2) (ZMod {n})",
+        labels=tuple(f"!![{r[0]}, {r[1]}; {r[2]}, {r[3]}]" for r in entries.tolist()),
+        add=encode(entries[:, None, :] + entries[None, :, :]),
+        mul=encode(product),
+        neg=encode(-entries),
+        zero=index[(0, 0, 0, 0)],
+        one=index[(1, 0, 0, 1)],
+    )
+
+
+def _symmetric3() -> FiniteStructure:
+    perms = list(itertools.permutations(range(3)))
+    index = {perm: i for i, perm in enumerate(perms)}
+    compose = np.array(
+        [[index[tuple(p[q[i]] for i in range(3))] for q in perms] for p in perms],
+        dtype=np.int64,
+    )
+    inverse = np.array(
+        [index[tuple(sorted(range(3), key=p.__getitem__))] for p in perms], dtype=np.int64
+    )
+    return FiniteStructure(
+        name="Equiv.Perm (Fin 3)",
+        labels=tuple(str(list(p)) for p in perms),
+        mul=compose,
+        inv=inverse,
+        one=index[(0, 1, 2)],
+    )
+
+
+def _multiplicative(structure: FiniteStructure, *, with_inverse: bool) -> FiniteStructure:
+    """Group view of an additive structure: ``*`` is ``+``, ``⁻¹`` is ``-``, ``1`` is ``0``."""
+    return FiniteStructure(
+        name=f"Multiplicative ({structure.name})",
+        labels=structure.labels,
+        mul=structure.add,
+        inv=structure.neg if with_inverse else None,
+        one=structure.zero,
+    )
+
+
+def _additive(structure: FiniteStructure) -> FiniteStructure:
+    """Additive view of a multiplicative group: ``+`` is ``*``, ``-`` is ``⁻¹``, ``0`` is ``1``."""
+    return FiniteStructure(
+        name=f"Additive ({structure.name})",
+        labels=structure.labels,
+        add=structure.mul,
+        neg=structure.inv,
+        zero=structure.one,
+    )
+
+
+def _restrict(structure: FiniteStructure, *ops: str) -> FiniteStructure:
+    kept = {op: getattr(structure, op) for op in ("add", "mul", "neg", "inv", "zero", "one")}
+    return FiniteStructure(
+        name=structure.name,
+        labels=structure.labels,
+        **{op: value if op in ops else None for op, value in kept.items()},
+    )
+
+
+_SMALL_MODULI = (2, 3, 4, 5, 6)
+_PRIMES = (2, 3, 5, 7)
+
+
+@cache
+def structures_for(class_name: str) -> tuple[FiniteStructure, ...]:
+    """Small models of ``class_name`` (empty when the class is not supported)."""
+    zmods = tuple(_zmod(n) for n in _SMALL_MODULI)
+    s3 = _symmetric3()
+    ring_ops = ("add", "mul", "neg", "zero", "one")
+    semiring_ops = ("add", "mul", "zero", "one")
+    if class_name == "CommRing":
+        return zmods
+    if class_name == "Ring":
+        return (*zmods, _matrix2(2), _matrix2(3))
+    if class_name == "CommSemiring":
+        return tuple(_restrict(s, *semiring_ops) for s in zmods)
+    if class_name == "Semiring":
+        return tuple(_restrict(s, *semiring_ops) for s in (*zmods, _matrix2(2)))
+    if class_name in ("Field", "DivisionRing"):
+        return tuple(_restrict(_zmod(p, field=True), *ring_ops, "inv") for p in _PRIMES)
+    if class_name == "CommGroup":
+        return tuple(_multiplicative(s, with_inverse=True) for s in zmods)
+    if class_name == "Group":
+        return (*(_multiplicative(s, with_inverse=True) for s in zmods), s3)
+    if class_name == "CommMonoid":
+        return tuple(_restrict(s, "mul", "one") for s in zmods)
+    if class_name == "Monoid":
+        return (
+            *(_restrict(s, "mul", "one") for s in zmods),
+            _restrict(s3, "mul", "one"),
+            _restrict(_matrix2(2), "mul", "one"),
+        )
+    if class_name == "AddCommGroup":
+        return tuple(_restrict(s, "add", "neg", "zero") for s in zmods)
+    if class_name == "AddGroup":
+        return (*(_restrict(s, "add", "neg", "zero") for s in zmods), _additive(s3))
+    if class_name == "AddCommMonoid":
+        return tuple(_restrict(s, "add", "zero") for s in zmods)
+    if class_name == "AddMonoid":
+        return (
+            *(_restrict(s, "add", "zero") for s in zmods),
+            _restrict(_additive(s3), "add", "zero"),
+        )
+    return ()
+
+
+# Extra class binders that every structure above satisfies.
+_NEUTRAL_CLASSES = frozenset({"DecidableEq", "Fintype", "Finite", "Nontrivial", "Inhabited"})
+
+
+# --- Statement parsing ---------------------------------------------------------
+
+
+class UnsupportedStatementError(ValueError):
+    """Raised when a statement is outside the checkable equational fragment."""
+
+
+@dataclass(frozen=True, slots=True)
+class Expr:
+    """Expression tree node: ``op`` is ``var``/``num`` or an operator name."""
+
+    op: str
+    args: tuple[Expr, ...] = ()
+    value: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Equation:
+    class_name: str
+    variables: tuple[str, ...]
+    lhs: Expr
+    rhs: Expr
+
+
+_TOKEN_RE = re.compile(r"\s*(⁻¹|\d+|[^\W\d][\w'₀-₉]*|[-+*/^()=])")
+_BINDER_RE = re.compile(r"\s*([(\[{⦃])")
+_CLOSERS = {"(": ")", "[": "]", "{": "}", "⦃": "⦄"}
+_TYPE_RE = re.compile(r"^(?:Type\*|Type _|Type\s+\w+|Type|Sort\*|Sort _)$")
+_PLAIN_FORALL_RE = re.compile(r"\s*([^,:()\[\]{}]+?)\s*:\s*([^,]+?)\s*,")
+_IDENT_RE = re.compile(r"^[^\W\d][\w'₀-₉]*$")
+
+
+def _matching(text: str, start: int) -> int:
+    """Index of the bracket closing the one at ``start``."""
+    depth = 0
+    for index in range(start, len(text)):
+        if text[index] in _CLOSERS:
+            depth += 1
+        elif text[index] in _CLOSERS.values():
+            depth -= 1
+            if depth == 0:
+                return index
+    raise UnsupportedStatementError("unbalanced brackets")
+
+
+def _split_binders(text: str) -> tuple[list[tuple[str, str]], str]:
+    """Split leading bracketed binders off ``text``; returns (binders, rest)."""
+    binders: list[tuple[str, str]] = []
+    position = 0
+    while match := _BINDER_RE.match(text, position):
+        end = _matching(text, match.start(1))
+        binders.append((match.group(1), text[match.end(1) : end].strip()))
+        position = end + 1
+    return binders, text[position:].strip()
+
+
+def parse_equation(statement: str) -> Equation:
+    """Parse ``theorem name binders : [∀ binders,] lhs = rhs`` into an :class:`Equation`."""
+    head = re.match(r"\s*(?:theorem|lemma)\s+\S+", statement)
+    if head is None:
+        raise UnsupportedStatementError("not a theorem declaration")
+    binders, rest = _split_binders(statement[head.end() :])
+    if not rest.startswith(":"):
+        raise UnsupportedStatementError("missing statement type")
+    conclusion = rest[1:].split(":=", 1)[0].strip()
+    if conclusion.startswith("∀"):
+        forall_binders, tail = _split_binders(conclusion[1:])
+        if not forall_binders and (plain := _PLAIN_FORALL_RE.match(tail)):
+            forall_binders = [("(", f"{plain.group(1)} : {plain.group(2)}")]
+            tail = tail[plain.end() - 1 :]
+        if not forall_binders or not tail.startswith(","):
+            raise UnsupportedStatementError("unsupported ∀ binder form")
+        binders += forall_binders
+        conclusion = tail[1:].strip()
+
+    carrier: str | None = None
+    class_name: str | None = None
+    variables: list[str] = []
+    typed: list[tuple[list[str], str]] = []
+    for bracket, body in binders:
+        if bracket == "[":
+            words = body.split(":", 1)[-1].split()
+            if len(words) != 2:
+                raise UnsupportedStatementError(f"unsupported instance binder: {body}")
+            cls, target = words
+            if cls in _NEUTRAL_CLASSES:
+                continue
+            if class_name is not None or not structures_for(cls):
+                raise UnsupportedStatementError(f"unsupported class: {cls}")
+            class_name, carrier = cls, target
+            continue
+        names, sep, type_text = body.partition(":")
+        if not sep:
+            raise UnsupportedStatementError(f"untyped binder: {body}")
+        typed.append((names.split(), type_text.strip()))
+    if class_name is None or carrier is None:
+        raise UnsupportedStatementError("no supported algebraic class binder")
+    for names, type_text in typed:
+        if _TYPE_RE.match(type_text) and names == [carrier]:
+            continue
+        if type_text != carrier:
+            raise UnsupportedStatementError(f"unsupported binder type: {type_text}")
+        for name in names:
+            if not _IDENT_RE.match(name):
+                raise UnsupportedStatementError(f"unsupported binder name: {name}")
+            variables.append(name)
+
+    parser = _ExprParser(conclusion, frozenset(variables))
+    lhs = parser.parse_sum()
+    parser.expect("=")
+    rhs = parser.parse_sum()
+    parser.expect_end()
+    return Equation(class_name=class_name, variables=tuple(variables), lhs=lhs, rhs=rhs)
+
+
+class _ExprParser:
+    """Precedence climbing with Lean's levels: ``+ -`` < ``* /`` < unary ``-`` < ``^`` < ``⁻¹``."""
+
+    def __init__(self, text: str, variables: frozenset[str]) -> None:
+        self.tokens: list[str] = []
+        position = 0
+        while position < len(text):
+            match = _TOKEN_RE.match(text, position)
+            if match is None:
+                if text[position:].strip():
+                    raise UnsupportedStatementError(f"unsupported syntax: {text[position:]!r}")
+                break
+            self.tokens.append(match.group(1))
+            position = match.end()
+        self.position = 0
+        self.variables = variables
+
+    def peek(self) -> str | None:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def take(self) -> str:
+        token = self.peek()
+        if token is None:
+            raise UnsupportedStatementError("unexpected end of statement")
+        self.position += 1
+        return token
+
+    def expect(self, token: str) -> None:
+        if self.take() != token:
+            raise UnsupportedStatementError(f"expected {token!r}")
+
+    def expect_end(self) -> None:
+        if self.peek() is not None:
+            raise UnsupportedStatementError(f"unexpected token {self.peek()!r}")
+
+    def parse_sum(self) -> Expr:
+        node = self.parse_product()
+        while self.peek() in ("+", "-"):
+            op = "add" if self.take() == "+" else "sub"
+            node = Expr(op, (node, self.parse_product()))
+        return node
+
+    def parse_product(self) -> Expr:
+        node = self.parse_unary()
+        while self.peek() in ("*", "/"):
+            op = "mul" if self.take() == "*" else "div"
+            node = Expr(op, (node, self.parse_unary()))
+        return node
+
+    def parse_unary(self) -> Expr:
+        if self.peek() == "-":
+            self.take()
+            return Expr("neg", (self.parse_unary(),))
+        return self.parse_power()
+
+    def parse_power(self) -> Expr:
+        base = self.parse_postfix()
+        if self.peek() != "^":
+            return base
+        self.take()
+        exponent = self.take()
+        if not exponent.isdigit():
+            raise UnsupportedStatementError("only numeral exponents are supported")
+        return Expr("pow", (base,), exponent)
+
+    def parse_postfix(self) -> Expr:
+        node = self.parse_atom()
+        while self.peek() == "⁻¹":
+            self.take()
+            node = Expr("inv", (node,))
+        return node
+
+    def parse_atom(self) -> Expr:
+        token = self.take()
+        if token == "(":
+            node = self.parse_sum()
+            self.expect(")")
+            return node
+        if token.isdigit():
+            return Expr("num", value=token)
+        if token in self.variables:
+            return Expr("var", value=token)
+        raise UnsupportedStatementError(f"unsupported term: {token}")
+
+
+# --- Evaluation --------------------------------------------------------------
+
+
+def _evaluate(
+    node: Expr, structure: FiniteStructure, env: dict[str, Elements], rows: int
+) -> Elements:
+    def table(name: str) -> Elements:
+        value = getattr(structure, name)
+        if value is None:
+            raise UnsupportedStatementError(f"{structure.name} has no {name}")
+        return value
+
+    def constant(index: int | None, label: str) -> Elements:
+        if index is None:
+            raise UnsupportedStatementError(f"{structure.name} has no {label}")
+        return np.full(rows, index, dtype=np.int64)
+
+    def numeral(value: int) -> Elements:
+        if value == 0:
+            return constant(structure.zero, "0")
+        if value == 1:
+            return constant(structure.one, "1")
+        add = table("add")
+        acc = structure.one
+        for _ in range(value - 1):
+            acc = int(add[acc, structure.one])
+        return constant(acc, "1")
+
+    def power(base: Elements, exponent: int) -> Elements:
+        mul = table("mul")
+        result = constant(structure.one, "1")
+        square = base
+        while exponent:
+            if exponent & 1:
+                result = mul[result, square]
+            square = mul[square, square]
+            exponent >>= 1
+        return result
+
+    def walk(expr: Expr) -> Elements:
+        op = expr.op
+        if op == "var":
+            return env[expr.value]
+        if op == "num":
+            return numeral(int(expr.value))
+        args = [walk(arg) for arg in expr.args]
+        if op == "add":
+            return table("add")[args[0], args[1]]
+        if op == "mul":
+            return table("mul")[args[0], args[1]]
+        if op == "neg":
+            return table("neg")[args[0]]
+        if op == "inv":
+            return table("inv")[args[0]]
+        if op == "sub":
+            return table("add")[args[0], table("neg")[args[1]]]
+        if op == "div":
+            return table("mul")[args[0], table("inv")[args[1]]]
+        if op == "pow":
+            return power(args[0], int(expr.value))
+        raise UnsupportedStatementError(f"unknown operator {op}")
+
+    return walk(node)
+
+
+def _assignments(size: int, arity: int, max_assignments: int) -> npt.NDArray[np.int64]:
+    if arity == 0:
+        return np.zeros((1, 0), dtype=np.int64)
+    total = size**arity
+    if total <= max_assignments:
+        grids = np.meshgrid(*([np.arange(size, dtype=np.int64)] * arity), indexing="ij")
+        return np.stack([grid.ravel() for grid in grids], axis=1)
+    rng = np.random.default_rng(size * 1_000 + arity)
+    return rng.integers(0, size, size=(max_assignments, arity), dtype=np.int64)
+
+
+@dataclass(frozen=True, slots=True)
+class NumericCheck:
+    """Outcome of a search: ``falsified``, ``survived``, ``unsupported`` or ``timeout``."""
+
+    status: str
+    detail: str = ""
+
+
+def search_counterexample(
+    statement: str,
+    *,
+    time_budget_s: float = 1.0,
+    max_assignments: int = 20_000,
+) -> NumericCheck:
+    """Look for a falsifying assignment of ``statement`` in small finite models."""
+    started = time.monotonic()
+    try:
+        equation = parse_equation(statement)
+    except UnsupportedStatementError as exc:
+        return NumericCheck(status="unsupported", detail=str(exc))
+    checked = 0
+    for structure in structures_for(equation.class_name):
+        if time.monotonic() - started > time_budget_s:
+            return NumericCheck(status="timeout", detail=f"checked {checked} structures")
+        grid = _assignments(structure.size, len(equation.variables), max_assignments)
+        env = {name: grid[:, i] for i, name in enumerate(equation.variables)}
+        try:
+            lhs = _evaluate(equation.lhs, structure, env, len(grid))
+            rhs = _evaluate(equation.rhs, structure, env, len(grid))
+        except UnsupportedStatementError:
+            continue
+        checked += 1
+        mismatches = np.flatnonzero(lhs != rhs)
+        if mismatches.size:
+            row = grid[mismatches[0]]
+            assignment = ", ".join(
+                f"{name} := {structure.labels[int(row[i])]}"
+                for i, name in enumerate(equation.variables)
+            )
+            return NumericCheck(status="falsified", detail=f"{structure.name}: {assignment}")
+    if checked == 0:
+        return NumericCheck(status="unsupported", detail="no structure supports the operations")
+    return NumericCheck(status="survived", detail=f"checked {checked} structures")
+
+
+@dataclass(frozen=True, slots=True)
+class NumericCounterexampleFilter:
+    """Reject equational conjectures falsified on a small finite model.
+
+    Batches of at least ``PARALLEL_MIN_BATCH`` statements are searched in a
+    process pool of ``max_workers`` processes, started on first use and kept
+    until :meth:`close`. Workers come from a fork server, since the pool may be
+    started from a pipeline stage thread while other threads hold locks; smaller
+    batches (or ``max_workers <= 1``) are searched in-process. Each search stops
+    once it has spent ``time_budget_s`` and the conjecture is then accepted, as
+    are statements outside the supported fragment.
+    """
+
+    max_workers: int = 4
+    time_budget_s: float = 1.0
+    max_assignments: int = 20_000
+
+    _pool: ProcessPoolExecutor | None = field(init=False, default=None, repr=False, compare=False)
+    _pool_lock: threading.Lock = field(
+        init=False, default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.time_budget_s <= 0:
+            raise ValueError("time_budget_s must be positive")
+        if self.max_assignments <= 0:
+            raise ValueError("max_assignments must be a positive integer")
+
+    def __enter__(self) -> NumericCounterexampleFilter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def evaluate(self, conjecture: ConjectureCandidate) -> FilterDecision:
+        return self._decision(conjecture, self._search(conjecture.lean_statement))
+
+    def evaluate_batch(self, conjectures: Iterable[ConjectureCandidate]) -> list[FilterDecision]:
+        """Decisions for ``conjectures``, in input order."""
+        items = list(conjectures)
+        statements = [conjecture.lean_statement for conjecture in items]
+        if self.max_workers <= 1 or len(items) < PARALLEL_MIN_BATCH:
+            checks = [self._search(statement) for statement in statements]
+        else:
+            search = partial(
+                search_counterexample,
+                time_budget_s=self.time_budget_s,
+                max_assignments=self.max_assignments,
+            )
+            checks = list(self._process_pool().map(search, statements))
+        return [self._decision(c, check) for c, check in zip(items, checks, strict=True)]
+
+    def close(self) -> None:
+        """Shut down the worker processes; a later batch starts a new pool."""
+        with self._pool_lock:
+            pool = self._pool
+            object.__setattr__(self, "_pool", None)
+        if pool is not None:
+            pool.shutdown()
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("forkserver"),
+                )
+                object.__setattr__(self, "_pool", pool)
+            return self._pool
+
+    def _search(self, statement: str) -> NumericCheck:
+        return search_counterexample(
+            statement, time_budget_s=self.time_budget_s, max_assignments=self.max_assignments
+        )
+
+    @staticmethod
+    def _decision(conjecture: ConjectureCandidate, check: NumericCheck) -> FilterDecision:
+        if check.status == "falsified":
+            logger.info(
+                "Numeric counterexample for %s: %s", conjecture.gap_missing_decl, check.detail
+            )
+            return FilterDecision(accepted=False, reason=NUMERIC_REJECT_REASON)
+        if check.status == "survived":
+            return FilterDecision(accepted=True, reason=NUMERIC_PASS_REASON)
+        return FilterDecision(accepted=True, reason=NUMERIC_UNCHECKED_REASON)
@@ -0,0 +1,133 @@
+"""Rule-set counterexample filter compiled into a single regex scan."""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
+from autonomous_discovery.counterexample_filter.models import FilterDecision
+
+
+@dataclass(frozen=True, slots=True)
+class FilterRule:
+    """Reject statements whose lowercased text matches ``pattern``; ``name`` is the reason."""
+
+    name: str
+    pattern: str
+
+
+DEFAULT_FILTER_RULES: tuple[FilterRule, ...] = (
+    FilterRule("contains_false_literal", r":\s*false\b"),
+    FilterRule("contains_obvious_contradiction", r"\b1\s*=\s*0\b|\b0\s*=\s*1\b"),
+)
+
+PASS_REASON = "passed_basic_checks"
+
+# Backreferences (``\1``, ``(?P=name)``) and conditionals (``(?(1)...)``) refer
+# to group numbers or names that shift inside the combined alternation.
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+def load_filter_rules(path: Path) -> tuple[FilterRule, ...]:
+    """Read rules from a JSON list of ``{"name": ..., "pattern": ...}`` objects."""
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(raw, list):
+        raise ValueError("filter rules file must contain a JSON list")
+    rules: list[FilterRule] = []
+    for entry in raw:
+        if not isinstance(entry, dict):
+            raise ValueError("filter rules must be JSON objects")
+        try:
+            rules.append(FilterRule(name=str(entry["name"]), pattern=str(entry["pattern"])))
+        except KeyError as exc:
+            raise ValueError(f"Missing required field in filter rule: {exc}") from exc
+    return tuple(rules)
+
+
+@dataclass(frozen=True, slots=True)
+class RuleSetCounterexampleFilter:
+    """Apply an ordered rule set with one combined alternation scan per statement.
+
+    All rules are compiled once into ``(?P<r0>...)|(?P<r1>...)|...``, so an
+    accepted statement costs a single regex pass however many rules there are.
+    When the scan hits, only the rules ranked above the hit are re-checked, so
+    the reported reason is always the first matching rule in order, exactly as
+    if the rules were tried one by one. Rules that would change meaning inside
+    the alternation (global inline flags such as ``(?i)``, named groups,
+    backreferences or group conditionals) are left out of it and searched on
+    their own instead.
+    """
+
+    rules: tuple[FilterRule, ...] = DEFAULT_FILTER_RULES
+    pass_reason: str = PASS_REASON
+
+    _combined: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+    _compiled: tuple[re.Pattern[str], ...] = field(init=False, repr=False, compare=False)
+    _standalone: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        names = [rule.name for rule in self.rules]
+        if len(set(names)) != len(names):
+            raise ValueError("filter rule names must be unique")
+        try:
+            compiled = tuple(re.compile(rule.pattern) for rule in self.rules)
+        except re.error as exc:
+            raise ValueError(f"invalid filter rule pattern: {exc}") from exc
+        standalone = tuple(
+            index
+            for index, (rule, pattern) in enumerate(zip(self.rules, compiled, strict=True))
+            if not _combinable(rule.pattern, pattern)
+        )
+        combinable = [
+            f"(?P<r{index}>{rule.pattern})"
+            for index, rule in enumerate(self.rules)
+            if index not in standalone
+        ]
+        try:
+            combined = re.compile("|".join(combinable)) if combinable else None
+        except re.error as exc:
+            raise ValueError(f"invalid filter rule pattern: {exc}") from exc
+        object.__setattr__(self, "_compiled", compiled)
+        object.__setattr__(self, "_combined", combined)
+        object.__setattr__(self, "_standalone", standalone)
+
+    @classmethod
+    def from_rules_file(cls, path: Path) -> RuleSetCounterexampleFilter:
+        return cls(rules=load_filter_rules(path))
+
+    def evaluate(self, conjecture: ConjectureCandidate) -> FilterDecision:
+        return self._decide(conjecture.lean_statement.lower())
+
+    def evaluate_batch(self, conjectures: Iterable[ConjectureCandidate]) -> list[FilterDecision]:
+        """Decisions for ``conjectures``, in input order."""
+        return [self._decide(conjecture.lean_statement.lower()) for conjecture in conjectures]
+
+    def _decide(self, statement: str) -> FilterDecision:
+        match = self._combined.search(statement) if self._combined is not None else None
+        if match is not None:
+            hit = next(name for name, value in match.groupdict().items() if value is not None)
+            index = self._first_rule(statement, int(hit[1:]))
+            return FilterDecision(accepted=False, reason=self.rules[index].name)
+        for index in self._standalone:
+            if self._compiled[index].search(statement):
+                return FilterDecision(accepted=False, reason=self.rules[index].name)
+        return FilterDecision(accepted=True, reason=self.pass_reason)
+
+    def _first_rule(self, statement: str, hit: int) -> int:
+        for index, pattern in enumerate(self._compiled[:hit]):
+            if pattern.search(statement):
+                return index
+        return hit
+
+
+def _combinable(source: str, pattern: re.Pattern[str]) -> bool:
+    """Whether ``source`` keeps its meaning as one branch of the combined scan."""
+    # Global inline flags like (?i) compile to pattern-wide flags, which are
+    # rejected (or would leak to other rules) mid-alternation.
+    if pattern.flags & ~re.UNICODE:
+        return False
+    return not pattern.groupindex and _GROUP_REFERENCE.search(source) is None
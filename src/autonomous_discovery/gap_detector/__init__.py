@@ -5,6 +5,17 @@ from autonomous_discovery.gap_detector.analogical import (
     GapCandidate,
     GapDetectorConfig,
 )
+from autonomous_discovery.gap_detector.clustering import (
+    GapCluster,
+    GapDedupeResult,
+    cluster_gaps,
+)
+from autonomous_discovery.gap_detector.columnar import (
+    GAP_SIGNAL_NAMES,
+    GapColumns,
+    read_gap_columns,
+    write_gap_columns,
+)
 from autonomous_discovery.gap_detector.evaluate_cli import main as evaluate_metrics_cli_main
 from autonomous_discovery.gap_detector.evaluation import (
     build_topk_label_template_rows,
@@ -12,7 +23,12 @@ from autonomous_discovery.gap_detector.evaluation import (
     compute_topk_precision,
 )
 from autonomous_discovery.gap_detector.pilot import run_phase1_pilot
-from autonomous_discovery.gap_detector.report import read_gap_report, write_gap_report
+from autonomous_discovery.gap_detector.report import (
+    GapReportWriter,
+    iter_gap_report,
+    read_gap_report,
+    write_gap_report,
+)
 from autonomous_discovery.gap_detector.seeds import SeedHint, scan_seed_annotations
 from autonomous_discovery.gap_detector.type_classes import (
     DEFAULT_PROVIDED,
@@ -25,17 +41,26 @@ __all__ = [
     "AnalogicalGapDetector",
     "DEFAULT_PROVIDED",
     "FamilyCompatibility",
+    "GAP_SIGNAL_NAMES",
     "GapCandidate",
+    "GapCluster",
+    "GapColumns",
+    "GapDedupeResult",
     "GapDetectorConfig",
+    "GapReportWriter",
     "SeedHint",
     "UNIVERSAL_CLASSES",
     "build_topk_label_template_rows",
+    "cluster_gaps",
     "compute_detection_rate",
     "compute_topk_precision",
     "evaluate_metrics_cli_main",
     "extract_type_classes",
+    "iter_gap_report",
+    "read_gap_columns",
     "read_gap_report",
     "run_phase1_pilot",
     "scan_seed_annotations",
+    "write_gap_columns",
     "write_gap_report",
 ]
@@ -9,6 +9,7 @@ from autonomous_discovery.gap_detector.type_classes import (
     FamilyCompatibility,
     extract_type_classes,
 )
+from autonomous_discovery.instrumentation import accumulate, traced
 from autonomous_discovery.knowledge_base.graph import MathlibGraph
 
 
@@ -48,6 +49,7 @@ class AnalogicalGapDetector:
 
     config: GapDetectorConfig = field(default_factory=GapDetectorConfig)
 
+    @traced("gap_detector.detect")
     def detect(self, graph: MathlibGraph, top_k: int | None = None) -> list[GapCandidate]:
         """Return top-k ranked gap candidates."""
         nodes = set(graph.nodes())
@@ -131,15 +133,16 @@ class AnalogicalGapDetector:
                     if self.config.require_namespace_stem_match and not namespace_stem_match:
                         continue
 
-                    translated_total, translated_hits, cross_total, cross_hits = (
-                        self._translated_dependency_stats(
-                            source_deps=source_deps,
-                            source_prefix=source_prefix,
-                            target_prefix=target_prefix,
-                            nodes=nodes,
-                            dep_weights=dep_weights,
+                    with accumulate("gap_detector.dependency_stats"):
+                        translated_total, translated_hits, cross_total, cross_hits = (
+                            self._translated_dependency_stats(
+                                source_deps=source_deps,
+                                source_prefix=source_prefix,
+                                target_prefix=target_prefix,
+                                nodes=nodes,
+                                dep_weights=dep_weights,
+                            )
                         )
-                    )
                     dep_overlap = (
                         translated_hits / translated_total if translated_total > 0 else 0.0
                     )
@@ -221,6 +224,7 @@ class AnalogicalGapDetector:
                     cross_hits += 1
         return translated_total, translated_hits, cross_total, cross_hits
 
+    @traced("gap_detector.dependency_weights")
     def _compute_dep_weights(self, nodes: set[str]) -> dict[str, float]:
         """Compute specificity weights for dependency nodes.
 
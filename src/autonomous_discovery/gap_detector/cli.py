@@ -8,6 +8,7 @@ from pathlib import Path
 
 from autonomous_discovery.config import ProjectConfig
 from autonomous_discovery.gap_detector.analogical import AnalogicalGapDetector, GapDetectorConfig
+from autonomous_discovery.gap_detector.columnar import write_gap_columns
 from autonomous_discovery.gap_detector.report import write_gap_report
 from autonomous_discovery.knowledge_base.graph import MathlibGraph
 from autonomous_discovery.knowledge_base.parser import parse_declaration_types, parse_premises
@@ -25,6 +26,15 @@ def build_parser(config: ProjectConfig | None = None) -> argparse.ArgumentParser
     )
     parser.add_argument("--top-k", type=int, default=20)
     parser.add_argument("--min-score", type=float, default=0.2)
+    parser.add_argument(
+        "--output-format",
+        choices=("jsonl", "columnar"),
+        default="jsonl",
+        help=(
+            "jsonl writes one JSON object per line; columnar writes a directory of "
+            "memory-mappable .npy columns (a .jsonl suffix is dropped from the path)."
+        ),
+    )
     return parser
 
 
@@ -50,7 +60,13 @@ def main(argv: list[str] | None = None) -> int:
         )
     )
     candidates = detector.detect(graph)
-    write_gap_report(candidates, args.output_path)
+    if args.output_format == "columnar":
+        output_path = args.output_path
+        if output_path.suffix == ".jsonl":
+            output_path = output_path.with_suffix("")
+        write_gap_columns(candidates, output_path)
+    else:
+        write_gap_report(candidates, args.output_path)
     return 0
 
 
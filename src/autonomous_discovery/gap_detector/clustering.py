@@ -0,0 +1,127 @@
+"""Cluster gap candidates that would yield the same conjecture before generation."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from autonomous_discovery.gap_detector.analogical import GapCandidate
+from autonomous_discovery.instrumentation import traced
+from autonomous_discovery.knowledge_base.graph import MathlibGraph
+
+_BINDER_RE = re.compile(r"[(\[{⦃]\s*([^:()\[\]{}⦃⦄]+?)\s*:")
+_IDENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_']*$")
+
+
+@dataclass(frozen=True, slots=True)
+class GapCluster:
+    """Gaps expected to produce the same conjecture; ``representative`` ranks first."""
+
+    representative: GapCandidate
+    members: tuple[GapCandidate, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class GapDedupeResult:
+    """Representatives to send to the generator and the clusters they stand for."""
+
+    representatives: tuple[GapCandidate, ...]
+    clusters: tuple[GapCluster, ...]
+
+    @property
+    def merged_count(self) -> int:
+        return sum(len(cluster.members) - 1 for cluster in self.clusters)
+
+
+def _rank_key(gap: GapCandidate) -> tuple[float, str, str, str]:
+    # Same ordering the generators use, so representatives are what they would pick.
+    return (-gap.score, gap.missing_decl, gap.source_decl, gap.target_family)
+
+
+def _family_stem(prefix: str) -> str:
+    return prefix.rstrip(".")
+
+
+def translated_shape(gap: GapCandidate, graph: MathlibGraph) -> str | None:
+    """Source type signature rewritten into the target family, binder names erased.
+
+    Two gaps with the same shape ask the generator for the same statement, even if
+    they reach it from different source declarations or families. Returns ``None``
+    when the source has no recorded signature.
+    """
+    signature = graph.type_signature_of(gap.source_decl)
+    if not signature:
+        return None
+    suffix = gap.missing_decl[len(gap.target_family) :]
+    source_prefix = gap.source_decl[: len(gap.source_decl) - len(suffix)]
+    target_stem = _family_stem(gap.target_family)
+    source_stem = _family_stem(source_prefix)
+    if source_stem and gap.source_decl.endswith(suffix):
+        signature = re.sub(rf"\b{re.escape(source_stem)}\b", target_stem, signature)
+
+    mapping: dict[str, str] = {}
+    for match in _BINDER_RE.finditer(signature):
+        for name in match.group(1).split():
+            if _IDENT_RE.match(name) and name not in mapping:
+                mapping[name] = f"v{len(mapping) + 1}"
+    if mapping:
+        names = "|".join(re.escape(name) for name in sorted(mapping, key=len, reverse=True))
+        signature = re.sub(
+            rf"(?<![\w.'])({names})(?![\w'])",
+            lambda match: mapping[match.group(1)],
+            signature,
+        )
+    return re.sub(r"\s+", " ", signature).strip()
+
+
+@traced("gap_detector.cluster")
+def cluster_gaps(
+    gaps: list[GapCandidate],
+    graph: MathlibGraph | None = None,
+    *,
+    top_k: int | None = None,
+) -> GapDedupeResult:
+    """Union gaps sharing a missing declaration or a translated statement shape.
+
+    Clusters are ordered by their best-ranked member and, when ``top_k`` is set,
+    only the first ``top_k`` clusters are kept, so the budget goes to distinct work.
+    """
+    ranked = sorted(gaps, key=_rank_key)
+    parent = list(range(len(ranked)))
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def union(left: int, right: int) -> None:
+        left_root, right_root = find(left), find(right)
+        if left_root != right_root:
+            # The better-ranked (smaller index) root stays the representative.
+            parent[max(left_root, right_root)] = min(left_root, right_root)
+
+    first_by_key: dict[tuple[str, str], int] = {}
+    for index, gap in enumerate(ranked):
+        keys = [("name", gap.missing_decl)]
+        if graph is not None and (shape := translated_shape(gap, graph)) is not None:
+            keys.append(("shape", shape))
+        for key in keys:
+            if key in first_by_key:
+                union(first_by_key[key], index)
+            else:
+                first_by_key[key] = index
+
+    members: dict[int, list[GapCandidate]] = {}
+    for index, gap in enumerate(ranked):
+        members.setdefault(find(index), []).append(gap)
+    clusters = tuple(
+        GapCluster(representative=ranked[root], members=tuple(group))
+        for root, group in sorted(members.items())
+    )
+    if top_k is not None:
+        clusters = clusters[:top_k]
+    return GapDedupeResult(
+        representatives=tuple(cluster.representative for cluster in clusters),
+        clusters=clusters,
+    )
@@ -0,0 +1,151 @@
+"""Columnar gap-candidate artifacts: one memory-mappable ``.npy`` file per column.
+
+A report is a directory holding ``columns.json`` plus one array per column:
+
+- ``score.npy`` and ``signal.<name>.npy``: ``float64``; a signal a candidate does
+  not carry is stored as NaN.
+- ``<field>.data.npy`` / ``<field>.offsets.npy`` for each string field: the
+  UTF-8 bytes of all rows concatenated, and ``row_count + 1`` ``int64`` offsets.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from autonomous_discovery.gap_detector.analogical import GapCandidate
+
+FORMAT_VERSION = 1
+MANIFEST_NAME = "columns.json"
+
+# Signals emitted by ``AnalogicalGapDetector.detect``, in emission order.
+GAP_SIGNAL_NAMES: tuple[str, ...] = (
+    "dependency_overlap",
+    "translated_dependency_hits",
+    "translated_dependency_total",
+    "source_pagerank",
+    "source_descendants",
+    "cross_family_hits",
+    "cross_family_total",
+    "cross_family_overlap",
+    "namespace_stem_match",
+    "type_class_satisfaction",
+)
+
+_STRING_FIELDS: tuple[str, ...] = ("source_decl", "target_family", "missing_decl")
+
+
+def write_gap_columns(candidates: Iterable[GapCandidate], output_dir: Path) -> None:
+    """Write candidates as a columnar report directory."""
+    rows = list(candidates)
+    extra = sorted({name for row in rows for name in row.signals} - set(GAP_SIGNAL_NAMES))
+    signal_names = [*GAP_SIGNAL_NAMES, *extra]
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    for field in _STRING_FIELDS:
+        encoded = [getattr(row, field).encode("utf-8") for row in rows]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        np.save(output_dir / f"{field}.data.npy", data)
+        np.save(output_dir / f"{field}.offsets.npy", offsets)
+
+    np.save(output_dir / "score.npy", np.array([row.score for row in rows], dtype=np.float64))
+    for name in signal_names:
+        column = np.array([row.signals.get(name, math.nan) for row in rows], dtype=np.float64)
+        np.save(output_dir / f"signal.{name}.npy", column)
+
+    manifest = {"format_version": FORMAT_VERSION, "row_count": len(rows), "signals": signal_names}
+    (output_dir / MANIFEST_NAME).write_text(
+        json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+
+
+class _StringColumn:
+    def __init__(self, data: npt.NDArray[np.uint8], offsets: npt.NDArray[np.int64]) -> None:
+        self.data = data
+        self.offsets = offsets
+
+    def __getitem__(self, index: int) -> str:
+        start, end = int(self.offsets[index]), int(self.offsets[index + 1])
+        return bytes(self.data[start:end]).decode("utf-8")
+
+
+class GapColumns:
+    """Read-only view of a columnar report; ``GapCandidate`` rows are built on access.
+
+    Numeric columns are memory-mapped by default, so opening a report costs only
+    the manifest read and analysis can work on ``score`` / ``signal(name)`` arrays
+    directly without materialising candidates.
+    """
+
+    def __init__(self, report_dir: Path, *, mmap: bool = True) -> None:
+        manifest = json.loads((report_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        if manifest.get("format_version") != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported columnar format version: {manifest.get('format_version')}"
+            )
+        mode = "r" if mmap else None
+        self.report_dir = report_dir
+        self.signal_names: tuple[str, ...] = tuple(manifest["signals"])
+        self._row_count = int(manifest["row_count"])
+        self.score: npt.NDArray[np.float64] = np.load(report_dir / "score.npy", mmap_mode=mode)
+        self._signals = {
+            name: np.load(report_dir / f"signal.{name}.npy", mmap_mode=mode)
+            for name in self.signal_names
+        }
+        self._strings = {
+            field: _StringColumn(
+                np.load(report_dir / f"{field}.data.npy", mmap_mode=mode),
+                np.load(report_dir / f"{field}.offsets.npy", mmap_mode=mode),
+            )
+            for field in _STRING_FIELDS
+        }
+
+    def __len__(self) -> int:
+        return self._row_count
+
+    def signal(self, name: str) -> npt.NDArray[np.float64]:
+        """Column for ``name``; NaN marks rows that did not carry the signal."""
+        if name not in self._signals:
+            raise KeyError(name)
+        return self._signals[name]
+
+    def string(self, field: str, index: int) -> str:
+        return self._strings[field][self._check_index(index)]
+
+    def __getitem__(self, index: int) -> GapCandidate:
+        index = self._check_index(index)
+        signals = {
+            name: float(value)
+            for name, column in self._signals.items()
+            if not math.isnan(value := column[index])
+        }
+        return GapCandidate(
+            source_decl=self._strings["source_decl"][index],
+            target_family=self._strings["target_family"][index],
+            missing_decl=self._strings["missing_decl"][index],
+            score=float(self.score[index]),
+            signals=signals,
+        )
+
+    def __iter__(self) -> Iterator[GapCandidate]:
+        for index in range(self._row_count):
+            yield self[index]
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += self._row_count
+        if not 0 <= index < self._row_count:
+            raise IndexError("gap report index out of range")
+        return index
+
+
+def read_gap_columns(report_dir: Path, *, mmap: bool = True) -> GapColumns:
+    """Open a columnar report written by :func:`write_gap_columns`."""
+    return GapColumns(report_dir, mmap=mmap)
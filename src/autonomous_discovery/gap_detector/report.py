@@ -3,37 +3,64 @@
 from __future__ import annotations
 
 import dataclasses
-import json
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 from autonomous_discovery.gap_detector.analogical import GapCandidate
+from autonomous_discovery.jsonl import DEFAULT_BATCH_SIZE, JsonlWriter, iter_jsonl
 
 
-def write_gap_report(candidates: list[GapCandidate], output_path: Path) -> None:
-    """Write candidates as newline-delimited JSON."""
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as f:
+class GapReportWriter:
+    """Append gap candidates as newline-delimited JSON, flushing in batches."""
+
+    def __init__(
+        self,
+        output_path: Path,
+        *,
+        append: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        self._writer = JsonlWriter(output_path, append=append, batch_size=batch_size)
+
+    def __enter__(self) -> GapReportWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def rows_written(self) -> int:
+        return self._writer.rows_written
+
+    def write(self, candidate: GapCandidate) -> None:
+        self._writer.write(dataclasses.asdict(candidate))
+
+    def write_all(self, candidates: Iterable[GapCandidate]) -> None:
         for candidate in candidates:
-            f.write(json.dumps(dataclasses.asdict(candidate), sort_keys=True))
-            f.write("\n")
+            self.write(candidate)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def write_gap_report(candidates: Iterable[GapCandidate], output_path: Path) -> None:
+    """Write candidates as newline-delimited JSON."""
+    with GapReportWriter(output_path) as writer:
+        writer.write_all(candidates)
+
+
+def iter_gap_report(path: Path) -> Iterator[GapCandidate]:
+    """Yield candidates from newline-delimited JSON one at a time."""
+    for record in iter_jsonl(path):
+        yield GapCandidate(
+            source_decl=record["source_decl"],
+            target_family=record["target_family"],
+            missing_decl=record["missing_decl"],
+            score=float(record["score"]),
+            signals={k: float(v) for k, v in record["signals"].items()},
+        )
 
 
 def read_gap_report(path: Path) -> list[GapCandidate]:
     """Load candidates from newline-delimited JSON."""
-    candidates: list[GapCandidate] = []
-    with path.open(encoding="utf-8") as f:
-        for line in f:
-            stripped = line.strip()
-            if not stripped:
-                continue
-            record = json.loads(stripped)
-            candidates.append(
-                GapCandidate(
-                    source_decl=record["source_decl"],
-                    target_family=record["target_family"],
-                    missing_decl=record["missing_decl"],
-                    score=float(record["score"]),
-                    signals={k: float(v) for k, v in record["signals"].items()},
-                )
-            )
-    return candidates
+    return list(iter_gap_report(path))
@@ -0,0 +1,248 @@
+"""Stage timing and resource spans for pipeline runs.
+
+Library code marks stages with :func:`span` (or the :func:`traced` decorator)
+and hot inner steps with :func:`accumulate`. Both are no-ops unless a
+:class:`Tracer` is active through :func:`use_tracer`, so instrumented modules
+need no tracer argument and cost almost nothing outside a traced run.
+
+A span records:
+
+- ``wall_ms``: elapsed wall-clock time.
+- ``cpu_ms``: CPU time of the thread that ran the span.
+- ``child_cpu_ms``: CPU time of subprocesses (e.g. Lean) that exited and were
+  reaped during the span.
+- ``peak_rss_mb``: the process's peak resident set size when the span ended.
+
+Spans nest under the span active in the current context (thread or asyncio
+task). Worker threads join the tree when started with a copied context
+(``contextvars.copy_context().run``).
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# ``ru_maxrss`` is in kilobytes on Linux and in bytes on macOS.
+_RSS_UNIT_BYTES = 1 if sys.platform == "darwin" else 1024
+
+
+def _peak_rss_bytes() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT_BYTES
+
+
+def _children_cpu_ns() -> int:
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return int((usage.ru_utime + usage.ru_stime) * 1_000_000_000)
+
+
+@dataclass(slots=True)
+class Span:
+    """One timed stage, or the running total of an accumulated step.
+
+    Accumulated steps only track ``count`` and ``wall_ns``; their CPU and memory
+    fields stay ``None``.
+    """
+
+    name: str
+    start_ns: int
+    thread_id: int
+    wall_ns: int = 0
+    cpu_ns: int | None = None
+    child_cpu_ns: int | None = None
+    peak_rss_bytes: int | None = None
+    count: int = 1
+    children: list[Span] = field(default_factory=list)
+    accumulated: dict[str, Span] = field(default_factory=dict)
+
+
+class Tracer:
+    """Collects the spans of one run into a tree."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._root_accumulated: dict[str, Span] = {}
+
+    def stages(self) -> list[dict[str, Any]]:
+        """The span tree, with same-named siblings merged (``count`` sums them)."""
+        return _merge([*self.spans, *self._root_accumulated.values()])
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Spans as Chrome trace-event JSON (load in ``chrome://tracing`` or Perfetto)."""
+        events: list[dict[str, Any]] = []
+        pid = os.getpid()
+        origin = min((span.start_ns for span in self.spans), default=0)
+        stack = list(self.spans)
+        while stack:
+            current = stack.pop()
+            stack.extend(current.children)
+            args: dict[str, Any] = {
+                "cpu_ms": _ms(current.cpu_ns),
+                "child_cpu_ms": _ms(current.child_cpu_ns),
+                "peak_rss_mb": _mb(current.peak_rss_bytes),
+            }
+            if current.accumulated:
+                args["accumulated"] = {
+                    name: {"count": step.count, "wall_ms": _ms(step.wall_ns)}
+                    for name, step in current.accumulated.items()
+                }
+            events.append(
+                {
+                    "name": current.name,
+                    "ph": "X",
+                    "ts": (current.start_ns - origin) / 1000,
+                    "dur": current.wall_ns / 1000,
+                    "pid": pid,
+                    "tid": current.thread_id,
+                    "args": args,
+                }
+            )
+        events.sort(key=lambda event: (event["ts"], -event["dur"]))
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace()) + "\n", encoding="utf-8")
+
+    def _attach(self, parent: Span | None, span: Span) -> None:
+        with self._lock:
+            (parent.children if parent is not None else self.spans).append(span)
+
+    def _accumulate(self, parent: Span | None, name: str, wall_ns: int) -> None:
+        with self._lock:
+            steps = parent.accumulated if parent is not None else self._root_accumulated
+            step = steps.get(name)
+            if step is None:
+                steps[name] = Span(name, 0, 0, wall_ns=wall_ns)
+            else:
+                step.count += 1
+                step.wall_ns += wall_ns
+
+
+_TRACER: ContextVar[Tracer | None] = ContextVar("autonomous_discovery_tracer", default=None)
+_PARENT: ContextVar[Span | None] = ContextVar("autonomous_discovery_span", default=None)
+
+
+@contextmanager
+def use_tracer(tracer: Tracer) -> Iterator[Tracer]:
+    """Record spans opened in this context (and contexts copied from it) into ``tracer``."""
+    tracer_token = _TRACER.set(tracer)
+    parent_token = _PARENT.set(None)
+    try:
+        yield tracer
+    finally:
+        _PARENT.reset(parent_token)
+        _TRACER.reset(tracer_token)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time the enclosed block as stage ``name`` under the current span."""
+    tracer = _TRACER.get()
+    if tracer is None:
+        yield
+        return
+    parent = _PARENT.get()
+    current = Span(name, time.perf_counter_ns(), threading.get_ident())
+    token = _PARENT.set(current)
+    cpu_started = time.thread_time_ns()
+    child_cpu_started = _children_cpu_ns()
+    try:
+        yield
+    finally:
+        current.wall_ns = time.perf_counter_ns() - current.start_ns
+        current.cpu_ns = time.thread_time_ns() - cpu_started
+        current.child_cpu_ns = _children_cpu_ns() - child_cpu_started
+        current.peak_rss_bytes = _peak_rss_bytes()
+        _PARENT.reset(token)
+        tracer._attach(parent, current)
+
+
+@contextmanager
+def accumulate(name: str) -> Iterator[None]:
+    """Add the enclosed block's wall time to step ``name`` of the current span.
+
+    Meant for steps repeated thousands of times, where one span each would
+    bloat the tree: only a call count and total wall time are kept.
+    """
+    tracer = _TRACER.get()
+    if tracer is None:
+        yield
+        return
+    started = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        tracer._accumulate(_PARENT.get(), name, time.perf_counter_ns() - started)
+
+
+def traced[**P, R](name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator running each call of a function (sync or async) in :func:`span`."""
+
+    def decorate(function: Callable[P, R]) -> Callable[P, R]:
+        if inspect.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                with span(name):
+                    return await function(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with span(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def _ms(value_ns: int | None) -> float | None:
+    return round(value_ns / 1_000_000, 3) if value_ns is not None else None
+
+
+def _mb(value_bytes: int | None) -> float | None:
+    return round(value_bytes / (1024 * 1024), 3) if value_bytes is not None else None
+
+
+def _merge(spans: list[Span]) -> list[dict[str, Any]]:
+    merged: dict[str, dict[str, Any]] = {}
+    children: dict[str, list[Span]] = {}
+    for current in spans:
+        node = merged.get(current.name)
+        if node is None:
+            node = merged[current.name] = {
+                "name": current.name,
+                "count": 0,
+                "wall_ms": 0.0,
+                "cpu_ms": None,
+                "child_cpu_ms": None,
+                "peak_rss_mb": None,
+            }
+            children[current.name] = []
+        node["count"] += current.count
+        node["wall_ms"] = round(node["wall_ms"] + current.wall_ns / 1_000_000, 3)
+        for key, value in (("cpu_ms", current.cpu_ns), ("child_cpu_ms", current.child_cpu_ns)):
+            if value is not None:
+                node[key] = round((node[key] or 0.0) + value / 1_000_000, 3)
+        if current.peak_rss_bytes is not None:
+            node["peak_rss_mb"] = max(node["peak_rss_mb"] or 0.0, _mb(current.peak_rss_bytes))
+        children[current.name].extend([*current.children, *current.accumulated.values()])
+    for name, node in merged.items():
+        node["children"] = _merge(children[name])
+    return list(merged.values())
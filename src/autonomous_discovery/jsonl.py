@@ -0,0 +1,131 @@
+"""Streaming JSONL helpers with optional compression and a fast JSON codec.
+
+Files ending in ``.gz`` are gzip-compressed and files ending in ``.zst`` are
+zstd-compressed (requires the optional ``zstandard`` package). Rows are encoded
+with ``orjson`` when it is installed and with the standard library otherwise;
+both produce the same compact, sorted-key, UTF-8 lines so artifacts stay
+diffable whichever codec wrote them.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from types import ModuleType
+from typing import IO, Any
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _zstandard() -> ModuleType:
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise RuntimeError(
+            "zstd-compressed JSONL requires the optional 'zstandard' package"
+        ) from exc
+    return zstandard
+
+
+def open_jsonl(path: Path, mode: str = "r") -> IO[str]:
+    """Open ``path`` as text, compressed according to its suffix.
+
+    ``mode`` is one of ``"r"``, ``"w"`` or ``"a"``.
+    """
+    if mode not in ("r", "w", "a"):
+        raise ValueError("mode must be one of r, w, a")
+    if mode != "r":
+        path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".gz":
+        return gzip.open(path, f"{mode}t", encoding="utf-8")
+    if path.suffix == ".zst":
+        zstandard = _zstandard()
+        if mode == "r":
+            raw = zstandard.ZstdDecompressor().stream_reader(
+                path.open("rb"), read_across_frames=True, closefd=True
+            )
+            return io.TextIOWrapper(raw, encoding="utf-8")
+        return zstandard.open(path, f"{mode}t", encoding="utf-8")
+    return path.open(mode, encoding="utf-8")
+
+
+def dumps_row(row: dict[str, Any]) -> str:
+    """Encode one row as a single JSON line without the trailing newline."""
+    if _orjson is not None:
+        return _orjson.dumps(row, option=_orjson.OPT_SORT_KEYS).decode("utf-8")
+    # Match orjson's output: no spaces after separators, non-ASCII left unescaped.
+    return json.dumps(row, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads_row(line: str) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(line)
+    return json.loads(line)
+
+
+def iter_jsonl(path: Path) -> Iterator[Any]:
+    """Yield decoded rows one at a time, skipping blank lines."""
+    with open_jsonl(path) as f:
+        for line in f:
+            if line.strip():
+                yield loads_row(line)
+
+
+class JsonlWriter:
+    """Incremental JSONL writer that buffers rows and flushes every ``batch_size``.
+
+    The file is created (or truncated) on construction; pass ``append=True`` to
+    extend an existing file instead. Use as a context manager so the last batch
+    is flushed and the file closed.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        append: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        self.path = path
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._buffer: list[str] = []
+        self._file = open_jsonl(path, "a" if append else "w")
+
+    def __enter__(self) -> JsonlWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def write(self, row: dict[str, Any]) -> None:
+        self._buffer.append(dumps_row(row))
+        self.rows_written += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def write_all(self, rows: Iterable[dict[str, Any]]) -> None:
+        for row in rows:
+            self.write(row)
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._file.write("\n".join(self._buffer) + "\n")
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
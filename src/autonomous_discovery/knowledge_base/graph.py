@@ -6,6 +6,7 @@ from typing import Any
 
 import networkx as nx
 
+from autonomous_discovery.instrumentation import accumulate, traced
 from autonomous_discovery.knowledge_base.parser import DeclarationEntry, PremisesEntry
 
 
@@ -19,6 +20,7 @@ class MathlibGraph:
         self._graph = graph
 
     @classmethod
+    @traced("knowledge_base.build_graph")
     def from_raw_data(
         cls,
         premises: list[PremisesEntry],
@@ -110,7 +112,8 @@ class MathlibGraph:
 
     def descendants_count(self, node: str) -> int:
         """Count transitive dependencies (descendants in the dependency graph)."""
-        return len(nx.descendants(self._graph, node))
+        with accumulate("knowledge_base.descendants"):
+            return len(nx.descendants(self._graph, node))
 
     def type_signature_of(self, name: str) -> str | None:
         """Return the type signature of a declaration, or None if not available."""
@@ -118,5 +121,6 @@ class MathlibGraph:
             return None
         return self._graph.nodes[name].get("type_signature")
 
+    @traced("knowledge_base.pagerank")
     def pagerank(self) -> dict[str, float]:
         return nx.pagerank(self._graph)
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from autonomous_discovery.instrumentation import traced
+
 
 @dataclass(frozen=True, slots=True)
 class Dependency:
@@ -31,6 +33,7 @@ class DeclarationEntry:
     type_signature: str
 
 
+@traced("knowledge_base.parse_premises")
 def parse_premises(text: str) -> list[PremisesEntry]:
     """Parse the output of `lake exe premises Mathlib`.
 
@@ -74,6 +77,7 @@ def parse_premises(text: str) -> list[PremisesEntry]:
     return entries
 
 
+@traced("knowledge_base.parse_declaration_types")
 def parse_declaration_types(text: str) -> list[DeclarationEntry]:
     """Parse the output of `lake exe declaration_types Mathlib`.
 
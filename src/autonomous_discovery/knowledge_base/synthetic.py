@@ -0,0 +1,305 @@
+"""Synthetic Mathlib-like dumps for offline scale testing.
+
+Writes ``premises.txt`` and ``decl_types.txt`` in the ``---``-delimited formats
+read by :func:`parse_premises` and :func:`parse_declaration_types`, at any size,
+so benchmarks and stress tests can run at production scale without the real
+multi-hundred-MB dump.
+
+The generated graph imitates the shapes the pipeline depends on:
+
+- *Family concepts*: a lemma suffix (``mul_comm`` or, with a namespace stem,
+  ``map.mul_comm``) declared in a random subset of the algebra families
+  (``Group.``, ``Ring.`` ...). Each copy depends on its own family's copies of
+  earlier concepts, so absent copies are the analogical gaps the detector looks
+  for.
+- *Core declarations* (``Nat.``, ``List.``, ``Finset.`` ...) shared by all
+  families.
+- Power-law dependency degrees: out-degrees are Pareto-distributed and
+  dependency targets are biased towards early, foundational declarations.
+- ``*`` (explicit) and ``s`` (simp) edge flags and bracketed type-class
+  instances in the signatures.
+
+Generation is deterministic for a given :class:`SyntheticDumpConfig`.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TextIO
+
+from autonomous_discovery.config import ProjectConfig
+
+_LEMMA_WORDS = (
+    "mul", "add", "comm", "assoc", "inv", "one", "zero", "map", "comp", "id", "left", "right",
+    "cancel", "eq", "iff", "le", "lt", "sub", "neg", "smul", "sum", "prod", "mem", "coe",
+    "ext", "injective", "surjective", "self", "pow", "succ", "pred", "card", "ker", "range",
+    "span", "eval", "degree", "bot", "top", "sup", "inf", "mk", "apply", "symm", "trans", "of",
+    "to", "def",
+)  # fmt: skip
+_NAMESPACE_STEMS = (
+    "map", "ker", "range", "comap", "mk", "coe", "toFun", "eval", "smul", "card", "span",
+    "closure",
+)  # fmt: skip
+_CORE_NAMESPACES = (
+    "Nat", "Int", "List", "Finset", "Set", "Function", "Eq", "HMul", "HAdd", "Membership",
+    "Multiset", "Fin", "Real", "Option", "Prod",
+)  # fmt: skip
+_FAMILY_CLASSES: dict[str, tuple[str, ...]] = {
+    "Algebra.": ("CommSemiring", "Semiring", "Algebra"),
+    "CommRing.": ("CommRing",),
+    "Field.": ("Field",),
+    "Group.": ("Group", "Monoid"),
+    "Ideal.": ("CommRing", "Semiring"),
+    "LinearMap.": ("Semiring", "AddCommMonoid", "Module"),
+    "Matrix.": ("Fintype", "DecidableEq", "Semiring"),
+    "Module.": ("Module", "AddCommMonoid"),
+    "MonoidHom.": ("MulOneClass", "Monoid"),
+    "MulAction.": ("Monoid", "MulAction"),
+    "Polynomial.": ("Semiring", "CommRing"),
+    "Ring.": ("Ring", "CommRing"),
+    "RingHom.": ("NonAssocSemiring", "Semiring"),
+    "Subgroup.": ("Group",),
+    "Submodule.": ("Semiring", "AddCommMonoid", "Module"),
+    "Subring.": ("Ring",),
+}
+_CORE_CLASSES = ("DecidableEq", "Inhabited", "Preorder", "LinearOrder", "Nonempty")
+_RELATIONS = ("=", "≤", "<", "↔", "≠")
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticDumpConfig:
+    """Shape of a synthetic dump.
+
+    ``family_fraction`` of the declarations belong to ``family_prefixes``; each
+    family concept is declared in every family with ``counterpart_probability``.
+    Out-degrees follow a Pareto distribution with shape ``dependency_shape``
+    (1.2 gives a mean of about 6 with a heavy tail), capped at
+    ``max_dependencies``; larger ``dependency_skew`` concentrates in-degree on
+    earlier declarations.
+    """
+
+    declarations: int = 10_000
+    seed: int = 0
+    family_prefixes: tuple[str, ...] = field(
+        default_factory=lambda: ProjectConfig().algebra_name_prefixes
+    )
+    family_fraction: float = 0.35
+    counterpart_probability: float = 0.5
+    stem_probability: float = 0.5
+    dependency_shape: float = 1.2
+    dependency_skew: float = 3.0
+    max_dependencies: int = 200
+    explicit_probability: float = 0.3
+    simp_probability: float = 0.1
+
+    def __post_init__(self) -> None:
+        if self.declarations <= 0:
+            raise ValueError("declarations must be a positive integer")
+        if not self.family_prefixes:
+            raise ValueError("family_prefixes must not be empty")
+        for name in ("family_fraction", "counterpart_probability", "stem_probability"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be in [0, 1]")
+        if self.explicit_probability < 0 or self.simp_probability < 0:
+            raise ValueError("edge flag probabilities must be non-negative")
+        if self.explicit_probability + self.simp_probability > 1.0:
+            raise ValueError("explicit_probability + simp_probability must be at most 1")
+        if self.dependency_shape <= 0:
+            raise ValueError("dependency_shape must be positive")
+        if self.dependency_skew < 1.0:
+            raise ValueError("dependency_skew must be at least 1")
+        if self.max_dependencies <= 0:
+            raise ValueError("max_dependencies must be a positive integer")
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticDeclaration:
+    """One generated declaration; ``dependencies`` are ``(flag, name)`` pairs.
+
+    ``flag`` is ``"*"`` (explicit), ``"s"`` (simp) or ``""``.
+    """
+
+    kind: str
+    name: str
+    type_signature: str
+    dependencies: tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticDumpStats:
+    declarations: int
+    dependencies: int
+    family_declarations: int
+
+
+def iter_synthetic_declarations(config: SyntheticDumpConfig) -> Iterator[SyntheticDeclaration]:
+    """Yield ``config.declarations`` declarations; each depends only on earlier ones."""
+    rng = random.Random(config.seed)
+    names: list[str] = []
+    # Suffixes of earlier family concepts and the families that declare them.
+    concepts: list[tuple[str, frozenset[str]]] = []
+    core_index = 0
+    # Each concept yields several declarations, so draw concepts less often than
+    # ``family_fraction`` to make that the expected share of family declarations.
+    copies = max(1.0, len(config.family_prefixes) * config.counterpart_probability)
+    concept_probability = config.family_fraction / (
+        config.family_fraction + copies * (1.0 - config.family_fraction)
+    )
+
+    while len(names) < config.declarations:
+        if rng.random() < concept_probability:
+            suffix = _lemma_name(len(concepts))
+            if rng.random() < config.stem_probability:
+                suffix = f"{rng.choice(_NAMESPACE_STEMS)}.{suffix}"
+            families = [
+                prefix
+                for prefix in config.family_prefixes
+                if rng.random() < config.counterpart_probability
+            ] or [rng.choice(config.family_prefixes)]
+            families = families[: config.declarations - len(names)]
+            # Copies share their core dependencies and translate the family ones.
+            degree = _degree(rng, config)
+            core_dependencies = _pick_earlier(rng, config, names, max(1, degree // 2))
+            related = (
+                [concepts[_skewed_index(rng, config, len(concepts))] for _ in range(degree)]
+                if concepts
+                else []
+            )
+            kind = "theorem" if rng.random() < 0.85 else "definition"
+            statement = _statement(rng)
+            for prefix in families:
+                dependencies = [
+                    *core_dependencies,
+                    *(f"{prefix}{other}" for other, owners in related if prefix in owners),
+                ]
+                name = f"{prefix}{suffix}"
+                yield SyntheticDeclaration(
+                    kind=kind,
+                    name=name,
+                    type_signature=_signature(rng, kind, _family_classes(prefix), statement),
+                    dependencies=_flagged(rng, config, dependencies),
+                )
+                names.append(name)
+            concepts.append((suffix, frozenset(families)))
+        else:
+            name = f"{rng.choice(_CORE_NAMESPACES)}.{_lemma_name(core_index)}"
+            core_index += 1
+            kind = rng.choices(("theorem", "definition", "instance"), weights=(70, 22, 8))[0]
+            dependencies = _pick_earlier(rng, config, names, _degree(rng, config))
+            yield SyntheticDeclaration(
+                kind=kind,
+                name=name,
+                type_signature=_signature(rng, kind, _CORE_CLASSES, _statement(rng)),
+                dependencies=_flagged(rng, config, dependencies),
+            )
+            names.append(name)
+
+
+def write_synthetic_dump(
+    premises_path: Path, decl_types_path: Path, config: SyntheticDumpConfig
+) -> SyntheticDumpStats:
+    """Write a synthetic ``premises.txt``/``decl_types.txt`` pair, streaming."""
+    premises_path.parent.mkdir(parents=True, exist_ok=True)
+    decl_types_path.parent.mkdir(parents=True, exist_ok=True)
+    declarations = dependencies = family_declarations = 0
+    with (
+        premises_path.open("w", encoding="utf-8") as premises,
+        decl_types_path.open("w", encoding="utf-8") as decl_types,
+    ):
+        for declaration in iter_synthetic_declarations(config):
+            _write_premises_block(premises, declaration)
+            decl_types.write(
+                f"---\n{declaration.kind}\n{declaration.name}\n{declaration.type_signature}\n"
+            )
+            declarations += 1
+            dependencies += len(declaration.dependencies)
+            if declaration.name.startswith(config.family_prefixes):
+                family_declarations += 1
+    return SyntheticDumpStats(
+        declarations=declarations,
+        dependencies=dependencies,
+        family_declarations=family_declarations,
+    )
+
+
+def _write_premises_block(stream: TextIO, declaration: SyntheticDeclaration) -> None:
+    lines = ["---", declaration.name]
+    for flag, dependency in declaration.dependencies:
+        # Matches lean-training-data: "  * name", "s name" or "  name".
+        if flag == "s":
+            lines.append(f"s {dependency}")
+        elif flag == "*":
+            lines.append(f"  * {dependency}")
+        else:
+            lines.append(f"  {dependency}")
+    stream.write("\n".join(lines) + "\n")
+
+
+def _lemma_name(index: int) -> str:
+    """A distinct lemma name for every index: two words, then bijective base-N words."""
+    base = len(_LEMMA_WORDS)
+    words = [_LEMMA_WORDS[index % base], _LEMMA_WORDS[index // base % base]]
+    index //= base * base
+    while index:
+        index -= 1
+        words.append(_LEMMA_WORDS[index % base])
+        index //= base
+    return "_".join(words)
+
+
+def _degree(rng: random.Random, config: SyntheticDumpConfig) -> int:
+    return min(config.max_dependencies, int(rng.paretovariate(config.dependency_shape)))
+
+
+def _skewed_index(rng: random.Random, config: SyntheticDumpConfig, size: int) -> int:
+    return int(size * rng.random() ** config.dependency_skew)
+
+
+def _pick_earlier(
+    rng: random.Random, config: SyntheticDumpConfig, names: list[str], count: int
+) -> list[str]:
+    if not names:
+        return []
+    picked = {names[_skewed_index(rng, config, len(names))] for _ in range(count)}
+    return sorted(picked)
+
+
+def _flagged(
+    rng: random.Random, config: SyntheticDumpConfig, dependencies: list[str]
+) -> tuple[tuple[str, str], ...]:
+    flagged: list[tuple[str, str]] = []
+    for dependency in dict.fromkeys(dependencies):
+        draw = rng.random()
+        if draw < config.explicit_probability:
+            flag = "*"
+        elif draw < config.explicit_probability + config.simp_probability:
+            flag = "s"
+        else:
+            flag = ""
+        flagged.append((flag, dependency))
+    return tuple(flagged)
+
+
+def _family_classes(prefix: str) -> tuple[str, ...]:
+    return _FAMILY_CLASSES.get(prefix, (prefix.rstrip(".").rsplit(".", maxsplit=1)[-1],))
+
+
+def _statement(rng: random.Random) -> str:
+    left, right = rng.sample(_LEMMA_WORDS, 2)
+    return f"{left} a b {rng.choice(_RELATIONS)} {right} b a"
+
+
+def _signature(rng: random.Random, kind: str, classes: tuple[str, ...], statement: str) -> str:
+    instances = " ".join(
+        f"[inst{position} : {name} α]"
+        for position, name in enumerate(rng.sample(classes, rng.randint(1, min(2, len(classes)))))
+    )
+    if kind == "theorem":
+        signature = f"∀ {{α : Type u_1}} {instances} (a b : α),"
+        # Long signatures wrap onto indented continuation lines, as in the real dump.
+        return f"{signature}\n  {statement}" if rng.random() < 0.2 else f"{signature} {statement}"
+    arrows = instances.replace("] [", "] → [")
+    return f"{{α : Type u_1}} → {arrows} → α → α → α"
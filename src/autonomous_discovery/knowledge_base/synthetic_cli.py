@@ -0,0 +1,71 @@
+"""CLI for writing a synthetic Mathlib-like premises/declaration dump."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from autonomous_discovery.config import ProjectConfig
+from autonomous_discovery.knowledge_base.synthetic import (
+    SyntheticDumpConfig,
+    write_synthetic_dump,
+)
+
+
+def build_parser(config: ProjectConfig | None = None) -> argparse.ArgumentParser:
+    config = config or ProjectConfig()
+    parser = argparse.ArgumentParser(
+        description="Write a synthetic premises.txt/decl_types.txt pair for scale testing."
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=config.data_processed_dir / "synthetic",
+        help="Directory receiving the dump files (default: data/processed/synthetic).",
+    )
+    parser.add_argument("--declarations", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--family-fraction",
+        type=float,
+        default=0.35,
+        help="Expected share of declarations in the algebra families (default: 0.35).",
+    )
+    parser.add_argument(
+        "--counterpart-probability",
+        type=float,
+        default=0.5,
+        help="Probability that a family concept is declared in each family (default: 0.5).",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    config = ProjectConfig()
+    parser = build_parser(config)
+    args = parser.parse_args(argv)
+    try:
+        dump_config = SyntheticDumpConfig(
+            declarations=args.declarations,
+            seed=args.seed,
+            family_prefixes=config.algebra_name_prefixes,
+            family_fraction=args.family_fraction,
+            counterpart_probability=args.counterpart_probability,
+        )
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+
+    premises_path = args.output_dir / config.premises_file
+    decl_types_path = args.output_dir / config.decl_types_file
+    stats = write_synthetic_dump(premises_path, decl_types_path, dump_config)
+    print(
+        f"Wrote {stats.declarations} declarations ({stats.family_declarations} in families, "
+        f"{stats.dependencies} dependencies) to {premises_path} and {decl_types_path}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
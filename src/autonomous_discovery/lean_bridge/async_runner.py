@@ -0,0 +1,147 @@
+"""AsyncLeanRunner: asyncio subprocess bridge with streamed, byte-capped output."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from autonomous_discovery.lean_bridge.runner import DEFAULT_TIMEOUT, LeanResult
+
+DEFAULT_MAX_OUTPUT_BYTES = 64 * 1024
+TRUNCATION_MARKER = "...<truncated>"
+
+_READ_CHUNK_BYTES = 8192
+# Grace period for pipe readers after the process group has been killed.
+_DRAIN_GRACE_SECONDS = 1.0
+
+
+class AsyncLeanRunner:
+    """Awaitable subprocess bridge to Lean 4 and Lake.
+
+    Each command runs in its own session so a timeout or cancellation can kill the
+    whole process group (including children spawned under a sandbox prefix).
+    stdout/stderr are streamed and capped at ``max_output_bytes`` while reading, so
+    a chatty compiler cannot grow memory without bound.
+    """
+
+    def __init__(
+        self,
+        project_dir: str | Path | None = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        *,
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+        max_concurrency: int | None = None,
+    ) -> None:
+        if max_output_bytes <= 0:
+            raise ValueError("max_output_bytes must be a positive integer")
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer")
+        self.project_dir = str(project_dir) if project_dir else None
+        self.timeout = timeout
+        self.max_output_bytes = max_output_bytes
+        self.max_concurrency = max_concurrency
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+    async def check_lean_available(self) -> bool:
+        """Check if `lean` is on PATH and responds."""
+        result = await self.run_command(["lean", "--version"], timeout=30)
+        return result.success
+
+    async def run_command(
+        self,
+        cmd: list[str],
+        *,
+        timeout: float | None = None,
+        cwd: str | None = None,
+    ) -> LeanResult:
+        """Run an arbitrary command and capture capped output."""
+        effective_timeout = timeout if timeout is not None else self.timeout
+        effective_cwd = cwd if cwd is not None else self.project_dir
+        async with self._slot():
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=effective_cwd,
+                    start_new_session=True,
+                )
+            except (FileNotFoundError, OSError) as e:
+                return LeanResult(stdout="", stderr=str(e), returncode=-1, timed_out=False)
+
+            assert proc.stdout is not None and proc.stderr is not None
+            stdout_task = asyncio.create_task(_read_capped(proc.stdout, self.max_output_bytes))
+            stderr_task = asyncio.create_task(_read_capped(proc.stderr, self.max_output_bytes))
+            timed_out = False
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=effective_timeout)
+            except TimeoutError:
+                timed_out = True
+            finally:
+                if proc.returncode is None:
+                    _kill_process_group(proc)
+                    await proc.wait()
+                    if not timed_out:
+                        # Cancelled by the caller: do not leave readers behind.
+                        stdout_task.cancel()
+                        stderr_task.cancel()
+
+            stdout = await _finish_reader(stdout_task)
+            stderr = await _finish_reader(stderr_task)
+            return LeanResult(
+                stdout=stdout,
+                stderr=stderr,
+                returncode=-1 if timed_out else proc.returncode,
+                timed_out=timed_out,
+            )
+
+    async def run_lake(self, *args: str, timeout: float | None = None) -> LeanResult:
+        """Run a `lake` command in the project directory."""
+        return await self.run_command(["lake", *args], timeout=timeout, cwd=self.project_dir)
+
+    @asynccontextmanager
+    async def _slot(self) -> AsyncIterator[None]:
+        if self.max_concurrency is None:
+            yield
+            return
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        async with self._semaphore:
+            yield
+
+
+async def _read_capped(stream: asyncio.StreamReader, max_bytes: int) -> str:
+    """Drain ``stream`` to EOF, keeping at most ``max_bytes`` of its content."""
+    kept = bytearray()
+    truncated = False
+    while chunk := await stream.read(_READ_CHUNK_BYTES):
+        room = max_bytes - len(kept)
+        if room > 0:
+            kept.extend(chunk[:room])
+        if len(chunk) > room:
+            truncated = True
+    text = kept.decode("utf-8", errors="replace")
+    return text + TRUNCATION_MARKER if truncated else text
+
+
+async def _finish_reader(task: asyncio.Task[str]) -> str:
+    try:
+        # wait_for cancels the reader if an escaped grandchild keeps the pipe open.
+        return await asyncio.wait_for(task, timeout=_DRAIN_GRACE_SECONDS)
+    except TimeoutError:
+        return ""
+
+
+def _kill_process_group(proc: asyncio.subprocess.Process) -> None:
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
@@ -6,10 +6,25 @@ from autonomous_discovery.novelty_checker.basic import (
     SemanticComparator,
     SemanticComparison,
 )
+from autonomous_discovery.novelty_checker.canonical import (
+    CanonicalKeys,
+    canonical_keys,
+    canonical_keys_batch,
+)
+from autonomous_discovery.novelty_checker.lsh import MinHashLSH
+from autonomous_discovery.novelty_checker.mathlib_index import MathlibTheoremIndex
+from autonomous_discovery.novelty_checker.store import NOVELTY_LAYERS, NoveltyStore
 
 __all__ = [
     "BasicNoveltyChecker",
+    "CanonicalKeys",
+    "MathlibTheoremIndex",
+    "MinHashLSH",
+    "NOVELTY_LAYERS",
     "NoveltyDecision",
+    "NoveltyStore",
     "SemanticComparator",
     "SemanticComparison",
+    "canonical_keys",
+    "canonical_keys_batch",
 ]
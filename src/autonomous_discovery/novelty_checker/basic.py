@@ -6,15 +6,40 @@ Layers are evaluated in order:
 3. lightweight defEq-style duplicate via binder alpha-normalization
 4. bi-implication duplicate (P ↔ Q)
 
+Layer keys come from :func:`canonical_keys`, which derives all of them from one
+tokenization of the statement and memoizes the result. ``check_batch`` computes
+the keys of a whole batch up front, in parallel for large batches.
+
 Optional semantic comparison can be plugged in as a final duplicate check.
+An optional :class:`NoveltyStore` extends layers 1-4 to statements remembered
+in earlier cycles, and an optional ``MathlibTheoremIndex`` rejects restatements
+of existing Mathlib theorems (layers 3-4 keys) as ``mathlib_duplicate``.
+With a :class:`MinHashLSH` index, the semantic layer compares only against
+near-duplicate candidates retrieved from the whole history instead of the most
+recent statements.
 """
 
 from __future__ import annotations
 
 import logging
-import re
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
+
+from autonomous_discovery.novelty_checker.canonical import (
+    CanonicalKeys,
+    canonical_keys,
+    canonical_keys_batch,
+    process_pool,
+    strip_wrapping_parens,
+)
+from autonomous_discovery.novelty_checker.lsh import MinHashLSH
+from autonomous_discovery.novelty_checker.store import NoveltyStore
+
+if TYPE_CHECKING:
+    from autonomous_discovery.novelty_checker.mathlib_index import MathlibTheoremIndex
 
 logger = logging.getLogger(__name__)
 
@@ -50,60 +75,148 @@ class BasicNoveltyChecker:
 
     This checker is stateful: novel statements are added to ``existing_statements``.
     Normalization strips line comments only (not nested Lean block comments).
+    With a ``store``, each layer also consults statements persisted by
+    ``remember`` (typically in earlier cycles); ``is_novel`` itself never writes
+    to the store. ``batch_workers`` bounds the process pool large batches use
+    for key computation; it starts on first use and is kept until :meth:`close`.
     """
 
     existing_statements: set[str] = field(default_factory=set)
     semantic_comparator: SemanticComparator | None = None
     semantic_compare_limit: int = 20
     semantic_confidence_threshold: float = 0.9
+    store: NoveltyStore | None = None
+    mathlib_index: MathlibTheoremIndex | None = None
+    lsh: MinHashLSH | None = None
+    batch_workers: int = 4
 
     _normalized_existing: set[str] = field(init=False, default_factory=set)
     _defeq_existing: set[str] = field(init=False, default_factory=set)
     _bi_implication_existing: set[tuple[str, str]] = field(init=False, default_factory=set)
     _seen_order: list[str] = field(init=False, default_factory=list)
+    _lsh_loaded_store: bool = field(init=False, default=False)
+    _pool: ProcessPoolExecutor | None = field(init=False, default=None, repr=False)
+    _pool_lock: threading.Lock = field(init=False, default_factory=threading.Lock, repr=False)
 
     def __post_init__(self) -> None:
-        for statement in self.existing_statements:
-            self._index_statement(statement)
+        seed = list(self.existing_statements)
+        for statement, keys in zip(seed, self._keys_batch(seed), strict=True):
+            self._index_statement(statement, keys)
+
+    def __enter__(self) -> BasicNoveltyChecker:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def is_novel(self, statement: str) -> NoveltyDecision:
-        if statement in self.existing_statements:
+        return self._decide(statement, canonical_keys(statement))
+
+    def check_batch(self, statements: Iterable[str]) -> list[NoveltyDecision]:
+        """Decisions for ``statements`` in input order, as sequential ``is_novel`` calls.
+
+        Canonical keys are computed for the whole batch first; the stateful
+        layer checks then run one statement at a time, so a statement is still
+        rejected as a duplicate of an earlier one in the same batch.
+        """
+        items = list(statements)
+        keys = self._keys_batch(items)
+        return [self._decide(statement, k) for statement, k in zip(items, keys, strict=True)]
+
+    def close(self) -> None:
+        """Shut down the key-computation workers; a later large batch starts new ones."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def _keys_batch(self, statements: list[str]) -> list[CanonicalKeys]:
+        return canonical_keys_batch(
+            statements, max_workers=self.batch_workers, pool=self._process_pool
+        )
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = process_pool(self.batch_workers)
+            return self._pool
+
+    def _decide(self, statement: str, keys: CanonicalKeys) -> NoveltyDecision:
+        if statement in self.existing_statements or self._stored("exact", statement):
             return NoveltyDecision(is_novel=False, reason="exact_duplicate")
 
-        normalized = self._normalize(statement)
-        if normalized in self._normalized_existing:
+        if keys.normalized in self._normalized_existing or self._stored(
+            "normalized", keys.normalized
+        ):
             return NoveltyDecision(is_novel=False, reason="normalized_duplicate")
 
-        defeq_key = self._defeq_key(statement)
-        if defeq_key in self._defeq_existing:
+        if keys.defeq in self._defeq_existing or self._stored("defeq", keys.defeq):
             return NoveltyDecision(is_novel=False, reason="defeq_duplicate")
 
-        bi_implication_key = self._bi_implication_key(statement)
-        if bi_implication_key is not None and bi_implication_key in self._bi_implication_existing:
+        bi_implication_key = keys.bi_implication
+        if bi_implication_key is not None and (
+            bi_implication_key in self._bi_implication_existing
+            or self._stored("bi_implication", _pair_key(bi_implication_key))
+        ):
             return NoveltyDecision(is_novel=False, reason="bi_implication_duplicate")
 
-        semantic = self._semantic_decision(statement)
+        if self.mathlib_index is not None and (
+            self.mathlib_index.contains("defeq", keys.defeq)
+            or (
+                bi_implication_key is not None
+                and self.mathlib_index.contains("bi_implication", _pair_key(bi_implication_key))
+            )
+        ):
+            return NoveltyDecision(is_novel=False, reason="mathlib_duplicate", layer="mathlib")
+
+        semantic = self._semantic_decision(statement, keys)
         if semantic is not None:
             return semantic
 
-        self._index_statement(statement)
+        self._index_statement(statement, keys)
         return NoveltyDecision(is_novel=True, reason="novel")
 
-    def _index_statement(self, statement: str) -> None:
+    def remember(self, statement: str) -> None:
+        """Index ``statement`` and persist it to the store so later cycles see it."""
+        keys = canonical_keys(statement)
+        if statement not in self.existing_statements:
+            self._index_statement(statement, keys)
+        if self.store is not None:
+            self.store.add(
+                statement,
+                normalized=keys.normalized,
+                defeq=keys.defeq,
+                bi_implication=_pair_key(keys.bi_implication) if keys.bi_implication else None,
+            )
+
+    def _stored(self, layer: str, key: str) -> bool:
+        return self.store is not None and self.store.contains(layer, key)
+
+    def _index_statement(self, statement: str, keys: CanonicalKeys) -> None:
         self.existing_statements.add(statement)
         self._seen_order.append(statement)
-        self._normalized_existing.add(self._normalize(statement))
-        self._defeq_existing.add(self._defeq_key(statement))
-        bi_key = self._bi_implication_key(statement)
-        if bi_key is not None:
-            self._bi_implication_existing.add(bi_key)
-
-    def _semantic_decision(self, statement: str) -> NoveltyDecision | None:
-        if self.semantic_comparator is None or not self._seen_order:
+        self._normalized_existing.add(keys.normalized)
+        self._defeq_existing.add(keys.defeq)
+        if self.lsh is not None:
+            self.lsh.add(keys.defeq, statement)
+        if keys.bi_implication is not None:
+            self._bi_implication_existing.add(keys.bi_implication)
+
+    def _semantic_decision(self, statement: str, keys: CanonicalKeys) -> NoveltyDecision | None:
+        if self.semantic_comparator is None:
+            return None
+        if self.lsh is not None:
+            compare_scope = self._lsh_candidates(keys.defeq)
+        else:
+            compare_scope = self._seen_order[-self.semantic_compare_limit :]
+            if self.store is not None:
+                stored = self.store.recent(self.semantic_compare_limit)
+                compare_scope = list(dict.fromkeys([*stored, *compare_scope]))
+                compare_scope = compare_scope[-self.semantic_compare_limit :]
+        if not compare_scope:
             return None
 
         best_low_confidence: float | None = None
-        compare_scope = self._seen_order[-self.semantic_compare_limit :]
         for previous in reversed(compare_scope):
             try:
                 comparison = self.semantic_comparator.compare(statement, previous)
@@ -132,87 +245,19 @@ class BasicNoveltyChecker:
 
         return None
 
-    def _normalize(self, statement: str) -> str:
-        without_line_comments = re.sub(r"--.*$", "", statement, flags=re.MULTILINE)
-        return re.sub(r"\s+", " ", without_line_comments).strip()
-
-    def _defeq_key(self, statement: str) -> str:
-        body = self._statement_body(statement)
-        return self._alpha_normalize_binders(body)
-
-    def _statement_body(self, statement: str) -> str:
-        normalized = self._normalize(statement)
-        theorem_prefix = re.match(r"^\s*theorem\s+[A-Za-z_][A-Za-z0-9_']*\s*:\s*(.+)$", normalized)
-        if theorem_prefix:
-            return theorem_prefix.group(1).strip()
-        parts = normalized.split(":", maxsplit=1)
-        if len(parts) == 2:
-            return parts[1].strip()
-        return normalized
-
-    def _alpha_normalize_binders(self, expr: str) -> str:
-        binder_names: list[str] = []
-        pattern = (
-            r"(?:∀|forall)\s*(?:\(\s*([A-Za-z_][A-Za-z0-9_']*)\s*:|"
-            r"([A-Za-z_][A-Za-z0-9_']*)\s*:)"
-        )
-        for match in re.finditer(pattern, expr):
-            name = match.group(1) or match.group(2)
-            if name:
-                binder_names.append(name)
-
-        mapping: dict[str, str] = {}
-        for name in binder_names:
-            if name not in mapping:
-                mapping[name] = f"v{len(mapping) + 1}"
-
-        normalized = expr
-        for original, canonical in mapping.items():
-            normalized = re.sub(rf"\b{re.escape(original)}\b", canonical, normalized)
-        normalized = re.sub(r"\bforall\b", "∀", normalized)
-        normalized = re.sub(
-            r"∀\s*\(\s*([A-Za-z_][A-Za-z0-9_']*)\s*:\s*([^)]+?)\s*\)",
-            r"∀ \1 : \2",
-            normalized,
-        )
-        return re.sub(r"\s+", " ", normalized).strip()
-
-    def _bi_implication_key(self, statement: str) -> tuple[str, str] | None:
-        body = self._statement_body(statement)
-        if "↔" in body:
-            left, right = body.split("↔", maxsplit=1)
-            return self._canonical_relation_pair(left, right)
+    def _lsh_candidates(self, defeq_key: str) -> list[str]:
+        assert self.lsh is not None
+        if self.store is not None and not self._lsh_loaded_store:
+            for stored in self.store.iter_statements():
+                self.lsh.add(canonical_keys(stored).defeq, stored)
+            self._lsh_loaded_store = True
+        # Most similar first; the comparison loop walks the scope in reverse.
+        candidates = self.lsh.query(defeq_key, limit=self.semantic_compare_limit)
+        return candidates[::-1]
 
-        return None
+    def _strip_wrapping_parens(self, text: str) -> str:
+        return strip_wrapping_parens(text)
 
-    def _canonical_relation_pair(self, left: str, right: str) -> tuple[str, str] | None:
-        left_norm = self._strip_wrapping_parens(self._normalize(left))
-        right_norm = self._strip_wrapping_parens(self._normalize(right))
-        if not left_norm or not right_norm:
-            return None
-        return tuple(sorted((left_norm, right_norm)))
 
-    def _strip_wrapping_parens(self, text: str) -> str:
-        candidate = text.strip()
-        while self._is_fully_wrapped(candidate):
-            inner = candidate[1:-1].strip()
-            if not inner:
-                break
-            candidate = inner
-        return candidate
-
-    def _is_fully_wrapped(self, text: str) -> bool:
-        if len(text) < 2 or text[0] != "(" or text[-1] != ")":
-            return False
-
-        depth = 0
-        for index, char in enumerate(text):
-            if char == "(":
-                depth += 1
-            elif char == ")":
-                depth -= 1
-                if depth < 0:
-                    return False
-                if depth == 0 and index != len(text) - 1:
-                    return False
-        return depth == 0
+def _pair_key(pair: tuple[str, str]) -> str:
+    return "\x00".join(pair)
@@ -0,0 +1,294 @@
+"""Single-pass canonicalization of Lean statements into novelty-layer keys.
+
+:func:`canonical_keys` normalizes a statement once and derives every layer key
+from that result:
+
+- ``normalized``: line comments removed and whitespace collapsed.
+- ``body``: the proposition after ``theorem name :``.
+- ``defeq``: the body tokenized once, with quantifier binders expanded to one
+  ``∀ v : T ,`` per name and renamed ``v1, v2, ...`` in binding order, and
+  tokens joined by single spaces.
+- ``bi_implication``: the sorted sides of the first ``↔``, outer parentheses
+  stripped.
+
+Results are memoized per statement string. :func:`canonical_keys_batch` computes
+keys for large batches in a process pool.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import re
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
+CANONICAL_CACHE_SIZE = 1 << 16
+# Below this many distinct statements, process start-up costs more than it saves.
+PARALLEL_MIN_BATCH = 256
+
+_COMMENT_OR_SPACE_RE = re.compile(r"(?:--[^\n]*|\s)+")
+_DECLARATION_HEADER_RE = re.compile(r"^\s*(?:theorem|lemma)\s+[A-Za-z_][A-Za-z0-9_'.]*")
+# Universe levels written after ``Type``/``Sort``: ``u``, ``u_1``, ``v2``, ``_``.
+_UNIVERSE_RE = re.compile(r"[uvw](?:_?\d+)?|_")
+_TOKEN_RE = re.compile(
+    r"(?P<ident>[^\W\d][\w'.!?]*)|(?P<number>\d+(?:\.\d+)?)|(?P<op><->|->|:=|::)|\S"
+)
+
+_QUANTIFIERS = {"∀": "∀", "forall": "∀", "∃": "∃"}
+_SYMBOL_ALIASES = {"->": "→", "<->": "↔"}
+_BRACKETS = {"(": ")", "{": "}", "[": "]", "⦃": "⦄"}
+_CLOSING = frozenset(_BRACKETS.values())
+
+
+@dataclass(frozen=True, slots=True)
+class CanonicalKeys:
+    """Every novelty-layer key of one statement."""
+
+    normalized: str
+    body: str
+    defeq: str
+    bi_implication: tuple[str, str] | None
+
+
+@lru_cache(maxsize=CANONICAL_CACHE_SIZE)
+def canonical_keys(statement: str) -> CanonicalKeys:
+    normalized = normalize_statement(statement)
+    body = _statement_body(normalized)
+
+    bi_implication: tuple[str, str] | None = None
+    if "↔" in body:
+        left, right = (strip_wrapping_parens(side) for side in body.split("↔", maxsplit=1))
+        if left and right:
+            bi_implication = (left, right) if left <= right else (right, left)
+
+    return CanonicalKeys(
+        normalized=normalized,
+        body=body,
+        defeq=alpha_normalize(body),
+        bi_implication=bi_implication,
+    )
+
+
+def process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """A pool of ``max_workers`` processes started from a fork server.
+
+    Forking the caller could copy locks held by its other threads (e.g. pipeline
+    stages) into the workers, where nothing would ever release them.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("forkserver")
+    )
+
+
+def canonical_keys_batch(
+    statements: Iterable[str],
+    *,
+    max_workers: int = 4,
+    pool: Callable[[], Executor] | None = None,
+) -> list[CanonicalKeys]:
+    """Keys for ``statements``, in input order.
+
+    Repeated statements are canonicalized once. Batches of at least
+    ``PARALLEL_MIN_BATCH`` distinct statements are spread over the executor
+    ``pool`` returns, or else over a :func:`process_pool` of ``max_workers``
+    processes started for this call; smaller ones (or ``max_workers <= 1``) run
+    in-process and fill the memo cache.
+    """
+    items = list(statements)
+    unique = list(dict.fromkeys(items))
+    if max_workers <= 1 or len(unique) < PARALLEL_MIN_BATCH:
+        computed = [canonical_keys(statement) for statement in unique]
+    else:
+        chunksize = max(1, len(unique) // (max_workers * 4))
+        if pool is not None:
+            computed = list(pool().map(canonical_keys, unique, chunksize=chunksize))
+        else:
+            with process_pool(max_workers) as executor:
+                computed = list(executor.map(canonical_keys, unique, chunksize=chunksize))
+    by_statement = dict(zip(unique, computed, strict=True))
+    return [by_statement[statement] for statement in items]
+
+
+def _statement_body(normalized: str) -> str:
+    """The proposition a declaration states, with pre-colon binders as ``∀`` binders.
+
+    ``theorem t (n m : Nat) : n + m = m + n`` and
+    ``theorem t : ∀ (n m : Nat), n + m = m + n`` share the body
+    ``∀ (n m : Nat), n + m = m + n``.
+    """
+    header = _DECLARATION_HEADER_RE.match(normalized)
+    if header:
+        rest = normalized[header.end() :]
+        colon = _top_level_colon(rest)
+        if colon is not None:
+            binders, body = rest[:colon].strip(), rest[colon + 1 :].strip()
+            return f"∀ {binders}, {body}" if binders else body
+    _, colon_text, rest = normalized.partition(":")
+    return rest.strip() if colon_text else normalized
+
+
+def _top_level_colon(text: str) -> int | None:
+    """Index of the first ``:`` outside brackets that does not start ``:=``."""
+    depth = 0
+    for index, char in enumerate(text):
+        if char in _BRACKETS:
+            depth += 1
+        elif char in _CLOSING:
+            depth -= 1
+        elif char == ":" and depth == 0 and not text.startswith(":=", index):
+            return index
+    return None
+
+
+def normalize_statement(text: str) -> str:
+    """Drop ``--`` line comments and collapse whitespace in one substitution."""
+    return _COMMENT_OR_SPACE_RE.sub(" ", text).strip()
+
+
+def alpha_normalize(expr: str) -> str:
+    """Tokenize ``expr`` and rename quantifier binders in binding order.
+
+    Instance binder names are dropped (``[inst : C α]`` renders as ``[C α]``)
+    and universe annotations collapse (``Type u_1`` and ``Type*`` both render
+    as ``Type*``).
+    """
+    tokens = [(match.lastgroup, match.group()) for match in _TOKEN_RE.finditer(expr)]
+    out: list[str] = []
+    _render(tokens, 0, len(tokens), {}, out)
+    return " ".join(out)
+
+
+def strip_wrapping_parens(text: str) -> str:
+    candidate = text.strip()
+    while _is_fully_wrapped(candidate):
+        inner = candidate[1:-1].strip()
+        if not inner:
+            break
+        candidate = inner
+    return candidate
+
+
+def _is_fully_wrapped(text: str) -> bool:
+    if len(text) < 2 or text[0] != "(" or text[-1] != ")":
+        return False
+
+    depth = 0
+    for index, char in enumerate(text):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth < 0:
+                return False
+            if depth == 0 and index != len(text) - 1:
+                return False
+    return depth == 0
+
+
+_Token = tuple[str | None, str]
+
+
+def _render(
+    tokens: list[_Token], start: int, end: int, mapping: dict[str, str], out: list[str]
+) -> None:
+    index = start
+    while index < end:
+        kind, text = tokens[index]
+        if text in _QUANTIFIERS:
+            index = _render_quantifier(tokens, index, end, mapping, out)
+            continue
+        if kind == "ident" and text in ("Type", "Sort") and index + 1 < end:
+            level = tokens[index + 1][1]
+            if level == "*" or _UNIVERSE_RE.fullmatch(level):
+                out.append(f"{text}*")
+                index += 2
+                continue
+        if kind == "ident":
+            head, dot, rest = text.partition(".")
+            out.append(mapping[head] + dot + rest if head in mapping else text)
+        else:
+            out.append(_SYMBOL_ALIASES.get(text, text))
+        index += 1
+
+
+def _render_quantifier(
+    tokens: list[_Token], start: int, end: int, mapping: dict[str, str], out: list[str]
+) -> int:
+    """Emit ``∀ v : T ,`` per bound name; returns the index after the binder list."""
+    quantifier = _QUANTIFIERS[tokens[start][1]]
+    index = start + 1
+    while index < end and tokens[index][1] != ",":
+        opener = tokens[index][1]
+        if opener in _BRACKETS:
+            close = _matching_close(tokens, index, end)
+            names_end = _names_end(tokens, index + 1, close)
+            names_start, type_end, next_index = index + 1, close, close + 1
+            if names_end == close or tokens[names_end][1] != ":":
+                # Anonymous binder such as ``[Group G]``: no names, all type.
+                names_end = index + 1
+            elif opener == "[":
+                # ``[inst : Group G]`` is the same binder as ``[Group G]``.
+                names_start = names_end = names_end + 1
+        else:
+            names_end = _names_end(tokens, index, end)
+            if names_end == index:
+                break
+            follower = tokens[names_end][1] if names_end < end else ","
+            type_end = names_end if follower in _BRACKETS else _group_end(tokens, names_end, end)
+            opener, names_start, next_index = "", index, type_end
+
+        names = [text for _, text in tokens[names_start:names_end]]
+        for name in names:
+            if name not in mapping:
+                mapping[name] = f"v{len(mapping) + 1}"
+        binder_type: list[str] = []
+        _render(tokens, names_end, type_end, mapping, binder_type)
+        for binder in [[mapping[name], *binder_type] for name in names] or [binder_type]:
+            if opener in ("", "("):
+                out.extend([quantifier, *binder, ","])
+            else:
+                out.extend([quantifier, opener, *binder, _BRACKETS[opener], ","])
+        index = next_index
+
+    if index == start + 1:
+        out.append(quantifier)
+        return index
+    if index < end and tokens[index][1] == ",":
+        return index + 1
+    return index
+
+
+def _names_end(tokens: list[_Token], start: int, end: int) -> int:
+    index = start
+    while index < end and tokens[index][0] == "ident":
+        index += 1
+    return index
+
+
+def _matching_close(tokens: list[_Token], start: int, end: int) -> int:
+    depth = 0
+    for index in range(start, end):
+        text = tokens[index][1]
+        if text in _BRACKETS:
+            depth += 1
+        elif text in _CLOSING:
+            depth -= 1
+            if depth == 0:
+                return index
+    return end
+
+
+def _group_end(tokens: list[_Token], start: int, end: int) -> int:
+    """End of a bare binder group: the next ``,`` outside brackets."""
+    depth = 0
+    for index in range(start, end):
+        text = tokens[index][1]
+        if text in _BRACKETS:
+            depth += 1
+        elif text in _CLOSING:
+            depth -= 1
+        elif text == "," and depth <= 0:
+            return index
+    return end
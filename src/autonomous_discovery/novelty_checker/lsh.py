@@ -0,0 +1,115 @@
+"""MinHash locality-sensitive hashing for near-duplicate statement retrieval."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+import numpy as np
+import numpy.typing as npt
+
+_TOKEN_RE = re.compile(r"\w+|[^\s\w]")
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def shingles(text: str, size: int) -> set[str]:
+    """Token ``size``-grams of ``text``; short texts yield one shingle of all tokens."""
+    tokens = _TOKEN_RE.findall(text)
+    if len(tokens) <= size:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+@dataclass(slots=True)
+class MinHashLSH:
+    """Banded MinHash index over token shingles.
+
+    Each key gets ``num_perm`` MinHash values split into ``bands`` bands; two keys
+    become candidates when any band matches exactly, so retrieval touches only
+    the buckets of the query rather than the whole history. With ``r`` rows per
+    band, pairs with Jaccard similarity ``s`` collide with probability
+    ``1 - (1 - s**r) ** bands``.
+    """
+
+    num_perm: int = 64
+    bands: int = 16
+    shingle_size: int = 3
+    seed: int = 0
+
+    _multipliers: npt.NDArray[np.uint64] = field(init=False, repr=False)
+    _offsets: npt.NDArray[np.uint64] = field(init=False, repr=False)
+    _buckets: dict[tuple[int, bytes], list[int]] = field(init=False, repr=False)
+    _items: list[str] = field(init=False, repr=False)
+    _signatures: list[npt.NDArray[np.uint64]] = field(init=False, repr=False)
+    _index_of: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.num_perm <= 0 or self.bands <= 0:
+            raise ValueError("num_perm and bands must be positive integers")
+        if self.num_perm % self.bands:
+            raise ValueError("num_perm must be divisible by bands")
+        if self.shingle_size <= 0:
+            raise ValueError("shingle_size must be a positive integer")
+        rng = np.random.default_rng(self.seed)
+        info = np.iinfo(np.uint64)
+        # Odd multipliers keep each permutation a bijection on 64-bit words.
+        self._multipliers = rng.integers(0, info.max, size=self.num_perm, dtype=np.uint64) | 1
+        self._offsets = rng.integers(0, info.max, size=self.num_perm, dtype=np.uint64)
+        self._buckets = defaultdict(list)
+        self._items = []
+        self._signatures = []
+        self._index_of = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def signature(self, key: str) -> npt.NDArray[np.uint64]:
+        hashed = np.array([_hash64(s) for s in shingles(key, self.shingle_size)], dtype=np.uint64)
+        if hashed.size == 0:
+            return np.full(self.num_perm, np.iinfo(np.uint64).max, dtype=np.uint64)
+        mixed = (hashed[:, None] ^ self._offsets[None, :]) * self._multipliers[None, :]
+        mixed ^= mixed >> np.uint64(29)
+        mixed *= _MIX
+        return mixed.min(axis=0)
+
+    def add(self, key: str, item: str) -> None:
+        """Index ``item`` under ``key`` (e.g. an alpha-normalized statement body)."""
+        if item in self._index_of:
+            return
+        signature = self.signature(key)
+        position = len(self._items)
+        self._items.append(item)
+        self._signatures.append(signature)
+        self._index_of[item] = position
+        for bucket in self._band_keys(signature):
+            self._buckets[bucket].append(position)
+
+    def query(self, key: str, *, limit: int | None = None) -> list[str]:
+        """Items sharing a band with ``key``, by descending estimated Jaccard similarity."""
+        signature = self.signature(key)
+        found: set[int] = set()
+        for bucket in self._band_keys(signature):
+            found.update(self._buckets.get(bucket, ()))
+        scored = sorted(
+            found,
+            key=lambda position: (
+                -int(np.count_nonzero(self._signatures[position] == signature)),
+                position,
+            ),
+        )
+        if limit is not None:
+            scored = scored[:limit]
+        return [self._items[position] for position in scored]
+
+    def _band_keys(self, signature: npt.NDArray[np.uint64]) -> list[tuple[int, bytes]]:
+        rows = self.num_perm // self.bands
+        return [
+            (band, signature[band * rows : (band + 1) * rows].tobytes())
+            for band in range(self.bands)
+        ]
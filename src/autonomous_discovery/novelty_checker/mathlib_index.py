@@ -0,0 +1,129 @@
+"""Memory-mapped hash index of Mathlib theorem statements for novelty checks.
+
+The index is built once per ``decl_types.txt`` snapshot. Each theorem type is
+canonicalized with the same :func:`canonical_keys` the novelty checker uses
+for its defeq and bi-implication layers, hashed to 64 bits and stored as a sorted
+``uint64`` array. Loading memory-maps the arrays, so startup does not depend
+on the number of theorems, and a lookup is a binary search over the mapping.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from autonomous_discovery.knowledge_base.parser import DeclarationEntry, parse_declaration_types
+from autonomous_discovery.novelty_checker.basic import _pair_key
+from autonomous_discovery.novelty_checker.canonical import canonical_keys
+
+# Version 2: defeq keys are token-joined with multi-name binders expanded.
+# Version 3: instance binder names and universe levels are dropped from defeq keys.
+FORMAT_VERSION = 3
+MANIFEST_NAME = "manifest.json"
+INDEX_LAYERS: tuple[str, ...] = ("defeq", "bi_implication")
+
+# Any valid name works: ``canonical_keys`` strips the header before keying.
+_PLACEHOLDER_NAME = "mathlib_theorem"
+
+
+def key_hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _snapshot_id(decl_types_path: Path) -> str:
+    stat = decl_types_path.stat()
+    return f"{decl_types_path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def statement_keys(statement: str) -> dict[str, str | None]:
+    """Layer keys for ``statement``, as compared against the index."""
+    keys = canonical_keys(statement)
+    return {
+        "defeq": keys.defeq,
+        "bi_implication": _pair_key(keys.bi_implication) if keys.bi_implication else None,
+    }
+
+
+class MathlibTheoremIndex:
+    """Sorted 64-bit key hashes of every Mathlib theorem, one array per layer."""
+
+    def __init__(self, index_dir: Path, *, mmap: bool = True) -> None:
+        manifest = json.loads((index_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        if manifest.get("format_version") != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported Mathlib index format version: {manifest.get('format_version')}"
+            )
+        self.index_dir = index_dir
+        self.snapshot: str = manifest["snapshot"]
+        self.theorem_count = int(manifest["theorem_count"])
+        mode = "r" if mmap else None
+        self._layers: dict[str, npt.NDArray[np.uint64]] = {
+            layer: np.load(index_dir / f"{layer}.npy", mmap_mode=mode) for layer in INDEX_LAYERS
+        }
+
+    @classmethod
+    def build(
+        cls,
+        declarations: Iterable[DeclarationEntry],
+        index_dir: Path,
+        *,
+        snapshot: str = "",
+    ) -> MathlibTheoremIndex:
+        """Index every ``theorem`` declaration and write the arrays to ``index_dir``."""
+        hashes: dict[str, set[int]] = {layer: set() for layer in INDEX_LAYERS}
+        theorem_count = 0
+        for entry in declarations:
+            if entry.kind != "theorem":
+                continue
+            theorem_count += 1
+            statement = f"theorem {_PLACEHOLDER_NAME} : {entry.type_signature}"
+            for layer, key in statement_keys(statement).items():
+                if key is not None:
+                    hashes[layer].add(key_hash(key))
+
+        index_dir.mkdir(parents=True, exist_ok=True)
+        for layer, values in hashes.items():
+            array = np.fromiter(sorted(values), dtype=np.uint64, count=len(values))
+            np.save(index_dir / f"{layer}.npy", array)
+        manifest = {
+            "format_version": FORMAT_VERSION,
+            "snapshot": snapshot,
+            "theorem_count": theorem_count,
+        }
+        (index_dir / MANIFEST_NAME).write_text(
+            json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        return cls(index_dir)
+
+    @classmethod
+    def load_or_build(cls, decl_types_path: Path, index_dir: Path) -> MathlibTheoremIndex:
+        """Open the index for this ``decl_types.txt`` snapshot, rebuilding it if stale."""
+        snapshot = _snapshot_id(decl_types_path)
+        manifest_path = index_dir / MANIFEST_NAME
+        if manifest_path.exists():
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            if (
+                manifest.get("format_version") == FORMAT_VERSION
+                and manifest.get("snapshot") == snapshot
+            ):
+                return cls(index_dir)
+        declarations = parse_declaration_types(decl_types_path.read_text(encoding="utf-8"))
+        return cls.build(declarations, index_dir, snapshot=snapshot)
+
+    def contains(self, layer: str, key: str) -> bool:
+        array = self._layers[layer]
+        value = np.uint64(key_hash(key))
+        position = int(np.searchsorted(array, value))
+        return position < len(array) and array[position] == value
+
+    def matches(self, statement: str) -> bool:
+        """Whether ``statement`` restates an indexed theorem on any layer."""
+        return any(
+            key is not None and self.contains(layer, key)
+            for layer, key in statement_keys(statement).items()
+        )
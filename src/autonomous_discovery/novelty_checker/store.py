@@ -0,0 +1,134 @@
+"""SQLite-backed novelty index that persists statements across cycles."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+NOVELTY_LAYERS: tuple[str, ...] = ("exact", "normalized", "defeq", "bi_implication")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS statements (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    statement TEXT NOT NULL,
+    exact_hash BLOB NOT NULL UNIQUE,
+    normalized_hash BLOB NOT NULL,
+    defeq_hash BLOB NOT NULL,
+    bi_implication_hash BLOB,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS statements_normalized ON statements (normalized_hash);
+CREATE INDEX IF NOT EXISTS statements_defeq ON statements (defeq_hash);
+CREATE INDEX IF NOT EXISTS statements_bi_implication ON statements (bi_implication_hash);
+"""
+
+
+def layer_hash(key: str) -> bytes:
+    """Fixed-width digest of a layer key, so indexes stay small for long statements."""
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
+class NoveltyStore:
+    """Persistent per-layer hash index of known statements.
+
+    Each novelty layer (exact text, normalized text, alpha-normalized body and
+    bi-implication pair) has its own indexed hash column, so a lookup is one
+    index probe regardless of how many statements are stored. The database is
+    opened on first use and every ``add`` commits in its own transaction.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def __enter__(self) -> NoveltyStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def contains(self, layer: str, key: str) -> bool:
+        if layer not in NOVELTY_LAYERS:
+            raise ValueError(f"layer must be one of {', '.join(NOVELTY_LAYERS)}")
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    f"SELECT 1 FROM statements WHERE {layer}_hash = ? LIMIT 1", (layer_hash(key),)
+                )
+                .fetchone()
+            )
+        return row is not None
+
+    def add(
+        self,
+        statement: str,
+        *,
+        normalized: str,
+        defeq: str,
+        bi_implication: str | None,
+    ) -> bool:
+        """Record ``statement`` with its layer keys; returns ``False`` if already stored."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO statements (statement, exact_hash, normalized_hash, "
+                    "defeq_hash, bi_implication_hash, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        statement,
+                        layer_hash(statement),
+                        layer_hash(normalized),
+                        layer_hash(defeq),
+                        layer_hash(bi_implication) if bi_implication is not None else None,
+                        time.time(),
+                    ),
+                )
+        return cursor.rowcount == 1
+
+    def recent(self, limit: int) -> list[str]:
+        """Most recently stored statements, oldest first."""
+        if limit <= 0:
+            return []
+        with self._lock:
+            rows = (
+                self._connection()
+                .execute("SELECT statement FROM statements ORDER BY id DESC LIMIT ?", (limit,))
+                .fetchall()
+            )
+        return [str(row[0]) for row in reversed(rows)]
+
+    def iter_statements(self) -> Iterator[str]:
+        """All stored statements, oldest first."""
+        with self._lock:
+            rows = (
+                self._connection()
+                .execute("SELECT statement FROM statements ORDER BY id")
+                .fetchall()
+            )
+        for (statement,) in rows:
+            yield str(statement)
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection().execute("SELECT COUNT(*) FROM statements").fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
@@ -7,12 +7,25 @@ import shlex
 import sys
 from pathlib import Path
 
-from autonomous_discovery.config import ProjectConfig
+import httpx
+
+from autonomous_discovery.config import LLMConfig, ProjectConfig
 from autonomous_discovery.conjecture_generator import (
     OllamaConjectureGenerator,
+    ResponseCache,
     TemplateConjectureGenerator,
 )
-from autonomous_discovery.pipeline.phase2 import run_phase2_cycle
+from autonomous_discovery.conjecture_generator.cache import CACHE_MODES
+from autonomous_discovery.conjecture_generator.protocol import ConjectureGenerator
+from autonomous_discovery.counterexample_filter import (
+    BasicCounterexampleFilter,
+    ChainedCounterexampleFilter,
+    NumericCounterexampleFilter,
+    RuleSetCounterexampleFilter,
+)
+from autonomous_discovery.pipeline.phase2 import CounterexampleFilter, run_phase2_cycle
+from autonomous_discovery.proof_engine.portfolio import PortfolioProofEngine
+from autonomous_discovery.proof_engine.timeouts import AdaptiveTimeoutPolicy
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -45,24 +58,268 @@ def build_parser() -> argparse.ArgumentParser:
         default="template",
         help="Conjecture generator backend (default: template).",
     )
+    parser.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=1,
+        help="Concurrent Ollama requests over one keep-alive connection pool (default: 1).",
+    )
+    parser.add_argument(
+        "--llm-samples-per-gap",
+        type=int,
+        default=1,
+        help=(
+            "Sample each gap with this many seeded Ollama requests in parallel and keep "
+            "every distinct statement, ranked by agreement (default: 1)."
+        ),
+    )
+    parser.add_argument(
+        "--llm-stream",
+        action="store_true",
+        help="Stream Ollama replies and stop reading once a declaration has been emitted.",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        type=Path,
+        default=None,
+        help="SQLite file caching Ollama responses per prompt (ollama generator only).",
+    )
+    parser.add_argument(
+        "--llm-cache-mode",
+        choices=CACHE_MODES,
+        default="read_through",
+        help=(
+            "read_through serves hits and records misses; record_only refreshes entries; "
+            "replay_only never contacts Ollama (default: read_through)."
+        ),
+    )
+    parser.add_argument(
+        "--llm-cache-max-mb",
+        type=int,
+        default=256,
+        help="Evict least recently used cached responses beyond this size (default: 256).",
+    )
+    parser.add_argument(
+        "--adaptive-timeouts",
+        action="store_true",
+        help=(
+            "Derive per-tactic Lean timeouts from previous attempt logs "
+            "(the output dir's phase2_attempts.jsonl plus any --timeout-history files)."
+        ),
+    )
+    parser.add_argument(
+        "--timeout-history",
+        type=Path,
+        action="append",
+        default=[],
+        help=(
+            "Additional phase2_attempts.jsonl file to learn tactic latencies "
+            "and success rates from."
+        ),
+    )
+    parser.add_argument(
+        "--cycle-deadline-s",
+        type=float,
+        default=None,
+        help="Wall-clock budget for the cycle, split across remaining proof attempts.",
+    )
+    parser.add_argument(
+        "--mathlib-prelude",
+        action="store_true",
+        help="Import the pre-built LeanExtract.Prelude module instead of all of Mathlib.",
+    )
+    parser.add_argument(
+        "--proof-portfolio",
+        action="store_true",
+        help=(
+            "Race a portfolio of tactics per conjecture, ordered by historical success "
+            "rate per target family, and stop at the first success."
+        ),
+    )
+    parser.add_argument(
+        "--sandbox-pool-size",
+        type=int,
+        default=0,
+        help=(
+            "Number of long-lived sandboxed Lean workers to reuse across attempts "
+            "(0 starts a fresh sandbox per attempt)."
+        ),
+    )
+    parser.add_argument(
+        "--filter-rules",
+        type=Path,
+        default=None,
+        help=(
+            'JSON list of {"name": ..., "pattern": ...} counterexample filter rules '
+            "(regexes over the lowercased statement), replacing the built-in rules."
+        ),
+    )
+    parser.add_argument(
+        "--numeric-counterexamples",
+        action="store_true",
+        help=(
+            "After the rule filter, reject equational conjectures falsified on small finite "
+            "models (ZMod n, 2x2 matrices, S3) before any proof attempt."
+        ),
+    )
+    parser.add_argument(
+        "--novelty-store",
+        type=Path,
+        default=None,
+        help=(
+            "SQLite file of previously verified statements; duplicates of them are "
+            "rejected and this cycle's verified statements are added."
+        ),
+    )
+    parser.add_argument(
+        "--mathlib-novelty-index",
+        type=Path,
+        default=None,
+        help=(
+            "Directory for a memory-mapped index of all Mathlib theorem statements "
+            "(built from --decl-types-path on first use); restatements are rejected."
+        ),
+    )
+    parser.add_argument(
+        "--family-prefix",
+        action="append",
+        default=None,
+        help=(
+            "Declaration family prefix (e.g. Ring.) to detect gaps between; repeat for "
+            "several families (default: the configured algebra families)."
+        ),
+    )
+    parser.add_argument(
+        "--dedupe-gaps",
+        action="store_true",
+        help=(
+            "Cluster gaps that share a missing declaration or translated statement shape "
+            "and generate conjectures for one representative per cluster."
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Continue an interrupted cycle in --output-dir: reuse its checkpointed gaps, "
+            "conjectures and gating, and skip proof attempts already recorded."
+        ),
+    )
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help=(
+            "Overlap conjecture generation, gating and verification: verify each "
+            "conjecture as soon as it is gated instead of after the whole batch."
+        ),
+    )
+    parser.add_argument(
+        "--pipeline-queue-size",
+        type=int,
+        default=8,
+        help="Maximum conjectures buffered between pipelined stages.",
+    )
+    parser.add_argument(
+        "--trace-path",
+        type=Path,
+        default=None,
+        help=(
+            "Write per-stage wall time, CPU time and peak RSS as a Chrome trace JSON "
+            "(chrome://tracing or Perfetto); the same tree is always in the metrics."
+        ),
+    )
     return parser
 
 
-def main(argv: list[str] | None = None) -> int:
-    args = build_parser().parse_args(argv)
+def argument_error(args: argparse.Namespace) -> str | None:
+    """Why ``args`` cannot start a cycle, or ``None`` if they can."""
     if args.trusted_local_run and not args.i_understand_unsafe:
-        print(
-            (
-                "--trusted-local-run requires --i-understand-unsafe. "
-                "Use sandboxed mode unless inputs are fully trusted."
-            ),
-            file=sys.stderr,
+        return (
+            "--trusted-local-run requires --i-understand-unsafe. "
+            "Use sandboxed mode unless inputs are fully trusted."
+        )
+    if args.llm_concurrency <= 0:
+        return "--llm-concurrency must be a positive integer"
+    if args.llm_samples_per_gap <= 0:
+        return "--llm-samples-per-gap must be a positive integer"
+    if args.llm_cache_max_mb <= 0:
+        return "--llm-cache-max-mb must be a positive integer"
+    return None
+
+
+def build_conjecture_filter(args: argparse.Namespace) -> CounterexampleFilter | None:
+    """The filter selected by ``args``; raises for an unreadable or invalid rules file."""
+    conjecture_filter = None
+    if args.filter_rules is not None:
+        conjecture_filter = RuleSetCounterexampleFilter.from_rules_file(args.filter_rules)
+    if args.numeric_counterexamples:
+        conjecture_filter = ChainedCounterexampleFilter(
+            filters=(
+                conjecture_filter or BasicCounterexampleFilter(),
+                NumericCounterexampleFilter(),
+            )
         )
+    return conjecture_filter
+
+
+def build_llm_cache(args: argparse.Namespace) -> ResponseCache | None:
+    if args.generator != "ollama" or args.llm_cache is None:
+        return None
+    return ResponseCache(
+        args.llm_cache,
+        mode=args.llm_cache_mode,
+        max_bytes=args.llm_cache_max_mb * 1024 * 1024,
+    )
+
+
+def build_generator(
+    args: argparse.Namespace,
+    *,
+    llm_cache: ResponseCache | None = None,
+    llm_client: httpx.Client | None = None,
+) -> ConjectureGenerator:
+    if args.generator != "ollama":
+        return TemplateConjectureGenerator()
+    return OllamaConjectureGenerator(
+        config=LLMConfig(
+            max_concurrency=args.llm_concurrency,
+            stream=args.llm_stream,
+            samples_per_gap=args.llm_samples_per_gap,
+        ),
+        cache=llm_cache,
+        client=llm_client,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    error = argument_error(args)
+    if error is not None:
+        print(error, file=sys.stderr)
         return 1
-    generator = (
-        OllamaConjectureGenerator()
-        if args.generator == "ollama"
-        else TemplateConjectureGenerator()
+    try:
+        conjecture_filter = build_conjecture_filter(args)
+    except FileNotFoundError as exc:
+        print(f"Input file not found: {exc.filename}", file=sys.stderr)
+        return 1
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    llm_cache = build_llm_cache(args)
+    generator = build_generator(args, llm_cache=llm_cache)
+    # A resumed cycle replays its own attempt rows into the timeout policy, and
+    # must rank the portfolio as the interrupted run did, so it leaves its own
+    # log out of both.
+    history_paths = (
+        list(args.timeout_history)
+        if args.resume
+        else [args.output_dir / "phase2_attempts.jsonl", *args.timeout_history]
+    )
+    timeout_policy = (
+        AdaptiveTimeoutPolicy.from_attempt_logs(history_paths) if args.adaptive_timeouts else None
+    )
+    proof_engine = (
+        PortfolioProofEngine.from_attempt_logs(history_paths) if args.proof_portfolio else None
     )
     try:
         summary = run_phase2_cycle(
@@ -74,6 +331,20 @@ def main(argv: list[str] | None = None) -> int:
             trusted_local_run=args.trusted_local_run,
             sandbox_command_prefix=tuple(shlex.split(args.sandbox_command_prefix)),
             generator=generator,
+            conjecture_filter=conjecture_filter,
+            proof_engine=proof_engine,
+            timeout_policy=timeout_policy,
+            cycle_deadline_s=args.cycle_deadline_s,
+            use_mathlib_prelude=args.mathlib_prelude,
+            sandbox_pool_size=args.sandbox_pool_size,
+            dedupe_gaps=args.dedupe_gaps,
+            novelty_store_path=args.novelty_store,
+            mathlib_index_dir=args.mathlib_novelty_index,
+            resume=args.resume,
+            pipelined=args.pipelined,
+            pipeline_queue_size=args.pipeline_queue_size,
+            family_prefixes=tuple(args.family_prefix) if args.family_prefix else None,
+            trace_path=args.trace_path,
         )
     except FileNotFoundError as exc:
         print(f"Input file not found: {exc.filename}", file=sys.stderr)
@@ -81,6 +352,11 @@ def main(argv: list[str] | None = None) -> int:
     except ValueError as exc:
         print(str(exc), file=sys.stderr)
         return 1
+    finally:
+        if llm_cache is not None:
+            llm_cache.close()
+        if hasattr(conjecture_filter, "close"):
+            conjecture_filter.close()
     if not summary["runtime_ready"] and summary["skipped_reason"]:
         print(summary["skipped_reason"], file=sys.stderr)
         return 1
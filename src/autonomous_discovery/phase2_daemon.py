@@ -0,0 +1,183 @@
+"""CLI for a long-running Phase 2 daemon serving cycle requests from a directory."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import shlex
+import signal
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from autonomous_discovery.phase2_cli import (
+    argument_error,
+    build_conjecture_filter,
+    build_generator,
+    build_llm_cache,
+)
+from autonomous_discovery.phase2_cli import build_parser as build_cycle_parser
+from autonomous_discovery.pipeline.daemon import (
+    PROCESSING_DIR_NAME,
+    REQUEST_SUFFIX,
+    DiscoverySession,
+    serve_directory,
+)
+from autonomous_discovery.proof_engine.portfolio import PortfolioProofEngine
+from autonomous_discovery.proof_engine.timeouts import AdaptiveTimeoutPolicy
+
+logger = logging.getLogger(__name__)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = build_cycle_parser()
+    parser.description = (
+        "Serve Phase 2 discovery cycles from a watched directory, keeping the graph, "
+        "novelty index, LLM client and Lean workers warm between cycles. Cycle flags "
+        "below are defaults for requests; each cycle writes to --output-dir/<request>, "
+        "and any --trace-path makes every cycle write phase2_trace.json there."
+    )
+    parser.add_argument(
+        "--watch-dir",
+        type=Path,
+        default=None,
+        help=("Directory polled for <name>.json cycle requests (default: --output-dir/requests)."),
+    )
+    parser.add_argument(
+        "--poll-interval-s",
+        type=float,
+        default=1.0,
+        help="Seconds between polls of an empty watch directory (default: 1).",
+    )
+    parser.add_argument(
+        "--max-requests",
+        type=int,
+        default=None,
+        help="Exit after handling this many requests.",
+    )
+    parser.add_argument(
+        "--exit-when-idle",
+        action="store_true",
+        help="Exit once the watch directory has no pending requests.",
+    )
+    parser.add_argument(
+        "--lean-probe-ttl-s",
+        type=float,
+        default=60.0,
+        help="Reuse the Lean availability probe for this many seconds (default: 60).",
+    )
+    return parser
+
+
+def _request_defaults(args: argparse.Namespace) -> dict[str, Any]:
+    return {
+        "top_k": args.top_k,
+        "proof_retry_budget": args.proof_retry_budget,
+        "dedupe_gaps": args.dedupe_gaps,
+        "family_prefixes": args.family_prefix,
+        "cycle_deadline_s": args.cycle_deadline_s,
+        "pipelined": args.pipelined,
+        "pipeline_queue_size": args.pipeline_queue_size,
+        "trace": args.trace_path is not None,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    error = argument_error(args)
+    if error is not None:
+        print(error, file=sys.stderr)
+        return 1
+    if args.poll_interval_s <= 0:
+        print("--poll-interval-s must be positive", file=sys.stderr)
+        return 1
+    if args.max_requests is not None and args.max_requests <= 0:
+        print("--max-requests must be a positive integer", file=sys.stderr)
+        return 1
+    try:
+        conjecture_filter = build_conjecture_filter(args)
+    except FileNotFoundError as exc:
+        print(f"Input file not found: {exc.filename}", file=sys.stderr)
+        return 1
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+
+    watch_dir = args.watch_dir or args.output_dir / "requests"
+    # Earlier cycles served from this output root seed the learned tactic statistics.
+    # Interrupted requests replay their own rows when they resume, so they are left out.
+    interrupted = {
+        path.name.removesuffix(REQUEST_SUFFIX)
+        for path in (watch_dir / PROCESSING_DIR_NAME).glob(f"*{REQUEST_SUFFIX}")
+    }
+    history_paths = [
+        *sorted(
+            path
+            for path in args.output_dir.glob("*/phase2_attempts.jsonl")
+            if path.parent.name not in interrupted
+        ),
+        *args.timeout_history,
+    ]
+    timeout_policy = (
+        AdaptiveTimeoutPolicy.from_attempt_logs(history_paths) if args.adaptive_timeouts else None
+    )
+    proof_engine = (
+        PortfolioProofEngine.from_attempt_logs(history_paths) if args.proof_portfolio else None
+    )
+    llm_cache = build_llm_cache(args)
+    llm_client = httpx.Client(timeout=None) if args.generator == "ollama" else None
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        with DiscoverySession(
+            premises_path=args.premises_path,
+            decl_types_path=args.decl_types_path,
+            output_root=args.output_dir,
+            generator=build_generator(args, llm_cache=llm_cache, llm_client=llm_client),
+            conjecture_filter=conjecture_filter,
+            proof_engine=proof_engine,
+            timeout_policy=timeout_policy,
+            trusted_local_run=args.trusted_local_run,
+            sandbox_command_prefix=tuple(shlex.split(args.sandbox_command_prefix)),
+            use_mathlib_prelude=args.mathlib_prelude,
+            sandbox_pool_size=args.sandbox_pool_size,
+            novelty_store_path=args.novelty_store,
+            mathlib_index_dir=args.mathlib_novelty_index,
+            lean_probe_ttl_s=args.lean_probe_ttl_s,
+        ) as session:
+            runtime_status = session.warm()
+            if not runtime_status["runtime_ready"]:
+                logger.warning("Verifier runtime is not ready; cycles will skip verification")
+            handled = serve_directory(
+                session,
+                watch_dir,
+                poll_interval_s=args.poll_interval_s,
+                stop=stop,
+                max_requests=args.max_requests,
+                exit_when_idle=args.exit_when_idle,
+                request_defaults=_request_defaults(args),
+            )
+    except FileNotFoundError as exc:
+        print(f"Input file not found: {exc.filename}", file=sys.stderr)
+        return 1
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        # The interrupted request stays in processing/ and resumes on the next start.
+        return 130
+    finally:
+        if llm_client is not None:
+            llm_client.close()
+        if llm_cache is not None:
+            llm_cache.close()
+    logger.info("Phase2 daemon handled %d requests", handled)
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    raise SystemExit(main())
@@ -1,5 +1,16 @@
 """Phase-level orchestration pipelines."""
 
+from autonomous_discovery.pipeline.checkpoint import CycleCheckpoint
+from autonomous_discovery.pipeline.daemon import CycleRequest, DiscoverySession, serve_directory
 from autonomous_discovery.pipeline.phase2 import run_phase2_cycle
+from autonomous_discovery.pipeline.streaming import StageCancelledError, StageChannel
 
-__all__ = ["run_phase2_cycle"]
+__all__ = [
+    "CycleCheckpoint",
+    "CycleRequest",
+    "DiscoverySession",
+    "StageCancelledError",
+    "StageChannel",
+    "run_phase2_cycle",
+    "serve_directory",
+]
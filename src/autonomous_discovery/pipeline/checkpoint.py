@@ -0,0 +1,174 @@
+"""Stage checkpoints that let an interrupted Phase 2 cycle resume.
+
+Checkpoints live in ``<output_dir>/phase2_checkpoint/``:
+
+- ``manifest.json``: the cycle parameters the checkpoint belongs to, the stages
+  completed so far and small per-stage metadata.
+- ``gaps.jsonl`` / ``conjectures.jsonl``: detected gaps and generated conjectures.
+- ``<stage>.json``: any other stage payload (e.g. the gating outcome).
+
+Stage files are written to a temporary file and moved into place before the
+manifest marks the stage complete, so a crash never leaves a half-written stage.
+Conjectures can also be streamed into their stage file as they are generated,
+which completes the stage once the last one is written.
+Attempt rows are checkpointed by the attempts JSONL itself, which is flushed
+after every row; :meth:`CycleCheckpoint.attempt_rows` drops a trailing partial
+line left by a crash.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from autonomous_discovery.conjecture_generator.io import ConjectureWriter, read_conjectures
+from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
+from autonomous_discovery.gap_detector.analogical import GapCandidate
+from autonomous_discovery.gap_detector.report import GapReportWriter, read_gap_report
+
+CHECKPOINT_DIR_NAME = "phase2_checkpoint"
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 1
+
+
+def _write_atomic(path: Path, write: Callable[[Path], None]) -> None:
+    temporary = path.with_name(f"{path.name}.tmp")
+    write(temporary)
+    os.replace(temporary, path)
+
+
+def _write_json_atomic(path: Path, payload: dict[str, Any]) -> None:
+    _write_atomic(
+        path,
+        lambda target: target.write_text(
+            json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        ),
+    )
+
+
+class CycleCheckpoint:
+    """Completed stages of one Phase 2 cycle, keyed by its parameters.
+
+    Without ``resume`` any earlier checkpoint in ``output_dir`` is discarded. With
+    ``resume`` the existing checkpoint is reused, and a checkpoint written with
+    different parameters raises ``ValueError`` rather than mixing two runs.
+    """
+
+    def __init__(self, output_dir: Path, parameters: dict[str, Any], *, resume: bool) -> None:
+        self.directory = output_dir / CHECKPOINT_DIR_NAME
+        # Round-trip so tuples compare equal to the lists read back from JSON.
+        self.parameters: dict[str, Any] = json.loads(json.dumps(parameters))
+        manifest = self._read_manifest() if resume else None
+        if manifest is not None and manifest.get("parameters") != self.parameters:
+            raise ValueError(
+                f"Checkpoint in {self.directory} was written with different cycle "
+                "parameters; rerun without resume"
+            )
+        self._completed: list[str] = list(manifest["completed"]) if manifest else []
+        self._metadata: dict[str, Any] = dict(manifest["metadata"]) if manifest else {}
+        self.resumed_stages: tuple[str, ...] = tuple(self._completed)
+        # Pipelined stages complete from their own worker threads.
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if manifest is None:
+            self._write_manifest()
+
+    def has(self, stage: str) -> bool:
+        return stage in self._completed
+
+    def metadata(self, stage: str) -> dict[str, Any]:
+        return dict(self._metadata.get(stage, {}))
+
+    def save_gaps(self, gaps: Iterable[GapCandidate], **metadata: Any) -> None:
+        def write(target: Path) -> None:
+            with GapReportWriter(target) as writer:
+                writer.write_all(gaps)
+
+        _write_atomic(self.directory / "gaps.jsonl", write)
+        self._complete("gaps", metadata)
+
+    def load_gaps(self) -> list[GapCandidate]:
+        return read_gap_report(self.directory / "gaps.jsonl")
+
+    def save_conjectures(self, conjectures: Iterable[ConjectureCandidate]) -> None:
+        def write(target: Path) -> None:
+            with ConjectureWriter(target) as writer:
+                writer.write_all(conjectures)
+
+        _write_atomic(self.directory / "conjectures.jsonl", write)
+        self._complete("conjectures", {})
+
+    def stream_conjectures(
+        self, conjectures: Iterable[ConjectureCandidate]
+    ) -> Iterator[ConjectureCandidate]:
+        """Yield ``conjectures``, checkpointing each; the stage completes when they run out."""
+        path = self.directory / "conjectures.jsonl"
+        temporary = path.with_name(f"{path.name}.tmp")
+        with ConjectureWriter(temporary) as writer:
+            for conjecture in conjectures:
+                writer.write(conjecture)
+                yield conjecture
+        os.replace(temporary, path)
+        self._complete("conjectures", {})
+
+    def load_conjectures(self) -> list[ConjectureCandidate]:
+        return read_conjectures(self.directory / "conjectures.jsonl")
+
+    def save_json(self, stage: str, payload: dict[str, Any]) -> None:
+        _write_json_atomic(self.directory / f"{stage}.json", payload)
+        self._complete(stage, {})
+
+    def load_json(self, stage: str) -> dict[str, Any]:
+        return json.loads((self.directory / f"{stage}.json").read_text(encoding="utf-8"))
+
+    def attempt_rows(self, attempts_path: Path) -> list[dict[str, Any]]:
+        """Complete rows of ``attempts_path``, truncating a trailing partial line."""
+        if not attempts_path.exists():
+            return []
+        text = attempts_path.read_text(encoding="utf-8")
+        rows: list[dict[str, Any]] = []
+        complete_length = 0
+        # The last element is the text after the final newline: empty unless cut short.
+        for line in text.split("\n")[:-1]:
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+            complete_length += len(line) + 1
+        if complete_length != len(text):
+            kept = text[:complete_length]
+            _write_atomic(attempts_path, lambda target: target.write_text(kept, encoding="utf-8"))
+        return rows
+
+    def _complete(self, stage: str, metadata: dict[str, Any]) -> None:
+        with self._lock:
+            if stage not in self._completed:
+                self._completed.append(stage)
+            self._metadata[stage] = metadata
+            self._write_manifest()
+
+    def _read_manifest(self) -> dict[str, Any] | None:
+        path = self.directory / MANIFEST_NAME
+        if not path.exists():
+            return None
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        if manifest.get("format_version") != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported checkpoint format version: {manifest.get('format_version')}"
+            )
+        return manifest
+
+    def _write_manifest(self) -> None:
+        _write_json_atomic(
+            self.directory / MANIFEST_NAME,
+            {
+                "format_version": FORMAT_VERSION,
+                "parameters": self.parameters,
+                "completed": self._completed,
+                "metadata": self._metadata,
+            },
+        )
@@ -0,0 +1,342 @@
+"""Long-running Phase 2 service that keeps expensive state warm across cycles.
+
+A :class:`DiscoverySession` loads the Mathlib graph, the novelty index and the
+Lean verifier (with its sandbox worker pool) once, then runs any number of
+cycles against them. :func:`serve_directory` feeds it cycle requests dropped as
+JSON files into a watched directory:
+
+- ``<watch_dir>/<name>.json``: a pending request (see :class:`CycleRequest`).
+  Write it under another suffix and rename it into place so it is never read
+  half-written.
+- ``processing/<name>.json``: claimed by a running daemon, which holds an
+  exclusive ``flock`` on the file for the whole cycle. A daemon that starts
+  moves claims no live daemon holds (left by a crash) back and resumes them
+  from their checkpoints.
+- ``done/<name>.json`` / ``failed/<name>.json``: the request with its cycle
+  metrics or error.
+
+Each request's artifacts are written to ``<output_root>/<name>/``.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass, fields, replace
+from pathlib import Path
+from typing import IO, Any
+
+from autonomous_discovery.config import ProjectConfig
+from autonomous_discovery.conjecture_generator.protocol import ConjectureGenerator
+from autonomous_discovery.novelty_checker.basic import BasicNoveltyChecker
+from autonomous_discovery.novelty_checker.mathlib_index import MathlibTheoremIndex
+from autonomous_discovery.novelty_checker.store import NoveltyStore
+from autonomous_discovery.pipeline.phase2 import (
+    CounterexampleFilter,
+    ProofEngine,
+    Verifier,
+    _build_default_verifier,
+    _load_graph_cached,
+    _runtime_status,
+    run_phase2_cycle,
+)
+from autonomous_discovery.proof_engine.timeouts import AdaptiveTimeoutPolicy
+from autonomous_discovery.verifier.lean_verifier import LeanVerifier
+from autonomous_discovery.verifier.sandbox_pool import SandboxPool
+
+logger = logging.getLogger(__name__)
+
+REQUEST_SUFFIX = ".json"
+PROCESSING_DIR_NAME = "processing"
+DONE_DIR_NAME = "done"
+FAILED_DIR_NAME = "failed"
+TRACE_NAME = "phase2_trace.json"
+
+
+@dataclass(frozen=True, slots=True)
+class CycleRequest:
+    """Parameters of one cycle run by a :class:`DiscoverySession`.
+
+    ``name`` names the cycle's output directory; with ``trace`` the cycle also
+    writes a Chrome trace there. The other fields mirror the
+    :func:`run_phase2_cycle` arguments of the same name.
+    """
+
+    name: str
+    top_k: int = 20
+    proof_retry_budget: int = 3
+    dedupe_gaps: bool = False
+    family_prefixes: tuple[str, ...] | None = None
+    cycle_deadline_s: float | None = None
+    pipelined: bool = False
+    pipeline_queue_size: int = 8
+    resume: bool = False
+    trace: bool = False
+
+    @classmethod
+    def from_payload(
+        cls, name: str, payload: Any, *, defaults: dict[str, Any] | None = None
+    ) -> CycleRequest:
+        """Parse a request file's JSON object; its fields override ``defaults``."""
+        if not isinstance(payload, dict):
+            raise ValueError("Cycle request must be a JSON object")
+        known = {item.name for item in fields(cls)} - {"name"}
+        unknown = sorted(set(payload) - known)
+        if unknown:
+            raise ValueError(f"Unknown cycle request fields: {', '.join(unknown)}")
+        values = {**(defaults or {}), **payload}
+        if "family_prefixes" in values and values["family_prefixes"] is not None:
+            prefixes = values["family_prefixes"]
+            if not isinstance(prefixes, list) or not all(isinstance(p, str) for p in prefixes):
+                raise ValueError("family_prefixes must be a list of strings")
+            values["family_prefixes"] = tuple(prefixes)
+        return cls(name=name, **values)
+
+
+class DiscoverySession:
+    """Warm state shared by every cycle a long-running process executes.
+
+    The Mathlib graph stays in the in-process graph cache, and the novelty store
+    (in memory unless ``novelty_store_path`` is given), the Mathlib index, the
+    verifier and its sandbox pool, the generator and the adaptive timeout policy
+    are created once, so later cycles also see the verified statements and tactic
+    latencies of earlier ones. Each cycle gets a fresh novelty checker over the
+    store, so statements an earlier cycle gated but did not verify stay novel.
+    The verifier's Lean availability probe is reused for ``lean_probe_ttl_s``.
+    """
+
+    def __init__(
+        self,
+        *,
+        premises_path: Path,
+        decl_types_path: Path,
+        output_root: Path,
+        generator: ConjectureGenerator | None = None,
+        conjecture_filter: CounterexampleFilter | None = None,
+        proof_engine: ProofEngine | None = None,
+        verifier: Verifier | None = None,
+        timeout_policy: AdaptiveTimeoutPolicy | None = None,
+        trusted_local_run: bool = False,
+        sandbox_command_prefix: tuple[str, ...] = ("nsjail",),
+        use_mathlib_prelude: bool = False,
+        sandbox_pool_size: int = 0,
+        novelty_store_path: Path | None = None,
+        mathlib_index_dir: Path | None = None,
+        lean_probe_ttl_s: float = 60.0,
+    ) -> None:
+        if sandbox_pool_size < 0:
+            raise ValueError("sandbox_pool_size must be non-negative")
+        config = ProjectConfig()
+        self.premises_path = premises_path
+        self.decl_types_path = decl_types_path
+        self.output_root = output_root
+        self.generator = generator
+        self.conjecture_filter = conjecture_filter
+        self.proof_engine = proof_engine
+        self.timeout_policy = timeout_policy
+        self.trusted_local_run = trusted_local_run
+        self.cycle_count = 0
+
+        self._novelty_store = NoveltyStore(novelty_store_path or ":memory:")
+        self._mathlib_index = (
+            MathlibTheoremIndex.load_or_build(decl_types_path, mathlib_index_dir)
+            if mathlib_index_dir is not None
+            else None
+        )
+
+        self._sandbox_pool: SandboxPool | None = None
+        if verifier is None and sandbox_pool_size > 0 and not trusted_local_run:
+            self._sandbox_pool = SandboxPool(
+                size=sandbox_pool_size,
+                sandbox_command_prefix=sandbox_command_prefix,
+                project_dir=config.lean_project_dir,
+            )
+        if verifier is None:
+            verifier = _build_default_verifier(
+                config,
+                trusted_local_run=trusted_local_run,
+                sandbox_command_prefix=sandbox_command_prefix,
+                use_mathlib_prelude=use_mathlib_prelude,
+                sandbox_pool=self._sandbox_pool,
+            )
+        if isinstance(verifier, LeanVerifier):
+            verifier.availability_ttl_s = lean_probe_ttl_s
+        self.verifier = verifier
+
+    def __enter__(self) -> DiscoverySession:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def warm(self) -> dict[str, bool]:
+        """Load the graph and probe the verifier runtime ahead of the first cycle."""
+        _load_graph_cached(self.premises_path, self.decl_types_path)
+        return _runtime_status(self.verifier, trusted_local_run=self.trusted_local_run)
+
+    def run(self, request: CycleRequest) -> dict[str, Any]:
+        """Run one cycle into ``<output_root>/<request.name>`` and return its metrics."""
+        output_dir = self.output_root / request.name
+        # A checker indexes every statement it gates; only the remembered
+        # (verified) ones may carry over, through the store.
+        with BasicNoveltyChecker(
+            store=self._novelty_store, mathlib_index=self._mathlib_index
+        ) as novelty_checker:
+            metrics = run_phase2_cycle(
+                premises_path=self.premises_path,
+                decl_types_path=self.decl_types_path,
+                output_dir=output_dir,
+                top_k=request.top_k,
+                proof_retry_budget=request.proof_retry_budget,
+                trusted_local_run=self.trusted_local_run,
+                generator=self.generator,
+                conjecture_filter=self.conjecture_filter,
+                novelty_checker=novelty_checker,
+                proof_engine=self.proof_engine,
+                verifier=self.verifier,
+                timeout_policy=self.timeout_policy,
+                cycle_deadline_s=request.cycle_deadline_s,
+                dedupe_gaps=request.dedupe_gaps,
+                resume=request.resume,
+                pipelined=request.pipelined,
+                pipeline_queue_size=request.pipeline_queue_size,
+                family_prefixes=request.family_prefixes,
+                trace_path=output_dir / TRACE_NAME if request.trace else None,
+            )
+        self.cycle_count += 1
+        return metrics
+
+    def close(self) -> None:
+        if hasattr(self.conjecture_filter, "close"):
+            self.conjecture_filter.close()
+        if self._sandbox_pool is not None:
+            self._sandbox_pool.close()
+            self._sandbox_pool = None
+        self._novelty_store.close()
+
+
+def serve_directory(
+    session: DiscoverySession,
+    watch_dir: Path,
+    *,
+    poll_interval_s: float = 1.0,
+    stop: threading.Event | None = None,
+    max_requests: int | None = None,
+    exit_when_idle: bool = False,
+    request_defaults: dict[str, Any] | None = None,
+) -> int:
+    """Run the cycle requests dropped into ``watch_dir`` until ``stop`` is set.
+
+    Fields a request file omits are taken from ``request_defaults``, then from
+    the :class:`CycleRequest` defaults. Requests are claimed in name order by
+    locking them and moving them into ``processing/``, so several daemons can
+    share one directory. A request that fails (invalid JSON, invalid parameters
+    or an error during the cycle) is moved to ``failed/`` and the daemon carries
+    on. Returns the number of requests handled.
+    """
+    if poll_interval_s <= 0:
+        raise ValueError("poll_interval_s must be positive")
+    if max_requests is not None and max_requests <= 0:
+        raise ValueError("max_requests must be a positive integer")
+    stop = stop or threading.Event()
+    processing_dir = watch_dir / PROCESSING_DIR_NAME
+    for directory in (processing_dir, watch_dir / DONE_DIR_NAME, watch_dir / FAILED_DIR_NAME):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    interrupted: set[str] = set()
+    for path in sorted(processing_dir.glob(f"*{REQUEST_SUFFIX}")):
+        lock = _lock(path)
+        if lock is None:
+            continue  # Another daemon is running it.
+        with lock:
+            os.replace(path, watch_dir / path.name)
+        interrupted.add(path.name)
+        logger.info("Requeued interrupted cycle request %s", path.name)
+
+    handled = 0
+    while not stop.is_set():
+        pending = sorted(watch_dir.glob(f"*{REQUEST_SUFFIX}"))
+        if not pending:
+            if exit_when_idle:
+                break
+            stop.wait(poll_interval_s)
+            continue
+        for path in pending:
+            if stop.is_set():
+                break
+            claimed = processing_dir / path.name
+            # The lock moves with the file and marks the claim live until the cycle ends.
+            lock = _lock(path)
+            if lock is None:
+                continue  # Claimed by another daemon.
+            with lock:
+                try:
+                    os.replace(path, claimed)
+                except FileNotFoundError:
+                    continue  # Claimed and finished by another daemon.
+                _handle_request(
+                    session,
+                    claimed,
+                    watch_dir,
+                    defaults=request_defaults,
+                    resume=path.name in interrupted,
+                )
+            interrupted.discard(path.name)
+            handled += 1
+            if max_requests is not None and handled >= max_requests:
+                return handled
+    return handled
+
+
+def _handle_request(
+    session: DiscoverySession,
+    claimed: Path,
+    watch_dir: Path,
+    *,
+    defaults: dict[str, Any] | None,
+    resume: bool,
+) -> None:
+    name = claimed.name.removesuffix(REQUEST_SUFFIX)
+    payload: Any = None
+    try:
+        payload = json.loads(claimed.read_text(encoding="utf-8"))
+        request = CycleRequest.from_payload(name, payload, defaults=defaults)
+        if resume:
+            request = replace(request, resume=True)
+        logger.info("Starting cycle %s", name)
+        metrics = session.run(request)
+    except Exception as exc:
+        logger.exception("Cycle request %s failed", name)
+        result: dict[str, Any] = {"request": payload, "error": f"{type(exc).__name__}: {exc}"}
+        target = watch_dir / FAILED_DIR_NAME / claimed.name
+    else:
+        result = {"request": _request_payload(request), "metrics": metrics}
+        target = watch_dir / DONE_DIR_NAME / claimed.name
+    temporary = target.with_name(f"{target.name}.tmp")
+    temporary.write_text(json.dumps(result, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(temporary, target)
+    claimed.unlink(missing_ok=True)
+
+
+def _lock(path: Path) -> IO[bytes] | None:
+    """Open ``path`` holding an exclusive lock, or ``None`` if it is gone or locked."""
+    try:
+        handle = path.open("rb")
+    except FileNotFoundError:
+        return None
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        handle.close()
+        return None
+    return handle
+
+
+def _request_payload(request: CycleRequest) -> dict[str, Any]:
+    payload = asdict(request)
+    if request.family_prefixes is not None:
+        payload["family_prefixes"] = list(request.family_prefixes)
+    return payload
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import contextvars
 import json
 import logging
+import sys
+import threading
 import time
-from collections import Counter, OrderedDict
-from dataclasses import dataclass
+from collections import Counter, OrderedDict, deque
+from collections.abc import Callable, Iterable, Sequence
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
 from pathlib import Path
-from typing import Any, Protocol
+from typing import Any, NamedTuple, Protocol
 
 from autonomous_discovery.config import ProjectConfig
 from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
@@ -19,14 +24,23 @@ from autonomous_discovery.counterexample_filter.basic import (
     FilterDecision,
 )
 from autonomous_discovery.gap_detector.analogical import AnalogicalGapDetector, GapDetectorConfig
+from autonomous_discovery.gap_detector.clustering import cluster_gaps
+from autonomous_discovery.instrumentation import Tracer, span, use_tracer
 from autonomous_discovery.knowledge_base.graph import MathlibGraph
 from autonomous_discovery.knowledge_base.parser import parse_declaration_types, parse_premises
 from autonomous_discovery.lean_bridge.runner import LeanRunner
 from autonomous_discovery.novelty_checker.basic import BasicNoveltyChecker, NoveltyDecision
+from autonomous_discovery.novelty_checker.mathlib_index import MathlibTheoremIndex
+from autonomous_discovery.novelty_checker.store import NoveltyStore
+from autonomous_discovery.pipeline.checkpoint import CycleCheckpoint
+from autonomous_discovery.pipeline.streaming import StageCancelledError, StageChannel
 from autonomous_discovery.proof_engine.models import ProofAttempt
 from autonomous_discovery.proof_engine.simple_engine import SimpleProofEngine
+from autonomous_discovery.proof_engine.timeouts import AdaptiveTimeoutPolicy, CycleDeadline
 from autonomous_discovery.verifier.lean_verifier import LeanVerifier
 from autonomous_discovery.verifier.models import VerificationResult
+from autonomous_discovery.verifier.prelude import LeanPrelude
+from autonomous_discovery.verifier.sandbox_pool import SandboxPool
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +52,7 @@ _DUPLICATE_REASONS = {
     "defeq_duplicate",
     "bi_implication_duplicate",
     "semantic_duplicate",
+    "mathlib_duplicate",
 }
 
 
@@ -52,7 +67,9 @@ class ProofEngine(Protocol):
 class Verifier(Protocol):
     """Protocol for proof verification backends."""
 
-    def verify(self, statement: str, proof_script: str) -> VerificationResult: ...
+    def verify(
+        self, statement: str, proof_script: str, *, timeout: int | None = None
+    ) -> VerificationResult: ...
 
     def is_available(self) -> bool: ...
 
@@ -85,6 +102,30 @@ class GatingOutcome:
 class VerificationOutcome:
     success_count: int
     failure_counts: tuple[tuple[str, int], ...]
+    deadline_skipped_count: int = 0
+    race_cancelled_count: int = 0
+    verified_statements: tuple[str, ...] = ()
+
+
+def _gating_payload(gating: GatingOutcome) -> dict[str, Any]:
+    payload = asdict(gating)
+    payload["verifiable_conjectures"] = [asdict(c) for c in gating.verifiable_conjectures]
+    return payload
+
+
+def _gating_from_payload(payload: dict[str, Any]) -> GatingOutcome:
+    return GatingOutcome(
+        verifiable_conjectures=tuple(
+            ConjectureCandidate(**row) for row in payload["verifiable_conjectures"]
+        ),
+        filtered_out_count=payload["filtered_out_count"],
+        filter_pass_count=payload["filter_pass_count"],
+        filter_reject_reasons=tuple(tuple(pair) for pair in payload["filter_reject_reasons"]),
+        novelty_reason_counts=tuple(tuple(pair) for pair in payload["novelty_reason_counts"]),
+        duplicate_count=payload["duplicate_count"],
+        novel_count=payload["novel_count"],
+        novelty_unknown_count=payload["novelty_unknown_count"],
+    )
 
 
 def _file_signature(path: Path) -> tuple[str, int, int]:
@@ -92,6 +133,28 @@ def _file_signature(path: Path) -> tuple[str, int, int]:
     return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
 
 
+def _component_signature(component: Any) -> Any:
+    """Class and configuration of a generator or filter, as checkpoint parameters.
+
+    Dataclass fields are included recursively. Fields holding other objects
+    (response caches, HTTP clients) are runtime resources, not configuration,
+    and are left out, as are unset ones.
+    """
+    if isinstance(component, str | int | float | bool) or component is None:
+        return component
+    if isinstance(component, list | tuple):
+        return [_component_signature(item) for item in component]
+    signature: dict[str, Any] = {"class": type(component).__qualname__}
+    if is_dataclass(component):
+        for item in fields(component):
+            value = getattr(component, item.name)
+            if item.init and (
+                is_dataclass(value) or isinstance(value, str | int | float | bool | list | tuple)
+            ):
+                signature[item.name] = _component_signature(value)
+    return signature
+
+
 def _load_graph_cached(premises_path: Path, decl_types_path: Path) -> tuple[MathlibGraph, bool]:
     key = (*_file_signature(premises_path), *_file_signature(decl_types_path))
     if key in _GRAPH_CACHE:
@@ -141,12 +204,25 @@ def _runtime_status(verifier: Verifier, *, trusted_local_run: bool) -> dict[str,
 
 
 def _build_default_verifier(
-    config: ProjectConfig, *, trusted_local_run: bool, sandbox_command_prefix: tuple[str, ...]
+    config: ProjectConfig,
+    *,
+    trusted_local_run: bool,
+    sandbox_command_prefix: tuple[str, ...],
+    use_mathlib_prelude: bool = False,
+    sandbox_pool: SandboxPool | None = None,
 ) -> Verifier:
+    runner = LeanRunner(project_dir=config.lean_project_dir)
+    prelude = (
+        LeanPrelude(project_dir=config.lean_project_dir, runner=runner)
+        if use_mathlib_prelude
+        else None
+    )
     return LeanVerifier(
-        runner=LeanRunner(project_dir=config.lean_project_dir),
+        runner=runner,
         require_sandbox=not trusted_local_run,
         sandbox_command_prefix=sandbox_command_prefix,
+        prelude=prelude,
+        sandbox_pool=sandbox_pool,
     )
 
 
@@ -157,50 +233,89 @@ def _validate_inputs(top_k: int, proof_retry_budget: int) -> None:
         raise ValueError("proof_retry_budget must be a positive integer")
 
 
+@dataclass(slots=True)
+class _GatingTally:
+    """Gating counts accumulated over one or more batches of conjectures."""
+
+    filtered_out_count: int = 0
+    filter_pass_count: int = 0
+    filter_reject_reasons: Counter[str] = field(default_factory=Counter)
+    novelty_reason_counts: Counter[str] = field(default_factory=Counter)
+    duplicate_count: int = 0
+    novel_count: int = 0
+    novelty_unknown_count: int = 0
+    verifiable_conjectures: list[ConjectureCandidate] = field(default_factory=list)
+
+    def gate(
+        self,
+        conjectures: list[ConjectureCandidate],
+        *,
+        conjecture_filter: CounterexampleFilter,
+        novelty_checker: NoveltyChecker,
+    ) -> list[ConjectureCandidate]:
+        """Filter and novelty-check one batch; returns its verifiable conjectures."""
+        with span("gating.filter"):
+            if hasattr(conjecture_filter, "evaluate_batch"):
+                filter_decisions = list(conjecture_filter.evaluate_batch(conjectures))
+            else:
+                filter_decisions = [
+                    conjecture_filter.evaluate(conjecture) for conjecture in conjectures
+                ]
+
+        candidates: list[ConjectureCandidate] = []
+        for conjecture, filter_decision in zip(conjectures, filter_decisions, strict=True):
+            if not filter_decision.accepted:
+                self.filtered_out_count += 1
+                self.filter_reject_reasons[filter_decision.reason] += 1
+                continue
+            self.filter_pass_count += 1
+            candidates.append(conjecture)
+
+        statements = [conjecture.lean_statement for conjecture in candidates]
+        with span("gating.novelty"):
+            if hasattr(novelty_checker, "check_batch"):
+                novelty_decisions = list(novelty_checker.check_batch(statements))
+            else:
+                novelty_decisions = [
+                    novelty_checker.is_novel(statement) for statement in statements
+                ]
+
+        verifiable: list[ConjectureCandidate] = []
+        for conjecture, novelty_decision in zip(candidates, novelty_decisions, strict=True):
+            reason = novelty_decision.reason or "unknown"
+            self.novelty_reason_counts[reason] += 1
+            if novelty_decision.is_novel:
+                self.novel_count += 1
+                verifiable.append(conjecture)
+            elif reason in _DUPLICATE_REASONS:
+                self.duplicate_count += 1
+            else:
+                self.novelty_unknown_count += 1
+        self.verifiable_conjectures.extend(verifiable)
+        return verifiable
+
+    def outcome(self) -> GatingOutcome:
+        return GatingOutcome(
+            verifiable_conjectures=tuple(self.verifiable_conjectures),
+            filtered_out_count=self.filtered_out_count,
+            filter_pass_count=self.filter_pass_count,
+            filter_reject_reasons=tuple(sorted(self.filter_reject_reasons.items())),
+            novelty_reason_counts=tuple(sorted(self.novelty_reason_counts.items())),
+            duplicate_count=self.duplicate_count,
+            novel_count=self.novel_count,
+            novelty_unknown_count=self.novelty_unknown_count,
+        )
+
+
 def _gate_conjectures(
     conjectures: list[ConjectureCandidate],
     *,
     conjecture_filter: CounterexampleFilter,
     novelty_checker: NoveltyChecker,
 ) -> GatingOutcome:
-    filtered_out_count = 0
-    filter_pass_count = 0
-    filter_reject_reasons: Counter[str] = Counter()
-    novelty_reason_counts: Counter[str] = Counter()
-    duplicate_count = 0
-    novel_count = 0
-    novelty_unknown_count = 0
-    verifiable_conjectures: list[ConjectureCandidate] = []
-
-    for conjecture in conjectures:
-        filter_decision = conjecture_filter.evaluate(conjecture)
-        if not filter_decision.accepted:
-            filtered_out_count += 1
-            filter_reject_reasons[filter_decision.reason] += 1
-            continue
-
-        filter_pass_count += 1
-        novelty_decision = novelty_checker.is_novel(conjecture.lean_statement)
-        reason = novelty_decision.reason or "unknown"
-        novelty_reason_counts[reason] += 1
-        if novelty_decision.is_novel:
-            novel_count += 1
-            verifiable_conjectures.append(conjecture)
-        elif reason in _DUPLICATE_REASONS:
-            duplicate_count += 1
-        else:
-            novelty_unknown_count += 1
-
-    return GatingOutcome(
-        verifiable_conjectures=tuple(verifiable_conjectures),
-        filtered_out_count=filtered_out_count,
-        filter_pass_count=filter_pass_count,
-        filter_reject_reasons=tuple(sorted(filter_reject_reasons.items())),
-        novelty_reason_counts=tuple(sorted(novelty_reason_counts.items())),
-        duplicate_count=duplicate_count,
-        novel_count=novel_count,
-        novelty_unknown_count=novelty_unknown_count,
-    )
+    tally = _GatingTally()
+    tally.gate(conjectures, conjecture_filter=conjecture_filter, novelty_checker=novelty_checker)
+    return tally.outcome()
 
 
 def _skip_reason(runtime_status: dict[str, bool]) -> str | None:
@@ -216,56 +331,394 @@ def _skip_reason(runtime_status: dict[str, bool]) -> str | None:
     return "Verifier runtime is not ready."
 
 
+def _attempt_row(
+    conjecture: ConjectureCandidate,
+    attempt: ProofAttempt,
+    verification: VerificationResult,
+    duration_ms: float,
+    failure_kind: str,
+    timeout: int | None,
+) -> dict[str, Any]:
+    row: dict[str, Any] = {
+        "gap_missing_decl": conjecture.gap_missing_decl,
+        "statement": attempt.statement,
+        "proof_script": attempt.proof_script,
+        "engine": attempt.engine,
+        "attempt_index": attempt.attempt_index,
+        "success": verification.success,
+        "stderr": verification.stderr,
+        "timed_out": verification.timed_out,
+        "duration_ms": round(duration_ms, 3),
+        "failure_kind": failure_kind,
+    }
+    if timeout is not None:
+        row["timeout_s"] = timeout
+    return row
+
+
+class _PlannedConjecture(NamedTuple):
+    conjecture: ConjectureCandidate
+    attempts: list[ProofAttempt]
+    already_verified: bool
+
+
+class _AttemptPlanner:
+    """Plans proof attempts for conjectures as they arrive from ``source``.
+
+    ``remaining_attempts`` counts planned attempts not yet run; verification loops
+    decrement it as they go. Attempts already recorded in ``completed_rows`` (from
+    an interrupted run) are matched by gap, statement and proof script, dropped,
+    and their outcomes replayed into ``failure_counts`` and ``timeout_policy`` as
+    if they had just run; they still count towards ``proof_retry_budget``.
+    """
+
+    def __init__(
+        self,
+        source: StageChannel[ConjectureCandidate],
+        *,
+        proof_engine: ProofEngine,
+        proof_retry_budget: int,
+        completed_rows: Sequence[dict[str, Any]],
+        failure_counts: Counter[str],
+        timeout_policy: AdaptiveTimeoutPolicy | None,
+    ) -> None:
+        self.pending: deque[_PlannedConjecture] = deque()
+        self.remaining_attempts = 0
+        self._source = source
+        self._proof_engine = proof_engine
+        self._proof_retry_budget = proof_retry_budget
+        self._failure_counts = failure_counts
+        self._timeout_policy = timeout_policy
+        self._exhausted = False
+        # Proof scripts, not attempt indices: an engine's ranking (and so the
+        # index of each tactic) may differ between the interrupted and resumed run.
+        self._recorded: dict[tuple[str, str], dict[str, dict[str, Any]]] = {}
+        for row in completed_rows:
+            key = (row["gap_missing_decl"], row["statement"])
+            self._recorded.setdefault(key, {})[row["proof_script"]] = row
+
+    def next(self) -> _PlannedConjecture | None:
+        """The next conjecture to verify, waiting upstream only when none is planned."""
+        if not self._exhausted:
+            self._pull(block=not self.pending)
+        return self.pending.popleft() if self.pending else None
+
+    def drain(self) -> None:
+        """Plan every conjecture still to come, so skipped attempts can be counted."""
+        while not self._exhausted:
+            self._pull(block=True)
+
+    def _pull(self, *, block: bool) -> None:
+        ready = self._source.take(block=block)
+        if ready is None:
+            self._exhausted = True
+            return
+        for conjecture in ready:
+            planned = self._plan(conjecture)
+            self.remaining_attempts += len(planned.attempts)
+            self.pending.append(planned)
+
+    def _plan(self, conjecture: ConjectureCandidate) -> _PlannedConjecture:
+        attempts = self._proof_engine.build_attempts(
+            conjecture, max_attempts=self._proof_retry_budget
+        )
+        rows = self._recorded.pop((conjecture.gap_missing_decl, conjecture.lean_statement), {})
+        for row in rows.values():
+            if row["failure_kind"] != "none":
+                self._failure_counts[row["failure_kind"]] += 1
+            if self._timeout_policy is not None:
+                self._timeout_policy.record(
+                    row["proof_script"], row["duration_ms"], success=row["success"]
+                )
+        if any(row["success"] for row in rows.values()):
+            return _PlannedConjecture(conjecture, [], True)
+        pending = [attempt for attempt in attempts if attempt.proof_script not in rows]
+        return _PlannedConjecture(
+            conjecture, pending[: max(0, self._proof_retry_budget - len(rows))], False
+        )
+
+
 def _verify_conjectures(
     *,
     attempts_path: Path,
-    conjectures: list[ConjectureCandidate],
+    conjectures: Sequence[ConjectureCandidate] | StageChannel[ConjectureCandidate],
     proof_engine: ProofEngine,
     verifier: Verifier,
     proof_retry_budget: int,
+    timeout_policy: AdaptiveTimeoutPolicy | None = None,
+    cycle_deadline: CycleDeadline | None = None,
+    completed_rows: Sequence[dict[str, Any]] = (),
 ) -> VerificationOutcome:
-    success_count = 0
+    """Verify ``conjectures`` serially, appending one flushed row per attempt.
+
+    ``conjectures`` may be a :class:`StageChannel` fed by a concurrent gating
+    stage; the deadline's fair share is then computed over the conjectures gated
+    so far. Attempts already recorded in ``completed_rows`` (from an interrupted
+    run) are not repeated, and their rows are kept by appending to ``attempts_path``.
+    """
+    source = conjectures if isinstance(conjectures, StageChannel) else StageChannel.of(conjectures)
+    if hasattr(proof_engine, "race"):
+        return _race_conjectures(
+            attempts_path=attempts_path,
+            source=source,
+            proof_engine=proof_engine,
+            verifier=verifier,
+            proof_retry_budget=proof_retry_budget,
+            timeout_policy=timeout_policy,
+            cycle_deadline=cycle_deadline,
+            completed_rows=completed_rows,
+        )
+
+    verified_statements: list[str] = []
     failure_counts: Counter[str] = Counter()
+    deadline_skipped_count = 0
+    planner = _AttemptPlanner(
+        source,
+        proof_engine=proof_engine,
+        proof_retry_budget=proof_retry_budget,
+        completed_rows=completed_rows,
+        failure_counts=failure_counts,
+        timeout_policy=timeout_policy,
+    )
+
+    with attempts_path.open("a" if completed_rows else "w", encoding="utf-8") as f:
+        while (planned := planner.next()) is not None:
+            conjecture, attempts, conjecture_succeeded = planned
+            deadline_reached = False
+            for position, attempt in enumerate(attempts):
+                timeout: int | None = None
+                if timeout_policy is not None:
+                    timeout = timeout_policy.timeout_for(attempt.proof_script)
+                    if cycle_deadline is not None:
+                        timeout = cycle_deadline.allot(
+                            timeout, remaining_attempts=planner.remaining_attempts
+                        )
+                        if timeout is None:
+                            deadline_reached = True
+                            break
+                planner.remaining_attempts -= 1
 
-    with attempts_path.open("w", encoding="utf-8") as f:
-        for conjecture in conjectures:
-            attempts = proof_engine.build_attempts(
-                conjecture,
-                max_attempts=proof_retry_budget,
-            )
-            conjecture_succeeded = False
-            for attempt in attempts:
                 attempt_started_ns = time.perf_counter_ns()
-                verification = verifier.verify(attempt.statement, attempt.proof_script)
+                if timeout is None:
+                    verification = verifier.verify(attempt.statement, attempt.proof_script)
+                else:
+                    verification = verifier.verify(
+                        attempt.statement, attempt.proof_script, timeout=timeout
+                    )
                 duration_ms = (time.perf_counter_ns() - attempt_started_ns) / 1_000_000
+                if timeout_policy is not None:
+                    timeout_policy.record(
+                        attempt.proof_script, duration_ms, success=verification.success
+                    )
                 failure_kind = _failure_kind(verification)
                 if failure_kind != "none":
                     failure_counts[failure_kind] += 1
-                row = {
-                    "gap_missing_decl": conjecture.gap_missing_decl,
-                    "statement": attempt.statement,
-                    "proof_script": attempt.proof_script,
-                    "engine": attempt.engine,
-                    "attempt_index": attempt.attempt_index,
-                    "success": verification.success,
-                    "stderr": verification.stderr,
-                    "timed_out": verification.timed_out,
-                    "duration_ms": round(duration_ms, 3),
-                    "failure_kind": failure_kind,
-                }
+                row = _attempt_row(
+                    conjecture, attempt, verification, duration_ms, failure_kind, timeout
+                )
                 f.write(json.dumps(row, sort_keys=True) + "\n")
+                f.flush()
                 if verification.success:
                     conjecture_succeeded = True
+                    # Attempts left for this conjecture no longer need budget.
+                    planner.remaining_attempts -= len(attempts) - position - 1
                     break
             if conjecture_succeeded:
-                success_count += 1
+                verified_statements.append(conjecture.lean_statement)
+            if deadline_reached:
+                planner.drain()
+                deadline_skipped_count = planner.remaining_attempts
+                break
+
+    return VerificationOutcome(
+        success_count=len(verified_statements),
+        failure_counts=tuple(sorted(failure_counts.items())),
+        deadline_skipped_count=deadline_skipped_count,
+        verified_statements=tuple(verified_statements),
+    )
+
+
+def _race_conjectures(
+    *,
+    attempts_path: Path,
+    source: StageChannel[ConjectureCandidate],
+    proof_engine: Any,
+    verifier: Verifier,
+    proof_retry_budget: int,
+    timeout_policy: AdaptiveTimeoutPolicy | None = None,
+    cycle_deadline: CycleDeadline | None = None,
+    completed_rows: Sequence[dict[str, Any]] = (),
+) -> VerificationOutcome:
+    """Race each conjecture's attempts concurrently via ``proof_engine.race``.
+
+    Under a cycle deadline every race is capped at a fair share of the remaining
+    budget per conjecture, since its attempts run side by side.
+    """
+    verified_statements: list[str] = []
+    failure_counts: Counter[str] = Counter()
+    deadline_skipped_count = 0
+    race_cancelled_count = 0
+    planner = _AttemptPlanner(
+        source,
+        proof_engine=proof_engine,
+        proof_retry_budget=proof_retry_budget,
+        completed_rows=completed_rows,
+        failure_counts=failure_counts,
+        timeout_policy=timeout_policy,
+    )
+
+    with attempts_path.open("a" if completed_rows else "w", encoding="utf-8") as f:
+        while (planned := planner.next()) is not None:
+            conjecture, attempts, already_verified = planned
+            if already_verified:
+                verified_statements.append(conjecture.lean_statement)
+                continue
+            if not attempts:
+                continue
+            timeout_for = None
+            if timeout_policy is not None:
+                policy = timeout_policy
+                cap: int | None = None
+                if cycle_deadline is not None:
+                    cap = cycle_deadline.allot(
+                        max((policy.timeout_for(a.proof_script) for a in attempts), default=1),
+                        remaining_attempts=len(planner.pending) + 1,
+                    )
+                    if cap is None:
+                        planner.drain()
+                        deadline_skipped_count = planner.remaining_attempts
+                        break
+
+                def timeout_for(script: str, *, _cap: int | None = cap) -> int:
+                    timeout = policy.timeout_for(script)
+                    return timeout if _cap is None else min(timeout, _cap)
+
+            results = proof_engine.race(
+                conjecture, verifier, attempts=attempts, timeout_for=timeout_for
+            )
+            planner.remaining_attempts -= len(attempts)
+            race_cancelled_count += len(attempts) - len(results)
+            for result in results:
+                verification = result.verification
+                if timeout_policy is not None:
+                    timeout_policy.record(
+                        result.attempt.proof_script,
+                        result.duration_ms,
+                        success=verification.success,
+                    )
+                failure_kind = _failure_kind(verification)
+                if failure_kind != "none":
+                    failure_counts[failure_kind] += 1
+                row = _attempt_row(
+                    conjecture,
+                    result.attempt,
+                    verification,
+                    result.duration_ms,
+                    failure_kind,
+                    result.timeout_s,
+                )
+                f.write(json.dumps(row, sort_keys=True) + "\n")
+                f.flush()
+            if any(result.verification.success for result in results):
+                verified_statements.append(conjecture.lean_statement)
 
     return VerificationOutcome(
-        success_count=success_count,
+        success_count=len(verified_statements),
         failure_counts=tuple(sorted(failure_counts.items())),
+        deadline_skipped_count=deadline_skipped_count,
+        race_cancelled_count=race_cancelled_count,
+        verified_statements=tuple(verified_statements),
     )
 
 
+def _run_pipelined(
+    *,
+    produce: Callable[[], Iterable[ConjectureCandidate]],
+    queue_size: int,
+    conjecture_filter: CounterexampleFilter,
+    novelty_checker: NoveltyChecker,
+    verify: Callable[[StageChannel[ConjectureCandidate]], VerificationOutcome] | None,
+    on_gated: Callable[[GatingOutcome], None] | None = None,
+) -> tuple[list[ConjectureCandidate], GatingOutcome, VerificationOutcome]:
+    """Run generation, gating and verification concurrently over bounded channels.
+
+    Generation and gating each run in a worker thread and verification runs in the
+    caller's thread, so the first conjecture can be verified while later ones are
+    still being generated. Each channel holds at most ``queue_size`` conjectures.
+    A failure in any stage cancels the others and is re-raised here. Without
+    ``verify`` (verification skipped) gated conjectures are only counted.
+    ``on_gated`` receives the gating outcome as soon as the gating stage finishes,
+    while verification may still be running.
+    """
+    generated: StageChannel[ConjectureCandidate] = StageChannel(queue_size)
+    gated: StageChannel[ConjectureCandidate] = StageChannel(queue_size)
+    conjectures: list[ConjectureCandidate] = []
+    tally = _GatingTally()
+
+    def generate() -> None:
+        try:
+            with span("generation"):
+                for conjecture in produce():
+                    conjectures.append(conjecture)
+                    generated.put(conjecture)
+        except StageCancelledError:
+            return
+        except BaseException as error:
+            generated.close(error)
+            return
+        generated.close()
+
+    def gate() -> None:
+        try:
+            with span("gating"):
+                while (batch := generated.take()) is not None:
+                    for conjecture in tally.gate(
+                        batch,
+                        conjecture_filter=conjecture_filter,
+                        novelty_checker=novelty_checker,
+                    ):
+                        gated.put(conjecture)
+            if on_gated is not None:
+                on_gated(tally.outcome())
+        except StageCancelledError:
+            generated.cancel()
+            return
+        except BaseException as error:
+            generated.cancel()
+            gated.close(error)
+            return
+        gated.close()
+
+    # Copied contexts put the workers' spans under the caller's current span.
+    workers = [
+        threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(stage,),
+            name=f"phase2-{stage.__name__}",
+            daemon=True,
+        )
+        for stage in (generate, gate)
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        with span("verification"):
+            if verify is None:
+                while gated.take() is not None:
+                    pass
+                verification = VerificationOutcome(success_count=0, failure_counts=())
+            else:
+                verification = verify(gated)
+    except BaseException:
+        # Workers are daemons: one stuck in a generator call must not block the error.
+        gated.cancel()
+        generated.cancel()
+        raise
+    for worker in workers:
+        worker.join()
+    return conjectures, tally.outcome(), verification
+
+
 def run_phase2_cycle(
     *,
     premises_path: Path,
@@ -280,59 +733,240 @@ def run_phase2_cycle(
     novelty_checker: NoveltyChecker | None = None,
     proof_engine: ProofEngine | None = None,
     verifier: Verifier | None = None,
+    timeout_policy: AdaptiveTimeoutPolicy | None = None,
+    cycle_deadline_s: float | None = None,
+    use_mathlib_prelude: bool = False,
+    sandbox_pool_size: int = 0,
+    dedupe_gaps: bool = False,
+    novelty_store_path: Path | None = None,
+    mathlib_index_dir: Path | None = None,
+    resume: bool = False,
+    pipelined: bool = False,
+    pipeline_queue_size: int = 8,
+    family_prefixes: tuple[str, ...] | None = None,
+    trace_path: Path | None = None,
 ) -> dict[str, Any]:
-    """Execute one deterministic discovery cycle for Phase 2."""
+    """Execute one deterministic discovery cycle for Phase 2.
+
+    With ``timeout_policy`` each attempt gets a per-tactic timeout instead of the
+    verifier default; ``cycle_deadline_s`` additionally caps each attempt at a fair
+    share of the cycle's remaining wall-clock budget. ``use_mathlib_prelude`` makes
+    the default verifier import the pre-built ``LeanExtract.Prelude`` module instead
+    of all of Mathlib. ``sandbox_pool_size > 0`` makes the default sandboxed verifier
+    reuse that many long-lived jailed Lean workers instead of one jail per attempt.
+    A ``proof_engine`` with a ``race`` method (``PortfolioProofEngine``) verifies each
+    conjecture's attempts concurrently and stops at the first success.
+    ``dedupe_gaps`` clusters gaps that would produce the same conjecture and fills
+    the ``top_k`` budget with one representative per cluster. ``family_prefixes``
+    restricts gap detection to those declaration families (default: the configured
+    algebra families).
+    ``novelty_store_path`` backs the default novelty checker with a persistent
+    :class:`NoveltyStore`; statements verified in this cycle are remembered there,
+    so later cycles reject their duplicates. ``mathlib_index_dir`` makes the default
+    novelty checker reject restatements of Mathlib theorems, using a memory-mapped
+    index built there once per ``decl_types_path`` snapshot.
+
+    Detected gaps, generated conjectures and the gating outcome are checkpointed
+    in ``output_dir`` as each stage completes, and attempt rows are flushed as they
+    are written. With ``resume`` a cycle interrupted with the same inputs and
+    parameters reuses the completed stages and skips attempts already recorded.
+
+    With ``pipelined`` conjecture generation, gating and verification overlap:
+    conjectures flow between the stages through queues of ``pipeline_queue_size``
+    items instead of each stage waiting for the previous one to finish. The
+    attempts and metrics match a batch run; only the deadline's fair share differs,
+    since it is computed over the conjectures gated so far.
+
+    Wall time, CPU time and peak RSS of each stage and its instrumented sub-steps
+    are reported as the ``stages`` tree of the metrics; ``trace_path`` additionally
+    writes them as a Chrome trace.
+    """
     _validate_inputs(top_k, proof_retry_budget)
+    if cycle_deadline_s is not None and cycle_deadline_s <= 0:
+        raise ValueError("cycle_deadline_s must be positive")
+    if sandbox_pool_size < 0:
+        raise ValueError("sandbox_pool_size must be non-negative")
+    if pipeline_queue_size <= 0:
+        raise ValueError("pipeline_queue_size must be a positive integer")
+    if family_prefixes is not None and not family_prefixes:
+        raise ValueError("family_prefixes must not be empty")
 
     cycle_started_ns = time.perf_counter_ns()
+    cycle_deadline = CycleDeadline(cycle_deadline_s) if cycle_deadline_s is not None else None
+    if cycle_deadline is not None and timeout_policy is None:
+        timeout_policy = AdaptiveTimeoutPolicy()
     config = ProjectConfig()
-    graph, graph_cache_hit = _load_graph_cached(premises_path, decl_types_path)
-
-    detector = AnalogicalGapDetector(
-        config=GapDetectorConfig(
-            family_prefixes=config.algebra_name_prefixes,
-            top_k=top_k,
-        )
-    )
-    gaps = detector.detect(graph, top_k=top_k)
-
+    if family_prefixes is None:
+        family_prefixes = config.algebra_name_prefixes
     effective_generator = generator or TemplateConjectureGenerator()
-    conjectures = effective_generator.generate(gaps, max_candidates=top_k)
-
     effective_filter = conjecture_filter or BasicCounterexampleFilter()
-    effective_novelty_checker = novelty_checker or BasicNoveltyChecker()
-    gating = _gate_conjectures(
-        conjectures,
-        conjecture_filter=effective_filter,
-        novelty_checker=effective_novelty_checker,
+    checkpoint = CycleCheckpoint(
+        output_dir,
+        {
+            "premises": _file_signature(premises_path),
+            "decl_types": _file_signature(decl_types_path),
+            "top_k": top_k,
+            "proof_retry_budget": proof_retry_budget,
+            "dedupe_gaps": dedupe_gaps,
+            "family_prefixes": family_prefixes,
+            # Checkpointed conjectures and gating only hold for the same producers.
+            "generator": _component_signature(effective_generator),
+            "conjecture_filter": _component_signature(effective_filter),
+            "pipelined": pipelined,
+        },
+        resume=resume,
     )
+    tracer = Tracer()
+    # Resources opened for this cycle are released however it ends.
+    with use_tracer(tracer), ExitStack() as resources:
+        graph_cache_hit = False
+        gap_cluster_count: int | None = None
+        gap_duplicates_merged = 0
+        with span("gaps"):
+            if checkpoint.has("gaps"):
+                gaps = checkpoint.load_gaps()
+                gap_metadata = checkpoint.metadata("gaps")
+                gap_cluster_count = gap_metadata["gap_cluster_count"]
+                gap_duplicates_merged = gap_metadata["gap_duplicates_merged"]
+            else:
+                with span("graph_load"):
+                    graph, graph_cache_hit = _load_graph_cached(premises_path, decl_types_path)
+                detector = AnalogicalGapDetector(
+                    config=GapDetectorConfig(
+                        family_prefixes=family_prefixes,
+                        top_k=top_k,
+                    )
+                )
+                if dedupe_gaps:
+                    dedupe = cluster_gaps(
+                        detector.detect(graph, top_k=sys.maxsize), graph, top_k=top_k
+                    )
+                    gaps = list(dedupe.representatives)
+                    gap_cluster_count = len(dedupe.clusters)
+                    gap_duplicates_merged = dedupe.merged_count
+                else:
+                    gaps = detector.detect(graph, top_k=top_k)
+                checkpoint.save_gaps(
+                    gaps,
+                    gap_cluster_count=gap_cluster_count,
+                    gap_duplicates_merged=gap_duplicates_merged,
+                )
 
-    effective_proof_engine = proof_engine or SimpleProofEngine()
-    effective_verifier = verifier or _build_default_verifier(
-        config,
-        trusted_local_run=trusted_local_run,
-        sandbox_command_prefix=sandbox_command_prefix,
-    )
-    runtime_status = _runtime_status(effective_verifier, trusted_local_run=trusted_local_run)
-    verification_mode = "trusted_local" if trusted_local_run else "sandboxed"
-
-    output_dir.mkdir(parents=True, exist_ok=True)
-    attempts_path = output_dir / "phase2_attempts.jsonl"
-    metrics_path = output_dir / "phase2_cycle_metrics.json"
-
-    skipped_reason = _skip_reason(runtime_status)
-    verification_outcome = VerificationOutcome(success_count=0, failure_counts={})
-    if skipped_reason is not None:
-        attempts_path.write_text("", encoding="utf-8")
-        logger.warning("Phase2 verification skipped: %s", skipped_reason)
-    else:
-        verification_outcome = _verify_conjectures(
-            attempts_path=attempts_path,
-            conjectures=gating.verifiable_conjectures,
-            proof_engine=effective_proof_engine,
-            verifier=effective_verifier,
-            proof_retry_budget=proof_retry_budget,
-        )
+        with span("setup"):
+            novelty_store: NoveltyStore | None = None
+            if novelty_checker is None and novelty_store_path is not None:
+                novelty_store = resources.enter_context(NoveltyStore(novelty_store_path))
+            mathlib_index: MathlibTheoremIndex | None = None
+            if novelty_checker is None and mathlib_index_dir is not None:
+                mathlib_index = MathlibTheoremIndex.load_or_build(
+                    decl_types_path, mathlib_index_dir
+                )
+            effective_novelty_checker = novelty_checker or resources.enter_context(
+                BasicNoveltyChecker(store=novelty_store, mathlib_index=mathlib_index)
+            )
+
+            effective_proof_engine = proof_engine or SimpleProofEngine()
+            sandbox_pool: SandboxPool | None = None
+            if verifier is None and sandbox_pool_size > 0 and not trusted_local_run:
+                # Workers start lazily on the first attempt, so skipped cycles spawn no jails.
+                sandbox_pool = resources.enter_context(
+                    SandboxPool(
+                        size=sandbox_pool_size,
+                        sandbox_command_prefix=sandbox_command_prefix,
+                        project_dir=config.lean_project_dir,
+                    )
+                )
+            effective_verifier = verifier or _build_default_verifier(
+                config,
+                trusted_local_run=trusted_local_run,
+                sandbox_command_prefix=sandbox_command_prefix,
+                use_mathlib_prelude=use_mathlib_prelude,
+                sandbox_pool=sandbox_pool,
+            )
+            runtime_status = _runtime_status(
+                effective_verifier, trusted_local_run=trusted_local_run
+            )
+        verification_mode = "trusted_local" if trusted_local_run else "sandboxed"
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        attempts_path = output_dir / "phase2_attempts.jsonl"
+        metrics_path = output_dir / "phase2_cycle_metrics.json"
+
+        completed_rows = checkpoint.attempt_rows(attempts_path) if resume else []
+        skipped_reason = _skip_reason(runtime_status)
+        if skipped_reason is not None:
+            if not completed_rows:
+                attempts_path.write_text("", encoding="utf-8")
+            logger.warning("Phase2 verification skipped: %s", skipped_reason)
+
+        def verify(
+            source: Sequence[ConjectureCandidate] | StageChannel[ConjectureCandidate],
+        ) -> VerificationOutcome:
+            return _verify_conjectures(
+                attempts_path=attempts_path,
+                conjectures=source,
+                proof_engine=effective_proof_engine,
+                verifier=effective_verifier,
+                proof_retry_budget=proof_retry_budget,
+                timeout_policy=timeout_policy,
+                cycle_deadline=cycle_deadline,
+                completed_rows=completed_rows,
+            )
+
+        verification_outcome = VerificationOutcome(success_count=0, failure_counts=())
+        if pipelined and not checkpoint.has("gating"):
+            generated_fresh = not checkpoint.has("conjectures")
+
+            def produce() -> Iterable[ConjectureCandidate]:
+                if not generated_fresh:
+                    return checkpoint.load_conjectures()
+                if hasattr(effective_generator, "iter_generate"):
+                    candidates = effective_generator.iter_generate(gaps, max_candidates=top_k)
+                else:
+                    candidates = effective_generator.generate(gaps, max_candidates=top_k)
+                # Checkpointed as generated, so a crash during verification keeps them.
+                return checkpoint.stream_conjectures(candidates)
+
+            with span("pipeline"):
+                conjectures, gating, verification_outcome = _run_pipelined(
+                    produce=produce,
+                    queue_size=pipeline_queue_size,
+                    conjecture_filter=effective_filter,
+                    novelty_checker=effective_novelty_checker,
+                    verify=verify if skipped_reason is None else None,
+                    on_gated=lambda outcome: checkpoint.save_json(
+                        "gating", _gating_payload(outcome)
+                    ),
+                )
+        else:
+            with span("generation"):
+                if checkpoint.has("conjectures"):
+                    conjectures = checkpoint.load_conjectures()
+                else:
+                    conjectures = effective_generator.generate(gaps, max_candidates=top_k)
+                    checkpoint.save_conjectures(conjectures)
+
+            with span("gating"):
+                if checkpoint.has("gating"):
+                    gating = _gating_from_payload(checkpoint.load_json("gating"))
+                else:
+                    gating = _gate_conjectures(
+                        conjectures,
+                        conjecture_filter=effective_filter,
+                        novelty_checker=effective_novelty_checker,
+                    )
+                    checkpoint.save_json("gating", _gating_payload(gating))
+
+            if skipped_reason is None:
+                with span("verification"):
+                    verification_outcome = verify(gating.verifiable_conjectures)
+
+        remembered_count = 0
+        with span("novelty_remember"):
+            if hasattr(effective_novelty_checker, "remember"):
+                for statement in verification_outcome.verified_statements:
+                    effective_novelty_checker.remember(statement)
+                    remembered_count += 1
 
     success_rate = (
         verification_outcome.success_count / len(gating.verifiable_conjectures)
@@ -342,6 +976,10 @@ def run_phase2_cycle(
     cycle_duration_ms = (time.perf_counter_ns() - cycle_started_ns) / 1_000_000
     metrics: dict[str, Any] = {
         "gap_count": len(gaps),
+        "gap_dedupe_enabled": dedupe_gaps,
+        "family_prefixes": list(family_prefixes),
+        "gap_cluster_count": gap_cluster_count,
+        "gap_duplicates_merged": gap_duplicates_merged,
         "conjecture_count": len(conjectures),
         "filtered_out_count": gating.filtered_out_count,
         "filter_pass_count": gating.filter_pass_count,
@@ -350,6 +988,7 @@ def run_phase2_cycle(
         "duplicate_count": gating.duplicate_count,
         "novel_count": gating.novel_count,
         "novelty_unknown_count": gating.novelty_unknown_count,
+        "novelty_remembered_count": remembered_count,
         "verification_success_count": verification_outcome.success_count,
         "success_rate": success_rate,
         "cycle_duration_ms": round(cycle_duration_ms, 3),
@@ -364,11 +1003,25 @@ def run_phase2_cycle(
         "failure_counts": dict(verification_outcome.failure_counts),
         "top_k": top_k,
         "proof_retry_budget": proof_retry_budget,
+        "cycle_deadline_s": cycle_deadline_s,
+        "deadline_skipped_count": verification_outcome.deadline_skipped_count,
+        "race_cancelled_count": verification_outcome.race_cancelled_count,
+        "tactic_timeouts_s": timeout_policy.snapshot() if timeout_policy is not None else {},
+        "resumed": resume,
+        "resumed_stages": list(checkpoint.resumed_stages),
+        "resumed_attempt_count": len(completed_rows),
+        "stages": tracer.stages(),
+        "pipelined": pipelined,
+        "pipeline_queue_size": pipeline_queue_size,
         "artifacts": {
             "attempts_path": str(attempts_path),
             "metrics_path": str(metrics_path),
+            "checkpoint_dir": str(checkpoint.directory),
+            "trace_path": str(trace_path) if trace_path is not None else None,
         },
     }
+    if trace_path is not None:
+        tracer.write_chrome_trace(trace_path)
     metrics_path.write_text(json.dumps(metrics, indent=2, sort_keys=True) + "\n", encoding="utf-8")
     logger.info(
         (
@@ -0,0 +1,80 @@
+"""Bounded hand-off channels between concurrently running pipeline stages."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Iterable
+
+
+class StageCancelledError(Exception):
+    """Raised in a producer whose downstream stage has stopped consuming."""
+
+
+class StageChannel[T]:
+    """FIFO of at most ``maxsize`` items between a producer and a consumer stage.
+
+    ``put`` blocks while the channel is full, so a fast producer is throttled to
+    the pace of its consumer and memory stays bounded. The producer ends the
+    stream with ``close`` (optionally passing the exception it failed with, which
+    the consumer then re-raises); a consumer that gives up calls ``cancel`` so a
+    blocked producer raises :class:`StageCancelledError` instead of waiting.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self._items: deque[T] = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._cancelled = False
+        self._error: BaseException | None = None
+
+    @classmethod
+    def of(cls, items: Iterable[T]) -> StageChannel[T]:
+        """A closed channel already holding ``items``."""
+        buffered = list(items)
+        channel = cls(max(1, len(buffered)))
+        channel._items.extend(buffered)
+        channel._closed = True
+        return channel
+
+    def put(self, item: T) -> None:
+        with self._condition:
+            while len(self._items) >= self.maxsize and not self._cancelled:
+                self._condition.wait()
+            if self._cancelled:
+                raise StageCancelledError("downstream stage stopped consuming")
+            self._items.append(item)
+            self._condition.notify_all()
+
+    def close(self, error: BaseException | None = None) -> None:
+        with self._condition:
+            self._closed = True
+            self._error = error
+            self._condition.notify_all()
+
+    def cancel(self) -> None:
+        with self._condition:
+            self._cancelled = True
+            self._items.clear()
+            self._condition.notify_all()
+
+    def take(self, *, block: bool = True) -> list[T] | None:
+        """Every item ready now, or ``None`` once the channel is closed and empty.
+
+        With ``block`` this waits for at least one item (or the close); without
+        it an empty open channel returns ``[]``.
+        """
+        with self._condition:
+            while block and not self._items and not self._closed:
+                self._condition.wait()
+            if self._items:
+                ready = list(self._items)
+                self._items.clear()
+                self._condition.notify_all()
+                return ready
+            if self._error is not None:
+                raise self._error
+            return None if self._closed else []
@@ -1,9 +1,15 @@
 """Proof engine implementations."""
 
 from autonomous_discovery.proof_engine.models import ProofAttempt
+from autonomous_discovery.proof_engine.portfolio import PortfolioProofEngine, RaceResult
 from autonomous_discovery.proof_engine.simple_engine import SimpleProofEngine
+from autonomous_discovery.proof_engine.timeouts import AdaptiveTimeoutPolicy, CycleDeadline
 
 __all__ = [
+    "AdaptiveTimeoutPolicy",
+    "CycleDeadline",
+    "PortfolioProofEngine",
     "ProofAttempt",
+    "RaceResult",
     "SimpleProofEngine",
 ]
@@ -0,0 +1,38 @@
+"""Helpers for reading historical proof attempt logs (``phase2_attempts.jsonl``)."""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def tactic_name(proof_script: str) -> str:
+    """Return the leading tactic of a ``by`` proof script (e.g. ``exact?``)."""
+    body = proof_script.strip()
+    if body.startswith("by"):
+        body = body[2:]
+    tokens = body.split()
+    return tokens[0] if tokens else "<empty>"
+
+
+def iter_attempt_rows(paths: Iterable[Path]) -> Iterator[dict[str, Any]]:
+    """Yield attempt rows from JSONL logs, skipping missing files and malformed lines."""
+    for path in paths:
+        if not path.exists():
+            continue
+        with path.open(encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.debug("Skipping malformed attempt row %s:%d", path, line_number)
+                    continue
+                if isinstance(row, dict):
+                    yield row
@@ -0,0 +1,264 @@
+"""Tactic portfolio proof engine that races attempts and stops at the first success."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import itertools
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
+from autonomous_discovery.proof_engine.history import iter_attempt_rows, tactic_name
+from autonomous_discovery.proof_engine.models import ProofAttempt
+from autonomous_discovery.verifier.models import VerificationResult
+
+DEFAULT_PORTFOLIO_TACTICS: tuple[str, ...] = (
+    "simp_all",
+    "ring",
+    "linarith",
+    "omega",
+    "norm_num",
+    "decide",
+    "aesop",
+    "exact?",
+)
+
+TimeoutFor = Callable[[str], int | None]
+
+
+def target_family(missing_decl: str) -> str:
+    """Return the family of a gap target, e.g. ``Ring`` for ``Ring.mul_comm``."""
+    head, sep, _ = missing_decl.partition(".")
+    return head if sep and head else "<root>"
+
+
+@dataclass(frozen=True, slots=True)
+class RaceResult:
+    """A raced attempt that ran to completion."""
+
+    attempt: ProofAttempt
+    verification: VerificationResult
+    duration_ms: float
+    timeout_s: int | None = None
+
+
+@dataclass(slots=True)
+class PortfolioProofEngine:
+    """Rank a tactic portfolio by past success and race attempts concurrently.
+
+    Success rates are kept per (target family, tactic). A family's rate is
+    Laplace-smoothed towards the tactic's rate across all families, so sparse
+    families still benefit from global history. ``race`` runs the ranked
+    attempts with as many in flight as needed for the estimated chance that all
+    of them fail to drop below ``miss_probability`` (capped at
+    ``max_concurrency``), returns on the first success and cancels the rest.
+    """
+
+    engine_name: str = "portfolio-proof-engine"
+    tactics: tuple[str, ...] = DEFAULT_PORTFOLIO_TACTICS
+    max_concurrency: int = 4
+    miss_probability: float = 0.1
+
+    _family_counts: dict[tuple[str, str], list[int]] = field(init=False, default_factory=dict)
+    _tactic_counts: dict[str, list[int]] = field(init=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not self.tactics:
+            raise ValueError("tactics must not be empty")
+        if self.max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer")
+        if not 0.0 < self.miss_probability < 1.0:
+            raise ValueError("miss_probability must be in (0, 1)")
+
+    @classmethod
+    def from_attempt_logs(cls, paths: Iterable[Path], **kwargs: Any) -> PortfolioProofEngine:
+        """Build an engine seeded from ``phase2_attempts.jsonl``-style logs."""
+        engine = cls(**kwargs)
+        for row in iter_attempt_rows(paths):
+            missing_decl = row.get("gap_missing_decl")
+            proof_script = row.get("proof_script")
+            if not isinstance(missing_decl, str) or not isinstance(proof_script, str):
+                continue
+            engine.record(
+                target_family(missing_decl), proof_script, success=bool(row.get("success"))
+            )
+        return engine
+
+    def record(self, family: str, proof_script: str, *, success: bool) -> None:
+        tactic = tactic_name(proof_script)
+        for counts in (
+            self._family_counts.setdefault((family, tactic), [0, 0]),
+            self._tactic_counts.setdefault(tactic, [0, 0]),
+        ):
+            counts[0] += int(success)
+            counts[1] += 1
+
+    def success_rate(self, family: str, tactic: str) -> float:
+        successes, trials = self._tactic_counts.get(tactic, (0, 0))
+        prior = (successes + 1) / (trials + 2)
+        successes, trials = self._family_counts.get((family, tactic), (0, 0))
+        return (successes + 2 * prior) / (trials + 2)
+
+    def ranked_tactics(self, family: str) -> list[str]:
+        """Tactics by descending success rate; ties keep the configured order."""
+        return sorted(self.tactics, key=lambda tactic: -self.success_rate(family, tactic))
+
+    def concurrency_for(self, family: str, attempt_count: int) -> int:
+        """Fewest top-ranked attempts whose joint miss chance is below ``miss_probability``."""
+        limit = max(1, min(self.max_concurrency, attempt_count))
+        miss = 1.0
+        for width, tactic in enumerate(self.ranked_tactics(family)[:limit], start=1):
+            miss *= 1.0 - self.success_rate(family, tactic)
+            if miss <= self.miss_probability:
+                return width
+        return limit
+
+    def build_attempts(
+        self,
+        conjecture: ConjectureCandidate,
+        *,
+        max_attempts: int = 3,
+    ) -> list[ProofAttempt]:
+        if max_attempts <= 0:
+            return []
+        ranked = self.ranked_tactics(target_family(conjecture.gap_missing_decl))
+        return [
+            ProofAttempt(
+                statement=conjecture.lean_statement,
+                proof_script=f"by\n  {tactic}",
+                engine=self.engine_name,
+                attempt_index=index,
+            )
+            for index, tactic in enumerate(ranked[:max_attempts], start=1)
+        ]
+
+    def race(
+        self,
+        conjecture: ConjectureCandidate,
+        verifier: Any,
+        *,
+        attempts: Sequence[ProofAttempt] | None = None,
+        timeout_for: TimeoutFor | None = None,
+    ) -> list[RaceResult]:
+        """Race ``attempts`` (default: ``build_attempts``) and stop at the first success.
+
+        Attempts start in rank order, at most ``concurrency_for`` at a time, and a
+        queued attempt starts only when an in-flight one fails. Returns the
+        attempts that completed, in completion order. Verifiers with
+        ``verify_async`` run on an event loop where cancellation kills the Lean
+        process; other verifiers run on threads and in-flight attempts finish.
+        """
+        family = target_family(conjecture.gap_missing_decl)
+        planned = list(attempts) if attempts is not None else self.build_attempts(conjecture)
+        if not planned:
+            return []
+        concurrency = self.concurrency_for(family, len(planned))
+        if hasattr(verifier, "verify_async"):
+            results = asyncio.run(_race_async(planned, verifier, concurrency, timeout_for))
+        else:
+            results = _race_threads(planned, verifier, concurrency, timeout_for)
+        for result in results:
+            self.record(family, result.attempt.proof_script, success=result.verification.success)
+        return results
+
+
+async def _race_async(
+    attempts: list[ProofAttempt],
+    verifier: Any,
+    concurrency: int,
+    timeout_for: TimeoutFor | None,
+) -> list[RaceResult]:
+    async def run(attempt: ProofAttempt) -> RaceResult:
+        timeout = timeout_for(attempt.proof_script) if timeout_for is not None else None
+        started_ns = time.perf_counter_ns()
+        if timeout is None:
+            verification = await verifier.verify_async(attempt.statement, attempt.proof_script)
+        else:
+            verification = await verifier.verify_async(
+                attempt.statement, attempt.proof_script, timeout=timeout
+            )
+        return _race_result(attempt, verification, started_ns, timeout)
+
+    # Attempts start in rank order and only after an in-flight one has failed.
+    queued = iter(attempts)
+    order: dict[asyncio.Task[RaceResult], int] = {}
+    results: list[RaceResult] = []
+    pending: set[asyncio.Task[RaceResult]] = set()
+    try:
+        for attempt in itertools.islice(queued, concurrency):
+            task = asyncio.create_task(run(attempt))
+            order[task] = len(order)
+            pending.add(task)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            results.extend(task.result() for task in sorted(done, key=order.__getitem__))
+            if any(result.verification.success for result in results):
+                break
+            for attempt in itertools.islice(queued, len(done)):
+                task = asyncio.create_task(run(attempt))
+                order[task] = len(order)
+                pending.add(task)
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    return results
+
+
+def _race_threads(
+    attempts: list[ProofAttempt],
+    verifier: Any,
+    concurrency: int,
+    timeout_for: TimeoutFor | None,
+) -> list[RaceResult]:
+    def run(attempt: ProofAttempt) -> RaceResult:
+        timeout = timeout_for(attempt.proof_script) if timeout_for is not None else None
+        started_ns = time.perf_counter_ns()
+        if timeout is None:
+            verification = verifier.verify(attempt.statement, attempt.proof_script)
+        else:
+            verification = verifier.verify(
+                attempt.statement, attempt.proof_script, timeout=timeout
+            )
+        return _race_result(attempt, verification, started_ns, timeout)
+
+    def submit(executor: ThreadPoolExecutor, attempt: ProofAttempt) -> Future[RaceResult]:
+        # A copied context keeps the verifier's spans under the caller's current span.
+        return executor.submit(contextvars.copy_context().run, run, attempt)
+
+    queued = iter(attempts)
+    order: dict[Future[RaceResult], int] = {}
+    results: list[RaceResult] = []
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="proof-race") as executor:
+        for attempt in itertools.islice(queued, concurrency):
+            order[submit(executor, attempt)] = len(order)
+        pending = set(order)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            results.extend(future.result() for future in sorted(done, key=order.__getitem__))
+            if any(result.verification.success for result in results):
+                break
+            for attempt in itertools.islice(queued, len(done)):
+                future = submit(executor, attempt)
+                order[future] = len(order)
+                pending.add(future)
+    return results
+
+
+def _race_result(
+    attempt: ProofAttempt,
+    verification: VerificationResult,
+    started_ns: int,
+    timeout: int | None,
+) -> RaceResult:
+    return RaceResult(
+        attempt=attempt,
+        verification=verification,
+        duration_ms=(time.perf_counter_ns() - started_ns) / 1_000_000,
+        timeout_s=timeout,
+    )
@@ -0,0 +1,104 @@
+"""Adaptive per-tactic timeouts derived from historical attempt latencies."""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from autonomous_discovery.proof_engine.history import iter_attempt_rows, tactic_name
+
+
+@dataclass(slots=True)
+class AdaptiveTimeoutPolicy:
+    """Per-tactic timeouts from the latency distribution of successful attempts.
+
+    A tactic with at least ``min_samples`` successful runs gets
+    ``quantile(successful durations) * margin``, clamped to
+    ``[min_timeout_s, max_timeout_s]``. Tactics without enough history use
+    ``default_timeout_s``.
+    """
+
+    default_timeout_s: int = 30
+    min_timeout_s: int = 2
+    max_timeout_s: int = 120
+    quantile: float = 0.99
+    margin: float = 1.5
+    min_samples: int = 5
+
+    _durations_ms: dict[str, list[float]] = field(init=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.quantile <= 1.0:
+            raise ValueError("quantile must be in (0, 1]")
+        if self.min_timeout_s <= 0 or self.max_timeout_s < self.min_timeout_s:
+            raise ValueError("timeouts must satisfy 0 < min_timeout_s <= max_timeout_s")
+
+    @classmethod
+    def from_attempt_logs(cls, paths: Iterable[Path], **kwargs: Any) -> AdaptiveTimeoutPolicy:
+        """Build a policy seeded from ``phase2_attempts.jsonl``-style logs."""
+        policy = cls(**kwargs)
+        for row in iter_attempt_rows(paths):
+            try:
+                duration_ms = float(row["duration_ms"])
+                proof_script = str(row["proof_script"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            policy.record(proof_script, duration_ms, success=bool(row.get("success")))
+        return policy
+
+    def record(self, proof_script: str, duration_ms: float, *, success: bool) -> None:
+        """Record an attempt latency; only successful runs shape the distribution."""
+        if not success or duration_ms < 0:
+            return
+        self._durations_ms.setdefault(tactic_name(proof_script), []).append(duration_ms)
+
+    def timeout_for(self, proof_script: str) -> int:
+        """Return the timeout in whole seconds for the script's leading tactic."""
+        return self._timeout_for_tactic(tactic_name(proof_script))
+
+    def snapshot(self) -> dict[str, int]:
+        """Return the current timeout for every tactic with recorded history."""
+        return {tactic: self._timeout_for_tactic(tactic) for tactic in sorted(self._durations_ms)}
+
+    def _timeout_for_tactic(self, tactic: str) -> int:
+        samples = self._durations_ms.get(tactic, [])
+        if len(samples) < self.min_samples:
+            return self.default_timeout_s
+        observed_s = float(np.quantile(samples, self.quantile)) / 1000 * self.margin
+        return min(self.max_timeout_s, max(self.min_timeout_s, math.ceil(observed_s)))
+
+
+@dataclass(slots=True)
+class CycleDeadline:
+    """Wall-clock budget for a cycle, shared fairly across the remaining attempts."""
+
+    budget_s: float
+    clock: Callable[[], float] = time.monotonic
+
+    _started: float = field(init=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        if self.budget_s <= 0:
+            raise ValueError("budget_s must be positive")
+        self._started = self.clock()
+
+    def remaining_s(self) -> float:
+        return max(0.0, self.budget_s - (self.clock() - self._started))
+
+    def allot(self, requested_s: int, *, remaining_attempts: int) -> int | None:
+        """Cap ``requested_s`` at a fair share of the remaining budget.
+
+        Returns ``None`` once less than one second is left, meaning no further
+        attempts should be started.
+        """
+        remaining = self.remaining_s()
+        if remaining < 1.0:
+            return None
+        fair_share = remaining / max(1, remaining_attempts)
+        return max(1, min(requested_s, math.floor(fair_share)))
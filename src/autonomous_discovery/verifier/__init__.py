@@ -2,8 +2,13 @@
 
 from autonomous_discovery.verifier.lean_verifier import LeanVerifier
 from autonomous_discovery.verifier.models import VerificationResult
+from autonomous_discovery.verifier.prelude import LeanPrelude
+from autonomous_discovery.verifier.sandbox_pool import SandboxLimits, SandboxPool
 
 __all__ = [
+    "LeanPrelude",
     "LeanVerifier",
+    "SandboxLimits",
+    "SandboxPool",
     "VerificationResult",
 ]
@@ -2,25 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 import shutil
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-from autonomous_discovery.lean_bridge.runner import LeanRunner
+from autonomous_discovery.instrumentation import traced
+from autonomous_discovery.lean_bridge.async_runner import AsyncLeanRunner
+from autonomous_discovery.lean_bridge.runner import LeanResult, LeanRunner
 from autonomous_discovery.verifier.models import VerificationResult
+from autonomous_discovery.verifier.prelude import FULL_MATHLIB_HEADER, LeanPrelude
+from autonomous_discovery.verifier.sandbox_pool import SandboxPool
 
 
 @dataclass(slots=True)
 class LeanVerifier:
-    """Verify conjectures by compiling temporary Lean files."""
+    """Verify conjectures by compiling temporary Lean files.
+
+    Every attempt first checks that ``lean`` responds; with ``availability_ttl_s``
+    a probe result is reused for that many seconds instead, which long-running
+    callers issuing many attempts use to skip one subprocess per attempt.
+    """
 
     runner: LeanRunner = field(default_factory=LeanRunner)
     timeout: int = 30
     max_stderr_chars: int = 2000
     require_sandbox: bool = True
     sandbox_command_prefix: tuple[str, ...] = ("nsjail",)
+    prelude: LeanPrelude | None = None
+    sandbox_pool: SandboxPool | None = None
+    async_runner: AsyncLeanRunner | None = None
+    availability_ttl_s: float = 0.0
+    _availability: tuple[float, bool] | None = field(default=None, init=False, repr=False)
 
     _disallowed_patterns: tuple[re.Pattern[str], ...] = (
         re.compile(r"\brun_cmd\b", re.IGNORECASE),
@@ -34,12 +50,19 @@ class LeanVerifier:
         r"^\s*theorem\s+[A-Za-z_][A-Za-z0-9_]*\s*:\s*True\s*$"
     )
     _proof_pattern: re.Pattern[str] = re.compile(
-        r"^\s*by\s*\n\s*(exact\?|aesop|simp|trivial)\s*$",
+        r"^\s*by\s*\n\s*"
+        r"(exact\?|aesop|simp_all|simp|trivial|ring|linarith|omega|norm_num|decide)\s*$",
         re.IGNORECASE,
     )
 
     def is_available(self) -> bool:
-        return self.runner.check_lean_available()
+        if self.availability_ttl_s <= 0:
+            return self.runner.check_lean_available()
+        now = time.monotonic()
+        if self._availability is None or self._availability[0] <= now:
+            available = self.runner.check_lean_available()
+            self._availability = (now + self.availability_ttl_s, available)
+        return self._availability[1]
 
     def runtime_status(self) -> dict[str, bool]:
         lean_available = self.is_available()
@@ -51,7 +74,70 @@ class LeanVerifier:
             "runtime_ready": runtime_ready,
         }
 
-    def verify(self, statement: str, proof_script: str) -> VerificationResult:
+    @traced("verifier.lean")
+    def verify(
+        self, statement: str, proof_script: str, *, timeout: int | None = None
+    ) -> VerificationResult:
+        """Verify ``proof_script`` for ``statement``; ``timeout`` overrides ``self.timeout``."""
+        rejected = self._precheck(statement, proof_script)
+        if rejected is not None:
+            return rejected
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+        content = self._candidate_source(statement, proof_script)
+        if self.require_sandbox and self.sandbox_pool is not None:
+            # Pool workers redact their own temp paths before replying.
+            result = self.sandbox_pool.run(content, timeout=effective_timeout)
+            return self._to_verification(statement, proof_script, result, "")
+
+        with TemporaryDirectory(prefix="autonomous_discovery_lean_") as tmp_dir:
+            lean_path = Path(tmp_dir) / "Candidate.lean"
+            lean_path.write_text(
+                content,
+                encoding="utf-8",
+            )
+            result = self.runner.run_command(
+                self._lean_command(lean_path),
+                timeout=effective_timeout,
+            )
+            return self._to_verification(statement, proof_script, result, tmp_dir)
+
+    @traced("verifier.lean")
+    async def verify_async(
+        self, statement: str, proof_script: str, *, timeout: int | None = None
+    ) -> VerificationResult:
+        """Awaitable :meth:`verify`; cancelling it kills the running Lean process group.
+
+        Attempts served by ``sandbox_pool`` run on a worker thread and finish even
+        if cancelled, since the pool owns the worker process.
+        """
+        rejected = await asyncio.to_thread(self._precheck, statement, proof_script)
+        if rejected is not None:
+            return rejected
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+        content = await asyncio.to_thread(self._candidate_source, statement, proof_script)
+        if self.require_sandbox and self.sandbox_pool is not None:
+            result = await asyncio.to_thread(
+                self.sandbox_pool.run, content, timeout=effective_timeout
+            )
+            return self._to_verification(statement, proof_script, result, "")
+
+        if self.async_runner is None:
+            self.async_runner = AsyncLeanRunner(
+                project_dir=getattr(self.runner, "project_dir", None)
+            )
+        with TemporaryDirectory(prefix="autonomous_discovery_lean_") as tmp_dir:
+            lean_path = Path(tmp_dir) / "Candidate.lean"
+            lean_path.write_text(content, encoding="utf-8")
+            result = await self.async_runner.run_command(
+                self._lean_command(lean_path),
+                timeout=effective_timeout,
+            )
+            return self._to_verification(statement, proof_script, result, tmp_dir)
+
+    def _precheck(self, statement: str, proof_script: str) -> VerificationResult | None:
+        """Return a rejection result if the attempt must not reach Lean."""
         if not self.is_available():
             return VerificationResult(
                 statement=statement,
@@ -92,35 +178,37 @@ class LeanVerifier:
                 ),
                 timed_out=False,
             )
+        return None
+
+    def _candidate_source(self, statement: str, proof_script: str) -> str:
+        return f"{self._import_header()}\n\n{statement} :=\n{proof_script}\n"
+
+    def _lean_command(self, lean_path: Path) -> list[str]:
+        lean_cmd = ["lake", "env", "lean", str(lean_path)]
+        return [*self.sandbox_command_prefix, *lean_cmd] if self.require_sandbox else lean_cmd
+
+    def _to_verification(
+        self, statement: str, proof_script: str, result: LeanResult, tmp_dir: str
+    ) -> VerificationResult:
+        return VerificationResult(
+            statement=statement,
+            proof_script=proof_script,
+            success=result.success,
+            stderr=self._sanitize_stderr(result.stderr, tmp_dir),
+            timed_out=result.timed_out,
+        )
 
-        with TemporaryDirectory(prefix="autonomous_discovery_lean_") as tmp_dir:
-            lean_path = Path(tmp_dir) / "Candidate.lean"
-            content = f"import Mathlib\n\n{statement} :=\n{proof_script}\n"
-            lean_path.write_text(
-                content,
-                encoding="utf-8",
-            )
-
-            lean_cmd = ["lake", "env", "lean", str(lean_path)]
-            cmd = [*self.sandbox_command_prefix, *lean_cmd] if self.require_sandbox else lean_cmd
-            result = self.runner.run_command(
-                cmd,
-                timeout=self.timeout,
-            )
-            return VerificationResult(
-                statement=statement,
-                proof_script=proof_script,
-                success=result.success,
-                stderr=self._sanitize_stderr(result.stderr, tmp_dir),
-                timed_out=result.timed_out,
-            )
+    def _import_header(self) -> str:
+        if self.prelude is None:
+            return FULL_MATHLIB_HEADER
+        return self.prelude.import_header()
 
     def _contains_disallowed_content(self, statement: str, proof_script: str) -> bool:
         payload = f"{statement}\n{proof_script}"
         return any(pattern.search(payload) for pattern in self._disallowed_patterns)
 
     def _sanitize_stderr(self, stderr: str, tmp_dir: str) -> str:
-        redacted = stderr.replace(tmp_dir, "<tmpdir>")
+        redacted = stderr.replace(tmp_dir, "<tmpdir>") if tmp_dir else stderr
         if len(redacted) <= self.max_stderr_chars:
             return redacted
         return redacted[: self.max_stderr_chars] + "...<truncated>"
@@ -0,0 +1,105 @@
+"""Pre-built Mathlib import header (``LeanExtract.Prelude``) for candidate files."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from autonomous_discovery.lean_bridge.runner import LeanRunner
+
+logger = logging.getLogger(__name__)
+
+PRELUDE_MODULE = "LeanExtract.Prelude"
+FULL_MATHLIB_HEADER = "import Mathlib"
+
+# Inputs whose change invalidates the compiled prelude, relative to the Lake project.
+_FINGERPRINT_FILES: tuple[str, ...] = (
+    "lean-toolchain",
+    "lake-manifest.json",
+    "lakefile.toml",
+)
+
+
+@dataclass(slots=True)
+class LeanPrelude:
+    """Build-once import header shared by all candidate files.
+
+    The prelude module is compiled to an ``.olean`` with ``lake build`` and a
+    fingerprint of its inputs is stored next to the build output. Later processes
+    reuse the build while the fingerprint matches. If the build fails, candidates
+    fall back to ``import Mathlib``.
+    """
+
+    project_dir: Path
+    runner: LeanRunner = field(default_factory=LeanRunner)
+    module: str = PRELUDE_MODULE
+    build_timeout: int = 3600
+
+    _ready: bool | None = field(init=False, default=None)
+
+    @property
+    def source_path(self) -> Path:
+        return self.project_dir.joinpath(*self.module.split(".")).with_suffix(".lean")
+
+    @property
+    def olean_path(self) -> Path:
+        relative = Path(*self.module.split(".")).with_suffix(".olean")
+        return self.project_dir / ".lake" / "build" / "lib" / "lean" / relative
+
+    @property
+    def stamp_path(self) -> Path:
+        return self.project_dir / ".lake" / "prelude.stamp"
+
+    def fingerprint(self) -> str:
+        """Hash the toolchain, manifest, lakefile and prelude source."""
+        digest = hashlib.sha256()
+        for path in (*(self.project_dir / name for name in _FINGERPRINT_FILES), self.source_path):
+            digest.update(path.name.encode("utf-8"))
+            digest.update(b"\0")
+            if path.exists():
+                digest.update(path.read_bytes())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def is_current(self) -> bool:
+        if not self.olean_path.exists() or not self.stamp_path.exists():
+            return False
+        return self.stamp_path.read_text(encoding="utf-8").strip() == self.fingerprint()
+
+    def ensure_built(self) -> bool:
+        """Build the prelude if it is missing or stale; cache the outcome per instance."""
+        if self._ready is not None:
+            return self._ready
+        if not self.source_path.exists():
+            logger.warning("Prelude source not found at %s", self.source_path)
+            self._ready = False
+            return False
+        if self.is_current():
+            self._ready = True
+            return True
+
+        logger.info("Building Lean prelude %s", self.module)
+        result = self.runner.run_command(
+            ["lake", "build", self.module],
+            timeout=self.build_timeout,
+            cwd=str(self.project_dir),
+        )
+        if not result.success:
+            logger.warning(
+                "Prelude build failed (timed_out=%s); falling back to full Mathlib import: %s",
+                result.timed_out,
+                result.stderr[-500:],
+            )
+            self._ready = False
+            return False
+
+        self.stamp_path.parent.mkdir(parents=True, exist_ok=True)
+        self.stamp_path.write_text(self.fingerprint() + "\n", encoding="utf-8")
+        self._ready = True
+        return True
+
+    def import_header(self) -> str:
+        """Return the import line candidate files should start with."""
+        return f"import {self.module}" if self.ensure_built() else FULL_MATHLIB_HEADER
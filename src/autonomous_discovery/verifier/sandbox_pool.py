@@ -0,0 +1,229 @@
+"""Pool of long-lived sandboxed Lean workers fed over pipes."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import queue
+import select
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from autonomous_discovery.lean_bridge.runner import LeanResult
+from autonomous_discovery.verifier.sandbox_worker import DEFAULT_LEAN_COMMAND
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class SandboxLimits:
+    """Per-candidate resource limits enforced by each worker (<= 0 disables a limit)."""
+
+    cpu_seconds: int = 120
+    memory_mb: int = 8192
+    max_stderr_bytes: int = 64 * 1024
+
+
+class _Worker:
+    """One jailed worker process and its request pipe."""
+
+    def __init__(self, cmd: list[str]) -> None:
+        self.proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        # Replies are read from the raw pipe, so bytes received past a reply's
+        # newline wait here rather than in a file buffer ``select`` cannot see.
+        self._pending = b""
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def request(
+        self, payload: dict[str, object], *, deadline_s: float
+    ) -> dict[str, object] | None:
+        """Send one request; return the reply, or ``None`` on timeout or worker death."""
+        assert self.proc.stdin is not None and self.proc.stdout is not None
+        try:
+            self.proc.stdin.write((json.dumps(payload) + "\n").encode("utf-8"))
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError):
+            return None
+        line = self._read_line(time.monotonic() + deadline_s)
+        if line is None:
+            return None
+        try:
+            reply = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        return reply if isinstance(reply, dict) else None
+
+    def _read_line(self, deadline: float) -> bytes | None:
+        """The next reply line, or ``None`` once ``deadline`` passes or stdout closes."""
+        assert self.proc.stdout is not None
+        fd = self.proc.stdout.fileno()
+        while b"\n" not in self._pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                return None
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return None
+            self._pending += chunk
+        line, _, self._pending = self._pending.partition(b"\n")
+        return line
+
+    def kill(self) -> None:
+        try:
+            os.killpg(self.proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self.proc.wait()
+        for stream in (self.proc.stdin, self.proc.stdout):
+            if stream is not None:
+                # Closing stdin flushes buffered bytes into a pipe nobody reads any more.
+                with contextlib.suppress(OSError):
+                    stream.close()
+
+
+class SandboxPool:
+    """Fixed-size pool of sandboxed Lean workers.
+
+    Each worker is started once as ``[*sandbox_command_prefix, *worker_command]``,
+    so jail setup (namespaces, bind mounts) is paid per worker rather than per
+    attempt. Workers only accept Lean source over their pipe, compile it under
+    ``limits`` and reply with the outcome. A worker that misses its deadline or
+    dies is killed with its whole process group and replaced.
+
+    Callers must apply the verifier's input checks before submitting source.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = 2,
+        sandbox_command_prefix: tuple[str, ...] = ("nsjail",),
+        project_dir: str | Path | None = None,
+        lean_command: tuple[str, ...] = DEFAULT_LEAN_COMMAND,
+        limits: SandboxLimits | None = None,
+        worker_command: tuple[str, ...] | None = None,
+        response_grace_s: float = 5.0,
+    ) -> None:
+        if size <= 0:
+            raise ValueError("size must be a positive integer")
+        self.size = size
+        self.sandbox_command_prefix = sandbox_command_prefix
+        self.project_dir = str(project_dir) if project_dir else None
+        self.lean_command = lean_command
+        self.limits = limits or SandboxLimits()
+        self.worker_command = worker_command
+        self.response_grace_s = response_grace_s
+        self.spawn_count = 0
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._workers: list[_Worker] = []
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+
+    def __enter__(self) -> SandboxPool:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SandboxPool is closed")
+            if self._started:
+                return
+            for _ in range(self.size):
+                self._idle.put(self._spawn())
+            self._started = True
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.kill()
+
+    def run(self, source: str, *, timeout: float) -> LeanResult:
+        """Compile ``source`` on the next idle worker."""
+        self.start()
+        worker = self._idle.get()
+        started = time.monotonic()
+        try:
+            reply = worker.request(
+                {"source": source, "timeout": timeout},
+                deadline_s=timeout + self.response_grace_s,
+            )
+        except BaseException:
+            self._replace(worker)
+            raise
+        if reply is None:
+            elapsed = time.monotonic() - started
+            self._replace(worker)
+            if elapsed >= timeout:
+                return LeanResult(stdout="", stderr="", returncode=-1, timed_out=True)
+            return LeanResult(
+                stdout="",
+                stderr="Sandbox worker exited unexpectedly.",
+                returncode=-1,
+                timed_out=False,
+            )
+        self._idle.put(worker)
+        return LeanResult(
+            stdout="",
+            stderr=str(reply.get("stderr", "")),
+            returncode=int(reply.get("returncode", -1)),
+            timed_out=bool(reply.get("timed_out", False)),
+        )
+
+    def _worker_cmd(self) -> list[str]:
+        worker = self.worker_command or (
+            sys.executable,
+            "-m",
+            "autonomous_discovery.verifier.sandbox_worker",
+            *(("--cwd", self.project_dir) if self.project_dir else ()),
+            "--cpu-seconds",
+            str(self.limits.cpu_seconds),
+            "--memory-mb",
+            str(self.limits.memory_mb),
+            "--max-stderr-bytes",
+            str(self.limits.max_stderr_bytes),
+            "--",
+            *self.lean_command,
+        )
+        return [*self.sandbox_command_prefix, *worker]
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._worker_cmd())
+        self._workers.append(worker)
+        self.spawn_count += 1
+        return worker
+
+    def _replace(self, worker: _Worker) -> None:
+        worker.kill()
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+            if self._closed:
+                return
+            logger.info("Replacing sandbox worker pid=%d", worker.proc.pid)
+            self._idle.put(self._spawn())
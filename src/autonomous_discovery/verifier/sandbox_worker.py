@@ -0,0 +1,151 @@
+"""Long-lived Lean worker that runs inside a sandbox and serves requests over stdio.
+
+Protocol: one JSON object per line on stdin, ``{"source": str, "timeout": float}``,
+answered by one JSON line on stdout, ``{"returncode", "stderr", "timed_out"}``.
+Requests carry Lean source only; the worker never executes caller-supplied
+commands. Each candidate is compiled in a fresh temporary directory under CPU and
+address-space rlimits, and its process group is killed on timeout.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import signal
+import subprocess
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, TextIO
+
+DEFAULT_LEAN_COMMAND: tuple[str, ...] = ("lake", "env", "lean")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Serve sandboxed Lean verification requests.")
+    parser.add_argument("--cwd", type=Path, default=None)
+    parser.add_argument("--cpu-seconds", type=int, default=120)
+    parser.add_argument("--memory-mb", type=int, default=8192)
+    parser.add_argument("--max-stderr-bytes", type=int, default=64 * 1024)
+    parser.add_argument(
+        "lean_command",
+        nargs="*",
+        help="Lean command the candidate path is appended to (default: lake env lean).",
+    )
+    return parser
+
+
+def _limit_resources(cpu_seconds: int, memory_mb: int) -> Callable[[], None]:
+    """Return a ``preexec_fn`` applying the limits; non-positive values disable a limit."""
+
+    def apply() -> None:
+        if cpu_seconds > 0:
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds))
+        if memory_mb > 0:
+            memory_bytes = memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+
+    return apply
+
+
+def handle_request(
+    request: dict[str, Any],
+    *,
+    lean_command: tuple[str, ...],
+    cwd: Path | None,
+    cpu_seconds: int,
+    memory_mb: int,
+    max_stderr_bytes: int,
+) -> dict[str, Any]:
+    source = request.get("source")
+    timeout = request.get("timeout")
+    if not isinstance(source, str) or not isinstance(timeout, int | float) or timeout <= 0:
+        return {"returncode": -1, "stderr": "Malformed sandbox request.", "timed_out": False}
+
+    with TemporaryDirectory(prefix="autonomous_discovery_lean_") as tmp_dir:
+        lean_path = Path(tmp_dir) / "Candidate.lean"
+        lean_path.write_text(source, encoding="utf-8")
+        try:
+            proc = subprocess.Popen(
+                [*lean_command, str(lean_path)],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                cwd=cwd,
+                start_new_session=True,
+                preexec_fn=_limit_resources(cpu_seconds, memory_mb),
+            )
+        except OSError as e:
+            return {"returncode": -1, "stderr": str(e), "timed_out": False}
+
+        timed_out = False
+        try:
+            _, stderr_bytes = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            _, stderr_bytes = proc.communicate()
+
+        stderr = stderr_bytes[:max_stderr_bytes].decode("utf-8", errors="replace")
+        if len(stderr_bytes) > max_stderr_bytes:
+            stderr += "...<truncated>"
+        return {
+            "returncode": -1 if timed_out else proc.returncode,
+            "stderr": stderr.replace(tmp_dir, "<tmpdir>"),
+            "timed_out": timed_out,
+        }
+
+
+def serve(
+    stdin: TextIO,
+    stdout: TextIO,
+    *,
+    lean_command: tuple[str, ...],
+    cwd: Path | None,
+    cpu_seconds: int,
+    memory_mb: int,
+    max_stderr_bytes: int,
+) -> None:
+    for line in stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError:
+            request = {}
+        if not isinstance(request, dict):
+            request = {}
+        response = handle_request(
+            request,
+            lean_command=lean_command,
+            cwd=cwd,
+            cpu_seconds=cpu_seconds,
+            memory_mb=memory_mb,
+            max_stderr_bytes=max_stderr_bytes,
+        )
+        stdout.write(json.dumps(response, sort_keys=True) + "\n")
+        stdout.flush()
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    serve(
+        sys.stdin,
+        sys.stdout,
+        lean_command=tuple(args.lean_command) or DEFAULT_LEAN_COMMAND,
+        cwd=args.cwd,
+        cpu_seconds=args.cpu_seconds,
+        memory_mb=args.memory_mb,
+        max_stderr_bytes=args.max_stderr_bytes,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
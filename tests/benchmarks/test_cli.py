@@ -0,0 +1,185 @@
+"""Tests for the benchmark CLI."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from autonomous_discovery.benchmarks.cli import main
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+def _run_args(history: Path, *extra: str) -> list[str]:
+    return [
+        "run",
+        "--history",
+        str(history),
+        "--premises-path",
+        str(FIXTURES / "sample_premises.txt"),
+        "--decl-types-path",
+        str(FIXTURES / "sample_decl_types.txt"),
+        "--repeats",
+        "1",
+        "--warmup",
+        "0",
+        *extra,
+    ]
+
+
+def test_run_records_selected_benchmarks(tmp_path: Path) -> None:
+    history = tmp_path / "history.json"
+
+    exit_code = main(
+        _run_args(
+            history,
+            "--only",
+            "parser.*",
+            "--only",
+            "gap_detector.*",
+            "--only",
+            "novelty.*",
+            "--family-counts",
+            "2",
+            "--novelty-history-sizes",
+            "10",
+        )
+    )
+
+    assert exit_code == 0
+    [run] = json.loads(history.read_text(encoding="utf-8"))["runs"]
+    assert [result["name"] for result in run["results"]] == [
+        "parser.premises",
+        "parser.declaration_types",
+        "gap_detector.detect[families=2]",
+        "novelty.check_batch[history=10]",
+    ]
+    assert run["results"][0]["items"] > 0
+
+
+def test_run_covers_graph_benchmarks_on_fixture_dump(tmp_path: Path) -> None:
+    history = tmp_path / "history.json"
+
+    assert main(_run_args(history, "--only", "graph.*")) == 0
+
+    [run] = json.loads(history.read_text(encoding="utf-8"))["runs"]
+    results = {result["name"]: result for result in run["results"]}
+    assert set(results) == {
+        "graph.from_raw_data",
+        "graph.pagerank",
+        "graph.descendants_batch",
+    }
+    assert results["graph.from_raw_data"]["peak_alloc_mb"] is not None
+
+
+def test_run_stub_lean_verifier(tmp_path: Path) -> None:
+    history = tmp_path / "history.json"
+
+    exit_code = main(_run_args(history, "--only", "verifier.*", "--verifier-attempts", "2"))
+
+    assert exit_code == 0
+    [run] = json.loads(history.read_text(encoding="utf-8"))["runs"]
+    assert all(result["items"] == 2 for result in run["results"])
+
+
+def test_run_reports_missing_dump(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    exit_code = main(
+        [
+            "run",
+            "--history",
+            str(tmp_path / "history.json"),
+            "--premises-path",
+            str(tmp_path / "missing.txt"),
+            "--only",
+            "parser.*",
+        ]
+    )
+
+    assert exit_code == 1
+    assert "Input file not found" in capsys.readouterr().err
+    assert not (tmp_path / "history.json").exists()
+
+
+def test_run_list_prints_names(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["run", "--list", "--only", "novelty.*"]) == 0
+
+    assert capsys.readouterr().out.splitlines() == [
+        "novelty.check_batch[history=100]",
+        "novelty.check_batch[history=1000]",
+        "novelty.check_batch[history=10000]",
+    ]
+
+
+def _write_history(path: Path, baseline_ms: float, current_ms: float) -> None:
+    runs = [
+        {"results": [{"name": "toy", "items": 1, "wall_ms": [elapsed]}]}
+        for elapsed in (baseline_ms, current_ms)
+    ]
+    path.write_text(json.dumps({"format_version": 1, "runs": runs}), encoding="utf-8")
+
+
+def test_compare_fails_on_regression(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    history = tmp_path / "history.json"
+    _write_history(history, 10.0, 15.0)
+
+    assert main(["compare", "--history", str(history)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+    assert main(["compare", "--history", str(history), "--threshold", "0.6"]) == 0
+
+
+def test_compare_warns_about_benchmarks_timed_on_different_inputs(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    history = tmp_path / "history.json"
+    runs = [
+        {
+            "inputs": {"premises_path": premises_path},
+            "input_benchmarks": ["parser.premises"],
+            "results": [{"name": "parser.premises", "items": 1, "wall_ms": [elapsed]}],
+        }
+        for premises_path, elapsed in (("small", 10.0), ("large", 100.0))
+    ]
+    history.write_text(json.dumps({"format_version": 1, "runs": runs}), encoding="utf-8")
+
+    assert main(["compare", "--history", str(history)]) == 0
+    captured = capsys.readouterr()
+    assert "Skipping 1 benchmark(s) timed on different inputs: parser.premises" in captured.err
+    assert "REGRESSION" not in captured.out
+
+
+def test_compare_needs_two_runs(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["compare", "--history", str(tmp_path / "absent.json")]) == 1
+    assert "does not have runs" in capsys.readouterr().err
+
+
+def test_run_generates_and_reuses_synthetic_dump(tmp_path: Path) -> None:
+    history = tmp_path / "history.json"
+    args = [
+        "run",
+        "--history",
+        str(history),
+        "--synthetic-declarations",
+        "1500",
+        "--synthetic-dir",
+        str(tmp_path / "synthetic"),
+        "--only",
+        "parser.premises",
+        "--repeats",
+        "1",
+        "--warmup",
+        "0",
+    ]
+
+    assert main(args) == 0
+    dump_dir = tmp_path / "synthetic" / "1500-seed0"
+    written = (dump_dir / "premises.txt").stat().st_mtime_ns
+    assert main(args) == 0
+
+    assert (dump_dir / "premises.txt").stat().st_mtime_ns == written
+    assert not (tmp_path / "synthetic" / "1500-seed0.tmp").exists()
+    runs = json.loads(history.read_text(encoding="utf-8"))["runs"]
+    assert runs[-1]["results"][0]["items"] == 1500
+    assert runs[-1]["inputs"]["synthetic_declarations"] == 1500
+    assert runs[-1]["input_benchmarks"] == ["parser.premises"]
@@ -0,0 +1,51 @@
+"""Tests for the benchmark timing harness."""
+
+from __future__ import annotations
+
+import pytest
+
+from autonomous_discovery.benchmarks.harness import Benchmark, BenchmarkResult, run_benchmark
+
+
+def test_run_benchmark_prepares_each_run_and_counts_items() -> None:
+    prepared: list[int] = []
+
+    def prepare():
+        prepared.append(1)
+        return lambda: 7
+
+    result = run_benchmark(Benchmark("toy", prepare), repeats=3, warmup=2)
+
+    assert len(prepared) == 5
+    assert result.name == "toy"
+    assert result.items == 7
+    assert len(result.wall_ms) == 3
+    assert result.peak_alloc_mb is None
+
+
+def test_run_benchmark_tracks_peak_allocation() -> None:
+    benchmark = Benchmark(
+        "alloc", lambda: lambda: len(bytearray(4 * 1024 * 1024)), track_memory=True
+    )
+
+    result = run_benchmark(benchmark, repeats=1, warmup=0)
+
+    assert result.peak_alloc_mb is not None
+    assert result.peak_alloc_mb >= 4.0
+
+
+def test_result_round_trips_through_dict() -> None:
+    result = BenchmarkResult("toy", 10, (2.0, 4.0, 3.0), peak_alloc_mb=1.5)
+
+    payload = result.to_dict()
+
+    assert payload["median_ms"] == 3.0
+    assert payload["min_ms"] == 2.0
+    assert payload["items_per_s"] == pytest.approx(10 / 0.003, rel=1e-3)
+    assert BenchmarkResult.from_dict(payload) == result
+
+
+@pytest.mark.parametrize(("repeats", "warmup"), [(0, 1), (1, -1)])
+def test_run_benchmark_rejects_invalid_counts(repeats: int, warmup: int) -> None:
+    with pytest.raises(ValueError):
+        run_benchmark(Benchmark("toy", lambda: lambda: 1), repeats=repeats, warmup=warmup)
@@ -0,0 +1,90 @@
+"""Tests for the benchmark history file and regression comparison."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from autonomous_discovery.benchmarks.harness import BenchmarkResult
+from autonomous_discovery.benchmarks.history import (
+    append_run,
+    compare_runs,
+    input_mismatches,
+    load_runs,
+)
+
+METADATA = {"timestamp": "2026-01-01T00:00:00+00:00", "git_revision": None}
+
+
+def test_append_run_accumulates_runs(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "history.json"
+
+    append_run(path, [BenchmarkResult("a", 1, (1.0,))], METADATA)
+    append_run(path, [BenchmarkResult("a", 1, (2.0,))], METADATA)
+
+    runs = load_runs(path)
+    assert [run["results"][0]["median_ms"] for run in runs] == [1.0, 2.0]
+    assert json.loads(path.read_text(encoding="utf-8"))["format_version"] == 1
+    assert not path.with_name("history.json.tmp").exists()
+
+
+def test_load_runs_of_missing_file_is_empty(tmp_path: Path) -> None:
+    assert load_runs(tmp_path / "absent.json") == []
+
+
+def test_load_runs_rejects_unknown_format(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    path.write_text(json.dumps({"format_version": 99, "runs": []}), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Unsupported"):
+        load_runs(path)
+
+
+def test_compare_runs_flags_slowdowns_beyond_threshold() -> None:
+    baseline = {
+        "results": [
+            BenchmarkResult("steady", 1, (10.0,)).to_dict(),
+            BenchmarkResult("slower", 1, (10.0,)).to_dict(),
+            BenchmarkResult("dropped", 1, (10.0,)).to_dict(),
+        ]
+    }
+    current = {
+        "results": [
+            BenchmarkResult("steady", 1, (10.5,)).to_dict(),
+            BenchmarkResult("slower", 1, (12.0,)).to_dict(),
+            BenchmarkResult("added", 1, (1.0,)).to_dict(),
+        ]
+    }
+
+    comparisons = {item.name: item for item in compare_runs(baseline, current, threshold=0.10)}
+
+    assert set(comparisons) == {"steady", "slower"}
+    assert not comparisons["steady"].regressed
+    assert comparisons["slower"].regressed
+    assert comparisons["slower"].ratio == 1.2
+
+
+def test_compare_runs_skips_dump_benchmarks_timed_on_different_inputs() -> None:
+    def run(premises_path: str) -> dict[str, object]:
+        return {
+            "inputs": {"premises_path": premises_path},
+            "input_benchmarks": ["parser.premises"],
+            "results": [
+                BenchmarkResult("parser.premises", 1, (10.0,)).to_dict(),
+                BenchmarkResult("novelty.check_batch", 1, (10.0,)).to_dict(),
+            ],
+        }
+
+    baseline, current = run("small/premises.txt"), run("large/premises.txt")
+
+    assert input_mismatches(baseline, current) == ["parser.premises"]
+    assert [item.name for item in compare_runs(baseline, current)] == ["novelty.check_batch"]
+    assert input_mismatches(baseline, run("small/premises.txt")) == []
+    assert len(compare_runs(baseline, run("small/premises.txt"))) == 2
+
+
+def test_compare_runs_rejects_negative_threshold() -> None:
+    with pytest.raises(ValueError, match="threshold"):
+        compare_runs({"results": []}, {"results": []}, threshold=-0.1)
@@ -0,0 +1,135 @@
+"""Tests for the SQLite-backed LLM response cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from autonomous_discovery.config import LLMConfig
+from autonomous_discovery.conjecture_generator.cache import (
+    ResponseCache,
+    ResponseCacheMissError,
+)
+from autonomous_discovery.conjecture_generator.llm_generator import OllamaConjectureGenerator
+from autonomous_discovery.gap_detector.analogical import GapCandidate
+
+THEOREM = "theorem Ring_mul_assoc (R : Type*) [Ring R] (a b c : R) : a * b * c = a * (b * c)"
+
+
+def _gap() -> GapCandidate:
+    return GapCandidate(
+        source_decl="Group.mul_assoc",
+        target_family="Ring.",
+        missing_decl="Ring.mul_assoc",
+        score=0.85,
+        signals={"dependency_overlap": 0.7},
+    )
+
+
+def _ollama_response(content: str) -> MagicMock:
+    resp = MagicMock(spec=httpx.Response)
+    resp.json.return_value = {"message": {"role": "assistant", "content": content}}
+    resp.raise_for_status.return_value = None
+    return resp
+
+
+def test_key_depends_on_model_options_and_messages() -> None:
+    messages = [{"role": "user", "content": "hi"}]
+    base = ResponseCache.key_for("m", {"temperature": 0.7}, messages)
+
+    assert base == ResponseCache.key_for("m", {"temperature": 0.7}, list(messages))
+    assert base != ResponseCache.key_for("other", {"temperature": 0.7}, messages)
+    assert base != ResponseCache.key_for("m", {"temperature": 0.0}, messages)
+    assert base != ResponseCache.key_for("m", {"temperature": 0.7}, [*messages, *messages])
+
+
+def test_entries_persist_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "cache" / "llm.sqlite"
+    with ResponseCache(path) as cache:
+        cache.put("k", "value")
+
+    with ResponseCache(path) as cache:
+        assert cache.get("k") == "value"
+        assert cache.get("missing") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_evicts_least_recently_used_beyond_max_bytes(tmp_path: Path) -> None:
+    with ResponseCache(tmp_path / "llm.sqlite", max_bytes=10) as cache:
+        cache.put("a", "aaaa")
+        cache.put("b", "bbbb")
+        assert cache.get("a") == "aaaa"  # a is now more recent than b
+        cache.put("c", "cccc")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "aaaa"
+        assert cache.get("c") == "cccc"
+        assert cache.total_bytes() == 8
+        assert len(cache) == 2
+
+
+def test_rejects_invalid_configuration(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="mode"):
+        ResponseCache(tmp_path / "a.sqlite", mode="sometimes")
+    with pytest.raises(ValueError, match="max_bytes"):
+        ResponseCache(tmp_path / "b.sqlite", max_bytes=0)
+
+
+@patch("autonomous_discovery.conjecture_generator.llm_generator.httpx")
+def test_read_through_serves_repeat_runs_from_cache(mock_httpx: MagicMock, tmp_path: Path) -> None:
+    mock_httpx.post.return_value = _ollama_response(THEOREM + " := by sorry")
+    with ResponseCache(tmp_path / "llm.sqlite") as cache:
+        generator = OllamaConjectureGenerator(cache=cache)
+        first = generator.generate([_gap()], max_candidates=1)
+        second = generator.generate([_gap()], max_candidates=1)
+
+    assert first == second
+    assert mock_httpx.post.call_count == 1
+
+
+@patch("autonomous_discovery.conjecture_generator.llm_generator.httpx")
+def test_replay_only_reproduces_recorded_repair_loop_offline(
+    mock_httpx: MagicMock, tmp_path: Path
+) -> None:
+    path = tmp_path / "llm.sqlite"
+    mock_httpx.post.side_effect = [
+        _ollama_response("Let me think about it."),
+        _ollama_response(THEOREM + " := by sorry"),
+    ]
+    with ResponseCache(path, mode="record_only") as cache:
+        recorded = OllamaConjectureGenerator(cache=cache).generate([_gap()], max_candidates=1)
+
+    mock_httpx.post.reset_mock()
+    mock_httpx.post.side_effect = AssertionError("replay must not contact Ollama")
+    with ResponseCache(path, mode="replay_only") as cache:
+        replayed = OllamaConjectureGenerator(cache=cache).generate([_gap()], max_candidates=1)
+
+    assert replayed == recorded
+    assert replayed[0].lean_statement == THEOREM
+    mock_httpx.post.assert_not_called()
+
+
+@patch("autonomous_discovery.conjecture_generator.llm_generator.httpx")
+def test_replay_only_miss_fails_the_request(mock_httpx: MagicMock, tmp_path: Path) -> None:
+    with ResponseCache(tmp_path / "llm.sqlite", mode="replay_only") as cache:
+        generator = OllamaConjectureGenerator(config=LLMConfig(parse_retries=0), cache=cache)
+        assert generator.generate([_gap()], max_candidates=1) == []
+        with pytest.raises(ResponseCacheMissError):
+            generator._call_ollama(generator._build_messages(_gap()))
+
+    mock_httpx.post.assert_not_called()
+
+
+@patch("autonomous_discovery.conjecture_generator.llm_generator.httpx")
+def test_record_only_always_queries_and_refreshes(mock_httpx: MagicMock, tmp_path: Path) -> None:
+    mock_httpx.post.return_value = _ollama_response(THEOREM + " := by sorry")
+    with ResponseCache(tmp_path / "llm.sqlite", mode="record_only") as cache:
+        generator = OllamaConjectureGenerator(cache=cache)
+        generator.generate([_gap()], max_candidates=1)
+        generator.generate([_gap()], max_candidates=1)
+        assert len(cache) == 1
+
+    assert mock_httpx.post.call_count == 2
@@ -0,0 +1,93 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from autonomous_discovery import jsonl
+from autonomous_discovery.conjecture_generator.io import (
+    ConjectureWriter,
+    iter_conjectures,
+    read_conjectures,
+)
+from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
+from autonomous_discovery.jsonl import JsonlWriter
+
+
+def _candidate(index: int) -> ConjectureCandidate:
+    return ConjectureCandidate(
+        gap_missing_decl=f"Ring.c{index}",
+        lean_statement=f"theorem Ring_c{index} : True",
+        rationale="r",
+        model_id="m",
+        temperature=0.0,
+        metadata={"index": str(index)},
+    )
+
+
+def test_writer_flushes_in_batches_and_appends(tmp_path: Path) -> None:
+    path = tmp_path / "out" / "conjectures.jsonl"
+
+    with ConjectureWriter(path, batch_size=2) as writer:
+        writer.write(_candidate(0))
+        assert path.read_text(encoding="utf-8") == ""
+        writer.write(_candidate(1))
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+        writer.write(_candidate(2))
+    with ConjectureWriter(path, append=True) as writer:
+        writer.write_all(_candidate(i) for i in range(3, 5))
+
+    assert writer.rows_written == 2
+    assert [c.gap_missing_decl for c in read_conjectures(path)] == [f"Ring.c{i}" for i in range(5)]
+
+
+def test_gzip_round_trip_streams_lazily(tmp_path: Path) -> None:
+    path = tmp_path / "conjectures.jsonl.gz"
+
+    with ConjectureWriter(path) as writer:
+        writer.write_all(_candidate(i) for i in range(1000))
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert json.loads(f.readline())["gap_missing_decl"] == "Ring.c0"
+    stream = iter_conjectures(path)
+    assert next(stream) == _candidate(0)
+    assert sum(1 for _ in stream) == 999
+
+
+def test_zstd_round_trip(tmp_path: Path) -> None:
+    pytest.importorskip("zstandard")
+    path = tmp_path / "conjectures.jsonl.zst"
+
+    with ConjectureWriter(path, batch_size=3) as writer:
+        writer.write_all(_candidate(i) for i in range(10))
+
+    assert list(iter_conjectures(path)) == [_candidate(i) for i in range(10)]
+
+
+def test_writer_rejects_non_positive_batch_size(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="batch_size"):
+        JsonlWriter(tmp_path / "x.jsonl", batch_size=0)
+
+
+def test_rows_are_written_with_sorted_keys(tmp_path: Path) -> None:
+    path = tmp_path / "conjectures.jsonl"
+
+    with ConjectureWriter(path) as writer:
+        writer.write(_candidate(0))
+
+    row = json.loads(path.read_text(encoding="utf-8"))
+    assert list(row) == sorted(row)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_rows_encode_identically_with_either_codec(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(jsonl, "_orjson", None)
+
+    line = jsonl.dumps_row({"b": [1, 2.5], "a": "∀ x, x = x", "c": None})
+
+    assert line == '{"a":"∀ x, x = x","b":[1,2.5],"c":null}'
@@ -0,0 +1,194 @@
+"""Concurrent Ollama generation against a local fake Ollama HTTP server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from autonomous_discovery.config import LLMConfig
+from autonomous_discovery.conjecture_generator.llm_generator import OllamaConjectureGenerator
+from autonomous_discovery.gap_detector.analogical import GapCandidate
+
+
+class FakeOllama:
+    """Answers /api/chat from a per-gap script of replies ("500" means an HTTP error).
+
+    Replies for gaps in ``held`` wait until their event is set.
+    """
+
+    def __init__(
+        self,
+        scripts: dict[str, list[str]],
+        delay_s: float = 0.0,
+        held: dict[str, threading.Event] | None = None,
+    ) -> None:
+        self.scripts = scripts
+        self.delay_s = delay_s
+        self.held = held or {}
+        self.answered: list[str] = []
+        self.lock = threading.Lock()
+        self.calls: dict[str, int] = {}
+        self.requests: list[dict[str, Any]] = []
+        self.connections: set[int] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def reply_for(self, payload: dict[str, Any]) -> tuple[int, str]:
+        prompt = payload["messages"][1]["content"]
+        missing = prompt.split("missing declaration: ", 1)[1].split("\n", 1)[0]
+        with self.lock:
+            self.requests.append(payload)
+            index = self.calls.get(missing, 0)
+            self.calls[missing] = index + 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay_s)
+            if missing in self.held:
+                self.held[missing].wait(timeout=10)
+            script = self.scripts.get(missing, ["no theorem"])
+            reply = script[min(index, len(script) - 1)]
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+                self.answered.append(missing)
+        if reply == "500":
+            return 500, "{}"
+        return 200, json.dumps({"message": {"role": "assistant", "content": reply}})
+
+
+Serve = Callable[["FakeOllama"], str]
+
+
+def _handler(fake: FakeOllama) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:  # noqa: N802
+            fake.connections.add(id(self.connection))
+            length = int(self.headers["Content-Length"])
+            status, body = fake.reply_for(json.loads(self.rfile.read(length)))
+            encoded = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def serve() -> Iterator[Serve]:
+    servers: list[ThreadingHTTPServer] = []
+
+    def start(fake: FakeOllama) -> str:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(fake))
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _gap(name: str, score: float) -> GapCandidate:
+    return GapCandidate(
+        source_decl=f"Group.{name}",
+        target_family="Ring.",
+        missing_decl=f"Ring.{name}",
+        score=score,
+        signals={},
+    )
+
+
+def _theorem(name: str) -> str:
+    return f"theorem Ring_{name} (R : Type*) [Ring R] : True := by sorry"
+
+
+def test_concurrent_generation_keeps_rank_order_and_reuses_connections(serve: Serve) -> None:
+    names = [f"g{i}" for i in range(6)]
+    fake = FakeOllama({f"Ring.{n}": [_theorem(n)] for n in names}, delay_s=0.2)
+    config = LLMConfig(ollama_base_url=serve(fake), max_concurrency=3)
+    gaps = [_gap(name, score=0.1 * i) for i, name in enumerate(names)]
+
+    started = time.monotonic()
+    candidates = OllamaConjectureGenerator(config=config).generate(gaps, max_candidates=6)
+    elapsed = time.monotonic() - started
+
+    assert [c.gap_missing_decl for c in candidates] == [f"Ring.{n}" for n in reversed(names)]
+    assert fake.max_in_flight == 3
+    assert len(fake.connections) <= 3
+    assert elapsed < 1.0
+
+
+def test_concurrent_generation_retries_and_repairs_per_gap(serve: Serve) -> None:
+    fake = FakeOllama(
+        {
+            "Ring.flaky": ["500", _theorem("flaky")],
+            "Ring.chatty": ["Sure! Here is an idea.", _theorem("chatty")],
+            "Ring.hopeless": ["nothing"],
+        }
+    )
+    config = LLMConfig(ollama_base_url=serve(fake), max_concurrency=4, parse_retries=2)
+    gaps = [_gap("flaky", 0.9), _gap("chatty", 0.8), _gap("hopeless", 0.7)]
+
+    candidates = OllamaConjectureGenerator(config=config).generate(gaps, max_candidates=3)
+
+    assert [c.gap_missing_decl for c in candidates] == ["Ring.flaky", "Ring.chatty"]
+    assert fake.calls == {"Ring.flaky": 2, "Ring.chatty": 2, "Ring.hopeless": 3}
+    chatty_retry = [
+        r
+        for r in fake.requests
+        if "Ring.chatty" in r["messages"][1]["content"] and len(r["messages"]) == 4
+    ]
+    assert chatty_retry[0]["messages"][2]["content"] == "Sure! Here is an idea."
+
+
+def test_concurrent_generation_only_queries_gaps_sequential_mode_would(serve: Serve) -> None:
+    fake = FakeOllama(
+        {"Ring.a": ["nothing"], "Ring.b": [_theorem("b")], "Ring.c": [_theorem("c")]}
+    )
+    config = LLMConfig(ollama_base_url=serve(fake), max_concurrency=4, parse_retries=0)
+    gaps = [_gap("a", 0.9), _gap("b", 0.8), _gap("c", 0.7), _gap("d", 0.6)]
+
+    candidates = OllamaConjectureGenerator(config=config).generate(gaps, max_candidates=2)
+
+    assert [c.gap_missing_decl for c in candidates] == ["Ring.b", "Ring.c"]
+    assert sorted(fake.calls) == ["Ring.a", "Ring.b", "Ring.c"]
+
+
+def test_agenerate_rejects_non_positive_concurrency() -> None:
+    generator = OllamaConjectureGenerator(config=LLMConfig(max_concurrency=0))
+    with pytest.raises(ValueError, match="max_concurrency"):
+        asyncio.run(generator.agenerate([_gap("a", 1.0)], max_candidates=1))
+
+
+def test_concurrent_iter_generate_yields_before_all_gaps_finish(serve: Serve) -> None:
+    names = [f"g{i}" for i in range(4)]
+    release = threading.Event()
+    fake = FakeOllama({f"Ring.{n}": [_theorem(n)] for n in names}, held={"Ring.g0": release})
+    config = LLMConfig(ollama_base_url=serve(fake), max_concurrency=2)
+    gaps = [_gap(name, score=0.1 * i) for i, name in enumerate(names)]
+
+    stream = OllamaConjectureGenerator(config=config).iter_generate(gaps, max_candidates=4)
+    first = next(stream)
+    # The lowest-ranked gap is still held, so the first conjecture did not wait for it.
+    assert "Ring.g0" not in fake.answered
+    release.set()
+    rest = list(stream)
+
+    assert [c.gap_missing_decl for c in [first, *rest]] == [f"Ring.{n}" for n in reversed(names)]
@@ -0,0 +1,162 @@
+"""Multi-sample generation per gap against a local fake Ollama server."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from autonomous_discovery.config import LLMConfig
+from autonomous_discovery.conjecture_generator.llm_generator import (
+    OllamaConjectureGenerator,
+    rank_samples,
+)
+from autonomous_discovery.gap_detector.analogical import GapCandidate
+
+COMM = "theorem Ring_comm (R : Type*) [CommRing R] (a b : R) : a * b = b * a"
+COMM_SPACED = "theorem Ring_comm   (R : Type*) [CommRing R] (a b : R) :  a * b = b * a"
+ASSOC = "theorem Ring_assoc (R : Type*) [Ring R] (a b c : R) : a * b * c = a * (b * c)"
+
+
+class SeededOllama:
+    """Replies by ``options.seed``; requests carrying a repair prompt get ``repair``."""
+
+    def __init__(self, by_seed: dict[int, str], repair: str = "", delay_s: float = 0.0) -> None:
+        self.by_seed = by_seed
+        self.repair = repair
+        self.delay_s = delay_s
+        self.lock = threading.Lock()
+        self.payloads: list[dict[str, Any]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def reply_for(self, payload: dict[str, Any]) -> str:
+        with self.lock:
+            self.payloads.append(payload)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay_s)
+        with self.lock:
+            self.in_flight -= 1
+        if len(payload["messages"]) > 2:
+            return self.repair
+        return self.by_seed.get(payload["options"].get("seed", -1), "no idea")
+
+
+Serve = Callable[[SeededOllama], str]
+
+
+def _handler(fake: SeededOllama) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:  # noqa: N802
+            length = int(self.headers["Content-Length"])
+            content = fake.reply_for(json.loads(self.rfile.read(length)))
+            body = json.dumps({"message": {"role": "assistant", "content": content}}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def serve() -> Iterator[Serve]:
+    servers: list[ThreadingHTTPServer] = []
+
+    def start(fake: SeededOllama) -> str:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(fake))
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _gap(name: str = "comm", score: float = 0.9) -> GapCandidate:
+    return GapCandidate(
+        source_decl=f"Group.{name}",
+        target_family="Ring.",
+        missing_decl=f"Ring.{name}",
+        score=score,
+        signals={},
+    )
+
+
+def test_rank_samples_merges_near_duplicates_and_orders_by_votes() -> None:
+    renamed = "theorem Ring_comm' : ∀ (y : Nat), y = y"
+    original = "theorem Ring_comm : ∀ (x : Nat), x = x"
+
+    ranked = rank_samples([ASSOC, COMM, COMM_SPACED, original, renamed, COMM])
+
+    assert ranked == [(COMM, 3), (original, 2), (ASSOC, 1)]
+
+
+def test_rank_samples_merges_bi_implications_into_the_earliest_group() -> None:
+    ranked = rank_samples(["theorem a : P ↔ Q", "theorem c : R", "theorem b : Q ↔ P"])
+
+    assert ranked == [("theorem a : P ↔ Q", 2), ("theorem c : R", 1)]
+
+
+def test_samples_each_gap_with_parallel_seeded_requests(serve: Serve) -> None:
+    fake = SeededOllama(
+        {0: f"{ASSOC} := by sorry", 1: f"{COMM} := by sorry", 2: f"{COMM_SPACED} := by sorry"},
+        delay_s=0.2,
+    )
+    config = LLMConfig(ollama_base_url=serve(fake), samples_per_gap=3, seed=0)
+
+    candidates = OllamaConjectureGenerator(config=config).generate([_gap()], max_candidates=5)
+
+    assert [c.lean_statement for c in candidates] == [COMM, ASSOC]
+    assert [c.metadata["sample_votes"] for c in candidates] == ["2", "1"]
+    assert {c.metadata["samples_per_gap"] for c in candidates} == {"3"}
+    assert sorted(p["options"]["seed"] for p in fake.payloads) == [0, 1, 2]
+    assert fake.max_in_flight == 3
+
+
+def test_falls_back_to_repair_loop_when_no_sample_parses(serve: Serve) -> None:
+    fake = SeededOllama({}, repair=f"{ASSOC} := by sorry")
+    config = LLMConfig(ollama_base_url=serve(fake), samples_per_gap=2, parse_retries=1)
+
+    candidates = OllamaConjectureGenerator(config=config).generate([_gap()], max_candidates=1)
+
+    assert [c.lean_statement for c in candidates] == [ASSOC]
+    assert "sample_votes" not in candidates[0].metadata
+    # Two samples, then one repair round continuing from a failed sample.
+    assert len(fake.payloads) == 3
+    assert fake.payloads[-1]["messages"][2] == {"role": "assistant", "content": "no idea"}
+
+
+def test_no_repair_when_parse_retries_is_zero(serve: Serve) -> None:
+    fake = SeededOllama({})
+    config = LLMConfig(ollama_base_url=serve(fake), samples_per_gap=2, parse_retries=0)
+
+    assert OllamaConjectureGenerator(config=config).generate([_gap()], max_candidates=1) == []
+    assert len(fake.payloads) == 2
+
+
+def test_windows_count_multiple_candidates_per_gap(serve: Serve) -> None:
+    fake = SeededOllama({0: f"{COMM} := by sorry", 1: f"{ASSOC} := by sorry"})
+    config = LLMConfig(ollama_base_url=serve(fake), samples_per_gap=2)
+    gaps = [_gap("a", 0.9), _gap("b", 0.8), _gap("c", 0.7)]
+
+    candidates = OllamaConjectureGenerator(config=config).generate(gaps, max_candidates=3)
+
+    assert [c.gap_missing_decl for c in candidates] == ["Ring.a", "Ring.a", "Ring.b"]
+    # ceil(3 / 2) = 2 gaps were sampled; the third was never queried.
+    assert len(fake.payloads) == 4
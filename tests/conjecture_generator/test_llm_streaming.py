@@ -0,0 +1,173 @@
+"""Streaming Ollama mode against a local fake NDJSON chat server."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from autonomous_discovery.config import LLMConfig
+from autonomous_discovery.conjecture_generator.llm_generator import (
+    OllamaConjectureGenerator,
+    _DeclScanner,
+)
+from autonomous_discovery.gap_detector.analogical import GapCandidate
+
+STATEMENT = "theorem Ring_mul_assoc (R : Type*) [Ring R] (a b c : R) : a * b * c = a * (b * c)"
+
+
+class StreamingOllama:
+    """Streams each scripted reply as many small NDJSON chunks."""
+
+    def __init__(self, replies: list[str], *, chunk_chars: int = 4, delay_s: float = 0.01) -> None:
+        self.replies = replies
+        self.chunk_chars = chunk_chars
+        self.delay_s = delay_s
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.payloads: list[dict[str, object]] = []
+        self.disconnected = threading.Event()
+
+    def next_reply(self, payload: dict[str, object]) -> str:
+        with self.lock:
+            self.payloads.append(payload)
+            reply = self.replies[min(self.calls, len(self.replies) - 1)]
+            self.calls += 1
+        return reply
+
+
+Serve = Callable[[StreamingOllama], str]
+
+
+def _handler(fake: StreamingOllama) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802
+            length = int(self.headers["Content-Length"])
+            reply = fake.next_reply(json.loads(self.rfile.read(length)))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.end_headers()
+            chunks = [
+                reply[i : i + fake.chunk_chars] for i in range(0, len(reply), fake.chunk_chars)
+            ]
+            lines = [
+                {"message": {"role": "assistant", "content": c}, "done": False} for c in chunks
+            ]
+            lines.append({"message": {"role": "assistant", "content": ""}, "done": True})
+            try:
+                for line in lines:
+                    self.wfile.write((json.dumps(line) + "\n").encode("utf-8"))
+                    self.wfile.flush()
+                    time.sleep(fake.delay_s)
+            except (BrokenPipeError, ConnectionResetError):
+                fake.disconnected.set()
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def serve() -> Iterator[Serve]:
+    servers: list[ThreadingHTTPServer] = []
+
+    def start(fake: StreamingOllama) -> str:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(fake))
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _gap(name: str = "mul_assoc", score: float = 0.85) -> GapCandidate:
+    return GapCandidate(
+        source_decl=f"Group.{name}",
+        target_family="Ring.",
+        missing_decl=f"Ring.{name}",
+        score=score,
+        signals={},
+    )
+
+
+def _feed_all(text: str, size: int) -> tuple[bool, str]:
+    scanner = _DeclScanner()
+    for i in range(0, len(text), size):
+        if scanner.feed(text[i : i + size]):
+            return True, scanner.text
+    return False, scanner.text
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+def test_scanner_matches_full_parse_for_any_chunking(size: int) -> None:
+    text = f"Sure, here is a lemma-like theorems list.\n{STATEMENT} := by\n  sorry\nMore prose."
+    complete, prefix = _feed_all(text, size)
+
+    assert complete is True
+    assert OllamaConjectureGenerator()._parse_lean_statements(prefix)[0] == STATEMENT
+    assert "More prose" not in prefix or size == 1000
+
+
+def test_scanner_waits_for_where_to_be_a_whole_word() -> None:
+    scanner = _DeclScanner()
+
+    assert scanner.feed("theorem T (x : Nat) : x = x where") is False
+    assert scanner.feed("as") is False
+    assert scanner.feed(" := rfl") is True
+    assert OllamaConjectureGenerator()._parse_lean_statements(scanner.text) == [
+        "theorem T (x : Nat) : x = x whereas"
+    ]
+
+
+def test_scanner_accepts_where_once_followed_by_whitespace() -> None:
+    scanner = _DeclScanner()
+
+    assert scanner.feed("instance-ish lemma L : P where") is False
+    assert scanner.feed("\n") is True
+
+
+def test_streaming_stops_reading_once_declaration_is_complete(serve: Serve) -> None:
+    reply = f"{STATEMENT} := by\n  sorry\n" + "Some explanation. " * 200
+    fake = StreamingOllama([reply], chunk_chars=8, delay_s=0.01)
+    config = LLMConfig(ollama_base_url=serve(fake), stream=True)
+
+    started = time.monotonic()
+    candidates = OllamaConjectureGenerator(config=config).generate([_gap()], max_candidates=1)
+    elapsed = time.monotonic() - started
+
+    assert [c.lean_statement for c in candidates] == [STATEMENT]
+    assert fake.payloads[0]["stream"] is True
+    # The full reply would take ~4.5 s to stream.
+    assert elapsed < 2.0
+    assert fake.disconnected.wait(timeout=5)
+
+
+def test_streaming_without_declaration_runs_repair_loop(serve: Serve) -> None:
+    fake = StreamingOllama(["I am not sure.", f"{STATEMENT} := by sorry"], delay_s=0.0)
+    config = LLMConfig(ollama_base_url=serve(fake), stream=True, parse_retries=1)
+
+    candidates = OllamaConjectureGenerator(config=config).generate([_gap()], max_candidates=1)
+
+    assert [c.lean_statement for c in candidates] == [STATEMENT]
+    assert fake.calls == 2
+    assert fake.payloads[1]["messages"][2]["content"] == "I am not sure."  # type: ignore[index]
+
+
+def test_streaming_works_with_concurrent_generation(serve: Serve) -> None:
+    fake = StreamingOllama([f"{STATEMENT} := by sorry\n" + "tail " * 100], delay_s=0.005)
+    config = LLMConfig(ollama_base_url=serve(fake), stream=True, max_concurrency=2)
+    gaps = [_gap("a", 0.9), _gap("b", 0.8), _gap("c", 0.7)]
+
+    candidates = OllamaConjectureGenerator(config=config).generate(gaps, max_candidates=3)
+
+    assert [c.gap_missing_decl for c in candidates] == ["Ring.a", "Ring.b", "Ring.c"]
+    assert {c.lean_statement for c in candidates} == {STATEMENT}
@@ -62,3 +62,21 @@ def test_template_generator_rejects_newline_in_missing_decl() -> None:
 
     with pytest.raises(ValueError, match="newline"):
         generator.generate([gap], max_candidates=1)
+
+
+def test_template_iter_generate_matches_generate() -> None:
+    gaps = [
+        GapCandidate(
+            source_decl=f"Group.{name}",
+            target_family="Ring.",
+            missing_decl=f"Ring.{name}",
+            score=score,
+            signals={},
+        )
+        for name, score in (("mul_assoc", 0.5), ("one_mul", 0.9), ("mul_one", 0.7))
+    ]
+    generator = TemplateConjectureGenerator()
+
+    assert list(generator.iter_generate(gaps, max_candidates=2)) == generator.generate(
+        gaps, max_candidates=2
+    )
@@ -0,0 +1,155 @@
+import pytest
+
+from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
+from autonomous_discovery.counterexample_filter.basic import BasicCounterexampleFilter
+from autonomous_discovery.counterexample_filter.chain import ChainedCounterexampleFilter
+from autonomous_discovery.counterexample_filter.numeric import (
+    NumericCounterexampleFilter,
+    UnsupportedStatementError,
+    parse_equation,
+    search_counterexample,
+)
+
+
+def _candidate(statement: str) -> ConjectureCandidate:
+    return ConjectureCandidate(
+        gap_missing_decl="Ring.x",
+        lean_statement=statement,
+        rationale="test",
+        model_id="test",
+        temperature=0.0,
+    )
+
+
+@pytest.mark.parametrize(
+    ("statement", "status"),
+    [
+        ("theorem T (R : Type*) [Ring R] (a b : R) : a * b = b * a", "falsified"),
+        ("theorem T (R : Type*) [CommRing R] (a b : R) : a * b = b * a", "survived"),
+        (
+            "theorem T (R : Type*) [CommRing R] (a b : R) : "
+            "(a + b) ^ 2 = a ^ 2 + 2 * a * b + b ^ 2",
+            "survived",
+        ),
+        (
+            "theorem T (R : Type*) [CommRing R] (a b : R) : (a + b) ^ 2 = a ^ 2 + b ^ 2",
+            "falsified",
+        ),
+        ("theorem T {G : Type*} [Group G] (a b : G) : (a * b)⁻¹ = b⁻¹ * a⁻¹", "survived"),
+        ("theorem T {G : Type*} [Group G] (a b : G) : (a * b)⁻¹ = a⁻¹ * b⁻¹", "falsified"),
+        ("theorem T {G : Type*} [CommGroup G] : ∀ a b : G, (a * b)⁻¹ = a⁻¹ * b⁻¹", "survived"),
+        ("theorem T {K : Type*} [Field K] (a : K) : a * a⁻¹ = 1", "falsified"),
+        ("theorem T {G : Type*} [AddGroup G] : ∀ (a b : G), -(a + b) = -a + -b", "falsified"),
+        ("theorem T (R : Type*) [Ring R] (a : R) : -a ^ 2 = -(a * a)", "survived"),
+        ("theorem T (M : Type*) [Monoid M] (a : M) : a ^ 3 = a * a * a := by simp", "survived"),
+    ],
+)
+def test_search_counterexample_matches_algebra(statement: str, status: str) -> None:
+    assert search_counterexample(statement).status == status
+
+
+def test_counterexample_detail_names_structure_and_assignment() -> None:
+    check = search_counterexample("theorem T {G : Type*} [Group G] (a b : G) : a * b = b * a")
+
+    assert check.detail.startswith("Equiv.Perm (Fin 3): a := ")
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "theorem Ring_x (R : Type*) [Ring R] : True",
+        "theorem T (R : Type*) [Ring R] (a : R) (h : a = 0) : a = 0",
+        "theorem T (R : Type*) [IsDomain R] (a : R) : a = a",
+        "theorem T (R : Type*) [Ring R] (a : R) : f a = a",
+        "theorem T (R : Type*) [Ring R] (a : R) : a ≤ a",
+    ],
+)
+def test_statements_outside_the_fragment_are_not_checked(statement: str) -> None:
+    assert search_counterexample(statement).status == "unsupported"
+
+
+def test_group_numerals_other_than_one_are_unsupported() -> None:
+    check = search_counterexample("theorem T {G : Type*} [Group G] (a : G) : a * 2 = a")
+
+    assert check.status == "unsupported"
+
+
+def test_parse_equation_respects_lean_precedence() -> None:
+    equation = parse_equation("theorem T (R : Type*) [Ring R] (a b : R) : -a ^ 2 * b = a - b - a")
+
+    assert equation.class_name == "Ring"
+    assert equation.variables == ("a", "b")
+    assert equation.lhs.op == "mul"
+    assert equation.lhs.args[0].op == "neg"
+    assert equation.rhs.op == "sub"
+    assert equation.rhs.args[0].op == "sub"
+    with pytest.raises(UnsupportedStatementError):
+        parse_equation("theorem T (R : Type*) [Ring R] (a : R) : a = a = a")
+
+
+def test_numeric_filter_batch_in_process_pool_keeps_order() -> None:
+    statements = [
+        "theorem A (R : Type*) [CommRing R] (a b : R) : a * b = b * a",
+        "theorem B (R : Type*) [Ring R] (a b : R) : a * b = b * a",
+        "theorem C (R : Type*) [Ring R] : True",
+    ]
+    with NumericCounterexampleFilter(max_workers=2) as f:
+        decisions = f.evaluate_batch([_candidate(s) for s in statements * 2])
+        pool = f._pool
+        f.evaluate_batch([_candidate(s) for s in statements * 2])
+
+        assert pool is not None
+        assert f._pool is pool
+    assert f._pool is None
+    assert [(d.accepted, d.reason) for d in decisions] == [
+        (True, "passed_numeric_checks"),
+        (False, "numeric_counterexample"),
+        (True, "numeric_unchecked"),
+    ] * 2
+
+
+def test_numeric_filter_pool_workers_are_not_forked_from_the_caller() -> None:
+    statement = "theorem B (R : Type*) [Ring R] (a b : R) : a * b = b * a"
+    with NumericCounterexampleFilter(max_workers=2) as f:
+        decisions = f.evaluate_batch([_candidate(statement)] * 4)
+
+        # Forking a process whose stage threads hold locks can deadlock the workers.
+        assert f._pool is not None
+        assert f._pool._mp_context.get_start_method() == "forkserver"
+    assert [d.reason for d in decisions] == ["numeric_counterexample"] * 4
+
+
+def test_numeric_filter_searches_small_batches_in_process() -> None:
+    f = NumericCounterexampleFilter(max_workers=4)
+
+    decisions = f.evaluate_batch(
+        [_candidate("theorem B (R : Type*) [Ring R] (a b : R) : a * b = b * a")]
+    )
+
+    assert [d.reason for d in decisions] == ["numeric_counterexample"]
+    assert f._pool is None
+
+
+def test_numeric_filter_rejects_invalid_budget() -> None:
+    with pytest.raises(ValueError, match="time_budget_s"):
+        NumericCounterexampleFilter(time_budget_s=0)
+
+
+def test_chained_filter_stops_at_first_rejection() -> None:
+    chain = ChainedCounterexampleFilter(
+        filters=(BasicCounterexampleFilter(), NumericCounterexampleFilter(max_workers=1))
+    )
+    conjectures = [
+        _candidate("theorem A : False"),
+        _candidate("theorem B (R : Type*) [Ring R] (a b : R) : a * b = b * a"),
+        _candidate("theorem C (R : Type*) [CommRing R] (a b : R) : a * b = b * a"),
+    ]
+
+    batch = chain.evaluate_batch(conjectures)
+
+    assert [d.reason for d in batch] == [
+        "contains_false_literal",
+        "numeric_counterexample",
+        "passed_numeric_checks",
+    ]
+    assert [chain.evaluate(c) for c in conjectures] == batch
@@ -0,0 +1,118 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
+from autonomous_discovery.counterexample_filter.basic import BasicCounterexampleFilter
+from autonomous_discovery.counterexample_filter.models import FilterDecision
+from autonomous_discovery.counterexample_filter.rules import (
+    FilterRule,
+    RuleSetCounterexampleFilter,
+    load_filter_rules,
+)
+
+
+def _candidate(statement: str) -> ConjectureCandidate:
+    return ConjectureCandidate(
+        gap_missing_decl="Group.one_mul",
+        lean_statement=statement,
+        rationale="test",
+        model_id="test",
+        temperature=0.0,
+    )
+
+
+def test_reports_first_matching_rule_in_rule_order() -> None:
+    # "sorry" appears earlier in the text, but "false" ranks first in the rule set.
+    f = RuleSetCounterexampleFilter(
+        rules=(
+            FilterRule("false_literal", r":\s*false\b"),
+            FilterRule("sorry", r"sorry"),
+        )
+    )
+
+    decision = f.evaluate(_candidate("theorem sorry_bad : False"))
+
+    assert decision == FilterDecision(accepted=False, reason="false_literal")
+
+
+def test_evaluate_batch_matches_evaluate_in_order() -> None:
+    f = BasicCounterexampleFilter()
+    statements = [
+        "theorem ok (G : Type*) [Group G] (a : G) : a * 1 = a",
+        "theorem bad : False",
+        "theorem bad2 : 1 = 0",
+        "theorem ok2 : 10 = 10",
+    ]
+    conjectures = [_candidate(s) for s in statements]
+
+    decisions = f.evaluate_batch(conjectures)
+
+    assert decisions == [f.evaluate(c) for c in conjectures]
+    assert [d.reason for d in decisions] == [
+        "passed_basic_checks",
+        "contains_false_literal",
+        "contains_obvious_contradiction",
+        "passed_basic_checks",
+    ]
+
+
+def test_rules_with_inner_groups_and_many_alternatives() -> None:
+    rules = tuple(FilterRule(f"rule_{i}", rf"\bbad_{i}(_x)?\b") for i in range(300))
+    f = RuleSetCounterexampleFilter(rules=rules)
+
+    assert f.evaluate(_candidate("theorem T : bad_299_x")).reason == "rule_299"
+    assert f.evaluate(_candidate("theorem T : bad_2990")).accepted is True
+
+
+def test_rules_that_cannot_share_the_combined_scan_are_checked_alone() -> None:
+    f = RuleSetCounterexampleFilter(
+        rules=(
+            FilterRule("zzz", "zzz"),
+            FilterRule("reflexive", r"(\w+) = \1\b"),
+            FilterRule("case_insensitive", "(?i)SORRY"),
+            FilterRule("named_a", r"(?P<lhs>\w+) ≠ (?P=lhs)"),
+            FilterRule("named_b", r"(?P<lhs>\w+) < (?P=lhs)\b"),
+            FilterRule("mentions_c", r"\bc\b"),
+        )
+    )
+
+    assert f.evaluate(_candidate("theorem t : a = a")).reason == "reflexive"
+    assert f.evaluate(_candidate("theorem t : a = b")).accepted is True
+    assert f.evaluate(_candidate("theorem t : sorry")).reason == "case_insensitive"
+    assert f.evaluate(_candidate("theorem t : x ≠ x")).reason == "named_a"
+    assert f.evaluate(_candidate("theorem t : x < x")).reason == "named_b"
+    # A standalone rule ranked above a combined hit still wins.
+    assert f.evaluate(_candidate("theorem t : a = a ∧ zzz")).reason == "zzz"
+    assert f.evaluate(_candidate("theorem t : a = a ∧ c")).reason == "reflexive"
+    assert f.evaluate(_candidate("theorem t : a = b ∧ c")).reason == "mentions_c"
+
+
+def test_empty_rule_set_accepts_everything() -> None:
+    f = RuleSetCounterexampleFilter(rules=())
+
+    assert f.evaluate_batch([_candidate("theorem bad : False")]) == [
+        FilterDecision(accepted=True, reason="passed_basic_checks")
+    ]
+
+
+def test_rejects_duplicate_names_and_invalid_patterns() -> None:
+    with pytest.raises(ValueError, match="unique"):
+        RuleSetCounterexampleFilter(rules=(FilterRule("a", "x"), FilterRule("a", "y")))
+    with pytest.raises(ValueError, match="invalid filter rule pattern"):
+        RuleSetCounterexampleFilter(rules=(FilterRule("a", "("),))
+
+
+def test_load_filter_rules_from_json(tmp_path: Path) -> None:
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps([{"name": "sorry", "pattern": r"\bsorry\b"}]), encoding="utf-8")
+
+    f = RuleSetCounterexampleFilter.from_rules_file(path)
+
+    assert load_filter_rules(path) == (FilterRule("sorry", r"\bsorry\b"),)
+    assert f.evaluate(_candidate("theorem T : Sorry")).reason == "sorry"
+
+    path.write_text(json.dumps([{"name": "missing_pattern"}]), encoding="utf-8")
+    with pytest.raises(ValueError, match="Missing required field"):
+        load_filter_rules(path)
@@ -0,0 +1,109 @@
+import networkx as nx
+
+from autonomous_discovery.gap_detector.analogical import GapCandidate
+from autonomous_discovery.gap_detector.clustering import cluster_gaps, translated_shape
+from autonomous_discovery.knowledge_base.graph import MathlibGraph
+
+
+def _graph(signatures: dict[str, str]) -> MathlibGraph:
+    graph = nx.DiGraph()
+    for name, signature in signatures.items():
+        graph.add_node(name, type_signature=signature)
+    return MathlibGraph(graph)
+
+
+def _gap(source: str, target: str, score: float) -> GapCandidate:
+    suffix = source.split(".", 1)[1]
+    return GapCandidate(
+        source_decl=source,
+        target_family=target,
+        missing_decl=f"{target}{suffix}",
+        score=score,
+        signals={},
+    )
+
+
+def test_translated_shape_renames_family_and_erases_binder_names() -> None:
+    graph = _graph(
+        {
+            "Group.mul_one": "∀ {G : Type*} [Group G] (a : G), a * 1 = a",
+            "Monoid.mul_one": "∀ {M : Type*} [inst : Monoid M] (x : M), x * 1 = x",
+        }
+    )
+
+    group_shape = translated_shape(_gap("Group.mul_one", "Ring.", 0.9), graph)
+    monoid_shape = translated_shape(_gap("Monoid.mul_one", "Ring.", 0.8), graph)
+
+    assert group_shape == "∀ {v1 : Type*} [Ring v1] (v2 : v1), v2 * 1 = v2"
+    assert monoid_shape == "∀ {v1 : Type*} [v2 : Ring v1] (v3 : v1), v3 * 1 = v3"
+    assert translated_shape(_gap("Group.missing", "Ring.", 0.5), graph) is None
+
+
+def test_cluster_gaps_merges_shared_missing_decl_and_keeps_best_ranked() -> None:
+    gaps = [
+        _gap("Monoid.mul_comm", "Ring.", 0.4),
+        _gap("Group.mul_comm", "Ring.", 0.9),
+        _gap("Group.inv_inv", "Ring.", 0.6),
+    ]
+
+    result = cluster_gaps(gaps)
+
+    assert [g.source_decl for g in result.representatives] == [
+        "Group.mul_comm",
+        "Group.inv_inv",
+    ]
+    assert [len(cluster.members) for cluster in result.clusters] == [2, 1]
+    assert result.merged_count == 1
+
+
+def test_cluster_gaps_merges_equal_shapes_and_fills_top_k_with_distinct_work() -> None:
+    graph = _graph(
+        {
+            "Group.mul_one": "∀ {G : Type*} [Group G] (a : G), a * 1 = a",
+            "Group.mul_one'": "∀ {H : Type*} [Group H] (b : H), b * 1 = b",
+            "Group.one_mul": "∀ {G : Type*} [Group G] (a : G), 1 * a = a",
+            "Group.inv_inv": "∀ {G : Type*} [Group G] (a : G), a⁻¹⁻¹ = a",
+        }
+    )
+    gaps = [
+        _gap("Group.mul_one", "Ring.", 0.9),
+        _gap("Group.mul_one'", "Ring.", 0.8),
+        _gap("Group.one_mul", "Ring.", 0.7),
+        _gap("Group.inv_inv", "Ring.", 0.6),
+    ]
+
+    result = cluster_gaps(gaps, graph, top_k=2)
+
+    assert [g.missing_decl for g in result.representatives] == ["Ring.mul_one", "Ring.one_mul"]
+    assert [g.missing_decl for g in result.clusters[0].members] == [
+        "Ring.mul_one",
+        "Ring.mul_one'",
+    ]
+
+
+def test_cluster_gaps_chains_name_and_shape_matches_into_one_cluster() -> None:
+    graph = _graph(
+        {
+            "Group.a": "∀ (x : G), x = x",
+            "Monoid.a": "∀ (x : M), x * x = x * x",
+            "Monoid.b": "∀ (y : M), y * y = y * y",
+        }
+    )
+    gaps = [
+        _gap("Group.a", "Ring.", 0.9),
+        _gap("Monoid.a", "Ring.", 0.8),
+        _gap("Monoid.b", "Ring.", 0.7),
+    ]
+
+    result = cluster_gaps(gaps, graph)
+
+    assert len(result.clusters) == 1
+    assert result.representatives[0].source_decl == "Group.a"
+    assert result.merged_count == 2
+
+
+def test_cluster_gaps_handles_empty_input() -> None:
+    result = cluster_gaps([], top_k=5)
+
+    assert result.representatives == ()
+    assert result.clusters == ()
@@ -0,0 +1,71 @@
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from autonomous_discovery.gap_detector.analogical import GapCandidate
+from autonomous_discovery.gap_detector.columnar import (
+    GAP_SIGNAL_NAMES,
+    read_gap_columns,
+    write_gap_columns,
+)
+
+
+def _candidates() -> list[GapCandidate]:
+    return [
+        GapCandidate(
+            source_decl="Group.one_mul",
+            target_family="Ring.",
+            missing_decl="Ring.one_mul",
+            score=0.75,
+            signals={"dependency_overlap": 0.5, "source_pagerank": 0.2},
+        ),
+        GapCandidate(
+            source_decl="Ring.zero_mul",
+            target_family="Module.",
+            missing_decl="Module.zero_smul·é",
+            score=0.66,
+            signals={"dependency_overlap": 0.4, "custom_signal": 3.0},
+        ),
+    ]
+
+
+def test_columnar_round_trip_rebuilds_candidates(tmp_path: Path) -> None:
+    report_dir = tmp_path / "gaps"
+    write_gap_columns(_candidates(), report_dir)
+
+    columns = read_gap_columns(report_dir)
+
+    assert len(columns) == 2
+    assert list(columns) == _candidates()
+    assert columns[-1].missing_decl == "Module.zero_smul·é"
+    assert columns.signal_names == (*GAP_SIGNAL_NAMES, "custom_signal")
+
+
+def test_columnar_numeric_columns_are_memory_mapped(tmp_path: Path) -> None:
+    report_dir = tmp_path / "gaps"
+    write_gap_columns(_candidates(), report_dir)
+
+    columns = read_gap_columns(report_dir)
+    overlap = columns.signal("dependency_overlap")
+
+    assert isinstance(columns.score, np.memmap)
+    assert columns.score.tolist() == [0.75, 0.66]
+    assert overlap.tolist() == [0.5, 0.4]
+    assert math.isnan(columns.signal("source_pagerank")[1])
+    assert columns.string("source_decl", 1) == "Ring.zero_mul"
+    with pytest.raises(KeyError):
+        columns.signal("unknown")
+    with pytest.raises(IndexError):
+        columns[2]
+
+
+def test_columnar_handles_empty_reports(tmp_path: Path) -> None:
+    report_dir = tmp_path / "gaps"
+    write_gap_columns([], report_dir)
+
+    columns = read_gap_columns(report_dir)
+
+    assert len(columns) == 0
+    assert list(columns) == []
@@ -1,7 +1,12 @@
 import json
 
 from autonomous_discovery.gap_detector.analogical import GapCandidate
-from autonomous_discovery.gap_detector.report import read_gap_report, write_gap_report
+from autonomous_discovery.gap_detector.report import (
+    GapReportWriter,
+    iter_gap_report,
+    read_gap_report,
+    write_gap_report,
+)
 
 
 def test_write_and_read_gap_report_roundtrip(tmp_path) -> None:
@@ -32,3 +37,25 @@ def test_write_and_read_gap_report_roundtrip(tmp_path) -> None:
 
     loaded = read_gap_report(out_path)
     assert loaded == candidates
+
+
+def test_gap_report_writer_streams_gzip_reports(tmp_path) -> None:
+    out_path = tmp_path / "gap_candidates.jsonl.gz"
+    candidates = (
+        GapCandidate(
+            source_decl=f"Group.g{i}",
+            target_family="Ring.",
+            missing_decl=f"Ring.g{i}",
+            score=1.0 / (i + 1),
+            signals={"dependency_overlap": 0.5},
+        )
+        for i in range(50)
+    )
+
+    with GapReportWriter(out_path, batch_size=7) as writer:
+        writer.write_all(candidates)
+
+    assert writer.rows_written == 50
+    streamed = iter_gap_report(out_path)
+    assert next(streamed).missing_decl == "Ring.g0"
+    assert [c.missing_decl for c in streamed][-1] == "Ring.g49"
@@ -0,0 +1,50 @@
+"""Integration tests: the Phase 1 stages on a production-sized synthetic dump."""
+
+import pytest
+
+from autonomous_discovery.config import ProjectConfig
+from autonomous_discovery.gap_detector.analogical import AnalogicalGapDetector, GapDetectorConfig
+from autonomous_discovery.knowledge_base.graph import MathlibGraph
+from autonomous_discovery.knowledge_base.parser import parse_declaration_types, parse_premises
+from autonomous_discovery.knowledge_base.synthetic import (
+    SyntheticDumpConfig,
+    write_synthetic_dump,
+)
+
+SYNTHETIC_DECLARATIONS = 200_000
+
+
+@pytest.fixture(scope="module")
+def synthetic_graph(tmp_path_factory: pytest.TempPathFactory) -> MathlibGraph:
+    dump_dir = tmp_path_factory.mktemp("synthetic")
+    premises_path = dump_dir / "premises.txt"
+    decl_types_path = dump_dir / "decl_types.txt"
+    write_synthetic_dump(
+        premises_path,
+        decl_types_path,
+        SyntheticDumpConfig(declarations=SYNTHETIC_DECLARATIONS),
+    )
+    premises = parse_premises(premises_path.read_text(encoding="utf-8"))
+    declarations = parse_declaration_types(decl_types_path.read_text(encoding="utf-8"))
+    return MathlibGraph.from_raw_data(premises, declarations)
+
+
+@pytest.mark.integration
+class TestSyntheticScale:
+    def test_graph_scale(self, synthetic_graph: MathlibGraph) -> None:
+        """Synthetic graph should match the real dump's >150K-node scale."""
+        stats = synthetic_graph.get_statistics()
+        print(f"\nSynthetic graph: {stats}")
+        assert stats["node_count"] == SYNTHETIC_DECLARATIONS
+        assert stats["edge_count"] > 500_000
+
+    def test_gap_detection_at_scale(self, synthetic_graph: MathlibGraph) -> None:
+        config = ProjectConfig()
+        detector = AnalogicalGapDetector(
+            config=GapDetectorConfig(family_prefixes=config.algebra_name_prefixes, top_k=100)
+        )
+
+        gaps = detector.detect(synthetic_graph)
+
+        assert len(gaps) == 100
+        assert all(not synthetic_graph.has_node(gap.missing_decl) for gap in gaps)
@@ -0,0 +1,125 @@
+"""Tests for the synthetic Mathlib-like dump generator."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from autonomous_discovery.gap_detector.analogical import AnalogicalGapDetector, GapDetectorConfig
+from autonomous_discovery.knowledge_base.graph import MathlibGraph
+from autonomous_discovery.knowledge_base.parser import parse_declaration_types, parse_premises
+from autonomous_discovery.knowledge_base.synthetic import (
+    SyntheticDumpConfig,
+    iter_synthetic_declarations,
+    write_synthetic_dump,
+)
+from autonomous_discovery.knowledge_base.synthetic_cli import main
+
+FAMILIES = ("Group.", "Ring.", "Module.")
+
+
+def _write(tmp_path: Path, config: SyntheticDumpConfig) -> tuple[Path, Path]:
+    premises_path = tmp_path / "premises.txt"
+    decl_types_path = tmp_path / "decl_types.txt"
+    write_synthetic_dump(premises_path, decl_types_path, config)
+    return premises_path, decl_types_path
+
+
+def test_dump_round_trips_through_parsers(tmp_path: Path) -> None:
+    config = SyntheticDumpConfig(declarations=3_000, family_prefixes=FAMILIES)
+    premises_path, decl_types_path = _write(tmp_path, config)
+
+    premises = parse_premises(premises_path.read_text(encoding="utf-8"))
+    declarations = parse_declaration_types(decl_types_path.read_text(encoding="utf-8"))
+    expected = list(iter_synthetic_declarations(config))
+
+    assert [entry.name for entry in premises] == [item.name for item in expected]
+    assert [(entry.kind, entry.type_signature) for entry in declarations] == [
+        (item.kind, item.type_signature) for item in expected
+    ]
+    for entry, item in zip(premises, expected, strict=True):
+        assert [(dep.name, dep.is_explicit, dep.is_simp) for dep in entry.dependencies] == [
+            (name, flag == "*", flag == "s") for flag, name in item.dependencies
+        ]
+
+
+def test_generation_is_deterministic_and_seeded() -> None:
+    config = SyntheticDumpConfig(declarations=500, family_prefixes=FAMILIES)
+
+    first = list(iter_synthetic_declarations(config))
+
+    assert first == list(iter_synthetic_declarations(config))
+    reseeded = SyntheticDumpConfig(declarations=500, family_prefixes=FAMILIES, seed=1)
+    assert first != list(iter_synthetic_declarations(reseeded))
+
+
+def test_graph_has_mathlib_like_shape(tmp_path: Path) -> None:
+    config = SyntheticDumpConfig(declarations=5_000, family_prefixes=FAMILIES)
+    declarations = list(iter_synthetic_declarations(config))
+    names = [item.name for item in declarations]
+
+    assert len(names) == len(set(names)) == 5_000
+    seen: set[str] = set()
+    for item in declarations:
+        assert all(dependency in seen for _, dependency in item.dependencies)
+        seen.add(item.name)
+
+    family_share = sum(name.startswith(FAMILIES) for name in names) / len(names)
+    assert family_share == pytest.approx(config.family_fraction, abs=0.08)
+    flags = {flag for item in declarations for flag, _ in item.dependencies}
+    assert flags == {"", "*", "s"}
+    assert any("[inst0 : " in item.type_signature for item in declarations)
+
+    in_degree: dict[str, int] = {}
+    for item in declarations:
+        for _, dependency in item.dependencies:
+            in_degree[dependency] = in_degree.get(dependency, 0) + 1
+    degrees = sorted(in_degree.values(), reverse=True)
+    # Heavy tail: the most depended-on declaration is far above the median.
+    assert degrees[0] > 20 * degrees[len(degrees) // 2]
+
+
+def test_gap_detector_finds_gaps_in_synthetic_dump(tmp_path: Path) -> None:
+    premises_path, decl_types_path = _write(
+        tmp_path, SyntheticDumpConfig(declarations=4_000, family_prefixes=FAMILIES)
+    )
+    graph = MathlibGraph.from_raw_data(
+        parse_premises(premises_path.read_text(encoding="utf-8")),
+        parse_declaration_types(decl_types_path.read_text(encoding="utf-8")),
+    )
+
+    gaps = AnalogicalGapDetector(config=GapDetectorConfig(family_prefixes=FAMILIES)).detect(graph)
+
+    assert gaps
+    assert all(not graph.has_node(gap.missing_decl) for gap in gaps)
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"declarations": 0},
+        {"family_prefixes": ()},
+        {"family_fraction": 1.5},
+        {"explicit_probability": 0.7, "simp_probability": 0.5},
+        {"dependency_skew": 0.5},
+        {"max_dependencies": 0},
+    ],
+)
+def test_config_rejects_invalid_values(overrides: dict[str, object]) -> None:
+    with pytest.raises(ValueError):
+        SyntheticDumpConfig(**overrides)
+
+
+def test_cli_writes_dump(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    exit_code = main(["--output-dir", str(tmp_path), "--declarations", "200"])
+
+    assert exit_code == 0
+    assert "Wrote 200 declarations" in capsys.readouterr().out
+    premises = parse_premises((tmp_path / "premises.txt").read_text(encoding="utf-8"))
+    assert len(premises) == 200
+
+
+def test_cli_rejects_invalid_size(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["--output-dir", str(tmp_path), "--declarations", "0"]) == 1
+    assert "declarations must be a positive integer" in capsys.readouterr().err
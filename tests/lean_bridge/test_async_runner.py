@@ -0,0 +1,142 @@
+"""Tests for AsyncLeanRunner using real (non-Lean) subprocesses."""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from autonomous_discovery.lean_bridge.async_runner import TRUNCATION_MARKER, AsyncLeanRunner
+
+
+def _python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+def test_run_command_captures_output_and_returncode() -> None:
+    runner = AsyncLeanRunner()
+
+    result = asyncio.run(
+        runner.run_command(_python("import sys; print('out'); sys.stderr.write('err'); exit(3)"))
+    )
+
+    assert result.stdout.strip() == "out"
+    assert result.stderr == "err"
+    assert result.returncode == 3
+    assert result.timed_out is False
+    assert result.success is False
+
+
+def test_run_command_caps_streamed_stderr() -> None:
+    runner = AsyncLeanRunner(max_output_bytes=100)
+
+    result = asyncio.run(runner.run_command(_python("import sys; sys.stderr.write('x' * 50000)")))
+
+    assert result.success is True
+    assert result.stderr == "x" * 100 + TRUNCATION_MARKER
+
+
+def test_run_command_missing_executable() -> None:
+    runner = AsyncLeanRunner()
+
+    result = asyncio.run(runner.run_command(["definitely-not-an-executable-xyz"]))
+
+    assert result.success is False
+    assert result.timed_out is False
+    assert result.returncode == -1
+    assert result.stderr
+
+
+def test_timeout_kills_whole_process_group(tmp_path: Path) -> None:
+    pid_file = tmp_path / "child.pid"
+    # The parent spawns a long-lived child, then hangs itself.
+    code = (
+        "import subprocess, sys, time\n"
+        "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+        f"open({str(pid_file)!r}, 'w').write(str(child.pid))\n"
+        "time.sleep(60)\n"
+    )
+    runner = AsyncLeanRunner(timeout=1)
+
+    result = asyncio.run(runner.run_command(_python(code)))
+
+    assert result.timed_out is True
+    assert result.success is False
+    child_pid = int(pid_file.read_text())
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline and _is_alive(child_pid):
+        time.sleep(0.05)
+    assert not _is_alive(child_pid)
+
+
+def test_runs_commands_concurrently_on_one_loop() -> None:
+    runner = AsyncLeanRunner()
+
+    async def run_many() -> list[str]:
+        results = await asyncio.gather(
+            *(
+                runner.run_command(_python(f"import time; time.sleep(0.5); print({i})"))
+                for i in range(4)
+            )
+        )
+        return [r.stdout.strip() for r in results]
+
+    started = time.monotonic()
+    outputs = asyncio.run(run_many())
+    elapsed = time.monotonic() - started
+
+    assert outputs == ["0", "1", "2", "3"]
+    assert elapsed < 1.8
+
+
+def test_max_concurrency_limits_parallel_runs() -> None:
+    runner = AsyncLeanRunner(max_concurrency=1)
+
+    async def run_many() -> None:
+        await asyncio.gather(
+            *(runner.run_command(_python("import time; time.sleep(0.3)")) for _ in range(3))
+        )
+
+    started = time.monotonic()
+    asyncio.run(run_many())
+    assert time.monotonic() - started >= 0.85
+
+
+def test_cancellation_kills_running_command(tmp_path: Path) -> None:
+    pid_file = tmp_path / "proc.pid"
+    code = f"import os, time; open({str(pid_file)!r}, 'w').write(str(os.getpid())); time.sleep(60)"
+    runner = AsyncLeanRunner(timeout=60)
+
+    async def start_then_cancel() -> None:
+        task = asyncio.create_task(runner.run_command(_python(code)))
+        while not pid_file.exists() or not pid_file.read_text():
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(start_then_cancel())
+
+    assert not _is_alive(int(pid_file.read_text()))
+
+
+def test_rejects_non_positive_limits() -> None:
+    with pytest.raises(ValueError, match="max_output_bytes"):
+        AsyncLeanRunner(max_output_bytes=0)
+    with pytest.raises(ValueError, match="max_concurrency"):
+        AsyncLeanRunner(max_concurrency=0)
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # Reap-less zombies still answer kill(0); treat them as dead.
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as f:
+            return f.read().split()[2] != "Z"
+    except FileNotFoundError:
+        return True
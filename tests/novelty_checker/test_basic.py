@@ -1,3 +1,6 @@
+import pytest
+
+from autonomous_discovery.novelty_checker import canonical
 from autonomous_discovery.novelty_checker.basic import (
     BasicNoveltyChecker,
     NoveltyDecision,
@@ -170,3 +173,43 @@ def test_strip_wrapping_parens_keeps_internal_parenthesized_implication() -> Non
     stripped = checker._strip_wrapping_parens("(A) -> (B)")
 
     assert stripped == "(A) -> (B)"
+
+
+def test_check_batch_matches_sequential_is_novel() -> None:
+    statements = [
+        "theorem a : ∀ n : Nat, n + 0 = n",
+        "theorem b : ∀ m : Nat, m + 0 = m",
+        "theorem c : P ↔ Q",
+        "theorem a : ∀ n : Nat, n + 0 = n",
+        "theorem d : Q ↔ P",
+        "theorem e : True",
+    ]
+    sequential = BasicNoveltyChecker(existing_statements={"theorem e : True"})
+    batched = BasicNoveltyChecker(existing_statements={"theorem e : True"}, batch_workers=1)
+
+    decisions = batched.check_batch(statements)
+
+    assert decisions == [sequential.is_novel(statement) for statement in statements]
+    assert [decision.reason for decision in decisions] == [
+        "novel",
+        "defeq_duplicate",
+        "novel",
+        "exact_duplicate",
+        "bi_implication_duplicate",
+        "exact_duplicate",
+    ]
+    assert batched.existing_statements == sequential.existing_statements
+
+
+def test_check_batch_keeps_one_process_pool_until_close(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(canonical, "PARALLEL_MIN_BATCH", 2)
+    with BasicNoveltyChecker(batch_workers=2) as checker:
+        first = checker.check_batch(["theorem a : 1 = 1", "theorem b : 2 = 2"])
+        pool = checker._pool
+        second = checker.check_batch(["theorem c : 3 = 3", "theorem a : 1 = 1"])
+
+        assert pool is not None
+        assert checker._pool is pool
+        assert pool._mp_context.get_start_method() == "forkserver"
+    assert checker._pool is None
+    assert [d.reason for d in [*first, *second]] == ["novel", "novel", "novel", "exact_duplicate"]
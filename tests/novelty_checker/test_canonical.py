@@ -0,0 +1,89 @@
+import pytest
+
+from autonomous_discovery.novelty_checker import canonical
+from autonomous_discovery.novelty_checker.basic import BasicNoveltyChecker, NoveltyDecision
+from autonomous_discovery.novelty_checker.canonical import (
+    CanonicalKeys,
+    alpha_normalize,
+    canonical_keys,
+    canonical_keys_batch,
+)
+
+
+def test_canonical_keys_derives_every_layer_in_one_call() -> None:
+    keys = canonical_keys("theorem t : (P ∧ Q) ↔  (Q ∧ P) -- symmetric\n")
+
+    assert keys == CanonicalKeys(
+        normalized="theorem t : (P ∧ Q) ↔ (Q ∧ P)",
+        body="(P ∧ Q) ↔ (Q ∧ P)",
+        defeq="( P ∧ Q ) ↔ ( Q ∧ P )",
+        bi_implication=("P ∧ Q", "Q ∧ P"),
+    )
+
+
+def test_canonical_keys_are_memoized_per_statement() -> None:
+    statement = "theorem memo : ∀ n : Nat, n = n"
+
+    assert canonical_keys(statement) is canonical_keys(statement)
+
+
+def test_alpha_normalize_expands_multi_name_binders() -> None:
+    expected = "∀ v1 : Nat , ∀ v2 : Nat , v1 + v2 = v2 + v1"
+
+    assert alpha_normalize("∀ (n m : Nat), n + m = m + n") == expected
+    assert alpha_normalize("∀ a b : Nat, a+b = b+a") == expected
+    assert alpha_normalize("forall (x : Nat) (y : Nat), x + y = y + x") == expected
+
+
+def test_alpha_normalize_keeps_binder_kinds_and_instance_arguments() -> None:
+    renamed = alpha_normalize("∀ {α : Type} [Group α] (x : α), x * 1 = x")
+
+    assert renamed == "∀ { v1 : Type } , ∀ [ Group v1 ] , ∀ v2 : v1 , v2 * 1 = v2"
+
+
+def test_alpha_normalize_drops_instance_names_and_universe_levels() -> None:
+    expected = alpha_normalize("∀ {G : Type*} [CommMagma G] (a : G), a * a = a * a")
+
+    assert alpha_normalize("∀ {G : Type u_1} [inst : CommMagma G] (a : G), a * a = a * a") == (
+        expected
+    )
+    assert alpha_normalize("∀ {G : Type u} [h : CommMagma G] (x : G), x * x = x * x") == (expected)
+    assert alpha_normalize("∀ {G : Type} [CommMagma G] (a : G), a * a = a * a") != expected
+
+
+def test_canonical_keys_turn_pre_colon_binders_into_foralls() -> None:
+    keys = canonical_keys("theorem add_comm' (n m : Nat) : n + m = m + n")
+
+    assert keys.body == "∀ (n m : Nat), n + m = m + n"
+    assert keys.defeq == canonical_keys("theorem t : ∀ (a b : Nat), a + b = b + a").defeq
+    assert canonical_keys("lemma Nat.foo {a : Nat} (h : a = 0) : a + 0 = 0").body == (
+        "∀ {a : Nat} (h : a = 0), a + 0 = 0"
+    )
+
+
+def test_alpha_normalize_renames_in_binding_order_without_collisions() -> None:
+    assert alpha_normalize("∀ x v1 : G, x = v1") == alpha_normalize("∀ a b : G, a = b")
+    assert alpha_normalize("∀ x ∈ s, x.succ ∈ s") == "∀ v1 ∈ s , v1.succ ∈ s"
+    assert alpha_normalize("∀ x, f x = Nat.x") == "∀ v1 , f v1 = Nat.x"
+
+
+def test_checker_flags_renamed_multi_name_binder_statement() -> None:
+    checker = BasicNoveltyChecker(
+        existing_statements={"theorem foo : ∀ (n m : Nat), n + m = m + n"}
+    )
+
+    decision = checker.is_novel("theorem bar : ∀ a b : Nat, a + b = b + a")
+
+    assert decision == NoveltyDecision(is_novel=False, reason="defeq_duplicate")
+
+
+def test_canonical_keys_batch_in_process_pool_matches_sequential_keys(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(canonical, "PARALLEL_MIN_BATCH", 1)
+    statements = [f"theorem t{i} : ∀ (a b : Nat), a + {i} = b" for i in range(6)]
+    statements.append(statements[0])
+
+    keys = canonical_keys_batch(statements, max_workers=2)
+
+    assert keys == [canonical_keys(statement) for statement in statements]
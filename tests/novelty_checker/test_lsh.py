@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+
+from autonomous_discovery.novelty_checker.basic import BasicNoveltyChecker, SemanticComparison
+from autonomous_discovery.novelty_checker.lsh import MinHashLSH, shingles
+from autonomous_discovery.novelty_checker.store import NoveltyStore
+
+
+class RecordingComparator:
+    def __init__(self, equivalent_to: str | None = None) -> None:
+        self.equivalent_to = equivalent_to
+        self.calls: list[tuple[str, str]] = []
+
+    def compare(self, left: str, right: str) -> SemanticComparison:
+        self.calls.append((left, right))
+        return SemanticComparison(equivalent=right == self.equivalent_to, confidence=0.99)
+
+
+def test_shingles_cover_short_and_long_texts() -> None:
+    assert shingles("a + b", 3) == {"a + b"}
+    assert shingles("a + b = c", 3) == {"a + b", "+ b =", "b = c"}
+    assert shingles("", 3) == set()
+
+
+def test_query_finds_near_duplicates_and_skips_unrelated() -> None:
+    lsh = MinHashLSH()
+    lsh.add("∀ x : G, x * 1 * 1 * 1 = x * 1 * 1", "near")
+    lsh.add("∀ l : List Nat, l.reverse.reverse.length = l.length", "far")
+
+    assert lsh.query("∀ x : G, x * 1 * 1 * 1 = x * 1 * 1 * 1") == ["near"]
+    assert lsh.query("∀ x : G, x * 1 * 1 * 1 = x * 1 * 1")[0] == "near"
+    assert len(lsh) == 2
+
+
+def test_rejects_inconsistent_band_configuration() -> None:
+    with pytest.raises(ValueError, match="divisible"):
+        MinHashLSH(num_perm=10, bands=4)
+
+
+def test_semantic_layer_reaches_duplicates_older_than_the_window() -> None:
+    old = "theorem old : ∀ x : G, x * 1 * 1 * 1 = x * 1 * 1"
+    comparator = RecordingComparator(equivalent_to=old)
+    checker = BasicNoveltyChecker(
+        semantic_comparator=comparator, semantic_compare_limit=2, lsh=MinHashLSH()
+    )
+    checker.is_novel(old)
+    for i in range(50):
+        checker.is_novel(f"theorem filler{i} : ∀ n : Nat, n + {i} = {i} + n")
+    comparator.calls.clear()
+
+    decision = checker.is_novel("theorem new : ∀ x : G, x * 1 * 1 * 1 = x * 1 * 1 * 1")
+
+    assert decision.reason == "semantic_duplicate"
+    assert len(comparator.calls) <= 2
+
+
+def test_lsh_is_populated_from_store_history(tmp_path: Path) -> None:
+    old = "theorem old : ∀ x : G, x * 1 * 1 * 1 = x * 1 * 1"
+    with NoveltyStore(tmp_path / "novelty.sqlite") as store:
+        BasicNoveltyChecker(store=store).remember(old)
+        checker = BasicNoveltyChecker(
+            store=store,
+            semantic_comparator=RecordingComparator(equivalent_to=old),
+            lsh=MinHashLSH(),
+        )
+
+        decision = checker.is_novel("theorem new : ∀ x : G, x * 1 * 1 * 1 = x * 1 * 1 * 1")
+
+    assert decision.reason == "semantic_duplicate"
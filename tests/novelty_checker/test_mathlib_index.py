@@ -0,0 +1,85 @@
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from autonomous_discovery.knowledge_base.parser import DeclarationEntry
+from autonomous_discovery.novelty_checker.basic import BasicNoveltyChecker, NoveltyDecision
+from autonomous_discovery.novelty_checker.mathlib_index import MathlibTheoremIndex
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+def _index(tmp_path: Path) -> MathlibTheoremIndex:
+    decl_types_path = tmp_path / "decl_types.txt"
+    shutil.copy(FIXTURES / "sample_decl_types.txt", decl_types_path)
+    return MathlibTheoremIndex.load_or_build(decl_types_path, tmp_path / "index")
+
+
+def test_index_rejects_renamed_restatement_of_mathlib_theorem(tmp_path: Path) -> None:
+    checker = BasicNoveltyChecker(mathlib_index=_index(tmp_path))
+
+    decision = checker.is_novel("theorem my_add_comm : ∀ (n m : Nat),  n + m = m + n")
+
+    assert decision == NoveltyDecision(is_novel=False, reason="mathlib_duplicate", layer="mathlib")
+    assert checker.is_novel("theorem my_mul_comm : ∀ (a b : Nat), a * b = b * a").is_novel
+
+
+def test_index_is_memory_mapped_and_only_holds_theorems(tmp_path: Path) -> None:
+    index = _index(tmp_path)
+
+    assert index.theorem_count == 2
+    assert isinstance(index._layers["defeq"], np.memmap)
+    assert list(index._layers["defeq"]) == sorted(index._layers["defeq"])
+    assert not index.matches("theorem t : {α : Type u_1} → [inst : DecidableEq α] → List α")
+
+
+def test_load_or_build_reuses_index_until_snapshot_changes(tmp_path: Path) -> None:
+    decl_types_path = tmp_path / "decl_types.txt"
+    shutil.copy(FIXTURES / "sample_decl_types.txt", decl_types_path)
+    index_dir = tmp_path / "index"
+    first = MathlibTheoremIndex.load_or_build(decl_types_path, index_dir)
+    built_at = (index_dir / "defeq.npy").stat().st_mtime_ns
+
+    again = MathlibTheoremIndex.load_or_build(decl_types_path, index_dir)
+    assert again.snapshot == first.snapshot
+    assert (index_dir / "defeq.npy").stat().st_mtime_ns == built_at
+
+    decl_types_path.write_text(
+        "---\ntheorem\nFoo.bar\n(p ∧ q) ↔ (q ∧ p)\n"
+        "---\ntheorem\nFoo.zero\n∀ (n : Nat), n + 0 = n\n",
+        encoding="utf-8",
+    )
+    rebuilt = MathlibTheoremIndex.load_or_build(decl_types_path, index_dir)
+    assert rebuilt.theorem_count == 2
+    assert rebuilt.matches("theorem flipped : (q ∧ p) ↔ (p ∧ q)")
+    assert rebuilt.matches("theorem renamed : ∀ (k : Nat), k + 0 = k")
+    assert not rebuilt.matches("theorem my_add_comm : ∀ (n m : Nat), n + m = m + n")
+
+
+def test_index_matches_restatements_with_pre_colon_and_instance_binders(
+    tmp_path: Path,
+) -> None:
+    decl_types_path = tmp_path / "decl_types.txt"
+    decl_types_path.write_text(
+        "---\ntheorem\nNat.add_comm\n∀ (n m : Nat), n + m = m + n\n"
+        "---\ntheorem\nmul_comm\n"
+        "∀ {G : Type u_1} [inst : CommMagma G] (a b : G), a * b = b * a\n",
+        encoding="utf-8",
+    )
+    index = MathlibTheoremIndex.load_or_build(decl_types_path, tmp_path / "index")
+
+    assert index.matches("theorem x (n m : Nat) : n + m = m + n")
+    assert index.matches("theorem y : ∀ {G : Type u_1} [CommMagma G] (a b : G), a * b = b * a")
+    assert index.matches("theorem y {G : Type*} [CommMagma G] (a b : G) : a * b = b * a")
+    assert not index.matches("theorem z {G : Type*} [CommMagma G] (a b : G) : a * b = a * b")
+
+
+def test_build_from_entries_handles_empty_input(tmp_path: Path) -> None:
+    index = MathlibTheoremIndex.build(
+        [DeclarationEntry(kind="definition", name="f", type_signature="Nat → Nat")],
+        tmp_path / "index",
+    )
+
+    assert index.theorem_count == 0
+    assert not index.matches("theorem t : True")
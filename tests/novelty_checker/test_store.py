@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+
+from autonomous_discovery.novelty_checker.basic import BasicNoveltyChecker, SemanticComparison
+from autonomous_discovery.novelty_checker.store import NoveltyStore
+
+
+def test_store_persists_layers_across_checker_instances(tmp_path: Path) -> None:
+    path = tmp_path / "novelty.sqlite"
+    with NoveltyStore(path) as store:
+        BasicNoveltyChecker(store=store).remember("theorem t1 : ∀ x : Nat, x = x")
+        BasicNoveltyChecker(store=store).remember("theorem t2 : (a = b) ↔ (b = a)")
+
+    with NoveltyStore(path) as store:
+        checker = BasicNoveltyChecker(store=store)
+
+        assert len(store) == 2
+        assert checker.is_novel("theorem t1 : ∀ x : Nat, x = x").reason == "exact_duplicate"
+        assert checker.is_novel("theorem t1 :  ∀ x : Nat,  x = x").reason == "normalized_duplicate"
+        assert checker.is_novel("theorem t9 : ∀ y : Nat, y = y").reason == "defeq_duplicate"
+        assert checker.is_novel("theorem t8 : (b = a) ↔ (a = b)").reason == (
+            "bi_implication_duplicate"
+        )
+        assert checker.is_novel("theorem t3 : 1 + 1 = 2").is_novel is True
+
+
+def test_is_novel_does_not_write_to_store(tmp_path: Path) -> None:
+    with NoveltyStore(tmp_path / "novelty.sqlite") as store:
+        checker = BasicNoveltyChecker(store=store)
+
+        assert checker.is_novel("theorem t : True").is_novel is True
+        assert len(store) == 0
+        assert checker.is_novel("theorem t : True").reason == "exact_duplicate"
+
+
+def test_store_add_is_idempotent_and_opens_lazily(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "novelty.sqlite"
+    store = NoveltyStore(path)
+    assert not path.exists()
+
+    assert store.add("s", normalized="s", defeq="s", bi_implication=None) is True
+    assert store.add("s", normalized="s", defeq="s", bi_implication=None) is False
+    assert store.recent(5) == ["s"]
+    with pytest.raises(ValueError, match="layer"):
+        store.contains("semantic", "s")
+    store.close()
+
+
+def test_semantic_layer_compares_against_stored_statements(tmp_path: Path) -> None:
+    class EverythingEquivalent:
+        def compare(self, left: str, right: str) -> SemanticComparison:
+            return SemanticComparison(equivalent=True, confidence=0.95)
+
+    with NoveltyStore(tmp_path / "novelty.sqlite") as store:
+        BasicNoveltyChecker(store=store).remember("theorem old : True")
+        checker = BasicNoveltyChecker(store=store, semantic_comparator=EverythingEquivalent())
+
+        assert checker.is_novel("theorem new : 1 = 1").reason == "semantic_duplicate"
@@ -0,0 +1,47 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
+from autonomous_discovery.gap_detector.analogical import GapCandidate
+from autonomous_discovery.pipeline.checkpoint import CHECKPOINT_DIR_NAME, CycleCheckpoint
+
+PARAMETERS = {"top_k": 2, "premises": ("premises.txt", 1, 2)}
+
+
+def test_stages_are_reused_only_when_resuming(tmp_path: Path) -> None:
+    checkpoint = CycleCheckpoint(tmp_path, PARAMETERS, resume=False)
+    gap = GapCandidate("Group.one_mul", "Ring", "Ring.one_mul", 0.5, {"dependency_overlap": 1.0})
+    conjecture = ConjectureCandidate("Ring.one_mul", "theorem t : True", "r", "m", 0.0)
+    checkpoint.save_gaps([gap], gap_cluster_count=None)
+    checkpoint.save_conjectures([conjecture])
+    checkpoint.save_json("gating", {"novel_count": 1})
+
+    resumed = CycleCheckpoint(tmp_path, PARAMETERS, resume=True)
+
+    assert resumed.resumed_stages == ("gaps", "conjectures", "gating")
+    assert resumed.load_gaps() == [gap]
+    assert resumed.metadata("gaps") == {"gap_cluster_count": None}
+    assert resumed.load_conjectures() == [conjecture]
+    assert resumed.load_json("gating") == {"novel_count": 1}
+    assert not CycleCheckpoint(tmp_path, PARAMETERS, resume=False).has("gaps")
+    assert not list((tmp_path / CHECKPOINT_DIR_NAME).glob("*.tmp"))
+
+
+def test_resume_rejects_checkpoint_with_different_parameters(tmp_path: Path) -> None:
+    CycleCheckpoint(tmp_path, PARAMETERS, resume=False).save_json("gating", {})
+
+    with pytest.raises(ValueError, match="different cycle parameters"):
+        CycleCheckpoint(tmp_path, {**PARAMETERS, "top_k": 3}, resume=True)
+
+
+def test_attempt_rows_drops_trailing_partial_line(tmp_path: Path) -> None:
+    attempts_path = tmp_path / "phase2_attempts.jsonl"
+    complete = json.dumps({"attempt_index": 0}) + "\n"
+    attempts_path.write_text(complete + '{"attempt_in', encoding="utf-8")
+    checkpoint = CycleCheckpoint(tmp_path, PARAMETERS, resume=True)
+
+    assert checkpoint.attempt_rows(attempts_path) == [{"attempt_index": 0}]
+    assert attempts_path.read_text(encoding="utf-8") == complete
+    assert checkpoint.attempt_rows(tmp_path / "missing.jsonl") == []
@@ -0,0 +1,231 @@
+import fcntl
+import json
+from pathlib import Path
+
+import pytest
+
+from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
+from autonomous_discovery.phase2_daemon import build_parser
+from autonomous_discovery.pipeline.daemon import (
+    CycleRequest,
+    DiscoverySession,
+    serve_directory,
+)
+from autonomous_discovery.verifier.models import VerificationResult
+
+
+def _write_minimal_data(tmp_path: Path) -> tuple[Path, Path]:
+    premises_path = tmp_path / "premises.txt"
+    decl_types_path = tmp_path / "decl_types.txt"
+    premises_path.write_text("---\nGroup.one_mul\n  * Group.one\n", encoding="utf-8")
+    decl_types_path.write_text(
+        (
+            "---\ntheorem\nGroup.one_mul\nGroup.one_mul : Prop\n"
+            "---\ntheorem\nGroup.one\nGroup.one : Prop\n"
+        ),
+        encoding="utf-8",
+    )
+    return premises_path, decl_types_path
+
+
+class _TwoConjectureGenerator:
+    def generate(self, gaps: list[object], *, max_candidates: int) -> list[ConjectureCandidate]:
+        _ = (gaps, max_candidates)
+        return [
+            ConjectureCandidate(
+                gap_missing_decl=name,
+                lean_statement=f"theorem {name} : {name} = {name}",
+                rationale=name,
+                model_id="m",
+                temperature=0.0,
+            )
+            for name in ("A", "B")
+        ]
+
+
+class _SucceedingVerifier:
+    success = True
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def is_available(self) -> bool:
+        return True
+
+    def runtime_status(self) -> dict[str, bool]:
+        return {"lean_available": True, "sandbox_available": True, "runtime_ready": True}
+
+    def verify(
+        self, statement: str, proof_script: str, *, timeout: int | None = None
+    ) -> VerificationResult:
+        self.calls += 1
+        return VerificationResult(
+            statement=statement,
+            proof_script=proof_script,
+            success=self.success,
+            stderr="" if self.success else "error: failed",
+            timed_out=False,
+        )
+
+
+def _session(tmp_path: Path, verifier: _SucceedingVerifier) -> DiscoverySession:
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+    return DiscoverySession(
+        premises_path=premises_path,
+        decl_types_path=decl_types_path,
+        output_root=tmp_path / "out",
+        generator=_TwoConjectureGenerator(),
+        verifier=verifier,
+        trusted_local_run=True,
+    )
+
+
+def test_session_keeps_graph_and_novelty_state_warm_across_cycles(tmp_path: Path) -> None:
+    verifier = _SucceedingVerifier()
+    with _session(tmp_path, verifier) as session:
+        assert session.warm()["runtime_ready"] is True
+        first = session.run(CycleRequest(name="first", top_k=2, trace=True))
+        second = session.run(CycleRequest(name="second", top_k=2))
+
+    assert first["graph_cache_hit"] is True
+    assert first["verification_success_count"] == 2
+    # Statements verified by the first cycle are duplicates in the second.
+    assert second["duplicate_count"] == 2
+    assert second["verification_success_count"] == 0
+    assert verifier.calls == 2
+    assert session.cycle_count == 2
+    assert (tmp_path / "out" / "second" / "phase2_cycle_metrics.json").exists()
+    assert (tmp_path / "out" / "first" / "phase2_trace.json").exists()
+    assert not (tmp_path / "out" / "second" / "phase2_trace.json").exists()
+
+
+def test_session_does_not_carry_unverified_statements_across_cycles(tmp_path: Path) -> None:
+    class FailingVerifier(_SucceedingVerifier):
+        success = False
+
+    with _session(tmp_path, FailingVerifier()) as session:
+        first = session.run(CycleRequest(name="first", top_k=2))
+        second = session.run(CycleRequest(name="second", top_k=2))
+
+    assert first["novel_count"] == 2
+    assert first["verification_success_count"] == 0
+    assert second["novel_count"] == 2
+    assert second["novelty_reason_counts"] == {"novel": 2}
+
+
+def test_serve_directory_runs_requests_and_records_failures(tmp_path: Path) -> None:
+    watch_dir = tmp_path / "requests"
+    watch_dir.mkdir()
+    (watch_dir / "a.json").write_text(json.dumps({"family_prefixes": ["Group."]}))
+    (watch_dir / "b.json").write_text(json.dumps({"top_k": 1, "bogus": True}))
+    (watch_dir / "c.json").write_text("{not json")
+    (watch_dir / "ignored.tmp").write_text("{}")
+
+    with _session(tmp_path, _SucceedingVerifier()) as session:
+        handled = serve_directory(
+            session, watch_dir, exit_when_idle=True, request_defaults={"top_k": 2}
+        )
+
+    assert handled == 3
+    done = json.loads((watch_dir / "done" / "a.json").read_text())
+    assert done["request"]["top_k"] == 2
+    assert done["request"]["family_prefixes"] == ["Group."]
+    assert done["metrics"]["family_prefixes"] == ["Group."]
+    assert "bogus" in json.loads((watch_dir / "failed" / "b.json").read_text())["error"]
+    assert (watch_dir / "failed" / "c.json").exists()
+    assert not list((watch_dir / "processing").iterdir())
+    assert (watch_dir / "ignored.tmp").exists()
+
+
+def test_serve_directory_resumes_requests_interrupted_mid_cycle(tmp_path: Path) -> None:
+    watch_dir = tmp_path / "requests"
+    (watch_dir / "processing").mkdir(parents=True)
+    (watch_dir / "processing" / "a.json").write_text(json.dumps({"top_k": 2}))
+    (watch_dir / "b.json").write_text(json.dumps({"top_k": 2}))
+
+    with _session(tmp_path, _SucceedingVerifier()) as session:
+        assert serve_directory(session, watch_dir, max_requests=1) == 1
+
+    assert json.loads((watch_dir / "done" / "a.json").read_text())["request"]["resume"] is True
+    assert (watch_dir / "b.json").exists()
+
+
+def test_serve_directory_leaves_claims_of_live_daemons_alone(tmp_path: Path) -> None:
+    watch_dir = tmp_path / "requests"
+    (watch_dir / "processing").mkdir(parents=True)
+    claim = watch_dir / "processing" / "a.json"
+    claim.write_text(json.dumps({"top_k": 2}))
+
+    with claim.open("rb") as held:
+        fcntl.flock(held, fcntl.LOCK_EX)
+        with _session(tmp_path, _SucceedingVerifier()) as session:
+            handled = serve_directory(session, watch_dir, exit_when_idle=True)
+
+    assert handled == 0
+    assert claim.exists()
+    assert not (watch_dir / "a.json").exists()
+    assert not (tmp_path / "out" / "a").exists()
+
+
+def test_cycle_request_rejects_non_object_and_bad_prefixes() -> None:
+    with pytest.raises(ValueError, match="JSON object"):
+        CycleRequest.from_payload("a", [1])
+    with pytest.raises(ValueError, match="family_prefixes"):
+        CycleRequest.from_payload("a", {"family_prefixes": "Ring."})
+
+
+def test_daemon_parser_adds_watch_flags_to_cycle_flags() -> None:
+    args = build_parser().parse_args(["--top-k", "5", "--exit-when-idle"])
+    assert args.top_k == 5
+    assert args.exit_when_idle is True
+    assert args.watch_dir is None
+    assert args.lean_probe_ttl_s == 60.0
+
+
+def test_daemon_leaves_interrupted_requests_out_of_attempt_history(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from autonomous_discovery import phase2_daemon
+
+    for name in ("done", "interrupted"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "phase2_attempts.jsonl").write_text("")
+    (tmp_path / "requests" / "processing").mkdir(parents=True)
+    (tmp_path / "requests" / "processing" / "interrupted.json").write_text("{}")
+    seeded: dict[str, list[Path]] = {}
+
+    def record(name: str):
+        def from_attempt_logs(paths, **kwargs):
+            seeded[name] = list(paths)
+            return None
+
+        return from_attempt_logs
+
+    class FakeSession:
+        def __init__(self, **kwargs: object) -> None:
+            pass
+
+        def __enter__(self) -> "FakeSession":
+            return self
+
+        def __exit__(self, *exc_info: object) -> None:
+            pass
+
+        def warm(self) -> dict[str, bool]:
+            return {"runtime_ready": True}
+
+    monkeypatch.setattr(
+        phase2_daemon.PortfolioProofEngine, "from_attempt_logs", record("portfolio")
+    )
+    monkeypatch.setattr(
+        phase2_daemon.AdaptiveTimeoutPolicy, "from_attempt_logs", record("timeouts")
+    )
+    monkeypatch.setattr(phase2_daemon, "DiscoverySession", FakeSession)
+    monkeypatch.setattr(phase2_daemon, "serve_directory", lambda *args, **kwargs: 0)
+    monkeypatch.setattr(phase2_daemon.signal, "signal", lambda *args: None)
+
+    argv = ["--output-dir", str(tmp_path), "--proof-portfolio", "--adaptive-timeouts"]
+    assert phase2_daemon.main(argv) == 0
+
+    expected = [tmp_path / "done" / "phase2_attempts.jsonl"]
+    assert seeded == {"portfolio": expected, "timeouts": expected}
@@ -1,8 +1,10 @@
 """Unit tests for the --generator CLI flag on phase2_cli."""
 
+from pathlib import Path
+
 import pytest
 
-from autonomous_discovery.phase2_cli import build_parser
+from autonomous_discovery.phase2_cli import build_parser, main
 
 
 class TestGeneratorFlagParser:
@@ -27,3 +29,95 @@ class TestGeneratorFlagParser:
         parser = build_parser()
         with pytest.raises(SystemExit):
             parser.parse_args(["--generator", "invalid"])
+
+
+def test_parser_llm_concurrency_defaults_to_sequential() -> None:
+    assert build_parser().parse_args([]).llm_concurrency == 1
+    assert build_parser().parse_args(["--llm-concurrency", "4"]).llm_concurrency == 4
+
+
+def test_parser_llm_cache_flags() -> None:
+    args = build_parser().parse_args(
+        ["--llm-cache", "cache.sqlite", "--llm-cache-mode", "replay_only"]
+    )
+    assert str(args.llm_cache) == "cache.sqlite"
+    assert args.llm_cache_mode == "replay_only"
+    assert build_parser().parse_args([]).llm_cache_mode == "read_through"
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["--llm-cache-mode", "sometimes"])
+
+
+def test_parser_dedupe_gaps_is_opt_in() -> None:
+    assert build_parser().parse_args([]).dedupe_gaps is False
+    assert build_parser().parse_args(["--dedupe-gaps"]).dedupe_gaps is True
+
+
+def test_main_reports_missing_filter_rules_file(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    assert main(["--filter-rules", str(tmp_path / "missing.json")]) == 1
+    assert "Input file not found" in capsys.readouterr().err
+
+
+def test_parser_resume_is_opt_in() -> None:
+    assert build_parser().parse_args([]).resume is False
+    assert build_parser().parse_args(["--resume"]).resume is True
+
+
+def test_parser_pipelined_defaults() -> None:
+    args = build_parser().parse_args([])
+    assert args.pipelined is False
+    assert args.pipeline_queue_size == 8
+
+    args = build_parser().parse_args(["--pipelined", "--pipeline-queue-size", "2"])
+    assert args.pipelined is True
+    assert args.pipeline_queue_size == 2
+
+
+def test_parser_family_prefix_is_repeatable() -> None:
+    assert build_parser().parse_args([]).family_prefix is None
+    args = build_parser().parse_args(["--family-prefix", "Ring.", "--family-prefix", "Module."])
+    assert args.family_prefix == ["Ring.", "Module."]
+
+
+def test_parser_trace_path_is_optional() -> None:
+    assert build_parser().parse_args([]).trace_path is None
+    assert str(build_parser().parse_args(["--trace-path", "t.json"]).trace_path) == "t.json"
+
+
+@pytest.mark.parametrize("resume", [False, True])
+def test_main_leaves_own_attempt_log_out_of_history_on_resume(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, resume: bool
+) -> None:
+    from autonomous_discovery import phase2_cli
+
+    seeded: dict[str, list[Path]] = {}
+
+    def record(name: str):
+        def from_attempt_logs(paths, **kwargs):
+            seeded[name] = list(paths)
+            return None
+
+        return from_attempt_logs
+
+    monkeypatch.setattr(phase2_cli.PortfolioProofEngine, "from_attempt_logs", record("portfolio"))
+    monkeypatch.setattr(phase2_cli.AdaptiveTimeoutPolicy, "from_attempt_logs", record("timeouts"))
+    monkeypatch.setattr(
+        phase2_cli,
+        "run_phase2_cycle",
+        lambda **kwargs: {"runtime_ready": True, "skipped_reason": None},
+    )
+    history = tmp_path / "history.jsonl"
+    argv = [
+        "--output-dir",
+        str(tmp_path),
+        "--proof-portfolio",
+        "--adaptive-timeouts",
+        "--timeout-history",
+        str(history),
+    ]
+
+    assert main([*argv, "--resume"] if resume else argv) == 0
+
+    expected = [history] if resume else [tmp_path / "phase2_attempts.jsonl", history]
+    assert seeded == {"portfolio": expected, "timeouts": expected}
@@ -1,9 +1,16 @@
+import json
 import shutil
+import time
 from pathlib import Path
 
 import pytest
 
 from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
+from autonomous_discovery.conjecture_generator.template import TemplateConjectureGenerator
+from autonomous_discovery.counterexample_filter import (
+    BasicCounterexampleFilter,
+    RuleSetCounterexampleFilter,
+)
 from autonomous_discovery.counterexample_filter.basic import FilterDecision
 from autonomous_discovery.lean_bridge.runner import LeanRunner
 from autonomous_discovery.novelty_checker.basic import NoveltyDecision
@@ -97,8 +104,11 @@ def test_phase2_builds_default_verifier_with_project_context(
             runner: LeanRunner,
             require_sandbox: bool,
             sandbox_command_prefix: tuple[str, ...],
+            prelude: object = None,
+            sandbox_pool: object = None,
         ) -> None:
             captured["project_dir"] = runner.project_dir
+            captured["prelude"] = prelude
             captured["require_sandbox"] = require_sandbox
             captured["sandbox_command_prefix"] = sandbox_command_prefix
 
@@ -132,6 +142,7 @@ def test_phase2_builds_default_verifier_with_project_context(
     assert captured["project_dir"] is not None
     assert captured["require_sandbox"] is True
     assert captured["sandbox_command_prefix"] == ("sandbox", "--mode", "tight")
+    assert captured["prelude"] is None
 
 
 def test_graph_cache_is_bounded(tmp_path: Path) -> None:
@@ -311,3 +322,613 @@ def test_phase2_uses_runtime_status_fallback_when_verifier_lacks_method(tmp_path
 
     assert summary["lean_available"] is True
     assert summary["runtime_ready"] is True
+
+
+class _TwoConjectureGenerator:
+    def generate(self, gaps: list[object], *, max_candidates: int) -> list[ConjectureCandidate]:
+        _ = (gaps, max_candidates)
+        return [
+            ConjectureCandidate(
+                gap_missing_decl=name,
+                lean_statement=f"theorem {name} : {name} = {name}",
+                rationale=name,
+                model_id="m",
+                temperature=0.0,
+            )
+            for name in ("A", "B")
+        ]
+
+
+class _TimeoutRecordingVerifier:
+    def __init__(self) -> None:
+        self.timeouts: list[int | None] = []
+
+    def is_available(self) -> bool:
+        return True
+
+    def runtime_status(self) -> dict[str, bool]:
+        return {"lean_available": True, "sandbox_available": True, "runtime_ready": True}
+
+    def verify(
+        self, statement: str, proof_script: str, *, timeout: int | None = None
+    ) -> VerificationResult:
+        self.timeouts.append(timeout)
+        return VerificationResult(
+            statement=statement,
+            proof_script=proof_script,
+            success=False,
+            stderr="error: failed",
+            timed_out=False,
+        )
+
+
+def test_phase2_passes_per_tactic_timeouts_from_policy(tmp_path: Path) -> None:
+    from autonomous_discovery.proof_engine.timeouts import AdaptiveTimeoutPolicy
+
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+    policy = AdaptiveTimeoutPolicy(min_samples=1, quantile=1.0, margin=1.0)
+    policy.record("by\n  simp", 4000.0, success=True)
+    verifier = _TimeoutRecordingVerifier()
+
+    summary = run_phase2_cycle(
+        premises_path=premises_path,
+        decl_types_path=decl_types_path,
+        output_dir=tmp_path / "out",
+        top_k=2,
+        trusted_local_run=True,
+        generator=_TwoConjectureGenerator(),
+        verifier=verifier,
+        timeout_policy=policy,
+    )
+
+    # exact?/aesop have no history (default 30 s); simp learned 4 s.
+    assert verifier.timeouts == [30, 30, 4, 30, 30, 4]
+    assert summary["tactic_timeouts_s"] == {"simp": 4}
+    assert summary["deadline_skipped_count"] == 0
+
+
+def test_phase2_cycle_deadline_skips_attempts_once_budget_is_spent(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import autonomous_discovery.pipeline.phase2 as phase2
+    from autonomous_discovery.proof_engine.timeouts import CycleDeadline
+
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+    now = [0.0]
+
+    class SlowVerifier(_TimeoutRecordingVerifier):
+        def verify(
+            self, statement: str, proof_script: str, *, timeout: int | None = None
+        ) -> VerificationResult:
+            now[0] += 40.0
+            return super().verify(statement, proof_script, timeout=timeout)
+
+    monkeypatch.setattr(
+        phase2, "CycleDeadline", lambda budget_s: CycleDeadline(budget_s, clock=lambda: now[0])
+    )
+    verifier = SlowVerifier()
+
+    summary = run_phase2_cycle(
+        premises_path=premises_path,
+        decl_types_path=decl_types_path,
+        output_dir=tmp_path / "out",
+        top_k=2,
+        trusted_local_run=True,
+        generator=_TwoConjectureGenerator(),
+        verifier=verifier,
+        cycle_deadline_s=100.0,
+    )
+
+    # Fair shares: 100/6, 60/5, 20/4; the fourth attempt finds the budget spent.
+    assert verifier.timeouts == [16, 12, 5]
+    assert summary["deadline_skipped_count"] == 3
+    lines = Path(summary["artifacts"]["attempts_path"]).read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3
+
+
+def test_phase2_rejects_non_positive_cycle_deadline(tmp_path: Path) -> None:
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+
+    with pytest.raises(ValueError, match="cycle_deadline_s"):
+        run_phase2_cycle(
+            premises_path=premises_path,
+            decl_types_path=decl_types_path,
+            output_dir=tmp_path / "out",
+            cycle_deadline_s=0,
+        )
+
+
+def test_phase2_races_portfolio_attempts_and_stops_at_first_success(tmp_path: Path) -> None:
+    from autonomous_discovery.proof_engine.portfolio import PortfolioProofEngine
+
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+
+    class RingOnlyVerifier(_TimeoutRecordingVerifier):
+        def verify(
+            self, statement: str, proof_script: str, *, timeout: int | None = None
+        ) -> VerificationResult:
+            super().verify(statement, proof_script, timeout=timeout)
+            return VerificationResult(
+                statement=statement,
+                proof_script=proof_script,
+                success=proof_script == "by\n  ring",
+                stderr="" if proof_script == "by\n  ring" else "error: failed",
+                timed_out=False,
+            )
+
+    summary = run_phase2_cycle(
+        premises_path=premises_path,
+        decl_types_path=decl_types_path,
+        output_dir=tmp_path / "out",
+        top_k=2,
+        proof_retry_budget=2,
+        trusted_local_run=True,
+        generator=_TwoConjectureGenerator(),
+        proof_engine=PortfolioProofEngine(max_concurrency=1),
+        verifier=RingOnlyVerifier(),
+    )
+
+    rows = [
+        json.loads(line)
+        for line in Path(summary["artifacts"]["attempts_path"]).read_text().splitlines()
+    ]
+    assert summary["verification_success_count"] == 2
+    assert summary["race_cancelled_count"] == 0
+    assert [(row["gap_missing_decl"], row["proof_script"]) for row in rows] == [
+        ("A", "by\n  simp_all"),
+        ("A", "by\n  ring"),
+        ("B", "by\n  simp_all"),
+        ("B", "by\n  ring"),
+    ]
+    assert {row["engine"] for row in rows} == {"portfolio-proof-engine"}
+
+
+def test_phase2_dedupe_gaps_sends_one_representative_per_cluster(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from autonomous_discovery.gap_detector.analogical import GapCandidate
+
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+    detected = [
+        GapCandidate(
+            source_decl=f"{family}.{suffix}",
+            target_family="Ring.",
+            missing_decl=f"Ring.{suffix}",
+            score=score,
+            signals={},
+        )
+        for family, suffix, score in (
+            ("Group", "mul_comm", 0.9),
+            ("Monoid", "mul_comm", 0.8),
+            ("Group", "inv_inv", 0.7),
+            ("Group", "one_mul", 0.6),
+        )
+    ]
+    requested_top_k: list[int | None] = []
+
+    def fake_detect(self: object, graph: object, top_k: int | None = None) -> list[GapCandidate]:
+        requested_top_k.append(top_k)
+        return detected[:top_k]
+
+    monkeypatch.setattr(
+        "autonomous_discovery.pipeline.phase2.AnalogicalGapDetector.detect", fake_detect
+    )
+    seen: list[str] = []
+
+    class RecordingGenerator:
+        def generate(
+            self, gaps: list[GapCandidate], *, max_candidates: int
+        ) -> list[ConjectureCandidate]:
+            seen.extend(gap.missing_decl for gap in gaps)
+            return []
+
+    summary = run_phase2_cycle(
+        premises_path=premises_path,
+        decl_types_path=decl_types_path,
+        output_dir=tmp_path / "out",
+        top_k=2,
+        generator=RecordingGenerator(),
+        dedupe_gaps=True,
+    )
+
+    assert requested_top_k[0] is not None and requested_top_k[0] > len(detected)
+    assert seen == ["Ring.mul_comm", "Ring.inv_inv"]
+    assert summary["gap_dedupe_enabled"] is True
+    assert summary["gap_count"] == 2
+    assert summary["gap_cluster_count"] == 2
+    assert summary["gap_duplicates_merged"] == 1
+
+
+def test_phase2_novelty_store_rejects_statements_verified_in_earlier_cycles(
+    tmp_path: Path,
+) -> None:
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+
+    class AlwaysProves(_TimeoutRecordingVerifier):
+        def verify(
+            self, statement: str, proof_script: str, *, timeout: int | None = None
+        ) -> VerificationResult:
+            return VerificationResult(
+                statement=statement,
+                proof_script=proof_script,
+                success=True,
+                stderr="",
+                timed_out=False,
+            )
+
+    def run(output_dir: Path) -> dict[str, object]:
+        return run_phase2_cycle(
+            premises_path=premises_path,
+            decl_types_path=decl_types_path,
+            output_dir=output_dir,
+            top_k=2,
+            trusted_local_run=True,
+            generator=_TwoConjectureGenerator(),
+            verifier=AlwaysProves(),
+            novelty_store_path=tmp_path / "novelty.sqlite",
+        )
+
+    first = run(tmp_path / "cycle1")
+    second = run(tmp_path / "cycle2")
+
+    assert first["novel_count"] == 2
+    assert first["novelty_remembered_count"] == 2
+    assert second["novel_count"] == 0
+    assert second["duplicate_count"] == 2
+    assert second["verification_success_count"] == 0
+
+
+def test_phase2_closes_the_novelty_store_when_the_cycle_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from autonomous_discovery.novelty_checker.store import NoveltyStore
+
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+    closed: list[NoveltyStore] = []
+    close = NoveltyStore.close
+
+    def record_close(store: NoveltyStore) -> None:
+        closed.append(store)
+        close(store)
+
+    class CrashingVerifier(_TimeoutRecordingVerifier):
+        def verify(
+            self, statement: str, proof_script: str, *, timeout: int | None = None
+        ) -> VerificationResult:
+            raise RuntimeError("verifier crashed")
+
+    monkeypatch.setattr(NoveltyStore, "close", record_close)
+
+    with pytest.raises(RuntimeError, match="verifier crashed"):
+        run_phase2_cycle(
+            premises_path=premises_path,
+            decl_types_path=decl_types_path,
+            output_dir=tmp_path / "out",
+            top_k=2,
+            trusted_local_run=True,
+            generator=_TwoConjectureGenerator(),
+            verifier=CrashingVerifier(),
+            novelty_store_path=tmp_path / "novelty.sqlite",
+        )
+
+    assert [store.path for store in closed] == [tmp_path / "novelty.sqlite"]
+
+
+def test_phase2_resume_skips_completed_stages_and_recorded_attempts(tmp_path: Path) -> None:
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+    output_dir = tmp_path / "out"
+
+    class CountingGenerator(_TwoConjectureGenerator):
+        calls = 0
+
+        def generate(
+            self, gaps: list[object], *, max_candidates: int
+        ) -> list[ConjectureCandidate]:
+            CountingGenerator.calls += 1
+            return super().generate(gaps, max_candidates=max_candidates)
+
+    class InterruptedVerifier(_TimeoutRecordingVerifier):
+        def verify(
+            self, statement: str, proof_script: str, *, timeout: int | None = None
+        ) -> VerificationResult:
+            if len(self.timeouts) == 2:
+                raise KeyboardInterrupt
+            return super().verify(statement, proof_script, timeout=timeout)
+
+    def run(verifier: _TimeoutRecordingVerifier, *, resume: bool) -> dict[str, object]:
+        return run_phase2_cycle(
+            premises_path=premises_path,
+            decl_types_path=decl_types_path,
+            output_dir=output_dir,
+            top_k=2,
+            trusted_local_run=True,
+            generator=CountingGenerator(),
+            verifier=verifier,
+            resume=resume,
+        )
+
+    with pytest.raises(KeyboardInterrupt):
+        run(InterruptedVerifier(), resume=False)
+    resumed_verifier = _TimeoutRecordingVerifier()
+    summary = run(resumed_verifier, resume=True)
+
+    rows = [
+        json.loads(line)
+        for line in Path(summary["artifacts"]["attempts_path"]).read_text().splitlines()
+    ]
+    assert CountingGenerator.calls == 1
+    assert summary["resumed_stages"] == ["gaps", "conjectures", "gating"]
+    assert summary["resumed_attempt_count"] == 2
+    assert len(resumed_verifier.timeouts) == 4
+    assert len(rows) == 6
+    assert len({(row["statement"], row["attempt_index"]) for row in rows}) == 6
+    assert summary["failure_counts"] == {"compile_error": 6}
+
+
+def test_phase2_resume_matches_recorded_attempts_by_proof_script(tmp_path: Path) -> None:
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+    output_dir = tmp_path / "out"
+
+    class RankedEngine:
+        def __init__(self, tactics: tuple[str, ...]) -> None:
+            self.tactics = tactics
+
+        def build_attempts(
+            self, conjecture: ConjectureCandidate, *, max_attempts: int = 3
+        ) -> list[ProofAttempt]:
+            return [
+                ProofAttempt(
+                    statement=conjecture.lean_statement,
+                    proof_script=f"by\n  {tactic}",
+                    engine="ranked",
+                    attempt_index=index,
+                )
+                for index, tactic in enumerate(self.tactics[:max_attempts], start=1)
+            ]
+
+    class InterruptedVerifier(_TimeoutRecordingVerifier):
+        def verify(
+            self, statement: str, proof_script: str, *, timeout: int | None = None
+        ) -> VerificationResult:
+            if len(self.timeouts) == 1:
+                raise KeyboardInterrupt
+            return super().verify(statement, proof_script, timeout=timeout)
+
+    def run(
+        engine: RankedEngine, verifier: _TimeoutRecordingVerifier, *, resume: bool
+    ) -> dict[str, object]:
+        return run_phase2_cycle(
+            premises_path=premises_path,
+            decl_types_path=decl_types_path,
+            output_dir=output_dir,
+            top_k=2,
+            proof_retry_budget=3,
+            trusted_local_run=True,
+            generator=_TwoConjectureGenerator(),
+            proof_engine=engine,
+            verifier=verifier,
+            resume=resume,
+        )
+
+    with pytest.raises(KeyboardInterrupt):
+        run(RankedEngine(("simp_all", "ring", "linarith")), InterruptedVerifier(), resume=False)
+    # The failed simp_all attempt now ranks last, shifting every attempt index.
+    summary = run(
+        RankedEngine(("ring", "linarith", "omega", "simp_all")),
+        _TimeoutRecordingVerifier(),
+        resume=True,
+    )
+
+    rows = [
+        json.loads(line)
+        for line in Path(summary["artifacts"]["attempts_path"]).read_text().splitlines()
+    ]
+    first = sorted(row["proof_script"] for row in rows if row["gap_missing_decl"] == "A")
+    assert first == ["by\n  linarith", "by\n  ring", "by\n  simp_all"]
+    assert summary["resumed_attempt_count"] == 1
+    assert len(rows) == 6
+
+
+@pytest.mark.parametrize(
+    "changed",
+    [
+        {"generator": TemplateConjectureGenerator(temperature=0.5)},
+        {"generator": _TwoConjectureGenerator()},
+        {"conjecture_filter": RuleSetCounterexampleFilter(rules=())},
+        {"pipelined": True},
+    ],
+)
+def test_phase2_resume_rejects_changed_generator_filter_or_mode(
+    tmp_path: Path, changed: dict[str, object]
+) -> None:
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+
+    def run(*, resume: bool, **overrides: object) -> dict[str, object]:
+        arguments: dict[str, object] = {
+            "generator": TemplateConjectureGenerator(),
+            "conjecture_filter": BasicCounterexampleFilter(),
+            "pipelined": False,
+            **overrides,
+        }
+        return run_phase2_cycle(
+            premises_path=premises_path,
+            decl_types_path=decl_types_path,
+            output_dir=tmp_path / "out",
+            top_k=2,
+            trusted_local_run=True,
+            verifier=_TimeoutRecordingVerifier(),
+            resume=resume,
+            **arguments,
+        )
+
+    run(resume=False)
+
+    with pytest.raises(ValueError, match="different cycle parameters"):
+        run(resume=True, **changed)
+    assert run(resume=True)["resumed_stages"] == ["gaps", "conjectures", "gating"]
+
+
+def test_phase2_pipelined_cycle_matches_batch_cycle(tmp_path: Path) -> None:
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+    outputs = {}
+    for pipelined in (False, True):
+        summary = run_phase2_cycle(
+            premises_path=premises_path,
+            decl_types_path=decl_types_path,
+            output_dir=tmp_path / f"out-{pipelined}",
+            top_k=2,
+            trusted_local_run=True,
+            generator=_TwoConjectureGenerator(),
+            verifier=_TimeoutRecordingVerifier(),
+            pipelined=pipelined,
+            pipeline_queue_size=1,
+        )
+        rows = [
+            (row["gap_missing_decl"], row["proof_script"])
+            for row in map(
+                json.loads,
+                Path(summary["artifacts"]["attempts_path"]).read_text().splitlines(),
+            )
+        ]
+        for key in ("artifacts", "cycle_duration_ms", "graph_cache_hit", "pipelined", "stages"):
+            summary.pop(key)
+        outputs[pipelined] = (summary, rows)
+
+    assert outputs[True] == outputs[False]
+    assert outputs[True][0]["conjecture_count"] == 2
+    assert len(outputs[True][1]) == 6
+    checkpoint = tmp_path / "out-True" / "phase2_checkpoint"
+    assert (checkpoint / "conjectures.jsonl").exists()
+    assert (checkpoint / "gating.json").exists()
+
+
+def test_phase2_pipelined_cycle_checkpoints_stages_before_verification_ends(
+    tmp_path: Path,
+) -> None:
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+    output_dir = tmp_path / "out"
+    manifest_path = output_dir / "phase2_checkpoint" / "manifest.json"
+
+    class CountingGenerator(_TwoConjectureGenerator):
+        calls = 0
+
+        def generate(
+            self, gaps: list[object], *, max_candidates: int
+        ) -> list[ConjectureCandidate]:
+            CountingGenerator.calls += 1
+            return super().generate(gaps, max_candidates=max_candidates)
+
+    class InterruptedVerifier(_TimeoutRecordingVerifier):
+        def verify(
+            self, statement: str, proof_script: str, *, timeout: int | None = None
+        ) -> VerificationResult:
+            # Crash mid-verification, once the gating stage has had a chance to close.
+            for _ in range(500):
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+                if "gating" in manifest["completed"]:
+                    break
+                time.sleep(0.01)
+            raise KeyboardInterrupt
+
+    def run(verifier: _TimeoutRecordingVerifier, *, resume: bool) -> dict[str, object]:
+        return run_phase2_cycle(
+            premises_path=premises_path,
+            decl_types_path=decl_types_path,
+            output_dir=output_dir,
+            top_k=2,
+            trusted_local_run=True,
+            generator=CountingGenerator(),
+            verifier=verifier,
+            resume=resume,
+            pipelined=True,
+        )
+
+    with pytest.raises(KeyboardInterrupt):
+        run(InterruptedVerifier(), resume=False)
+    resumed_verifier = _TimeoutRecordingVerifier()
+    summary = run(resumed_verifier, resume=True)
+
+    assert CountingGenerator.calls == 1
+    assert summary["resumed_stages"] == ["gaps", "conjectures", "gating"]
+    assert summary["conjecture_count"] == 2
+    assert len(resumed_verifier.timeouts) == 6
+
+
+def test_phase2_pipelined_cycle_propagates_generator_errors(tmp_path: Path) -> None:
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+
+    class FailingGenerator:
+        def iter_generate(self, gaps: list[object], *, max_candidates: int):
+            yield from _TwoConjectureGenerator().generate(gaps, max_candidates=max_candidates)
+            raise RuntimeError("generator crashed")
+
+        def generate(self, gaps: list[object], *, max_candidates: int) -> list[object]:
+            return list(self.iter_generate(gaps, max_candidates=max_candidates))
+
+    with pytest.raises(RuntimeError, match="generator crashed"):
+        run_phase2_cycle(
+            premises_path=premises_path,
+            decl_types_path=decl_types_path,
+            output_dir=tmp_path / "out",
+            top_k=2,
+            trusted_local_run=True,
+            generator=FailingGenerator(),
+            verifier=_TimeoutRecordingVerifier(),
+            pipelined=True,
+        )
+
+
+def test_phase2_rejects_non_positive_pipeline_queue_size(tmp_path: Path) -> None:
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+
+    with pytest.raises(ValueError, match="pipeline_queue_size"):
+        run_phase2_cycle(
+            premises_path=premises_path,
+            decl_types_path=decl_types_path,
+            output_dir=tmp_path / "out",
+            pipeline_queue_size=0,
+        )
+
+
+def test_phase2_rejects_empty_family_prefixes(tmp_path: Path) -> None:
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+
+    with pytest.raises(ValueError, match="family_prefixes"):
+        run_phase2_cycle(
+            premises_path=premises_path,
+            decl_types_path=decl_types_path,
+            output_dir=tmp_path / "out",
+            family_prefixes=(),
+        )
+
+
+def test_phase2_reports_stage_tree_and_writes_chrome_trace(tmp_path: Path) -> None:
+    premises_path, decl_types_path = _write_minimal_data(tmp_path)
+    trace_path = tmp_path / "trace.json"
+
+    summary = run_phase2_cycle(
+        premises_path=premises_path,
+        decl_types_path=decl_types_path,
+        output_dir=tmp_path / "out",
+        top_k=2,
+        trusted_local_run=True,
+        generator=_TwoConjectureGenerator(),
+        verifier=_TimeoutRecordingVerifier(),
+        trace_path=trace_path,
+    )
+
+    stages = {stage["name"]: stage for stage in summary["stages"]}
+    assert list(stages) == [
+        "gaps",
+        "setup",
+        "generation",
+        "gating",
+        "verification",
+        "novelty_remember",
+    ]
+    gap_steps = [child["name"] for child in stages["gaps"]["children"]]
+    assert gap_steps == ["graph_load", "gap_detector.detect"]
+    assert all(stage["wall_ms"] >= 0 for stage in stages.values())
+    assert summary["artifacts"]["trace_path"] == str(trace_path)
+    event_names = {event["name"] for event in json.loads(trace_path.read_text())["traceEvents"]}
+    assert {"gaps", "verification", "knowledge_base.pagerank"} <= event_names
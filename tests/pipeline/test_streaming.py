@@ -0,0 +1,78 @@
+import threading
+
+import pytest
+
+from autonomous_discovery.pipeline.streaming import StageCancelledError, StageChannel
+
+
+def test_take_returns_ready_items_then_none_after_close() -> None:
+    channel: StageChannel[int] = StageChannel(4)
+    channel.put(1)
+    channel.put(2)
+
+    assert channel.take() == [1, 2]
+    assert channel.take(block=False) == []
+    channel.close()
+    assert channel.take() is None
+
+
+def test_of_builds_a_closed_channel() -> None:
+    channel = StageChannel.of([1, 2, 3])
+
+    assert channel.take() == [1, 2, 3]
+    assert channel.take() is None
+    assert StageChannel.of([]).take() is None
+
+
+def test_put_blocks_while_full_until_consumed() -> None:
+    channel: StageChannel[int] = StageChannel(1)
+    channel.put(1)
+    produced = threading.Event()
+
+    def produce() -> None:
+        channel.put(2)
+        produced.set()
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    assert not produced.wait(0.05)
+    assert channel.take() == [1]
+    producer.join(timeout=1)
+    assert produced.is_set()
+    assert channel.take() == [2]
+
+
+def test_close_with_error_reraises_after_remaining_items() -> None:
+    channel: StageChannel[int] = StageChannel(2)
+    channel.put(1)
+    channel.close(RuntimeError("upstream failed"))
+
+    assert channel.take() == [1]
+    with pytest.raises(RuntimeError, match="upstream failed"):
+        channel.take()
+
+
+def test_cancel_unblocks_waiting_producer() -> None:
+    channel: StageChannel[int] = StageChannel(1)
+    channel.put(1)
+    errors: list[BaseException] = []
+
+    def produce() -> None:
+        try:
+            channel.put(2)
+        except StageCancelledError as error:
+            errors.append(error)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    channel.cancel()
+    producer.join(timeout=1)
+
+    assert len(errors) == 1
+    with pytest.raises(StageCancelledError):
+        channel.put(3)
+
+
+def test_rejects_non_positive_maxsize() -> None:
+    with pytest.raises(ValueError, match="maxsize"):
+        StageChannel(0)
@@ -0,0 +1,187 @@
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from autonomous_discovery.conjecture_generator.models import ConjectureCandidate
+from autonomous_discovery.instrumentation import Tracer, span, use_tracer
+from autonomous_discovery.proof_engine.portfolio import (
+    DEFAULT_PORTFOLIO_TACTICS,
+    PortfolioProofEngine,
+    target_family,
+)
+from autonomous_discovery.verifier.models import VerificationResult
+
+
+def _conjecture(missing_decl: str = "Ring.one_mul") -> ConjectureCandidate:
+    return ConjectureCandidate(
+        gap_missing_decl=missing_decl,
+        lean_statement="theorem Ring_one_mul : True",
+        rationale="",
+        model_id="template-v1",
+        temperature=0.0,
+    )
+
+
+def _result(proof_script: str, *, success: bool) -> VerificationResult:
+    return VerificationResult(
+        statement="theorem Ring_one_mul : True",
+        proof_script=proof_script,
+        success=success,
+        stderr="" if success else "error: failed",
+        timed_out=False,
+    )
+
+
+def test_target_family_uses_leading_namespace() -> None:
+    assert target_family("Ring.one_mul") == "Ring"
+    assert target_family("Subgroup.Normal.mk") == "Subgroup"
+    assert target_family("one_mul") == "<root>"
+
+
+def test_without_history_attempts_follow_configured_order() -> None:
+    engine = PortfolioProofEngine()
+
+    attempts = engine.build_attempts(_conjecture(), max_attempts=3)
+
+    assert [a.proof_script for a in attempts] == [
+        f"by\n  {tactic}" for tactic in DEFAULT_PORTFOLIO_TACTICS[:3]
+    ]
+    assert [a.attempt_index for a in attempts] == [1, 2, 3]
+    assert engine.build_attempts(_conjecture(), max_attempts=0) == []
+
+
+def test_history_reorders_tactics_per_family(tmp_path: Path) -> None:
+    log = tmp_path / "phase2_attempts.jsonl"
+    rows = [
+        {"gap_missing_decl": "Ring.a", "proof_script": "by\n  ring", "success": True},
+        {"gap_missing_decl": "Ring.b", "proof_script": "by\n  ring", "success": True},
+        {"gap_missing_decl": "Ring.c", "proof_script": "by\n  simp_all", "success": False},
+        {"gap_missing_decl": "Group.a", "proof_script": "by\n  decide", "success": True},
+    ]
+    log.write_text("\n".join(json.dumps(row) for row in rows) + "\nnot json\n", encoding="utf-8")
+
+    engine = PortfolioProofEngine.from_attempt_logs([log, tmp_path / "missing.jsonl"])
+
+    ring = engine.ranked_tactics("Ring")
+    assert ring[0] == "ring"
+    assert ring[-1] == "simp_all"
+    assert engine.ranked_tactics("Group")[0] == "decide"
+    # Unseen families inherit the global per-tactic prior.
+    assert engine.ranked_tactics("Field")[:2] == ["ring", "decide"]
+
+
+def test_concurrency_shrinks_when_a_tactic_is_reliable() -> None:
+    engine = PortfolioProofEngine(max_concurrency=4)
+    assert engine.concurrency_for("Ring", 8) == 4
+    assert engine.concurrency_for("Ring", 2) == 2
+
+    for _ in range(20):
+        engine.record("Ring", "by\n  ring", success=True)
+
+    assert engine.concurrency_for("Ring", 8) == 1
+
+
+class _ScriptedVerifier:
+    """Sync verifier where only ``winner`` succeeds, after ``delays`` seconds."""
+
+    def __init__(self, winner: str, delays: dict[str, float]) -> None:
+        self.winner = winner
+        self.delays = delays
+        self.started: list[str] = []
+        self.lock = threading.Lock()
+
+    def verify(
+        self, statement: str, proof_script: str, *, timeout: int | None = None
+    ) -> VerificationResult:
+        with self.lock:
+            self.started.append(proof_script)
+        time.sleep(self.delays.get(proof_script, 0.0))
+        return _result(proof_script, success=proof_script == self.winner)
+
+
+def test_race_returns_first_success_and_skips_queued_attempts() -> None:
+    engine = PortfolioProofEngine(max_concurrency=2)
+    verifier = _ScriptedVerifier(
+        winner="by\n  ring",
+        delays={"by\n  simp_all": 0.3, "by\n  ring": 0.05},
+    )
+
+    results = engine.race(_conjecture(), verifier, attempts=engine.build_attempts(_conjecture()))
+
+    assert [r.attempt.proof_script for r in results] == ["by\n  ring"]
+    assert results[0].verification.success is True
+    # linarith was queued behind the two in-flight attempts and never started.
+    assert "by\n  linarith" not in verifier.started
+    assert engine.ranked_tactics("Ring")[0] == "ring"
+
+
+def test_race_threads_record_verifier_spans_under_the_caller() -> None:
+    class SpanningVerifier(_ScriptedVerifier):
+        def verify(
+            self, statement: str, proof_script: str, *, timeout: int | None = None
+        ) -> VerificationResult:
+            with span("verifier.lean"):
+                return super().verify(statement, proof_script, timeout=timeout)
+
+    engine = PortfolioProofEngine(max_concurrency=2)
+    tracer = Tracer()
+    with use_tracer(tracer), span("verification"):
+        results = engine.race(_conjecture(), SpanningVerifier(winner="", delays={}))
+
+    (verification,) = tracer.stages()
+    assert [child["name"] for child in verification["children"]] == ["verifier.lean"]
+    assert verification["children"][0]["count"] == len(results) == 3
+
+
+def test_race_reports_all_failures_when_nothing_proves() -> None:
+    engine = PortfolioProofEngine()
+    verifier = _ScriptedVerifier(winner="", delays={})
+
+    results = engine.race(_conjecture(), verifier, timeout_for=lambda script: 7)
+
+    assert len(results) == 3
+    assert not any(r.verification.success for r in results)
+    assert {r.timeout_s for r in results} == {7}
+
+
+class _AsyncVerifier:
+    def __init__(self) -> None:
+        self.cancelled: list[str] = []
+
+    def verify(self, statement: str, proof_script: str) -> VerificationResult:
+        raise AssertionError("async verifiers should be raced on the event loop")
+
+    async def verify_async(
+        self, statement: str, proof_script: str, *, timeout: int | None = None
+    ) -> VerificationResult:
+        try:
+            await asyncio.sleep(0.05 if proof_script == "by\n  linarith" else 5.0)
+        except asyncio.CancelledError:
+            self.cancelled.append(proof_script)
+            raise
+        return _result(proof_script, success=True)
+
+
+def test_race_cancels_in_flight_async_attempts() -> None:
+    engine = PortfolioProofEngine(max_concurrency=3)
+    verifier = _AsyncVerifier()
+
+    started = time.monotonic()
+    results = engine.race(_conjecture(), verifier)
+
+    assert time.monotonic() - started < 2
+    assert [r.attempt.proof_script for r in results] == ["by\n  linarith"]
+    assert sorted(verifier.cancelled) == ["by\n  ring", "by\n  simp_all"]
+
+
+def test_rejects_invalid_configuration() -> None:
+    with pytest.raises(ValueError, match="tactics"):
+        PortfolioProofEngine(tactics=())
+    with pytest.raises(ValueError, match="max_concurrency"):
+        PortfolioProofEngine(max_concurrency=0)
+    with pytest.raises(ValueError, match="miss_probability"):
+        PortfolioProofEngine(miss_probability=1.0)
@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from autonomous_discovery.proof_engine.history import tactic_name
+from autonomous_discovery.proof_engine.timeouts import AdaptiveTimeoutPolicy, CycleDeadline
+
+
+def _write_attempts(path: Path, rows: list[dict[str, object]]) -> None:
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+
+
+def test_tactic_name_extracts_leading_tactic() -> None:
+    assert tactic_name("by\n  exact?") == "exact?"
+    assert tactic_name("by simp_all") == "simp_all"
+    assert tactic_name("by") == "<empty>"
+
+
+def test_policy_uses_default_without_enough_history() -> None:
+    policy = AdaptiveTimeoutPolicy(default_timeout_s=30, min_samples=3)
+    policy.record("by\n  simp", 100.0, success=True)
+
+    assert policy.timeout_for("by\n  simp") == 30
+    assert policy.timeout_for("by\n  aesop") == 30
+
+
+def test_policy_derives_clamped_quantile_timeout_from_successes() -> None:
+    policy = AdaptiveTimeoutPolicy(min_samples=3, quantile=1.0, margin=2.0, min_timeout_s=1)
+    for duration_ms in (500.0, 1000.0, 2000.0):
+        policy.record("by\n  simp", duration_ms, success=True)
+    policy.record("by\n  simp", 90_000.0, success=False)
+
+    assert policy.timeout_for("by\n  simp") == 4
+    assert policy.snapshot() == {"simp": 4}
+
+
+def test_policy_clamps_to_bounds() -> None:
+    policy = AdaptiveTimeoutPolicy(min_samples=1, min_timeout_s=2, max_timeout_s=10)
+    policy.record("by\n  trivial", 1.0, success=True)
+    policy.record("by\n  exact?", 60_000.0, success=True)
+
+    assert policy.timeout_for("by\n  trivial") == 2
+    assert policy.timeout_for("by\n  exact?") == 10
+
+
+def test_policy_reads_attempt_logs_and_skips_bad_rows(tmp_path: Path) -> None:
+    log_path = tmp_path / "phase2_attempts.jsonl"
+    _write_attempts(
+        log_path,
+        [
+            {"proof_script": "by\n  aesop", "duration_ms": 3000.0, "success": True},
+            {"proof_script": "by\n  aesop", "duration_ms": "bad", "success": True},
+            {"proof_script": "by\n  aesop", "duration_ms": 9000.0, "success": False},
+        ],
+    )
+    with log_path.open("a", encoding="utf-8") as f:
+        f.write("{not json\n")
+
+    policy = AdaptiveTimeoutPolicy.from_attempt_logs(
+        [log_path, tmp_path / "missing.jsonl"], min_samples=1, margin=1.0, quantile=1.0
+    )
+
+    assert policy.snapshot() == {"aesop": 3}
+
+
+def test_policy_rejects_invalid_quantile() -> None:
+    with pytest.raises(ValueError, match="quantile"):
+        AdaptiveTimeoutPolicy(quantile=0.0)
+
+
+def test_cycle_deadline_splits_remaining_budget() -> None:
+    now = [0.0]
+    deadline = CycleDeadline(100.0, clock=lambda: now[0])
+
+    assert deadline.allot(30, remaining_attempts=10) == 10
+    assert deadline.allot(5, remaining_attempts=10) == 5
+
+    now[0] = 90.0
+    assert deadline.allot(30, remaining_attempts=4) == 2
+
+    now[0] = 99.5
+    assert deadline.allot(30, remaining_attempts=1) is None
@@ -0,0 +1,87 @@
+import asyncio
+import contextvars
+import json
+import threading
+from pathlib import Path
+
+from autonomous_discovery.instrumentation import Tracer, accumulate, span, traced, use_tracer
+
+
+def test_spans_are_no_ops_without_an_active_tracer() -> None:
+    tracer = Tracer()
+    with span("outside"), accumulate("step"):
+        pass
+
+    assert tracer.stages() == []
+
+
+def test_stages_nest_and_merge_same_named_siblings() -> None:
+    tracer = Tracer()
+    with use_tracer(tracer):
+        with span("cycle"):
+            for _ in range(3):
+                with span("attempt"):
+                    with accumulate("probe"):
+                        pass
+                    with accumulate("probe"):
+                        pass
+
+    (cycle,) = tracer.stages()
+    assert cycle["name"] == "cycle"
+    assert cycle["count"] == 1
+    assert cycle["cpu_ms"] is not None
+    assert cycle["peak_rss_mb"] > 0
+    (attempt,) = cycle["children"]
+    assert attempt["count"] == 3
+    (probe,) = attempt["children"]
+    assert probe["name"] == "probe"
+    assert probe["count"] == 6
+    assert probe["cpu_ms"] is None
+
+
+def test_traced_decorator_covers_sync_and_async_functions() -> None:
+    @traced("sync_step")
+    def sync_step(value: int) -> int:
+        return value + 1
+
+    @traced("async_step")
+    async def async_step(value: int) -> int:
+        return value * 2
+
+    tracer = Tracer()
+    with use_tracer(tracer):
+        assert sync_step(1) == 2
+        assert asyncio.run(async_step(2)) == 4
+
+    assert [stage["name"] for stage in tracer.stages()] == ["sync_step", "async_step"]
+
+
+def test_worker_threads_join_the_tree_through_a_copied_context() -> None:
+    tracer = Tracer()
+
+    def work() -> None:
+        with span("worker"):
+            pass
+
+    with use_tracer(tracer), span("parent"):
+        worker = threading.Thread(target=contextvars.copy_context().run, args=(work,))
+        worker.start()
+        worker.join()
+
+    (parent,) = tracer.stages()
+    assert [child["name"] for child in parent["children"]] == ["worker"]
+
+
+def test_chrome_trace_has_one_complete_event_per_span(tmp_path: Path) -> None:
+    tracer = Tracer()
+    with use_tracer(tracer), span("outer"):
+        with span("inner"), accumulate("step"):
+            pass
+    path = tmp_path / "trace.json"
+    tracer.write_chrome_trace(path)
+
+    events = json.loads(path.read_text())["traceEvents"]
+    assert [event["name"] for event in events] == ["outer", "inner"]
+    assert all(event["ph"] == "X" for event in events)
+    assert events[0]["dur"] >= events[1]["dur"]
+    assert events[1]["args"]["accumulated"]["step"]["count"] == 1
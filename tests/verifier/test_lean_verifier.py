@@ -1,3 +1,5 @@
+import asyncio
+
 from autonomous_discovery.lean_bridge.runner import LeanResult
 from autonomous_discovery.verifier.lean_verifier import LeanVerifier
 
@@ -76,3 +78,75 @@ def test_lean_verifier_runtime_status_empty_sandbox_prefix_is_unavailable() -> N
 
     assert status["sandbox_available"] is False
     assert status["runtime_ready"] is False
+
+
+def test_lean_verifier_timeout_override_is_passed_to_runner() -> None:
+    class RecordingRunner(FakeRunner):
+        def __init__(self) -> None:
+            super().__init__(available=True, result=LeanResult("", "", 0, False))
+            self.timeouts: list[int | None] = []
+
+        def run_command(
+            self, cmd: list[str], *, timeout: int | None = None, cwd: str | None = None
+        ) -> LeanResult:
+            self.timeouts.append(timeout)
+            return super().run_command(cmd, timeout=timeout, cwd=cwd)
+
+    runner = RecordingRunner()
+    verifier = LeanVerifier(runner=runner, require_sandbox=False, timeout=30)
+
+    verifier.verify("theorem T : True", "by\n  trivial")
+    verifier.verify("theorem T : True", "by\n  trivial", timeout=7)
+
+    assert runner.timeouts == [30, 7]
+
+
+def test_lean_verifier_verify_async_uses_async_runner_after_prechecks() -> None:
+    class FakeAsyncRunner:
+        def __init__(self) -> None:
+            self.calls: list[tuple[list[str], float | None]] = []
+
+        async def run_command(
+            self, cmd: list[str], *, timeout: float | None = None, cwd: str | None = None
+        ) -> LeanResult:
+            self.calls.append((cmd, timeout))
+            return LeanResult("", f"{cmd[-1]}:1:0: error: boom", 1, False)
+
+    async_runner = FakeAsyncRunner()
+    verifier = LeanVerifier(
+        runner=FakeRunner(available=True, result=LeanResult("", "", 0, False)),
+        require_sandbox=False,
+        async_runner=async_runner,  # type: ignore[arg-type]
+    )
+
+    rejected = asyncio.run(verifier.verify_async("theorem T : True", "by\n  #eval 1"))
+    result = asyncio.run(verifier.verify_async("theorem T : True", "by\n  ring", timeout=9))
+
+    assert "unsafe" in rejected.stderr.lower()
+    assert len(async_runner.calls) == 1
+    cmd, timeout = async_runner.calls[0]
+    assert cmd[:3] == ["lake", "env", "lean"]
+    assert timeout == 9
+    assert result.success is False
+    assert result.stderr.startswith("<tmpdir>/Candidate.lean")
+
+
+def test_lean_verifier_reuses_availability_probe_within_ttl() -> None:
+    class CountingRunner(FakeRunner):
+        probes = 0
+
+        def check_lean_available(self) -> bool:
+            self.probes += 1
+            return super().check_lean_available()
+
+    runner = CountingRunner(available=True, result=LeanResult("", "", 0, False))
+    cached = LeanVerifier(runner=runner, require_sandbox=False, availability_ttl_s=60.0)
+    for _ in range(3):
+        cached.verify("theorem T : True", "by\n  trivial")
+    assert runner.probes == 1
+
+    runner.probes = 0
+    uncached = LeanVerifier(runner=runner, require_sandbox=False)
+    for _ in range(3):
+        uncached.verify("theorem T : True", "by\n  trivial")
+    assert runner.probes == 3
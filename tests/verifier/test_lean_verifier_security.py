@@ -73,3 +73,11 @@ def test_verifier_allows_non_template_statement_in_trusted_mode() -> None:
     result = verifier.verify("theorem X : Nat", "by\n  trivial")
 
     assert result.success is True
+
+
+def test_verifier_sandboxed_shape_accepts_portfolio_tactics_only() -> None:
+    verifier = LeanVerifier(runner=FakeRunner(), require_sandbox=True)
+
+    for tactic in ("simp_all", "ring", "linarith", "omega", "norm_num", "decide"):
+        assert verifier._is_supported_input_shape("theorem T : True", f"by\n  {tactic}")
+    assert not verifier._is_supported_input_shape("theorem T : True", "by\n  ring_nf; sorry")
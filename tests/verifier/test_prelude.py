@@ -0,0 +1,128 @@
+from pathlib import Path
+
+from autonomous_discovery.lean_bridge.runner import LeanResult
+from autonomous_discovery.verifier.lean_verifier import LeanVerifier
+from autonomous_discovery.verifier.prelude import FULL_MATHLIB_HEADER, LeanPrelude
+
+
+class FakeBuildRunner:
+    """Runner whose `lake build` writes the prelude .olean, and that records candidates."""
+
+    def __init__(self, project_dir: Path, *, build_ok: bool = True) -> None:
+        self.project_dir = project_dir
+        self.build_ok = build_ok
+        self.commands: list[list[str]] = []
+        self.candidate_sources: list[str] = []
+
+    def check_lean_available(self) -> bool:
+        return True
+
+    def run_command(
+        self, cmd: list[str], *, timeout: int | None = None, cwd: str | None = None
+    ) -> LeanResult:
+        self.commands.append(cmd)
+        if cmd[:2] == ["lake", "build"]:
+            if not self.build_ok:
+                return LeanResult("", "error: unknown module", 1, False)
+            olean = self.project_dir / ".lake/build/lib/lean/LeanExtract/Prelude.olean"
+            olean.parent.mkdir(parents=True, exist_ok=True)
+            olean.write_bytes(b"olean")
+        else:
+            self.candidate_sources.append(Path(cmd[-1]).read_text(encoding="utf-8"))
+        return LeanResult("", "", 0, False)
+
+
+def _make_project(tmp_path: Path) -> Path:
+    project = tmp_path / "LeanExtract"
+    (project / "LeanExtract").mkdir(parents=True)
+    (project / "lean-toolchain").write_text("leanprover/lean4:v4.27.0\n", encoding="utf-8")
+    (project / "lake-manifest.json").write_text("{}\n", encoding="utf-8")
+    (project / "lakefile.toml").write_text('name = "LeanExtract"\n', encoding="utf-8")
+    (project / "LeanExtract" / "Prelude.lean").write_text(
+        "import Mathlib.Algebra.Group.Basic\n", encoding="utf-8"
+    )
+    return project
+
+
+def _build_commands(runner: FakeBuildRunner) -> list[list[str]]:
+    return [cmd for cmd in runner.commands if cmd[:2] == ["lake", "build"]]
+
+
+def test_prelude_builds_once_and_reuses_stamp_across_instances(tmp_path: Path) -> None:
+    project = _make_project(tmp_path)
+    runner = FakeBuildRunner(project)
+
+    first = LeanPrelude(project_dir=project, runner=runner)
+    assert first.import_header() == "import LeanExtract.Prelude"
+    assert first.import_header() == "import LeanExtract.Prelude"
+
+    second = LeanPrelude(project_dir=project, runner=runner)
+    assert second.import_header() == "import LeanExtract.Prelude"
+
+    assert _build_commands(runner) == [["lake", "build", "LeanExtract.Prelude"]]
+    assert first.stamp_path.read_text(encoding="utf-8").strip() == first.fingerprint()
+
+
+def test_prelude_rebuilds_when_manifest_changes(tmp_path: Path) -> None:
+    project = _make_project(tmp_path)
+    runner = FakeBuildRunner(project)
+    LeanPrelude(project_dir=project, runner=runner).ensure_built()
+
+    (project / "lake-manifest.json").write_text('{"packages": []}\n', encoding="utf-8")
+    rebuilt = LeanPrelude(project_dir=project, runner=runner)
+
+    assert rebuilt.is_current() is False
+    assert rebuilt.ensure_built() is True
+    assert len(_build_commands(runner)) == 2
+
+
+def test_prelude_falls_back_to_full_mathlib_when_build_fails(tmp_path: Path) -> None:
+    project = _make_project(tmp_path)
+    runner = FakeBuildRunner(project, build_ok=False)
+    prelude = LeanPrelude(project_dir=project, runner=runner)
+
+    assert prelude.import_header() == FULL_MATHLIB_HEADER
+    assert prelude.import_header() == FULL_MATHLIB_HEADER
+    assert len(_build_commands(runner)) == 1
+    assert not prelude.stamp_path.exists()
+
+
+def test_prelude_missing_source_falls_back_without_building(tmp_path: Path) -> None:
+    project = _make_project(tmp_path)
+    (project / "LeanExtract" / "Prelude.lean").unlink()
+    runner = FakeBuildRunner(project)
+
+    assert LeanPrelude(project_dir=project, runner=runner).import_header() == FULL_MATHLIB_HEADER
+    assert runner.commands == []
+
+
+def test_verifier_candidates_import_prelude(tmp_path: Path) -> None:
+    project = _make_project(tmp_path)
+    runner = FakeBuildRunner(project)
+    verifier = LeanVerifier(
+        runner=runner,
+        require_sandbox=False,
+        prelude=LeanPrelude(project_dir=project, runner=runner),
+    )
+
+    result = verifier.verify("theorem T : True", "by\n  trivial")
+
+    assert result.success is True
+    assert runner.candidate_sources[0].startswith("import LeanExtract.Prelude\n")
+
+
+def test_verifier_defaults_to_full_mathlib_import(tmp_path: Path) -> None:
+    runner = FakeBuildRunner(tmp_path)
+    verifier = LeanVerifier(runner=runner, require_sandbox=False)
+
+    verifier.verify("theorem T : True", "by\n  trivial")
+
+    assert runner.candidate_sources[0].startswith("import Mathlib\n")
+
+
+def test_repository_prelude_module_exists() -> None:
+    from autonomous_discovery.config import ProjectConfig
+
+    prelude = LeanPrelude(project_dir=ProjectConfig().lean_project_dir)
+
+    assert prelude.source_path.exists()
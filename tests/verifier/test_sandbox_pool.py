@@ -0,0 +1,232 @@
+"""SandboxPool tests using a local stand-in for the jail binary and for Lean."""
+
+import os
+import stat
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from autonomous_discovery.lean_bridge.runner import LeanResult
+from autonomous_discovery.verifier.lean_verifier import LeanVerifier
+from autonomous_discovery.verifier.sandbox_pool import SandboxLimits, SandboxPool
+
+FAKE_LEAN = """\
+import resource, sys, time
+path = sys.argv[-1]
+source = open(path, encoding="utf-8").read()
+if "hang" in source:
+    time.sleep(60)
+if "limits" in source:
+    cpu = resource.getrlimit(resource.RLIMIT_CPU)[0]
+    sys.stderr.write(f"cpu={cpu}")
+    sys.exit(1)
+if "sorry" in source:
+    sys.stderr.write(f"{path}:3:0: error: declaration uses 'sorry'")
+    sys.exit(1)
+"""
+
+
+def _executable(path: Path, content: str) -> Path:
+    path.write_text(content, encoding="utf-8")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return path
+
+
+@pytest.fixture
+def fake_jail(tmp_path: Path) -> Path:
+    # Stand-in for nsjail: records each jail start, then execs the worker.
+    log = tmp_path / "jail.log"
+    return _executable(
+        tmp_path / "fake-jail",
+        f'#!/bin/sh\necho "$$" >> "{log}"\nexec "$@"\n',
+    )
+
+
+@pytest.fixture
+def fake_lean(tmp_path: Path) -> tuple[str, ...]:
+    return (sys.executable, str(_executable(tmp_path / "fake_lean.py", FAKE_LEAN)))
+
+
+def _pool(fake_jail: Path, fake_lean: tuple[str, ...], **kwargs: object) -> SandboxPool:
+    return SandboxPool(
+        sandbox_command_prefix=(str(fake_jail),),
+        lean_command=fake_lean,
+        response_grace_s=2.0,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def _jail_starts(fake_jail: Path) -> int:
+    log = fake_jail.parent / "jail.log"
+    return len(log.read_text().splitlines()) if log.exists() else 0
+
+
+def test_pool_reuses_jailed_workers_across_attempts(
+    fake_jail: Path, fake_lean: tuple[str, ...]
+) -> None:
+    with _pool(fake_jail, fake_lean, size=2) as pool:
+        results = [pool.run("theorem T : True := by trivial", timeout=10) for _ in range(5)]
+
+    assert all(result.success for result in results)
+    assert pool.spawn_count == 2
+    assert _jail_starts(fake_jail) == 2
+
+
+def test_pool_reports_failures_with_redacted_paths(
+    fake_jail: Path, fake_lean: tuple[str, ...]
+) -> None:
+    with _pool(fake_jail, fake_lean, size=1) as pool:
+        result = pool.run("theorem T : True := sorry", timeout=10)
+
+    assert result.success is False
+    assert result.timed_out is False
+    assert "<tmpdir>/Candidate.lean" in result.stderr
+    assert "autonomous_discovery_lean_" not in result.stderr
+
+
+def test_pool_applies_rlimits_to_candidates(fake_jail: Path, fake_lean: tuple[str, ...]) -> None:
+    limits = SandboxLimits(cpu_seconds=7, memory_mb=0)
+    with _pool(fake_jail, fake_lean, size=1, limits=limits) as pool:
+        result = pool.run("-- limits", timeout=10)
+
+    assert result.stderr == "cpu=7"
+
+
+def test_pool_times_out_and_keeps_serving(fake_jail: Path, fake_lean: tuple[str, ...]) -> None:
+    with _pool(fake_jail, fake_lean, size=1) as pool:
+        started = time.monotonic()
+        hung = pool.run("-- hang", timeout=1)
+        assert time.monotonic() - started < 5
+        after = pool.run("theorem T : True := by trivial", timeout=10)
+
+    assert hung.timed_out is True
+    assert hung.success is False
+    assert after.success is True
+
+
+SCRIPTED_WORKER = """\
+import json, sys, time
+reply = json.dumps({"stderr": "", "returncode": 0, "timed_out": False})
+for line in sys.stdin:
+    source = json.loads(line)["source"]
+    if "partial" in source:
+        sys.stdout.write(reply[:5])
+        sys.stdout.flush()
+        time.sleep(60)
+    elif "double" in source:
+        sys.stdout.write(reply + "\\n" + reply + "\\n")
+        sys.stdout.flush()
+"""
+
+
+def test_pool_times_out_a_worker_stalled_mid_reply(fake_jail: Path, tmp_path: Path) -> None:
+    worker = _executable(tmp_path / "worker.py", SCRIPTED_WORKER)
+    with _pool(fake_jail, (), size=1, worker_command=(sys.executable, str(worker))) as pool:
+        started = time.monotonic()
+        stalled = pool.run("partial", timeout=1)
+        # The deadline is 3s; the worker would otherwise hold the line open for 60s.
+        assert time.monotonic() - started < 30
+
+    assert stalled.timed_out is True
+    assert pool.spawn_count == 2
+
+
+def test_pool_reads_replies_that_arrived_with_an_earlier_one(
+    fake_jail: Path, tmp_path: Path
+) -> None:
+    worker = _executable(tmp_path / "worker.py", SCRIPTED_WORKER)
+    with _pool(fake_jail, (), size=1, worker_command=(sys.executable, str(worker))) as pool:
+        first = pool.run("double", timeout=1)
+        # The worker answers nothing else; this reply was sent with the first one.
+        second = pool.run("silent", timeout=1)
+
+    assert first.success is True
+    assert second.success is True
+    assert pool.spawn_count == 1
+
+
+def test_pool_replaces_dead_worker(fake_jail: Path, fake_lean: tuple[str, ...]) -> None:
+    with _pool(fake_jail, fake_lean, size=1) as pool:
+        pool.run("theorem T : True := by trivial", timeout=10)
+        [worker] = pool._workers
+        os.killpg(worker.proc.pid, 9)
+        worker.proc.wait()
+
+        crashed = pool.run("theorem T : True := by trivial", timeout=10)
+        recovered = pool.run("theorem T : True := by trivial", timeout=10)
+
+    assert crashed.success is False
+    assert "exited unexpectedly" in crashed.stderr
+    assert recovered.success is True
+    assert pool.spawn_count == 2
+
+
+def test_pool_serves_concurrent_attempts(fake_jail: Path, tmp_path: Path) -> None:
+    slow_lean = _executable(tmp_path / "slow_lean.py", "import time\ntime.sleep(1.0)\n")
+    results: list[LeanResult] = []
+    with _pool(fake_jail, (sys.executable, str(slow_lean)), size=3) as pool:
+        pool.start()
+        threads = [
+            threading.Thread(target=lambda: results.append(pool.run("x", timeout=10)))
+            for _ in range(3)
+        ]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+    assert len(results) == 3 and all(result.success for result in results)
+    assert elapsed < 2.5
+
+
+def test_pool_rejects_non_positive_size() -> None:
+    with pytest.raises(ValueError, match="size"):
+        SandboxPool(size=0)
+
+
+class _AvailableRunner:
+    def check_lean_available(self) -> bool:
+        return True
+
+    def run_command(
+        self, cmd: list[str], *, timeout: int | None = None, cwd: str | None = None
+    ) -> LeanResult:
+        raise AssertionError("pool-backed verifier must not spawn per-attempt sandboxes")
+
+
+def test_verifier_routes_sandboxed_attempts_through_pool(
+    fake_jail: Path, fake_lean: tuple[str, ...]
+) -> None:
+    with _pool(fake_jail, fake_lean, size=1) as pool:
+        verifier = LeanVerifier(
+            runner=_AvailableRunner(),
+            sandbox_command_prefix=(str(fake_jail),),
+            sandbox_pool=pool,
+        )
+        ok = verifier.verify("theorem T : True", "by\n  trivial")
+
+    assert ok.success is True
+
+
+def test_verifier_input_checks_run_before_pool(
+    fake_jail: Path, fake_lean: tuple[str, ...]
+) -> None:
+    pool = _pool(fake_jail, fake_lean, size=1)
+    verifier = LeanVerifier(
+        runner=_AvailableRunner(),
+        sandbox_command_prefix=(str(fake_jail),),
+        sandbox_pool=pool,
+    )
+
+    unsafe = verifier.verify("theorem T : True", 'by\n  run_cmd IO.println "x"')
+    unsupported = verifier.verify("theorem X : Nat", "by\n  trivial")
+    pool.close()
+
+    assert "unsafe" in unsafe.stderr.lower()
+    assert "constrained theorem/proof shapes" in unsupported.stderr.lower()
+    assert pool.spawn_count == 0